@@ -80,22 +80,24 @@ def run_pipeline(config_path: str) -> Path:
     with open(config_resolved_path, "w", encoding="utf-8") as f:
         yaml.dump(config, f, allow_unicode=True)
 
-    # データ読み込み
+    # データ読み込み（型縮小 + 列指向キャッシュ）
+    load_kwargs = dict(
+        train_path=dataset["train_path"],
+        test_path=dataset["test_path"],
+        label_col=dataset["label_col"],
+        cache_dir=dataset.get(
+            "cache_dir", str(Path(output_config.get("runs_dir", "runs")) / ".cache")
+        ),
+        downcast=dataset.get("downcast", True),
+        chunksize=dataset.get("chunksize"),
+    )
     try:
-        X_train_df, X_test_df, y_train, schema = load_train_test(
-            train_path=dataset["train_path"],
-            test_path=dataset["test_path"],
-            label_col=dataset["label_col"],
-        )
+        X_train_df, X_test_df, y_train, schema = load_train_test(**load_kwargs)
     except FileNotFoundError as e:
         logger.error(f"Data file not found: {e}")
         logger.info("Creating demo data...")
         create_demo_data(dataset, task)
-        X_train_df, X_test_df, y_train, schema = load_train_test(
-            train_path=dataset["train_path"],
-            test_path=dataset["test_path"],
-            label_col=dataset["label_col"],
-        )
+        X_train_df, X_test_df, y_train, schema = load_train_test(**load_kwargs)
 
     # スキーマ保存
     save_schema(schema, runs_dir / "schema.json")
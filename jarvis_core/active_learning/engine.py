@@ -39,6 +39,7 @@ class ALConfig:
     # Model settings
     model_type: str = "logistic"  # logistic, svm, random_forest
     feature_type: str = "tfidf"  # tfidf, embedding
+    incremental: bool = False  # SGD partial_fit on new labels instead of full refits
 
     # Behavior
     random_seed: int = 42
@@ -104,7 +105,14 @@ class ActiveLearningEngine:
         # Data
         self._instances: dict[str, list[float]] = {}
         self._labels: dict[str, int] = {}
-        self._unlabeled: list[str] = []
+        self._unlabeled: dict[str, None] = {}
+
+        # Matrix-backed store (None when numpy is unavailable)
+        self._X = None
+        self._row: dict[str, int] = {}
+        self._ids: list[str] = []
+        self._labeled_mask = None
+        self._pending_rows: list[int] = []
 
         # Model
         self._model = None
@@ -129,20 +137,21 @@ class ActiveLearningEngine:
             seed_labels: Optional initial labels
         """
         self._instances = instances
-        self._unlabeled = list(instances.keys())
+        self._unlabeled = dict.fromkeys(instances)
         self._stats.total_instances = len(instances)
 
         if instances:
             first_key = next(iter(instances))
             self._feature_dim = len(instances[first_key])
 
+        self._build_store()
+
         # Apply seed labels
         if seed_labels:
             for instance_id, label in seed_labels.items():
                 if instance_id in self._instances:
                     self._labels[instance_id] = label
-                    if instance_id in self._unlabeled:
-                        self._unlabeled.remove(instance_id)
+                    self._mark_labeled(instance_id)
                     if label == 1:
                         self._stats.relevant_found += 1
             self._stats.labeled_instances = len(self._labels)
@@ -154,6 +163,31 @@ class ActiveLearningEngine:
         self._state = ALState.IDLE
         logger.info(f"AL engine initialized with {len(instances)} instances")
 
+    def _build_store(self) -> None:
+        """Stack all feature vectors into one matrix with a labeled mask."""
+        self._ids = list(self._instances)
+        self._row = {instance_id: i for i, instance_id in enumerate(self._ids)}
+        self._pending_rows = []
+        try:
+            import numpy as np
+
+            self._X = np.asarray([self._instances[i] for i in self._ids], dtype=np.float32).reshape(
+                len(self._ids), -1
+            )
+            self._labeled_mask = np.zeros(len(self._ids), dtype=bool)
+        except (ImportError, ValueError) as e:
+            logger.debug(f"Matrix store unavailable, using per-instance scoring: {e}")
+            self._X = None
+            self._labeled_mask = None
+
+    def _mark_labeled(self, instance_id: str) -> None:
+        """Move an instance out of the unlabeled pool in O(1)."""
+        self._unlabeled.pop(instance_id, None)
+        row = self._row.get(instance_id)
+        if row is not None and self._labeled_mask is not None and not self._labeled_mask[row]:
+            self._labeled_mask[row] = True
+            self._pending_rows.append(row)
+
     def _select_initial_samples(self) -> list[str]:
         """Select initial samples for labeling."""
         needed = self._config.initial_samples - len(self._labels)
@@ -161,7 +195,7 @@ class ActiveLearningEngine:
             return []
 
         # Random selection for initial samples
-        samples = random.sample(self._unlabeled, min(needed, len(self._unlabeled)))
+        samples = random.sample(list(self._unlabeled), min(needed, len(self._unlabeled)))
         return samples
 
     def get_next_query(self, n: int = None) -> list[str]:
@@ -188,7 +222,7 @@ class ActiveLearningEngine:
             samples = self._uncertainty_sampling(n)
         else:
             # Fallback to random
-            samples = random.sample(self._unlabeled, min(n, len(self._unlabeled)))
+            samples = random.sample(list(self._unlabeled), min(n, len(self._unlabeled)))
 
         return samples
 
@@ -197,6 +231,20 @@ class ActiveLearningEngine:
         if not self._unlabeled or self._model is None:
             return []
 
+        scored = self._score_unlabeled()
+        if scored is not None:
+            import numpy as np
+
+            rows, proba = scored
+            uncertainty = 1.0 - np.abs(proba - 0.5) * 2
+            if n < len(rows):
+                top = np.argpartition(-uncertainty, n - 1)[:n]
+            else:
+                top = np.arange(len(rows))
+            # Highest uncertainty first, ties in pool order
+            top = top[np.lexsort((rows[top], -uncertainty[top]))]
+            return [self._ids[r] for r in rows[top]]
+
         # Get predictions for unlabeled instances
         uncertainties = []
         for instance_id in self._unlabeled:
@@ -214,6 +262,27 @@ class ActiveLearningEngine:
 
         return [x[0] for x in uncertainties[:n]]
 
+    def _score_unlabeled(self):
+        """Score every unlabeled row with one vectorized ``predict_proba``.
+
+        Returns:
+            ``(rows, proba)`` arrays, or None when the matrix store or the
+            model cannot score in batch (callers fall back to per-instance).
+        """
+        if self._X is None or self._model is None:
+            return None
+        try:
+            import numpy as np
+
+            rows = np.flatnonzero(~self._labeled_mask)
+            if len(rows) == 0:
+                return rows, np.zeros(0)
+            proba = np.asarray(self._model.predict_proba(self._X[rows]))[:, 1]
+            return rows, proba
+        except Exception as e:
+            logger.debug(f"Batch scoring failed, falling back: {e}")
+            return None
+
     def _predict_proba(self, features: list[float]) -> float:
         """Predict probability of relevance."""
         if self._model is None:
@@ -240,9 +309,7 @@ class ActiveLearningEngine:
             return
 
         self._labels[instance_id] = label
-
-        if instance_id in self._unlabeled:
-            self._unlabeled.remove(instance_id)
+        self._mark_labeled(instance_id)
 
         self._stats.labeled_instances = len(self._labels)
         if label == 1:
@@ -274,30 +341,36 @@ class ActiveLearningEngine:
 
         try:
             import numpy as np
-            from sklearn.linear_model import LogisticRegression
-
-            # Prepare training data
-            X = []
-            y = []
-            for instance_id, label in self._labels.items():
-                X.append(self._instances[instance_id])
-                y.append(label)
 
-            X = np.array(X)
-            y = np.array(y)
-
-            # Check if we have both classes
-            if len(set(y)) < 2:
-                return
-
-            # Train model
-            self._model = LogisticRegression(
-                random_state=self._config.random_seed,
-                max_iter=1000,
-            )
-            self._model.fit(X, y)
-
-            logger.debug(f"Model trained on {len(y)} instances")
+            if self._config.incremental:
+                self._partial_fit()
+            else:
+                from sklearn.linear_model import LogisticRegression
+
+                # Prepare training data
+                if self._X is not None:
+                    rows = [self._row[instance_id] for instance_id in self._labels]
+                    X = self._X[rows]
+                else:
+                    X = np.array([self._instances[i] for i in self._labels])
+                y = np.fromiter(self._labels.values(), dtype=np.int64, count=len(self._labels))
+
+                # Check if we have both classes
+                if len(set(y.tolist())) < 2:
+                    self._state = ALState.IDLE
+                    return
+
+                # Warm-start from the previous coefficients when retraining
+                if not isinstance(self._model, LogisticRegression):
+                    self._model = LogisticRegression(
+                        random_state=self._config.random_seed,
+                        max_iter=1000,
+                        warm_start=True,
+                    )
+                self._model.fit(X, y)
+                self._pending_rows = []
+
+                logger.debug(f"Model trained on {len(y)} instances")
 
         except ImportError:
             logger.warning("sklearn not available, using random sampling")
@@ -306,6 +379,32 @@ class ActiveLearningEngine:
 
         self._state = ALState.IDLE
 
+    def _partial_fit(self) -> None:
+        """Update an SGD model with rows labeled since the last fit."""
+        import numpy as np
+        from sklearn.linear_model import SGDClassifier
+
+        if self._X is None or not self._pending_rows:
+            return
+
+        rows = np.asarray(self._pending_rows, dtype=np.int64)
+        y = np.array([self._labels[self._ids[r]] for r in rows], dtype=np.int64)
+
+        if not isinstance(self._model, SGDClassifier):
+            # SGD needs both classes among the first batch to give useful probabilities
+            labeled_rows = np.flatnonzero(self._labeled_mask)
+            labeled_y = np.array([self._labels[self._ids[r]] for r in labeled_rows])
+            if len(set(labeled_y.tolist())) < 2:
+                return
+            rows, y = labeled_rows, labeled_y
+            self._model = SGDClassifier(loss="log_loss", random_state=self._config.random_seed)
+            self._model.partial_fit(self._X[rows], y, classes=np.array([0, 1]))
+        else:
+            self._model.partial_fit(self._X[rows], y)
+
+        self._pending_rows = []
+        logger.debug(f"Model updated incrementally with {len(rows)} instances")
+
     def should_stop(self) -> bool:
         """Check if stopping criterion is met.
 
@@ -348,6 +447,11 @@ class ActiveLearningEngine:
         # Estimate total relevant using predictions
         try:
             predicted_relevant = self._stats.relevant_found
+            scored = self._score_unlabeled()
+            if scored is not None:
+                _, proba = scored
+                predicted_relevant += float(proba[proba > 0.5].sum())
+                return self._stats.relevant_found / predicted_relevant
             for instance_id in self._unlabeled:
                 prob = self._predict_proba(self._instances[instance_id])
                 if prob > 0.5:
@@ -370,6 +474,11 @@ class ActiveLearningEngine:
         Returns:
             Dict mapping instance_id to relevance probability
         """
+        scored = self._score_unlabeled()
+        if scored is not None:
+            rows, proba = scored
+            return {self._ids[r]: float(p) for r, p in zip(rows.tolist(), proba.tolist())}
+
         predictions = {}
         for instance_id in self._unlabeled:
             predictions[instance_id] = self._predict_proba(self._instances[instance_id])
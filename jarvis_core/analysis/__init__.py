@@ -8,6 +8,7 @@ from .citation_network import CitationNetwork, CitationNode, CitationStats
 from .comparison import ComparisonAnalyzer, ComparisonRow, ComparisonTable
 from .contradiction import Contradiction, ContradictionDetector
 from .evidence_mapper import EvidenceMapper, EvidenceReference, MappedEvidence
+from .graph_analytics import GraphAnalytics
 from .knowledge_graph import Edge, KnowledgeGraph, Node
 from .review_generator import ReviewGenerator, ReviewOutput
 
@@ -28,4 +29,5 @@ __all__ = [
     "CitationNetwork",
     "CitationNode",
     "CitationStats",
+    "GraphAnalytics",
 ]
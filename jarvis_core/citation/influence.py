@@ -7,10 +7,19 @@ Per JARVIS_COMPLETION_INSTRUCTION Task 2.2.2
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, cast
 
+import numpy as np
+
+from jarvis_core.analysis.graph_analytics import GraphAnalytics
 from jarvis_core.citation.stance_classifier import CitationStance
 
+_STANCE_CODES = {
+    CitationStance.SUPPORT: 0,
+    CitationStance.CONTRAST: 1,
+    CitationStance.MENTION: 2,
+}
+
 
 @dataclass
 class InfluenceScore:
@@ -43,7 +52,8 @@ class InfluenceCalculator:
         """Initialize calculator.
 
         Args:
-            citation_graph: Optional CitationGraph instance
+            citation_graph: Optional CitationGraph instance, or a
+                GraphAnalytics whose edges are labelled with stance values
         """
         self._graph = citation_graph
 
@@ -61,6 +71,8 @@ class InfluenceCalculator:
         Returns:
             InfluenceScore object
         """
+        if citations is None and isinstance(self._graph, GraphAnalytics):
+            return self.calculate_batch([paper_id])[0]
         if citations is None and self._graph:
             citations = self._graph.get_citations(paper_id)
 
@@ -102,6 +114,76 @@ class InfluenceCalculator:
             controversy_score=controversy,
         )
 
+    def calculate_batch(
+        self,
+        paper_ids: list[str],
+        citations_map: dict[str, list[Any]] | None = None,
+    ) -> list[InfluenceScore]:
+        """Calculate influence scores for many papers in one vectorised pass.
+
+        Stance counts come from ``citations_map`` when given; otherwise from a
+        GraphAnalytics citation graph, whose per-label in-degree counts are
+        memoized until the graph changes.
+
+        Args:
+            paper_ids: List of paper IDs
+            citations_map: Dict mapping paper_id to list of citations
+
+        Returns:
+            InfluenceScore objects in the order of ``paper_ids``
+        """
+        if citations_map is None and isinstance(self._graph, GraphAnalytics):
+            graph = self._graph
+            idx = np.array([graph.node_index.get(pid, -1) for pid in paper_ids], dtype=np.int64)
+            known = idx >= 0
+            safe_idx = np.where(known, idx, 0)
+
+            def gather(counts: np.ndarray) -> np.ndarray:
+                if len(counts) == 0:
+                    return np.zeros(len(paper_ids), dtype=np.int64)
+                return cast(np.ndarray, np.where(known, counts[safe_idx], 0))
+
+            total = gather(graph.in_degree())
+            support = gather(graph.label_counts(CitationStance.SUPPORT.value))
+            contrast = gather(graph.label_counts(CitationStance.CONTRAST.value))
+            mention = gather(graph.label_counts(CitationStance.MENTION.value))
+        else:
+            citations_map = citations_map or {}
+            n = len(paper_ids)
+            total = np.zeros(n, dtype=np.int64)
+            owners: list[int] = []
+            codes: list[int] = []
+            for i, pid in enumerate(paper_ids):
+                citations = citations_map.get(pid) or []
+                total[i] = len(citations)
+                for c in citations:
+                    stance = getattr(c, "stance", None)
+                    code = _STANCE_CODES.get(stance) if stance is not None else None
+                    if code is not None:
+                        owners.append(i)
+                        codes.append(code)
+            flat = np.asarray(owners, dtype=np.int64) * 3 + np.asarray(codes, dtype=np.int64)
+            counts = np.bincount(flat, minlength=n * 3).reshape(n, 3)
+            support, contrast, mention = counts[:, 0], counts[:, 1], counts[:, 2]
+
+        denom = np.maximum(total, 1)
+        support_rate = support / denom
+        contrast_rate = contrast / denom
+        influence = total * (support_rate + 0.5 * contrast_rate)
+
+        return [
+            InfluenceScore(
+                paper_id=pid,
+                total_citations=int(total[i]),
+                support_count=int(support[i]),
+                contrast_count=int(contrast[i]),
+                mention_count=int(mention[i]),
+                influence_score=float(influence[i]),
+                controversy_score=float(contrast_rate[i]),
+            )
+            for i, pid in enumerate(paper_ids)
+        ]
+
     def rank_papers(
         self,
         paper_ids: list[str],
@@ -118,8 +200,9 @@ class InfluenceCalculator:
         Returns:
             Sorted list of InfluenceScore objects
         """
-        citations_map = citations_map or {}
-        scores = [self.calculate(pid, citations_map.get(pid, [])) for pid in paper_ids]
+        if citations_map is None and not isinstance(self._graph, GraphAnalytics):
+            citations_map = {}
+        scores = self.calculate_batch(paper_ids, citations_map)
 
         if by == "influence":
             return sorted(scores, key=lambda x: x.influence_score, reverse=True)
@@ -84,20 +84,51 @@ class ContradictionDetector:
     def detect_batch(self, claims: Sequence[Claim]) -> list[ContradictionResult]:
         """Detect contradictions among all pairs of claims.
 
+        In heuristic mode only pairs that can match an antonym pair are
+        compared: an inverted index maps each antonym word to the claims
+        containing it, and candidates are the union of ``word1 x word2``
+        postings.  Results are identical to the full pairwise scan.
+
         Args:
             claims: List of claims to compare pairwise.
 
         Returns:
             List of ContradictionResult for pairs with contradictions.
         """
+        if self.use_llm and self._get_llm():
+            results = []
+            for i in range(len(claims)):
+                for j in range(i + 1, len(claims)):
+                    result = self.detect(claims[i], claims[j])
+                    if result.is_contradictory:
+                        results.append(result)
+            return results
+
         results = []
-        for i in range(len(claims)):
-            for j in range(i + 1, len(claims)):
-                result = self.detect(claims[i], claims[j])
-                if result.is_contradictory:
-                    results.append(result)
+        for i, j in self._candidate_pairs(claims):
+            result = self._detect_heuristic(ClaimPair(claim_a=claims[i], claim_b=claims[j]))
+            if result.is_contradictory:
+                results.append(result)
         return results
 
+    def _candidate_pairs(self, claims: Sequence[Claim]) -> list[tuple[int, int]]:
+        """Index pairs ``(i, j)``, ``i < j``, sharing at least one antonym pair."""
+        postings: dict[str, list[int]] = {}
+        words = {w for pair in self.antonyms for w in pair}
+        for idx, claim in enumerate(claims):
+            text = claim.text.lower()
+            for word in words:
+                if word in text:
+                    postings.setdefault(word, []).append(idx)
+
+        candidates: set[tuple[int, int]] = set()
+        for word1, word2 in self.antonyms:
+            for a in postings.get(word1, ()):
+                for b in postings.get(word2, ()):
+                    if a != b:
+                        candidates.add((min(a, b), max(a, b)))
+        return sorted(candidates)
+
     def _detect_llm(self, llm, pair: ClaimPair) -> ContradictionResult:
         """Detect contradiction using LLM (Gemini)."""
         from jarvis_core.llm import Message
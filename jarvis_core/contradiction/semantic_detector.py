@@ -5,8 +5,10 @@ Uses embedding similarity for advanced contradiction detection.
 
 from __future__ import annotations
 
+import heapq
+from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, cast
 
 import numpy as np
 
@@ -111,20 +113,116 @@ class SemanticContradictionDetector:
             scores={"semantic_similarity": similarity},
         )
 
-    def detect_batch(self, claims: list[Claim]) -> list[tuple[Claim, Claim, ContradictionResult]]:
+    def detect_batch(
+        self,
+        claims: list[Claim],
+        top_k: int | None = None,
+        block_size: int = 512,
+    ) -> list[tuple[Claim, Claim, ContradictionResult]]:
         """Detect contradictions among a list of claims.
 
+        Produces the same verdicts as calling ``detect`` on every pair
+        ``(claims[i], claims[j])`` with ``i < j``, but embeds each claim (and
+        each needed negation) once and scores pairs with matrix products.
+
+        Args:
+            claims: Claims to compare.
+            top_k: If set, keep only the ``top_k`` most confident results.
+            block_size: Rows of the similarity matrix computed at a time.
+
         Returns list of (claim_a, claim_b, result) tuples for contradicting pairs.
         """
-        contradictions = []
-
-        for i, claim_a in enumerate(claims):
-            for claim_b in claims[i + 1 :]:
-                result = self.detect(claim_a, claim_b)
-                if result.is_contradictory:
-                    contradictions.append((claim_a, claim_b, result))
+        stream = self.iter_batch(claims, block_size=block_size)
+        if top_k is None:
+            return list(stream)
+        if top_k <= 0:
+            return []
+        best = heapq.nlargest(
+            top_k,
+            ((item[2].confidence, -n, item) for n, item in enumerate(stream)),
+            key=lambda entry: entry[:2],
+        )
+        return [item for _, _, item in best]
+
+    def iter_batch(
+        self, claims: list[Claim], block_size: int = 512
+    ) -> Iterator[tuple[Claim, Claim, ContradictionResult]]:
+        """Stream contradicting pairs, block by block, in ``(i, j)`` order.
+
+        ``detect`` never reports a contradiction for a pair whose similarity
+        is below ``similarity_threshold``, so candidate pairs come from a
+        thresholded similarity join over the normalised embedding matrix
+        computed ``block_size`` rows at a time; only those candidates are
+        scored.
+        """
+        n = len(claims)
+        if n < 2:
+            return
+        threshold = self.config.similarity_threshold
+        emb = _normalize_rows(self._embed_many([c.text for c in claims]))
+        first, second = _predicate_masks([c.text for c in claims])
+        partial_hit = 0.8 > self.config.contradiction_threshold
+        cols = np.arange(n)
+
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            sims = emb[start:stop] @ emb.T
+            rows = np.arange(start, stop)
+            sims[cols[None, :] <= rows[:, None]] = -np.inf
+            local_i, pair_j = np.nonzero(sims >= threshold)
+            if len(local_i) == 0:
+                continue
+            pair_i: np.ndarray = local_i + start
+            similarity = sims[local_i, pair_j]
+
+            direct: np.ndarray = np.zeros(len(pair_i), dtype=bool)
+            neg_similarity = np.zeros(len(pair_i))
+            if self.config.use_negation_embedding:
+                needed = np.unique(pair_i)
+                negated = self._embed_many([self._negate_claim(claims[i].text) for i in needed])
+                neg_emb = _normalize_rows(negated)
+                lookup = np.searchsorted(needed, pair_i)
+                neg_similarity = np.einsum("ij,ij->i", neg_emb[lookup], emb[pair_j])
+                direct = neg_similarity > threshold
+            partial = (
+                ~direct
+                & partial_hit
+                & (((first[pair_i] & second[pair_j]) | (second[pair_i] & first[pair_j])) != 0)
+            )
 
-        return contradictions
+            for k in np.flatnonzero(direct | partial):
+                a, b = claims[pair_i[k]], claims[pair_j[k]]
+                pair = ClaimPair(claim_a=a, claim_b=b)
+                sim = float(similarity[k])
+                if direct[k]:
+                    result = ContradictionResult(
+                        claim_pair=pair,
+                        contradiction_type=ContradictionType.DIRECT,
+                        confidence=float(neg_similarity[k]),
+                        scores={
+                            "semantic_similarity": sim,
+                            "negation_similarity": float(neg_similarity[k]),
+                        },
+                    )
+                else:
+                    result = ContradictionResult(
+                        claim_pair=pair,
+                        contradiction_type=ContradictionType.PARTIAL,
+                        confidence=0.8,
+                        scores={"semantic_similarity": sim, "partial_score": 0.8},
+                    )
+                yield a, b, result
+
+    def _embed_many(self, texts: list[str]) -> np.ndarray:
+        """Embed ``texts`` into a matrix, embedding each distinct text once."""
+        unique = list(dict.fromkeys(texts))
+        embedder = self.embedder
+        if hasattr(embedder, "encode"):
+            vectors = np.asarray(embedder.encode(unique), dtype=np.float64)
+        else:
+            vectors = np.vstack([np.asarray(embedder.embed(t), dtype=np.float64) for t in unique])
+        position = {text: i for i, text in enumerate(unique)}
+        return cast(np.ndarray, vectors[[position[t] for t in texts]])
 
     def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
         """Compute cosine similarity between two vectors."""
@@ -173,24 +271,46 @@ class SemanticContradictionDetector:
         text_b = claim_b.text.lower()
 
         # Check for opposite predicates
-        opposite_predicates = [
-            ("increase", "decrease"),
-            ("improve", "worsen"),
-            ("effective", "ineffective"),
-            ("benefit", "harm"),
-            ("positive", "negative"),
-            ("higher", "lower"),
-            ("more", "less"),
-            ("significant", "insignificant"),
-        ]
-
-        for pred_a, pred_b in opposite_predicates:
+        for pred_a, pred_b in OPPOSITE_PREDICATES:
             if (pred_a in text_a and pred_b in text_b) or (pred_b in text_a and pred_a in text_b):
                 return 0.8
 
         return 0.0
 
 
+OPPOSITE_PREDICATES = [
+    ("increase", "decrease"),
+    ("improve", "worsen"),
+    ("effective", "ineffective"),
+    ("benefit", "harm"),
+    ("positive", "negative"),
+    ("higher", "lower"),
+    ("more", "less"),
+    ("significant", "insignificant"),
+]
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalise rows; all-zero rows stay zero (cosine 0, as in ``detect``)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return cast(np.ndarray, matrix / norms)
+
+
+def _predicate_masks(texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Bitmasks of which left / right opposite predicates occur in each text."""
+    first: np.ndarray = np.zeros(len(texts), dtype=np.int64)
+    second: np.ndarray = np.zeros(len(texts), dtype=np.int64)
+    for i, text in enumerate(texts):
+        lowered = text.lower()
+        for bit, (pred_a, pred_b) in enumerate(OPPOSITE_PREDICATES):
+            if pred_a in lowered:
+                first[i] |= 1 << bit
+            if pred_b in lowered:
+                second[i] |= 1 << bit
+    return first, second
+
+
 class SimpleEmbedder:
     """Simple fallback embedder using bag-of-words."""
 
@@ -5,6 +5,12 @@ Per JARVIS_COMPLETION_PLAN_v3 Task 1.2: ローカル埋め込み
 """
 
 from jarvis_core.embeddings.bm25 import BM25Index
+from jarvis_core.embeddings.model_registry import (
+    EncodeService,
+    get_encode_service,
+    get_model_registry,
+    load_sentence_transformer,
+)
 from jarvis_core.embeddings.hybrid import FusionMethod, HybridSearch
 from jarvis_core.embeddings.sentence_transformer import (
     SentenceTransformerEmbedding,
@@ -37,4 +43,8 @@ __all__ = [
     "FusionMethod",
     "SPECTER2Embedding",
     "embedder",
+    "EncodeService",
+    "get_encode_service",
+    "get_model_registry",
+    "load_sentence_transformer",
 ]
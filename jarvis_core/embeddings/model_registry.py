@@ -0,0 +1,332 @@
+"""Process-wide embedding model registry and micro-batching encode service.
+
+Every ``SentenceTransformer`` in the process should come from
+``load_sentence_transformer`` so that each (model, device) pair is loaded
+once and shared.  Loading is serialised per key, so concurrent first calls
+wait for a single load instead of each reading the weights.
+
+``EncodeService`` sits in front of a shared model for request-at-a-time
+callers.  Concurrent ``encode`` calls from threads or async tasks are queued
+and coalesced by one worker thread into batches of up to ``max_batch_size``
+texts.  The worker waits at most ``max_wait_ms`` for a batch to fill.  Each
+batch is deduplicated and sorted by text length before chunking, so the
+padded batches the model sees hold texts of similar length.
+
+Example:
+    >>> service = get_encode_service("all-MiniLM-L6-v2")
+    >>> vector = service.encode("single query")        # shape (dim,)
+    >>> matrix = await service.aencode(["a", "b"])      # shape (2, dim)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_MS = 5.0
+
+ModelKey = tuple[str, str | None, tuple[tuple[str, Hashable], ...]]
+
+
+def _default_loader(model_name: str, **kwargs: Any) -> Any:
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name, **kwargs)
+
+
+@dataclass
+class _EncodeRequest:
+    texts: list[str]
+    options: tuple[tuple[str, Any], ...]
+    future: Future = field(default_factory=Future)
+
+
+class EncodeService:
+    """Coalesce concurrent ``encode`` calls on a shared model into batches.
+
+    Args:
+        model: Object with a ``SentenceTransformer``-style ``encode``.
+        max_batch_size: Largest number of texts sent to the model at once.
+            Requests at least this large skip the queue and encode directly.
+        max_wait_ms: How long the worker waits for a batch to fill.
+        name: Label used for the worker thread and log messages.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        name: str = "encode",
+    ):
+        self.model = model
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.name = name
+        self.requests = 0
+        self.batches = 0
+        self._queue: queue.Queue[_EncodeRequest | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, texts: str | list[str], **options: Any) -> Future:
+        """Queue ``texts`` for encoding and return a future for the result.
+
+        A single string resolves to a 1-D vector, a list to a 2-D matrix.
+        ``options`` are passed to ``model.encode``; only requests with equal
+        options share a batch.
+        """
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        request = _EncodeRequest(batch, tuple(sorted(options.items())))
+        if len(batch) >= self.max_batch_size or not batch:
+            self._run([request])
+        else:
+            self._ensure_worker()
+            self._queue.put(request)
+        if not single:
+            return request.future
+        outer: Future = Future()
+
+        def _unwrap(done: Future) -> None:
+            exc = done.exception()
+            if exc is not None:
+                outer.set_exception(exc)
+            else:
+                outer.set_result(done.result()[0])
+
+        request.future.add_done_callback(_unwrap)
+        return outer
+
+    def encode(self, texts: str | list[str], **options: Any) -> np.ndarray:
+        """Blocking encode through the batching queue."""
+        return self.submit(texts, **options).result()
+
+    async def aencode(self, texts: str | list[str], **options: Any) -> np.ndarray:
+        """Async encode; the event loop is never blocked by the model."""
+        return await asyncio.wrap_future(self.submit(texts, **options))
+
+    def close(self) -> None:
+        """Stop the worker after draining queued requests."""
+        with self._lock:
+            self._closed = True
+            worker = self._worker
+            self._worker = None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"EncodeService {self.name} is closed")
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._loop, name=f"{self.name}-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _loop(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            pending = [first]
+            size = len(first.texts)
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while size < self.max_batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                pending.append(item)
+                size += len(item.texts)
+            self._run(pending)
+            if stop:
+                return
+
+    def _run(self, requests: list[_EncodeRequest]) -> None:
+        groups: dict[tuple[tuple[str, Any], ...], list[_EncodeRequest]] = {}
+        for request in requests:
+            groups.setdefault(request.options, []).append(request)
+        for options, group in groups.items():
+            try:
+                self._encode_group(group, dict(options))
+            except Exception as exc:
+                for request in group:
+                    if not request.future.done():
+                        request.future.set_exception(exc)
+
+    def _encode_group(self, group: list[_EncodeRequest], options: dict[str, Any]) -> None:
+        unique: dict[str, int] = {}
+        for request in group:
+            for text in request.texts:
+                unique.setdefault(text, len(unique))
+        texts = list(unique)
+        # Length bucketing: similar-length texts share a padded batch.
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        vectors: np.ndarray | None = None
+        for start in range(0, len(order), self.max_batch_size):
+            chunk = order[start : start + self.max_batch_size]
+            encoded = np.asarray(
+                self.model.encode(
+                    [texts[i] for i in chunk],
+                    batch_size=len(chunk),
+                    convert_to_numpy=True,
+                    show_progress_bar=False,
+                    **options,
+                )
+            )
+            if vectors is None:
+                vectors = np.empty((len(texts),) + encoded.shape[1:], dtype=encoded.dtype)
+            vectors[chunk] = encoded
+            self.batches += 1
+        self.requests += len(group)
+        for request in group:
+            rows = [unique[text] for text in request.texts]
+            if vectors is None:
+                request.future.set_result(np.empty((0,), dtype=np.float32))
+            else:
+                request.future.set_result(vectors[rows])
+
+
+class ModelRegistry:
+    """Load each (model, device, options) once per process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._models: dict[ModelKey, Any] = {}
+        self._services: dict[ModelKey, EncodeService] = {}
+        self._loading: dict[ModelKey, threading.Lock] = {}
+
+    @staticmethod
+    def _key(model_name: str, device: str | None, kwargs: dict[str, Any]) -> ModelKey:
+        return (model_name, device, tuple(sorted((k, str(v)) for k, v in kwargs.items())))
+
+    def get(
+        self,
+        model_name: str,
+        device: str | None = None,
+        loader: Callable[..., Any] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Return the shared model, loading it on first use.
+
+        Raises whatever the loader raises (``ImportError`` when
+        sentence-transformers is missing); failed loads are not cached.
+        """
+        key = self._key(model_name, device, kwargs)
+        model = self._models.get(key)
+        if model is not None:
+            return model
+        with self._lock:
+            load_lock = self._loading.setdefault(key, threading.Lock())
+        with load_lock:
+            model = self._models.get(key)
+            if model is None:
+                if device is not None:
+                    kwargs["device"] = device
+                started = time.perf_counter()
+                model = (loader or _default_loader)(model_name, **kwargs)
+                logger.info(
+                    "Loaded embedding model %s (device=%s) in %.2fs",
+                    model_name,
+                    device,
+                    time.perf_counter() - started,
+                )
+                with self._lock:
+                    self._models[key] = model
+        return model
+
+    def get_encoder(
+        self,
+        model_name: str,
+        device: str | None = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        loader: Callable[..., Any] | None = None,
+        **kwargs: Any,
+    ) -> EncodeService:
+        """Return the shared ``EncodeService`` for a model."""
+        key = self._key(model_name, device, kwargs)
+        service = self._services.get(key)
+        if service is not None:
+            return service
+        model = self.get(model_name, device=device, loader=loader, **kwargs)
+        with self._lock:
+            service = self._services.get(key)
+            if service is None:
+                service = EncodeService(
+                    model,
+                    max_batch_size=max_batch_size,
+                    max_wait_ms=max_wait_ms,
+                    name=f"encode-{model_name}",
+                )
+                self._services[key] = service
+        return service
+
+    def loaded(self) -> list[ModelKey]:
+        with self._lock:
+            return list(self._models)
+
+    def clear(self) -> None:
+        """Drop all models and stop their services (mainly for tests)."""
+        with self._lock:
+            services = list(self._services.values())
+            self._services.clear()
+            self._models.clear()
+            self._loading.clear()
+        for service in services:
+            service.close()
+
+
+_REGISTRY = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide model registry."""
+    return _REGISTRY
+
+
+def load_sentence_transformer(model_name: str, device: str | None = None, **kwargs: Any) -> Any:
+    """Shared replacement for ``SentenceTransformer(model_name, device=..., **kwargs)``."""
+    return _REGISTRY.get(model_name, device=device, **kwargs)
+
+
+def get_encode_service(model_name: str, device: str | None = None, **kwargs: Any) -> EncodeService:
+    """Shared micro-batching encode service for ``model_name``."""
+    return _REGISTRY.get_encoder(model_name, device=device, **kwargs)
+
+
+__all__ = [
+    "EncodeService",
+    "ModelRegistry",
+    "get_encode_service",
+    "get_model_registry",
+    "load_sentence_transformer",
+]
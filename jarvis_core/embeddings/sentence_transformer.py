@@ -104,15 +104,13 @@ class SentenceTransformerEmbedding:
             return
 
         try:
-            from sentence_transformers import SentenceTransformer
+            from jarvis_core.embeddings.model_registry import load_sentence_transformer
 
             kwargs = {}
             if self._cache_dir:
                 kwargs["cache_folder"] = str(self._cache_dir)
-            if self._device:
-                kwargs["device"] = self._device
 
-            self._model = SentenceTransformer(self._model_name, **kwargs)
+            self._model = load_sentence_transformer(self._model_name, self._device, **kwargs)
             self._dimension = self._model.get_sentence_embedding_dimension()
             logger.info(
                 f"SentenceTransformerEmbedding initialized: {self._model_name}, "
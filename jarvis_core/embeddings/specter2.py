@@ -10,6 +10,8 @@ import logging
 
 import numpy as np
 
+from jarvis_core.embeddings.model_registry import load_sentence_transformer
+
 try:
     import transformers as transformers
 except Exception:  # pragma: no cover - compatibility for tests patching module attr
@@ -62,7 +64,7 @@ class SPECTER2Embedding:
         """Lazy load the model."""
         if self._model is None:
             try:
-                from sentence_transformers import SentenceTransformer
+                import sentence_transformers  # noqa: F401
             except ImportError:
                 raise ImportError(
                     "sentence-transformers is required for SPECTER2. "
@@ -79,7 +81,7 @@ class SPECTER2Embedding:
                     device = "cpu"
 
             logger.info(f"Loading SPECTER2 model on {device}...")
-            self._model = SentenceTransformer(self.MODEL_NAME, device=device)
+            self._model = load_sentence_transformer(self.MODEL_NAME, device=device)
             logger.info("SPECTER2 model loaded.")
 
         return self._model
@@ -10,7 +10,11 @@ This module provides:
 - Ensemble grading with confidence scores
 """
 
-from jarvis_core.evidence.ensemble import EnsembleClassifier, grade_evidence
+from jarvis_core.evidence.ensemble import (
+    EnsembleClassifier,
+    grade_evidence,
+    grade_evidence_batch,
+)
 from jarvis_core.evidence.llm_classifier import LLMBasedClassifier
 from jarvis_core.evidence.rule_classifier import RuleBasedClassifier
 from jarvis_core.evidence.schema import (
@@ -43,6 +47,7 @@ __all__ = [
     "LLMBasedClassifier",
     "EnsembleClassifier",
     "grade_evidence",
+    "grade_evidence_batch",
     "EVIDENCE_LEVEL_DESCRIPTIONS_EN",
     "Chunk",
     "EvidenceStore",
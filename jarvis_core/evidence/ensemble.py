@@ -7,8 +7,10 @@ Per JARVIS_COMPLETION_PLAN_v3 Task 2.1 Ensemble
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any
 
 from jarvis_core.evidence.llm_classifier import LLMBasedClassifier, LLMConfig
 from jarvis_core.evidence.rule_classifier import RuleBasedClassifier
@@ -19,6 +21,9 @@ from jarvis_core.evidence.schema import (
 
 logger = logging.getLogger(__name__)
 
+# Classifiers reused by grade_evidence, keyed by (strategy, use_llm)
+_CLASSIFIERS: dict[tuple[EnsembleStrategy, bool], EnsembleClassifier] = {}
+
 
 class EnsembleStrategy(Enum):
     """Strategy for combining classifier results."""
@@ -108,6 +113,42 @@ class EnsembleClassifier:
         # Combine results based on strategy
         return self._combine_results(rule_grade, llm_grade)
 
+    def classify_batch(
+        self,
+        papers: Iterable[Mapping[str, Any]],
+        jobs: int = 1,
+    ) -> list[EvidenceGrade]:
+        """Classify many papers with this classifier.
+
+        Rule-based grading runs through ``RuleBasedClassifier.classify_batch``
+        (parallel across ``jobs`` processes); LLM grading, when enabled, runs
+        in-process per paper.
+
+        Args:
+            papers: Dicts with optional ``title``, ``abstract``, ``full_text``
+            jobs: Worker processes for rule-based grading
+
+        Returns:
+            EvidenceGrade per paper, in input order
+        """
+        papers = list(papers)
+        rule_grades = self._rule_classifier.classify_batch(papers, jobs=jobs)
+
+        results = []
+        for paper, rule_grade in zip(papers, rule_grades):
+            llm_grade = None
+            if self._llm_classifier:
+                try:
+                    llm_grade = self._llm_classifier.classify(
+                        paper.get("title") or "",
+                        paper.get("abstract") or "",
+                        paper.get("full_text") or "",
+                    )
+                except Exception as e:
+                    logger.warning(f"LLM classification failed: {e}")
+            results.append(self._combine_results(rule_grade, llm_grade))
+        return results
+
     def _combine_results(
         self,
         rule_grade: EvidenceGrade,
@@ -306,10 +347,38 @@ def grade_evidence(
         >>> print(f"Evidence: {grade.level.description}")
         Evidence: 個別のRCT（狭い信頼区間）
     """
-    config = EnsembleConfig(
-        strategy=strategy,
-        use_llm=use_llm,
-    )
+    return _get_classifier(strategy, use_llm).classify(title, abstract, full_text)
 
-    classifier = EnsembleClassifier(config=config)
-    return classifier.classify(title, abstract, full_text)
+
+def grade_evidence_batch(
+    papers: Iterable[Mapping[str, Any]],
+    use_llm: bool = False,
+    strategy: EnsembleStrategy = EnsembleStrategy.WEIGHTED_AVERAGE,
+    jobs: int = 1,
+) -> list[EvidenceGrade]:
+    """Grade evidence levels for many papers with one shared classifier.
+
+    Args:
+        papers: Dicts with optional ``title``, ``abstract``, ``full_text``
+        use_llm: Whether to use LLM classifier
+        strategy: Ensemble strategy to use
+        jobs: Worker processes for rule-based grading
+
+    Returns:
+        EvidenceGrade per paper, in input order
+    """
+    return _get_classifier(strategy, use_llm).classify_batch(papers, jobs=jobs)
+
+
+def _get_classifier(strategy: EnsembleStrategy, use_llm: bool) -> EnsembleClassifier:
+    """Return the shared classifier for a strategy, building it once."""
+    key = (strategy, use_llm)
+    classifier = _CLASSIFIERS.get(key)
+    if classifier is None:
+        config = EnsembleConfig(
+            strategy=strategy,
+            use_llm=use_llm,
+        )
+        classifier = EnsembleClassifier(config=config)
+        _CLASSIFIERS[key] = classifier
+    return classifier
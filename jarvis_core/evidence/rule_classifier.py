@@ -8,8 +8,11 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from re import Pattern
+from typing import Any
 
 from jarvis_core.evidence.schema import (
     EvidenceGrade,
@@ -20,6 +23,50 @@ from jarvis_core.evidence.schema import (
 
 logger = logging.getLogger(__name__)
 
+_WORKER_CLASSIFIER: RuleBasedClassifier | None = None
+_REGEX_META = set("\\[](){}?*+|^$.")
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Leading literal of a ``\\b``-anchored pattern, lowercased.
+
+    A top-level alternation has no single required literal, so it yields ``""``
+    and the pattern is always searched.
+    """
+    if _has_top_level_alternation(pattern):
+        return ""
+    body = pattern[2:] if pattern.startswith("\\b") else pattern
+    prefix: list[str] = []
+    for ch in body:
+        if ch in _REGEX_META:
+            # A quantifier makes the preceding character optional
+            if ch in "?*{" and prefix:
+                prefix.pop()
+            break
+        prefix.append(ch)
+    return "".join(prefix).lower()
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    depth = 0
+    in_class = escaped = False
+    for ch in pattern:
+        if escaped:
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return True
+    return False
+
 
 @dataclass
 class ClassificationPattern:
@@ -50,6 +97,7 @@ class RuleBasedClassifier:
     def __init__(self) -> None:
         """Initialize the classifier with patterns."""
         self._patterns = self._build_patterns()
+        self._matcher = self._compile_matcher(self._patterns)
         self._sample_size_pattern = re.compile(
             r"(?:n\s*=\s*|sample\s+(?:size|of)\s*(?:was\s+)?|"
             r"(?:included|enrolled|recruited)\s+)(\d+(?:,\d+)?)",
@@ -183,6 +231,37 @@ class RuleBasedClassifier:
             ),
         ]
 
+    @staticmethod
+    def _compile_matcher(
+        patterns: list[ClassificationPattern],
+    ) -> list[tuple[str, list[tuple[int, Pattern]]]]:
+        """Group all study-type patterns under literal trigger words.
+
+        Every pattern starts with a literal word (``meta``, ``randomized``,
+        ``case``...) that must occur in the lowercased text for the regex to
+        match. Classification checks each distinct trigger once with a
+        substring test and only runs the regexes behind triggers that hit.
+        Patterns with a top-level ``|`` share the empty trigger, which always
+        hits.
+        """
+        by_trigger: dict[str, list[tuple[int, Pattern]]] = {}
+        for ci, config in enumerate(patterns):
+            for pattern in config.patterns:
+                by_trigger.setdefault(_literal_prefix(pattern.pattern), []).append((ci, pattern))
+        return list(by_trigger.items())
+
+    def _match_configs(self, text: str) -> set[int]:
+        """Return indices of pattern configs with at least one hit in ``text``."""
+        lowered = text.lower()
+        hits: set[int] = set()
+        for trigger, candidates in self._matcher:
+            if trigger not in lowered:
+                continue
+            for ci, pattern in candidates:
+                if ci not in hits and pattern.search(text):
+                    hits.add(ci)
+        return hits
+
     def classify(
         self,
         title: str = "",
@@ -205,19 +284,14 @@ class RuleBasedClassifier:
         if not combined_text:
             return EvidenceGrade.unknown()
 
-        # Find matching patterns
-        matches: list[tuple[StudyType, float]] = []
-
-        for pattern_config in self._patterns:
-            for pattern in pattern_config.patterns:
-                if pattern.search(combined_text):
-                    matches.append(
-                        (
-                            pattern_config.study_type,
-                            pattern_config.weight,
-                        )
-                    )
-                    break  # Only count each pattern config once
+        # Substring-check each trigger word, then run only the regexes behind
+        # the triggers that occur; each config counts once
+        hits = self._match_configs(combined_text)
+        matches: list[tuple[StudyType, float]] = [
+            (config.study_type, config.weight)
+            for ci, config in enumerate(self._patterns)
+            if ci in hits
+        ]
 
         if not matches:
             return EvidenceGrade(
@@ -256,6 +330,32 @@ class RuleBasedClassifier:
             raw_scores=raw_scores,
         )
 
+    def classify_batch(
+        self,
+        papers: Iterable[Mapping[str, Any]],
+        jobs: int = 1,
+        chunksize: int = 256,
+    ) -> list[EvidenceGrade]:
+        """Classify many papers, reusing this classifier's compiled matcher.
+
+        Args:
+            papers: Dicts with optional ``title``, ``abstract``, ``full_text``
+            jobs: Worker processes; 1 classifies in-process
+            chunksize: Papers sent to a worker per task when ``jobs > 1``
+
+        Returns:
+            EvidenceGrade per paper, in input order
+        """
+        items = [
+            (p.get("title") or "", p.get("abstract") or "", p.get("full_text") or "")
+            for p in papers
+        ]
+        if jobs <= 1 or len(items) <= chunksize:
+            return [self.classify(*item) for item in items]
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+            return list(pool.map(_classify_worker, items, chunksize=chunksize))
+
     def _extract_sample_size(self, text: str) -> int | None:
         """Extract sample size from text."""
         match = self._sample_size_pattern.search(text)
@@ -346,3 +446,17 @@ class RuleBasedClassifier:
             if match:
                 return match.group(1).strip()
         return None
+
+
+def _init_worker() -> RuleBasedClassifier:
+    """Build one classifier per worker process."""
+    global _WORKER_CLASSIFIER
+    _WORKER_CLASSIFIER = RuleBasedClassifier()
+    return _WORKER_CLASSIFIER
+
+
+def _classify_worker(item: tuple[str, str, str]) -> EvidenceGrade:
+    classifier = _WORKER_CLASSIFIER
+    if classifier is None:
+        classifier = _init_worker()
+    return classifier.classify(*item)
@@ -3,9 +3,13 @@
 import hashlib
 import math
 import re
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from jarvis_core.analysis.graph_analytics import GraphAnalytics
+
 
 # ============================================
 # 1. GRAPHRAG ENGINE
@@ -31,47 +35,75 @@ class GraphEdge:
 
 
 class GraphRAGEngine:
-    """Knowledge Graph + RAG unified engine."""
+    """Knowledge Graph + RAG unified engine.
+
+    ``analytics`` is the integer-id graph core: edge ``i`` of ``edges`` is edge
+    ``i`` of the analytics buffers, whose incident-edge index (CSR snapshot plus
+    append buffers) serves traversal and subgraph extraction in O(degree).
+    ``edges_by_type`` partitions edge positions by relationship type.
+    """
 
     def __init__(self):
         self.nodes: dict[str, GraphNode] = {}
         self.edges: list[GraphEdge] = []
+        self.edges_by_type: dict[str, list[int]] = defaultdict(list)
         self.adjacency: dict[str, list[str]] = defaultdict(list)
         self.reverse_adjacency: dict[str, list[str]] = defaultdict(list)
+        self.analytics = GraphAnalytics()
 
     def add_node(self, node: GraphNode):
         """Add node to graph."""
         self.nodes[node.id] = node
+        self.analytics.add_node(node.id)
 
     def add_edge(self, edge: GraphEdge):
         """Add edge to graph."""
+        self.edges_by_type[edge.type].append(len(self.edges))
         self.edges.append(edge)
         self.adjacency[edge.source].append(edge.target)
         self.reverse_adjacency[edge.target].append(edge.source)
+        self.analytics.add_edge(edge.source, edge.target, edge.weight, edge.type)
 
-    def multi_hop_query(self, start_id: str, hops: int = 2) -> list[GraphNode]:
+    def get_edges(self, edge_type: str) -> list[GraphEdge]:
+        """Return all edges of one relationship type in insertion order."""
+        return [self.edges[i] for i in self.edges_by_type.get(edge_type, [])]
+
+    def multi_hop_query(
+        self, start_id: str, hops: int = 2, edge_types: list[str] | None = None
+    ) -> list[GraphNode]:
         """Multi-hop graph traversal for reasoning.
 
+        Each hop expands the whole frontier at once through the incident-edge
+        index, so the cost is proportional to the edges actually traversed.
+
         Args:
             start_id: Starting node ID
             hops: Number of hops
+            edge_types: Follow only edges of these types (default: all)
 
         Returns:
-            List of reachable nodes
+            List of reachable nodes, ordered by hop
         """
-        visited = set()
-        current_level = {start_id}
+        analytics = self.analytics
+        start = analytics.index_of(start_id)
+        if start is None:
+            return []
+
+        visited = np.zeros(analytics.num_nodes, dtype=bool)
+        frontier = np.array([start], dtype=np.int64)
+        reached: list[int] = []
 
         for _ in range(hops):
-            next_level = set()
-            for node_id in current_level:
-                for neighbor in self.adjacency.get(node_id, []):
-                    if neighbor not in visited:
-                        next_level.add(neighbor)
-                        visited.add(neighbor)
-            current_level = next_level
+            if len(frontier) == 0:
+                break
+            _, neighbors = analytics.incident(frontier, "out", labels=edge_types)
+            neighbors = np.unique(neighbors)
+            frontier = neighbors[~visited[neighbors]]
+            visited[frontier] = True
+            reached.extend(frontier.tolist())
 
-        return [self.nodes[nid] for nid in visited if nid in self.nodes]
+        node_ids = analytics.node_ids
+        return [self.nodes[node_ids[i]] for i in reached if node_ids[i] in self.nodes]
 
     def find_path(self, source: str, target: str, max_depth: int = 5) -> list[str] | None:
         """Find path between two nodes (BFS).
@@ -87,30 +119,57 @@ class GraphRAGEngine:
         if source not in self.nodes or target not in self.nodes:
             return None
 
-        queue = [(source, [source])]
-        visited = {source}
+        parents: dict[str, str | None] = {source: None}
+        queue = deque([(source, 1)])
 
         while queue:
-            current, path = queue.pop(0)
-            if len(path) > max_depth:
+            current, length = queue.popleft()
+            if length > max_depth:
                 continue
 
             if current == target:
-                return path
+                path = [current]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                return path[::-1]
 
             for neighbor in self.adjacency.get(current, []):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
+                if neighbor not in parents:
+                    parents[neighbor] = current
+                    queue.append((neighbor, length + 1))
 
         return None
 
-    def get_subgraph(self, node_ids: list[str]) -> tuple[list[GraphNode], list[GraphEdge]]:
-        """Extract subgraph containing specified nodes."""
+    def get_subgraph(
+        self, node_ids: list[str], edge_types: list[str] | None = None
+    ) -> tuple[list[GraphNode], list[GraphEdge]]:
+        """Extract subgraph containing specified nodes.
+
+        Only the out-edges of the requested nodes are inspected, never the
+        full edge list.
+
+        Args:
+            node_ids: Node IDs to keep
+            edge_types: Keep only edges of these types (default: all)
+
+        Returns:
+            (nodes, edges) with edges in insertion order
+        """
         nodes = [self.nodes[nid] for nid in node_ids if nid in self.nodes]
-        node_set = set(node_ids)
-        edges = [e for e in self.edges if e.source in node_set and e.target in node_set]
-        return nodes, edges
+        analytics = self.analytics
+        rows = np.unique(
+            np.array(
+                [i for i in map(analytics.index_of, node_ids) if i is not None], dtype=np.int64
+            )
+        )
+        if len(rows) == 0:
+            return nodes, []
+
+        member = np.zeros(analytics.num_nodes, dtype=bool)
+        member[rows] = True
+        edge_ids, targets = analytics.incident(rows, "out", labels=edge_types)
+        edge_ids = np.sort(edge_ids[member[targets]])
+        return nodes, [self.edges[i] for i in edge_ids.tolist()]
 
 
 # ============================================
@@ -276,8 +335,196 @@ class CorrectiveRAG:
 # ============================================
 # 4. REAL-TIME PAPER STREAM
 # ============================================
+class AhoCorasick:
+    """Aho-Corasick automaton reporting which patterns occur in a text.
+
+    Patterns are reference-counted so callers can add and remove them
+    incrementally; the automaton is rebuilt lazily on the first search after
+    the pattern set changed.
+    """
+
+    def __init__(self):
+        self._refs: dict[str, int] = {}
+        self._dirty = False
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[str | None] = [None]
+        self._link: list[int] = [0]
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __contains__(self, pattern: str) -> bool:
+        return pattern in self._refs
+
+    def add(self, pattern: str):
+        """Add a (non-empty) pattern, or bump its reference count."""
+        if not pattern:
+            raise ValueError("Pattern must be non-empty")
+        count = self._refs.get(pattern, 0)
+        self._refs[pattern] = count + 1
+        if count == 0:
+            self._dirty = True
+
+    def discard(self, pattern: str):
+        """Drop one reference to a pattern; it is removed at zero."""
+        count = self._refs.get(pattern, 0)
+        if count > 1:
+            self._refs[pattern] = count - 1
+        elif count == 1:
+            del self._refs[pattern]
+            self._dirty = True
+
+    def _build(self):
+        goto: list[dict[str, int]] = [{}]
+        out: list[str | None] = [None]
+        for pattern in self._refs:
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append(None)
+                node = nxt
+            out[node] = pattern
+
+        # Breadth-first failure links; ``link`` jumps to the nearest proper
+        # suffix state that ends a pattern (0 when there is none).
+        fail = [0] * len(goto)
+        link = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0) if node else 0
+                target = fail[child]
+                link[child] = target if out[target] is not None else link[target]
+                queue.append(child)
+
+        self._goto, self._fail, self._out, self._link = goto, fail, out, link
+        self._dirty = False
+
+    def search(self, text: str) -> set[str]:
+        """Return the set of patterns occurring in ``text`` (single pass)."""
+        if self._dirty:
+            self._build()
+        goto, fail, out, link = self._goto, self._fail, self._out, self._link
+        found: set[str] = set()
+        emitted: set[int] = set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            match = node if out[node] is not None else link[node]
+            # A state's suffix chain is fixed, so stop at the first emitted one.
+            while match and match not in emitted:
+                emitted.add(match)
+                found.add(out[match])
+                match = link[match]
+        return found
+
+
+def _normalize_author(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+def _split_authors(authors) -> list[str]:
+    if not authors:
+        return []
+    if isinstance(authors, str):
+        authors = re.split(r"[,;]", authors)
+    return [name for name in (_normalize_author(str(a)) for a in authors) if name]
+
+
+class SubscriptionIndex:
+    """Compiled index over saved-search subscriptions.
+
+    All lower-cased keywords share one Aho-Corasick automaton and author
+    names live in a hash index, so a paper is matched against every
+    subscription in a single pass over its text.  A paper author is looked
+    up by full name and by surname (last token).
+    """
+
+    # Keeps a keyword from matching across the title/abstract boundary.
+    _SEPARATOR = "\x00"
+
+    def __init__(self):
+        self._automaton = AhoCorasick()
+        self._keyword_subs: dict[str, set[int]] = defaultdict(set)
+        self._author_subs: dict[str, set[int]] = defaultdict(set)
+        self._match_all: set[int] = set()
+        self._subscriptions: dict[int, tuple[set[str], set[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    def add(self, sub_id: int, keywords: list[str], authors: list[str] = None):
+        """Register (or replace) a subscription."""
+        self.remove(sub_id)
+        keyword_set = {kw.lower() for kw in keywords or []}
+        author_set = set(_split_authors(authors or []))
+        self._subscriptions[sub_id] = (keyword_set, author_set)
+
+        for kw in keyword_set:
+            if not kw:
+                # An empty keyword is a substring of everything.
+                self._match_all.add(sub_id)
+                continue
+            self._automaton.add(kw)
+            self._keyword_subs[kw].add(sub_id)
+        for author in author_set:
+            self._author_subs[author].add(sub_id)
+
+    def remove(self, sub_id: int) -> bool:
+        """Unregister a subscription. Returns False if it was unknown."""
+        entry = self._subscriptions.pop(sub_id, None)
+        if entry is None:
+            return False
+        keyword_set, author_set = entry
+        self._match_all.discard(sub_id)
+        for kw in keyword_set:
+            subs = self._keyword_subs.get(kw)
+            if subs is not None:
+                subs.discard(sub_id)
+                if not subs:
+                    del self._keyword_subs[kw]
+                self._automaton.discard(kw)
+        for author in author_set:
+            subs = self._author_subs[author]
+            subs.discard(sub_id)
+            if not subs:
+                del self._author_subs[author]
+        return True
+
+    def match(self, title: str, abstract: str = "", authors=None) -> set[int]:
+        """Return IDs of subscriptions matching a paper."""
+        matched = set(self._match_all)
+        if self._keyword_subs:
+            text = f"{title or ''}{self._SEPARATOR}{abstract or ''}".lower()
+            for kw in self._automaton.search(text):
+                matched |= self._keyword_subs[kw]
+        if self._author_subs:
+            for author in _split_authors(authors):
+                matched |= self._author_subs.get(author, set())
+                # A surname-only subscription ("Smith") matches "John Smith".
+                surname = author.rsplit(" ", 1)[-1]
+                if surname != author:
+                    matched |= self._author_subs.get(surname, set())
+        return matched
+
+
 class PaperStreamMonitor:
-    """Real-time paper feed monitoring."""
+    """Real-time paper feed monitoring.
+
+    Filters are compiled into a ``SubscriptionIndex``; ``hit_counts`` tracks
+    how many processed papers each filter matched.
+    """
 
     SOURCES = {
         "arxiv": "http://export.arxiv.org/api/query",
@@ -289,30 +536,51 @@ class PaperStreamMonitor:
         self.filters: list[dict] = []
         self.seen_ids: set[str] = set()
         self.callbacks: list[callable] = []
+        self.hit_counts: dict[int, int] = {}
+        self._index = SubscriptionIndex()
+        self._next_filter_id = 0
 
     def add_filter(
         self, keywords: list[str], authors: list[str] = None, journals: list[str] = None
-    ):
-        """Add monitoring filter."""
+    ) -> int:
+        """Add monitoring filter. Returns its filter ID."""
+        filter_id = self._next_filter_id
+        self._next_filter_id += 1
         self.filters.append(
-            {"keywords": keywords, "authors": authors or [], "journals": journals or []}
+            {
+                "id": filter_id,
+                "keywords": keywords,
+                "authors": authors or [],
+                "journals": journals or [],
+            }
+        )
+        self._index.add(filter_id, keywords, authors or [])
+        self.hit_counts[filter_id] = 0
+        return filter_id
+
+    def remove_filter(self, filter_id: int) -> bool:
+        """Remove a monitoring filter. Returns False if it was unknown."""
+        if not self._index.remove(filter_id):
+            return False
+        self.filters = [f for f in self.filters if f["id"] != filter_id]
+        self.hit_counts.pop(filter_id, None)
+        return True
+
+    def match_filters(self, paper: dict) -> list[int]:
+        """Return IDs of all filters matching a paper.
+
+        Keywords are case-insensitive substrings of the title or abstract;
+        authors match whole (case-insensitive) names or surnames in the
+        author list.
+        """
+        matched = self._index.match(
+            paper.get("title") or "", paper.get("abstract") or "", paper.get("authors")
         )
+        return sorted(matched)
 
     def check_match(self, paper: dict) -> bool:
         """Check if paper matches any filter."""
-        title = paper.get("title", "").lower()
-        abstract = paper.get("abstract", "").lower()
-        authors = paper.get("authors", "").lower()
-
-        for f in self.filters:
-            # Keyword match
-            if any(kw.lower() in title or kw.lower() in abstract for kw in f["keywords"]):
-                return True
-            # Author match
-            if any(a.lower() in authors for a in f["authors"]):
-                return True
-
-        return False
+        return bool(self.match_filters(paper))
 
     def process_new_papers(self, papers: list[dict]) -> list[dict]:
         """Process and filter new papers."""
@@ -322,7 +590,10 @@ class PaperStreamMonitor:
             paper_id = paper.get("id") or paper.get("pmid") or paper.get("arxiv_id")
             if paper_id and paper_id not in self.seen_ids:
                 self.seen_ids.add(paper_id)
-                if self.check_match(paper):
+                matched = self.match_filters(paper)
+                if matched:
+                    for filter_id in matched:
+                        self.hit_counts[filter_id] += 1
                     new_matches.append(paper)
 
         return new_matches
@@ -413,46 +684,41 @@ class CitationNetworkAnalyzer:
     def __init__(self, graph: GraphRAGEngine = None):
         self.graph = graph or GraphRAGEngine()
 
-    def calculate_pagerank(self, damping: float = 0.85, iterations: int = 20) -> dict[str, float]:
-        """Calculate PageRank for papers."""
-        nodes = [n for n in self.graph.nodes.values() if n.type == "paper"]
-        n = len(nodes)
-        if n == 0:
-            return {}
-
-        # Initialize scores
-        scores = {node.id: 1 / n for node in nodes}
-
-        for _ in range(iterations):
-            new_scores = {}
-            for node in nodes:
-                incoming = self.graph.reverse_adjacency.get(node.id, [])
-                rank = (1 - damping) / n
-                for source in incoming:
-                    outgoing_count = len(self.graph.adjacency.get(source, []))
-                    if outgoing_count > 0:
-                        rank += damping * scores.get(source, 0) / outgoing_count
-                new_scores[node.id] = rank
-            scores = new_scores
-
-        return scores
+    def calculate_pagerank(
+        self, damping: float = 0.85, iterations: int = 100, tol: float = 1.0e-6
+    ) -> dict[str, float]:
+        """Calculate PageRank for papers.
+
+        Ranks the subgraph induced by paper nodes only; authors, concepts and
+        other node types neither receive nor pass on score.  Scores come from
+        the graph's shared CSR analytics, so repeated calls are memoized until
+        an edge or node is added.
+        """
+        analytics = self.graph.analytics
+        paper_idx = self._paper_indices()
+        scores = analytics.pagerank(damping, tol=tol, max_iter=iterations, nodes=paper_idx)
+        return {analytics.node_ids[i]: float(scores[i]) for i in paper_idx}
+
+    def _paper_indices(self) -> list[int]:
+        index = self.graph.analytics.node_index
+        return [index[node.id] for node in self.graph.nodes.values() if node.type == "paper"]
 
     def find_influential_papers(self, top_n: int = 10) -> list[dict]:
         """Find most influential papers."""
-        rankings = self.calculate_pagerank()
-        sorted_papers = sorted(rankings.items(), key=lambda x: x[1], reverse=True)
+        analytics = self.graph.analytics
+        paper_idx = self._paper_indices()
+        scores = analytics.pagerank(nodes=paper_idx)
 
         results = []
-        for paper_id, score in sorted_papers[:top_n]:
-            if paper_id in self.graph.nodes:
-                node = self.graph.nodes[paper_id]
-                results.append(
-                    {
-                        "id": paper_id,
-                        "title": node.properties.get("title", "Unknown"),
-                        "influence_score": round(score * 1000, 2),
-                    }
-                )
+        for paper_id, score in analytics.top_k(scores, top_n, candidates=paper_idx):
+            node = self.graph.nodes[paper_id]
+            results.append(
+                {
+                    "id": paper_id,
+                    "title": node.properties.get("title", "Unknown"),
+                    "influence_score": round(score * 1000, 2),
+                }
+            )
 
         return results
 
@@ -481,10 +747,27 @@ class CitationNetworkAnalyzer:
 # 7. SEMANTIC PAPER CLUSTERING
 # ============================================
 class SemanticClustering:
-    """Embedding-based paper clustering."""
+    """Embedding-based paper clustering.
 
-    def __init__(self):
-        self.embeddings: dict[str, list[float]] = {}
+    Embeddings live in one contiguous, L2-normalised float32 matrix (grown by
+    doubling), so similarity search and k-means are NumPy batch operations.
+    """
+
+    def __init__(self, dim: int = 64):
+        self.dim = dim
+        self.paper_ids: list[str] = []
+        self._row: dict[str, int] = {}
+        self._matrix = np.zeros((16, dim), dtype=np.float32)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Normalised embeddings, one row per entry of ``paper_ids``."""
+        return self._matrix[: len(self.paper_ids)]
+
+    @property
+    def embeddings(self) -> dict[str, list[float]]:
+        """Embeddings keyed by paper ID."""
+        return dict(zip(self.paper_ids, self.matrix.tolist()))
 
     def simple_embed(self, text: str, dim: int = 64) -> list[float]:
         """Simple TF-based embedding (placeholder for real embeddings)."""
@@ -500,51 +783,78 @@ class SemanticClustering:
 
     def add_paper(self, paper_id: str, text: str):
         """Add paper embedding."""
-        self.embeddings[paper_id] = self.simple_embed(text)
+        self.add_embedding(paper_id, self.simple_embed(text, self.dim))
+
+    def add_embedding(self, paper_id: str, vector):
+        """Add (or replace) a precomputed embedding."""
+        vec = np.asarray(vector, dtype=np.float32).ravel()
+        if vec.shape[0] != self.dim:
+            raise ValueError(f"Expected embedding of dim {self.dim}, got {vec.shape[0]}")
+        norm = float(np.linalg.norm(vec))
+        row = self._row.get(paper_id)
+        if row is None:
+            row = len(self.paper_ids)
+            if row == self._matrix.shape[0]:
+                grown = np.zeros((2 * row, self.dim), dtype=np.float32)
+                grown[:row] = self._matrix
+                self._matrix = grown
+            self._row[paper_id] = row
+            self.paper_ids.append(paper_id)
+        self._matrix[row] = vec / norm if norm else vec
 
     def cosine_similarity(self, vec1: list[float], vec2: list[float]) -> float:
         """Calculate cosine similarity."""
-        dot = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = math.sqrt(sum(a * a for a in vec1))
-        norm2 = math.sqrt(sum(b * b for b in vec2))
-        return dot / (norm1 * norm2) if norm1 and norm2 else 0
+        a = np.asarray(vec1, dtype=np.float64)
+        b = np.asarray(vec2, dtype=np.float64)
+        norm1 = float(np.linalg.norm(a))
+        norm2 = float(np.linalg.norm(b))
+        return float(a @ b) / (norm1 * norm2) if norm1 and norm2 else 0
 
     def find_similar(self, paper_id: str, top_n: int = 5) -> list[tuple[str, float]]:
         """Find similar papers."""
-        if paper_id not in self.embeddings:
+        row = self._row.get(paper_id)
+        if row is None or top_n <= 0:
             return []
 
-        target = self.embeddings[paper_id]
-        similarities = []
-
-        for other_id, embedding in self.embeddings.items():
-            if other_id != paper_id:
-                sim = self.cosine_similarity(target, embedding)
-                similarities.append((other_id, sim))
-
-        return sorted(similarities, key=lambda x: x[1], reverse=True)[:top_n]
+        matrix = self.matrix
+        sims = matrix @ matrix[row]
+        candidates = np.delete(np.arange(len(sims)), row)
+        values = sims[candidates]
+        if top_n < len(candidates):
+            part = np.argpartition(-values, top_n - 1)[:top_n]
+        else:
+            part = np.arange(len(candidates))
+        ordered = candidates[part[np.lexsort((candidates[part], -values[part]))]]
+        return [(self.paper_ids[i], float(sims[i])) for i in ordered]
 
-    def cluster_papers(self, n_clusters: int = 5) -> dict[int, list[str]]:
-        """Simple k-means-like clustering."""
-        if len(self.embeddings) < n_clusters:
-            return {0: list(self.embeddings.keys())}
+    def cluster_papers(self, n_clusters: int = 5, max_iter: int = 10) -> dict[int, list[str]]:
+        """Spherical k-means clustering.
 
-        # Initialize centroids randomly (first n papers)
-        paper_ids = list(self.embeddings.keys())
-        centroids = [self.embeddings[paper_ids[i]] for i in range(n_clusters)]
+        Centroids start from the first ``n_clusters`` papers; each iteration
+        assigns every paper to its most similar centroid with one matrix
+        product and re-centres on the normalised cluster means, stopping once
+        assignments no longer change.
+        """
+        if len(self.paper_ids) < n_clusters or n_clusters <= 1:
+            return {0: list(self.paper_ids)}
+
+        matrix = self.matrix
+        centroids = matrix[:n_clusters].copy()
+        labels = None
+        for _ in range(max(1, max_iter)):
+            new_labels = np.argmax(matrix @ centroids.T, axis=1)
+            if labels is not None and np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, matrix)
+            norms = np.linalg.norm(sums, axis=1)
+            filled = norms > 0  # empty clusters keep their previous centroid
+            centroids[filled] = sums[filled] / norms[filled, None]
 
-        # Assign papers to clusters
         clusters = defaultdict(list)
-        for paper_id, embedding in self.embeddings.items():
-            best_cluster = 0
-            best_sim = -1
-            for i, centroid in enumerate(centroids):
-                sim = self.cosine_similarity(embedding, centroid)
-                if sim > best_sim:
-                    best_sim = sim
-                    best_cluster = i
-            clusters[best_cluster].append(paper_id)
-
+        for paper_id, label in zip(self.paper_ids, labels.tolist()):
+            clusters[label].append(paper_id)
         return dict(clusters)
 
 
@@ -1,20 +1,83 @@
-"""Run-scoped queue persistence for harvest."""
+"""Run-scoped queue persistence for harvest.
+
+Items live in a SQLite database (WAL mode) next to the legacy
+``queue.jsonl`` path, so every state change is a single-row update instead
+of a rewrite of the whole file.  Workers ``lease`` items for a visibility
+timeout and ``ack`` or ``retry`` them; a lease that is not acknowledged in
+time (e.g. the worker crashed) makes the item available again.  Items are
+deduplicated on ``paper_key``.  An existing ``queue.jsonl`` is imported once.
+"""
 
 from __future__ import annotations
 
 import json
+import logging
+import sqlite3
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_VISIBILITY_TIMEOUT = 300.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+QUEUED = "queued"
+LEASED = "leased"
+DONE = "done"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+# Columns managed by the queue; everything else round-trips via ``payload``.
+_STATE_FIELDS = ("status", "queued_at", "reason", "attempts")
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
 
 class HarvestQueue:
     def __init__(self, queue_path: Path):
-        self.queue_path = queue_path
+        self.queue_path = Path(queue_path)
         self.queue_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.queue_path.with_suffix(".sqlite")
+        self._local = threading.local()
+        self._init_db()
 
-    def load(self) -> list[dict]:
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " paper_key TEXT NOT NULL UNIQUE,"
+            " status TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " reason TEXT,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " lease_owner TEXT,"
+            " lease_expires REAL,"
+            " queued_at TEXT,"
+            " updated_at TEXT)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_items_status ON items(status, id)")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._import_legacy(conn)
+
+    def _import_legacy(self, conn: sqlite3.Connection) -> None:
         if not self.queue_path.exists():
-            return []
+            return
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone():
+            return
         rows: list[dict] = []
         for line in self.queue_path.read_text(encoding="utf-8").splitlines():
             if not line.strip():
@@ -25,29 +88,196 @@ class HarvestQueue:
                 continue
             if isinstance(row, dict):
                 rows.append(row)
-        return rows
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._upsert(conn, rows)
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('legacy_imported', '1')")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _to_row(record: tuple) -> dict:
+        payload, status, reason, attempts, queued_at = record
+        row = json.loads(payload)
+        row["status"] = status
+        row["queued_at"] = queued_at
+        if reason is not None:
+            row["reason"] = reason
+        if attempts:
+            row["attempts"] = attempts
+        return row
+
+    # ------------------------------------------------------------------
+    # Bulk access (compatible with the JSONL queue)
+    # ------------------------------------------------------------------
+
+    def load(self) -> list[dict]:
+        records = self._connect().execute(
+            "SELECT payload, status, reason, attempts, queued_at FROM items ORDER BY id"
+        )
+        return [self._to_row(record) for record in records]
 
     def save(self, rows: list[dict]) -> None:
-        data = "\n".join(json.dumps(row, ensure_ascii=False) for row in rows) + (
-            "\n" if rows else ""
+        """Upsert ``rows`` by ``paper_key`` (rows without a key are ignored)."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._upsert(conn, rows)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _upsert(self, conn: sqlite3.Connection, rows: list[dict]) -> None:
+        now = _now_iso()
+        params = []
+        for row in rows:
+            key = str(row.get("paper_key", "")).strip()
+            if not key:
+                continue
+            payload = {k: v for k, v in row.items() if k not in _STATE_FIELDS}
+            params.append(
+                (
+                    key,
+                    str(row.get("status") or QUEUED),
+                    json.dumps(payload, ensure_ascii=False),
+                    row.get("reason"),
+                    int(row.get("attempts") or 0),
+                    row.get("queued_at") or now,
+                    now,
+                )
+            )
+        conn.executemany(
+            "INSERT INTO items (paper_key, status, payload, reason, attempts, queued_at, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT(paper_key) DO UPDATE SET status = excluded.status,"
+            " payload = excluded.payload, reason = excluded.reason,"
+            " attempts = excluded.attempts, updated_at = excluded.updated_at,"
+            " lease_owner = NULL, lease_expires = NULL",
+            params,
         )
-        self.queue_path.write_text(data, encoding="utf-8")
 
     def enqueue_many(self, items: list[dict]) -> int:
-        rows = self.load()
-        existing = {str(r.get("paper_key", "")) for r in rows}
-        added = 0
+        now = _now_iso()
+        params = []
         for item in items:
             key = str(item.get("paper_key", "")).strip()
-            if not key or key in existing:
+            if not key:
                 continue
-            row = {
-                **item,
-                "status": "queued",
-                "queued_at": datetime.now(timezone.utc).isoformat(),
-            }
-            rows.append(row)
-            existing.add(key)
-            added += 1
-        self.save(rows)
-        return added
+            payload = {k: v for k, v in item.items() if k not in _STATE_FIELDS}
+            params.append((key, QUEUED, json.dumps(payload, ensure_ascii=False), now, now))
+        conn = self._connect()
+        before = conn.total_changes
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO items (paper_key, status, payload, queued_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                params,
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return conn.total_changes - before
+
+    # ------------------------------------------------------------------
+    # Lease / ack / retry
+    # ------------------------------------------------------------------
+
+    def lease(
+        self,
+        owner: str,
+        limit: int = 1,
+        visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+    ) -> list[dict]:
+        """Atomically claim up to ``limit`` queued (or expired) items for ``owner``."""
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            ids = [
+                r[0]
+                for r in conn.execute(
+                    "SELECT id FROM items WHERE status = ?"
+                    " OR (status = ? AND lease_expires < ?) ORDER BY id LIMIT ?",
+                    (QUEUED, LEASED, now, max(0, int(limit))),
+                )
+            ]
+            conn.executemany(
+                "UPDATE items SET status = ?, lease_owner = ?, lease_expires = ?,"
+                " attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                [(LEASED, owner, now + visibility_timeout, _now_iso(), i) for i in ids],
+            )
+            records = [
+                conn.execute(
+                    "SELECT payload, status, reason, attempts, queued_at FROM items WHERE id = ?",
+                    (i,),
+                ).fetchone()
+                for i in ids
+            ]
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return [self._to_row(record) for record in records]
+
+    def ack(
+        self,
+        paper_key: str,
+        status: str = DONE,
+        reason: str | None = None,
+        owner: str | None = None,
+    ) -> bool:
+        """Finish a leased item with ``status``; returns False if the lease was lost."""
+        sql = (
+            "UPDATE items SET status = ?, reason = ?, lease_owner = NULL, lease_expires = NULL,"
+            " updated_at = ? WHERE paper_key = ? AND status = ?"
+        )
+        params: list = [status, reason, _now_iso(), paper_key, LEASED]
+        if owner is not None:
+            sql += " AND lease_owner = ?"
+            params.append(owner)
+        return self._connect().execute(sql, params).rowcount == 1
+
+    def retry(
+        self,
+        paper_key: str,
+        reason: str | None = None,
+        owner: str | None = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> str | None:
+        """Return a leased item to the queue, or fail it after ``max_attempts``.
+
+        Returns the new status, or None if the lease was lost.
+        """
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT attempts FROM items WHERE paper_key = ? AND status = ?", (paper_key, LEASED)
+        ).fetchone()
+        if row is None:
+            return None
+        status = FAILED if row[0] >= max_attempts else QUEUED
+        return status if self.ack(paper_key, status=status, reason=reason, owner=owner) else None
+
+    def release(self, paper_key: str, owner: str | None = None) -> bool:
+        """Give a lease back without counting it as an attempt."""
+        sql = (
+            "UPDATE items SET status = ?, lease_owner = NULL, lease_expires = NULL,"
+            " attempts = MAX(attempts - 1, 0), updated_at = ? WHERE paper_key = ? AND status = ?"
+        )
+        params: list = [QUEUED, _now_iso(), paper_key, LEASED]
+        if owner is not None:
+            sql += " AND lease_owner = ?"
+            params.append(owner)
+        return self._connect().execute(sql, params).rowcount == 1
+
+    def counts(self) -> dict[str, int]:
+        return dict(
+            self._connect().execute("SELECT status, COUNT(*) FROM items GROUP BY status").fetchall()
+        )
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM items").fetchone()[0]
@@ -61,7 +61,7 @@ def run_watch(
         "source": source,
         "discovered": len(discovered),
         "queued_added": added,
-        "queue_total": len(queue.load()),
+        "queue_total": len(queue),
         "budget": {
             "max_items": budget.max_items,
             "max_minutes": budget.max_minutes,
@@ -158,7 +158,7 @@ def _write_harvest_report(run_dir: Path, mode: str, stats: dict, fail_reasons: l
         "",
         f"- Mode: {mode}",
         f"- Queue persistence scope: run-scoped (run_id={run_dir.name})",
-        f"- Queue path: logs/runs/{run_dir.name}/harvest/queue.jsonl",
+        f"- Queue path: logs/runs/{run_dir.name}/harvest/queue.sqlite",
         "",
         "## Stats",
     ]
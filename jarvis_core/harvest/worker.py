@@ -3,65 +3,133 @@
 from __future__ import annotations
 
 import json
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .budget import HarvestBudget
-from .queue import HarvestQueue
+from .queue import DEFAULT_VISIBILITY_TIMEOUT, DONE, FAILED, QUEUED, SKIPPED, HarvestQueue
 
+DEFAULT_WORKERS = 4
 
-def process_queue(*, run_dir: Path, budget: HarvestBudget, oa_only: bool = True) -> dict:
+
+class _BudgetGate:
+    """Thread-safe view of a ``HarvestBudget`` shared by the worker pool.
+
+    A worker reserves an item and a request before leasing, so concurrent
+    workers never start more items than ``max_items``/``max_requests`` allow.
+    """
+
+    def __init__(self, budget: HarvestBudget):
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    def reserve(self) -> bool:
+        with self._lock:
+            b = self.budget
+            if b.is_exceeded():
+                return False
+            if b.items_done + self._in_flight >= b.max_items:
+                return False
+            if b.requests_done + self._in_flight >= b.max_requests:
+                return False
+            self._in_flight += 1
+            return True
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def commit(self, item_done: bool) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self.budget.consume_request()
+            if item_done:
+                self.budget.consume_item()
+
+
+def _process_row(row: dict, items_dir: Path, oa_only: bool) -> tuple[str, str | None]:
+    """Handle one leased row; returns ``(status, reason)``."""
+    paper_key = (
+        str(row.get("paper_key", "unknown")).replace("/", "_").replace("\\", "_").replace(":", "_")
+    )
+    metadata = row.get("metadata") if isinstance(row.get("metadata"), dict) else row
+    pmc_id = str(row.get("pmc_id") or "")
+    if oa_only and not pmc_id:
+        return SKIPPED, "OA_NOT_AVAILABLE"
+    item_dir = items_dir / paper_key
+    item_dir.mkdir(parents=True, exist_ok=True)
+    (item_dir / "metadata.json").write_text(
+        json.dumps(metadata, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+    return DONE, None
+
+
+def process_queue(
+    *,
+    run_dir: Path,
+    budget: HarvestBudget,
+    oa_only: bool = True,
+    workers: int = DEFAULT_WORKERS,
+    visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT,
+) -> dict:
+    """Drain the run's harvest queue with a pool of ``workers`` threads.
+
+    Every item is leased, processed and acknowledged individually, so the
+    queue database is the checkpoint: a crash loses at most the in-flight
+    items, which become available again after ``visibility_timeout``.
+    """
     harvest_dir = run_dir / "harvest"
     queue = HarvestQueue(harvest_dir / "queue.jsonl")
-    rows = queue.load()
     items_dir = harvest_dir / "items"
     items_dir.mkdir(parents=True, exist_ok=True)
 
     budget.start()
-    processed = 0
-    skipped = 0
-    failed = 0
-
-    for row in rows:
-        if row.get("status") != "queued":
-            continue
-        if budget.is_exceeded():
-            break
-        budget.consume_request()
-        paper_key = (
-            str(row.get("paper_key", "unknown"))
-            .replace("/", "_")
-            .replace("\\", "_")
-            .replace(":", "_")
-        )
-        item_dir = items_dir / paper_key
-        item_dir.mkdir(parents=True, exist_ok=True)
-        metadata = row.get("metadata") if isinstance(row.get("metadata"), dict) else row
-        pmc_id = str(row.get("pmc_id") or "")
-        if oa_only and not pmc_id:
-            row["status"] = "skipped"
-            row["reason"] = "OA_NOT_AVAILABLE"
-            skipped += 1
-            continue
-        try:
-            (item_dir / "metadata.json").write_text(
-                json.dumps(metadata, ensure_ascii=False, indent=2), encoding="utf-8"
-            )
-            row["status"] = "done"
-            processed += 1
-            budget.consume_item()
-        except Exception as exc:
-            row["status"] = "failed"
-            row["reason"] = str(exc)
-            failed += 1
-
-    queue.save(rows)
+    gate = _BudgetGate(budget)
+    counts = {DONE: 0, SKIPPED: 0, FAILED: 0}
+    counts_lock = threading.Lock()
+    run_token = uuid.uuid4().hex[:8]
+
+    def _worker(index: int) -> None:
+        owner = f"{run_token}-{index}"
+        while gate.reserve():
+            leased = queue.lease(owner, limit=1, visibility_timeout=visibility_timeout)
+            if not leased:
+                gate.cancel()
+                return
+            row = leased[0]
+            key = str(row.get("paper_key", ""))
+            try:
+                status, reason = _process_row(row, items_dir, oa_only)
+            except Exception as exc:
+                status = queue.retry(key, reason=str(exc), owner=owner) or FAILED
+                gate.commit(item_done=False)
+                if status == FAILED:
+                    with counts_lock:
+                        counts[FAILED] += 1
+                continue
+            queue.ack(key, status=status, reason=reason, owner=owner)
+            gate.commit(item_done=status == DONE)
+            with counts_lock:
+                counts[status] += 1
+
+    n_workers = max(1, int(workers))
+    if n_workers == 1:
+        _worker(0)
+    else:
+        with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="harvest") as pool:
+            for future in [pool.submit(_worker, i) for i in range(n_workers)]:
+                future.result()
 
+    queue_counts = queue.counts()
     stats = {
-        "processed": processed,
-        "skipped": skipped,
-        "failed": failed,
-        "queue_total": len(rows),
-        "queue_pending": sum(1 for row in rows if row.get("status") == "queued"),
+        "processed": counts[DONE],
+        "skipped": counts[SKIPPED],
+        "failed": counts[FAILED],
+        "queue_total": sum(queue_counts.values()),
+        "queue_pending": queue_counts.get(QUEUED, 0),
         "budget": {
             "max_items": budget.max_items,
             "max_minutes": budget.max_minutes,
@@ -1,26 +1,129 @@
-"""Core hub for managing MCP servers and invoking tools."""
+"""Core hub for managing MCP servers and invoking tools.
+
+``invoke_tool`` is natively asynchronous: remote ``http`` servers are called
+through one pooled ``httpx.AsyncClient`` per server (falling back to
+``requests`` in a worker thread when httpx is not installed), and the
+blocking builtin API handlers run in worker threads so they never stall the
+event loop.  Each server has a token bucket sized from its
+``requests_per_minute`` and a cap on concurrent calls, and results of
+idempotent tools are cached for ``cache_ttl`` seconds keyed on
+``(server, tool, canonical params)``.  ``invoke_many`` fans calls out
+concurrently, so a multi-tool step takes as long as its slowest call.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import inspect
 import json
+import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 import requests
 
+from jarvis_core.reliability.rate_limiter import TokenBucket
+
 from .schema import MCPServer, MCPServerStatus, MCPTool, MCPToolResult
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency (``mcp`` extra)
+    httpx = None
 
-class MCPHub:
-    """Hub that registers MCP servers and invokes tools."""
+DEFAULT_CACHE_TTL = 300.0
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_MAX_CONNECTIONS = 8
+DEFAULT_TIMEOUT = 30.0
+REMOTE_SERVER_TYPES = {"http"}
+
+
+class _ResponseCache:
+    """Small LRU cache of tool results with a per-entry TTL."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, MCPToolResult]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str, str]) -> MCPToolResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def set(self, key: tuple[str, str, str], result: MCPToolResult) -> None:
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _ServerPool:
+    """Per-server, per-event-loop connection pool and concurrency gate.
+
+    asyncio primitives and httpx clients are bound to the loop that first
+    uses them, so a pool is rebuilt when the hub is driven from a new loop.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_connections: int) -> None:
+        self.loop = loop
+        self.semaphore = asyncio.Semaphore(max_connections)
+        self.client: Any | None = None
 
-    def __init__(self) -> None:
+
+class MCPHub:
+    """Hub that registers MCP servers and invokes tools.
+
+    Args:
+        cache_ttl: Seconds a successful idempotent tool result is reused;
+            ``0`` disables caching.
+        cache_size: Maximum number of cached results.
+        max_connections: Concurrent in-flight calls allowed per server.
+        timeout: Timeout in seconds for remote calls.
+        http_transport: Optional ``httpx`` transport for the pooled clients
+            (e.g. ``httpx.MockTransport`` in tests).
+    """
+
+    def __init__(
+        self,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = DEFAULT_TIMEOUT,
+        http_transport: Any | None = None,
+    ) -> None:
         self._servers: dict[str, MCPServer] = {}
-        self._rate_log: dict[str, list[float]] = defaultdict(list)
         self._local_handlers: dict[str, Any] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._pools: dict[str, _ServerPool] = {}
+        self._cache = _ResponseCache(cache_size, cache_ttl)
+        self._max_connections = max(1, max_connections)
+        self._timeout = timeout
+        self._http_transport = http_transport
 
     def register_server(self, server: MCPServer) -> None:
         """Register an MCP server."""
@@ -72,6 +175,7 @@ class MCPHub:
                         parameters=tool.get("parameters", {}),
                         required_params=tool.get("required_params", []),
                         enabled=tool.get("enabled", True),
+                        idempotent=tool.get("idempotent", False),
                     )
                     for tool in tool_defs
                 ]
@@ -79,42 +183,36 @@ class MCPHub:
 
     def invoke_tool_sync(self, tool_name: str, params: dict) -> MCPToolResult:
         """Synchronously invoke a tool - tries local handler first, then remote."""
-        # Try local handler
-        handler = self._local_handlers.get(tool_name)
-        if handler:
-            start = time.perf_counter()
+
+        async def _call() -> MCPToolResult:
             try:
-                data = handler(params)
-                latency = (time.perf_counter() - start) * 1000
-                return MCPToolResult(
-                    tool_name=tool_name,
-                    server_name="local",
-                    success=True,
-                    data=data,
-                    latency_ms=latency,
-                )
-            except Exception as e:
-                latency = (time.perf_counter() - start) * 1000
-                return MCPToolResult(
-                    tool_name=tool_name,
-                    server_name="local",
-                    success=False,
-                    error=str(e),
-                    latency_ms=latency,
-                )
+                return await self.invoke_tool(tool_name, params)
+            finally:
+                await self.aclose()
 
-        # Find the tool in registered servers
-        server, tool = self._find_tool(tool_name)
-        if not server or not tool:
-            return MCPToolResult(
-                tool_name=tool_name,
-                server_name="unknown",
-                success=False,
-                error="tool_not_found",
-                latency_ms=0.0,
-            )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(_call())
+
+        # Called from inside a running loop: run on a private loop in a thread.
+        state: dict[str, Any] = {}
 
-        # Dispatch to known API handlers
+        def _runner() -> None:
+            try:
+                state["result"] = asyncio.run(_call())
+            except BaseException as exc:  # pragma: no cover - re-raised below
+                state["error"] = exc
+
+        thread = threading.Thread(target=_runner, daemon=True)
+        thread.start()
+        thread.join()
+        if "error" in state:
+            raise state["error"]
+        return state["result"]
+
+    def _builtin_handler(self, tool_name: str) -> Any | None:
+        """Return the builtin API handler for ``tool_name``, if any."""
         dispatch = {
             "pubmed_search": self._local_pubmed_search,
             "arxiv_search": self._local_arxiv_search,
@@ -127,38 +225,7 @@ class MCPHub:
             "s2_citations": self._local_s2_citations,
             "s2_references": self._local_s2_references,
         }
-        local_fn = dispatch.get(tool_name)
-        if local_fn:
-            start = time.perf_counter()
-            try:
-                data = local_fn(params)
-                latency = (time.perf_counter() - start) * 1000
-                server.status = MCPServerStatus.CONNECTED
-                return MCPToolResult(
-                    tool_name=tool_name,
-                    server_name=server.name,
-                    success=True,
-                    data=data,
-                    latency_ms=latency,
-                )
-            except Exception as e:
-                latency = (time.perf_counter() - start) * 1000
-                server.status = MCPServerStatus.ERROR
-                return MCPToolResult(
-                    tool_name=tool_name,
-                    server_name=server.name,
-                    success=False,
-                    error=str(e),
-                    latency_ms=latency,
-                )
-
-        return MCPToolResult(
-            tool_name=tool_name,
-            server_name=server.name,
-            success=False,
-            error="no_local_handler_and_remote_not_available",
-            latency_ms=0.0,
-        )
+        return dispatch.get(tool_name)
 
     # --- Local API handlers: PubMed ---
 
@@ -404,16 +471,205 @@ class MCPHub:
             "references": results,
         }
 
-    # --- Async methods (kept for compatibility) ---
+    # --- Async invocation ---
 
     async def discover_tools(self, server_name: str) -> list[MCPTool]:
+        """Return a server's tools, fetching ``GET <url>/tools`` for http servers."""
         server = self._servers.get(server_name)
         if not server:
             return []
+        if server.server_type not in REMOTE_SERVER_TYPES or not server.server_url:
+            return server.tools
+
+        try:
+            payload = await self._request(server, "GET", "/tools")
+        except Exception:
+            server.status = MCPServerStatus.ERROR
+            return server.tools
+
+        tool_defs = payload.get("tools", []) if isinstance(payload, dict) else payload
+        server.tools = [
+            MCPTool(
+                name=tool.get("name", ""),
+                description=tool.get("description", ""),
+                parameters=tool.get("parameters", {}),
+                required_params=tool.get("required_params", []),
+                enabled=tool.get("enabled", True),
+                idempotent=tool.get("idempotent", False),
+            )
+            for tool in tool_defs or []
+        ]
+        server.status = MCPServerStatus.CONNECTED
         return server.tools
 
-    async def invoke_tool(self, tool_name: str, params: dict) -> MCPToolResult:
-        return self.invoke_tool_sync(tool_name, params)
+    async def invoke_tool(
+        self, tool_name: str, params: dict, max_wait: float = 0.0
+    ) -> MCPToolResult:
+        """Invoke a tool without blocking the event loop.
+
+        Args:
+            tool_name: Tool to call.
+            params: Tool parameters.
+            max_wait: Seconds to wait for a rate-limit token; ``0`` fails
+                immediately with ``rate_limit_exceeded``.
+        """
+        handler = self._local_handlers.get(tool_name)
+        if handler:
+            return await self._timed("local", tool_name, handler, params)
+
+        server, tool = self._find_tool(tool_name)
+        if not server or not tool:
+            return MCPToolResult(
+                tool_name=tool_name,
+                server_name="unknown",
+                success=False,
+                error="tool_not_found",
+                latency_ms=0.0,
+            )
+
+        cache_key = self._cache_key(server, tool, params)
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return dataclasses.replace(cached, latency_ms=0.0)
+
+        if not await self._acquire(server, max_wait):
+            server.status = MCPServerStatus.RATE_LIMITED
+            return MCPToolResult(
+                tool_name=tool_name,
+                server_name=server.name,
+                success=False,
+                error="rate_limit_exceeded",
+                latency_ms=0.0,
+            )
+
+        pool = self._pool(server)
+        async with pool.semaphore:
+            builtin = self._builtin_handler(tool_name)
+            if builtin:
+                result = await self._timed(server.name, tool_name, builtin, params)
+            elif server.server_type in REMOTE_SERVER_TYPES and server.server_url:
+
+                async def _remote(payload: dict) -> Any:
+                    body = {"tool": tool_name, "params": payload}
+                    return await self._request(server, "POST", "/invoke", json=body)
+
+                result = await self._timed(server.name, tool_name, _remote, params)
+            else:
+                return MCPToolResult(
+                    tool_name=tool_name,
+                    server_name=server.name,
+                    success=False,
+                    error="no_local_handler_and_remote_not_available",
+                    latency_ms=0.0,
+                )
+
+        server.status = MCPServerStatus.CONNECTED if result.success else MCPServerStatus.ERROR
+        if cache_key is not None and result.success:
+            self._cache.set(cache_key, result)
+        return result
+
+    async def invoke_many(
+        self, calls: Iterable[tuple[str, dict]], max_wait: float = 0.0
+    ) -> list[MCPToolResult]:
+        """Invoke several tools concurrently; results keep the order of ``calls``.
+
+        Calls to different servers run in parallel; calls to the same server
+        share its connection pool, concurrency cap and token bucket.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.invoke_tool(name, params, max_wait=max_wait) for name, params in calls)
+            )
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        for name, pool in list(self._pools.items()):
+            if pool.loop is not loop:
+                continue
+            if pool.client is not None:
+                await pool.client.aclose()
+            del self._pools[name]
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    async def _timed(
+        self, server_name: str, tool_name: str, fn: Any, params: dict
+    ) -> MCPToolResult:
+        start = time.perf_counter()
+        try:
+            if inspect.iscoroutinefunction(fn):
+                data = await fn(params)
+            else:
+                data = await asyncio.to_thread(fn, params)
+        except Exception as e:
+            return MCPToolResult(
+                tool_name=tool_name,
+                server_name=server_name,
+                success=False,
+                error=str(e) or type(e).__name__,
+                latency_ms=(time.perf_counter() - start) * 1000,
+            )
+        return MCPToolResult(
+            tool_name=tool_name,
+            server_name=server_name,
+            success=True,
+            data=data,
+            latency_ms=(time.perf_counter() - start) * 1000,
+        )
+
+    async def _request(
+        self, server: MCPServer, method: str, path: str, json: Any = None
+    ) -> Any:
+        url = server.server_url.rstrip("/") + path
+        if httpx is None:
+            resp = await asyncio.to_thread(
+                requests.request,
+                method,
+                url,
+                headers=server.headers,
+                json=json,
+                timeout=self._timeout,
+            )
+            resp.raise_for_status()
+            return resp.json()
+
+        pool = self._pool(server)
+        if pool.client is None:
+            pool.client = httpx.AsyncClient(
+                headers=server.headers,
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+                transport=self._http_transport,
+            )
+        resp = await pool.client.request(method, url, json=json)
+        resp.raise_for_status()
+        return resp.json()
+
+    def _pool(self, server: MCPServer) -> _ServerPool:
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(server.name)
+        if pool is None or pool.loop is not loop:
+            pool = _ServerPool(loop, self._max_connections)
+            self._pools[server.name] = pool
+        return pool
+
+    def _cache_key(
+        self, server: MCPServer, tool: MCPTool, params: dict
+    ) -> tuple[str, str, str] | None:
+        if not (tool.idempotent or self._builtin_handler(tool.name)):
+            return None
+        try:
+            canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+        except (TypeError, ValueError):
+            return None
+        return (server.name, tool.name, canonical)
 
     def list_all_tools(self) -> list[dict[str, Any]]:
         tools: list[dict[str, Any]] = []
@@ -447,15 +703,29 @@ class MCPHub:
                     return server, tool
         return None, None
 
-    def _allow_request(self, server: MCPServer) -> bool:
+    def _bucket(self, server: MCPServer) -> TokenBucket | None:
         if not server.requests_per_minute:
+            return None
+        bucket = self._buckets.get(server.name)
+        if bucket is None:
+            bucket = TokenBucket(
+                rate=server.requests_per_minute / 60.0,
+                capacity=server.requests_per_minute,
+            )
+            self._buckets[server.name] = bucket
+        return bucket
+
+    async def _acquire(self, server: MCPServer, max_wait: float = 0.0) -> bool:
+        """Take a token from the server's bucket, waiting up to ``max_wait``."""
+        bucket = self._bucket(server)
+        if bucket is None:
             return True
-        now = time.time()
-        window_start = now - 60
-        timestamps = [t for t in self._rate_log[server.name] if t >= window_start]
-        self._rate_log[server.name] = timestamps
-        if len(timestamps) >= server.requests_per_minute:
-            return False
-        timestamps.append(now)
-        self._rate_log[server.name] = timestamps
-        return True
+        deadline = time.monotonic() + max_wait
+        while True:
+            result = bucket.try_acquire()
+            if result.allowed:
+                return True
+            retry_after = result.retry_after or 0.0
+            if time.monotonic() + retry_after > deadline:
+                return False
+            await asyncio.sleep(retry_after)
@@ -25,6 +25,8 @@ class MCPTool:
     parameters: dict[str, Any] = field(default_factory=dict)
     required_params: list[str] = field(default_factory=list)
     enabled: bool = True
+    # Read-only tools whose results may be served from the hub's cache.
+    idempotent: bool = False
 
 
 @dataclass
@@ -0,0 +1,233 @@
+"""In-process run event bus.
+
+``ObservabilityLogger`` writes run events through ``RunEventBus.append``,
+which appends to ``data/runs/<run_id>/logs/events.jsonl`` and publishes the
+event.  Each event gets a per-file sequence number equal to its line index
+in that file, so a subscriber can
+resume from any offset: lines before the subscription are replayed from the
+file and everything after arrives live.
+
+Subscribers have bounded buffers.  Progress ticks for the same step are
+coalesced (only the latest is kept); when a buffer is full the oldest
+progress tick is dropped first, then the oldest event.  Dropped events leave
+a gap in ``seq`` that the client can fill by resuming from the file.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+DEFAULT_BUFFER_SIZE = 256
+PROGRESS_EVENT = "progress"
+
+
+def _count_lines(path: Path) -> int:
+    if not path.exists():
+        return 0
+    with open(path, "rb") as f:
+        return sum(1 for _ in f)
+
+
+def read_events(path: Path, since: int = 0, until: int | None = None) -> Iterator[dict[str, Any]]:
+    """Yield ``{"seq", "event", "data"}`` records from an events.jsonl file."""
+    if not path.exists():
+        return
+    with open(path, encoding="utf-8") as f:
+        for seq, line in enumerate(f):
+            if until is not None and seq >= until:
+                break
+            if seq < since or not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            yield {"seq": seq, "event": payload.get("event", ""), "data": payload}
+
+
+class Subscription:
+    """A bounded, coalescing event buffer for one watcher."""
+
+    def __init__(
+        self,
+        bus: RunEventBus,
+        run_id: str,
+        maxsize: int = DEFAULT_BUFFER_SIZE,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ):
+        self.bus = bus
+        self.run_id = run_id
+        self.maxsize = maxsize
+        self.dropped = 0
+        self.closed = False
+        self._buffer: deque[dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._loop = loop
+        self._async_ready = asyncio.Event() if loop is not None else None
+
+    def push(self, record: dict[str, Any]) -> None:
+        with self._lock:
+            if record["event"] == PROGRESS_EVENT and self._buffer:
+                last = self._buffer[-1]
+                if last["event"] == PROGRESS_EVENT and last["data"].get("step") == record[
+                    "data"
+                ].get("step"):
+                    self._buffer[-1] = record
+                    self.dropped += 1
+                    self._notify()
+                    return
+            if len(self._buffer) >= self.maxsize:
+                self._evict()
+            self._buffer.append(record)
+        self._notify()
+
+    def _evict(self) -> None:
+        for i, item in enumerate(self._buffer):
+            if item["event"] == PROGRESS_EVENT:
+                del self._buffer[i]
+                break
+        else:
+            self._buffer.popleft()
+        self.dropped += 1
+
+    def _notify(self) -> None:
+        self._ready.set()
+        if self._loop is not None and self._async_ready is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._async_ready.set)
+            except RuntimeError:
+                pass  # loop already closed
+
+    def drain(self) -> list[dict[str, Any]]:
+        with self._lock:
+            items = list(self._buffer)
+            self._buffer.clear()
+            self._ready.clear()
+            if self._async_ready is not None:
+                self._async_ready.clear()
+        return items
+
+    def get(self, timeout: float | None = None) -> list[dict[str, Any]]:
+        """Block until events arrive (or timeout) and return them."""
+        self._ready.wait(timeout)
+        return self.drain()
+
+    async def aget(self, timeout: float | None = None) -> list[dict[str, Any]]:
+        """Async variant of ``get``; requires the subscription to have a loop."""
+        if self._async_ready is None:
+            raise RuntimeError("Subscription was created without an event loop")
+        if not self._buffer:
+            try:
+                await asyncio.wait_for(self._async_ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        return self.drain()
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.bus.unsubscribe(self)
+
+    def __enter__(self) -> Subscription:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class RunEventBus:
+    """Fan-out of run events to in-process subscribers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next_seq: dict[Path | str, int] = {}
+        self._subscribers: dict[str, set[Subscription]] = {}
+
+    def _seq_key(self, run_id: str, source: Path | None) -> Path | str:
+        return source.resolve() if source is not None else run_id
+
+    def _seq_for(self, run_id: str, source: Path | None) -> int:
+        key = self._seq_key(run_id, source)
+        seq = self._next_seq.get(key)
+        if seq is None:
+            seq = _count_lines(source) if source is not None else 0
+            self._next_seq[key] = seq
+        return seq
+
+    def append(self, run_id: str, source: Path, payload: dict[str, Any]) -> int:
+        """Append ``payload`` to the run's events file and publish it; returns its seq.
+
+        Writing and sequencing happen under one lock, so ``seq`` always equals
+        the line index of the event in ``source``.
+        """
+        line = json.dumps(payload, ensure_ascii=False) + "\n"
+        source.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            seq = self._seq_for(run_id, source)
+            with open(source, "a", encoding="utf-8") as f:
+                f.write(line)
+            self._next_seq[self._seq_key(run_id, source)] = seq + 1
+            subscribers = list(self._subscribers.get(run_id, ()))
+        record = {"seq": seq, "event": payload.get("event", ""), "data": payload}
+        for sub in subscribers:
+            sub.push(record)
+        return seq
+
+    def subscribe(
+        self,
+        run_id: str,
+        source: Path | None = None,
+        since: int | None = None,
+        maxsize: int = DEFAULT_BUFFER_SIZE,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> tuple[Subscription, list[dict[str, Any]]]:
+        """Register a watcher and return it with the backlog to replay.
+
+        With ``since`` set, events ``[since, current)`` are read from
+        ``source``; live events delivered to the subscription start at
+        ``current``, so the replay and the live stream neither overlap nor
+        leave a gap.
+        """
+        sub = Subscription(self, run_id, maxsize=maxsize, loop=loop)
+        with self._lock:
+            self._subscribers.setdefault(run_id, set()).add(sub)
+            current = self._seq_for(run_id, source)
+        backlog: list[dict[str, Any]] = []
+        if since is not None and source is not None:
+            backlog = list(read_events(source, since=since, until=current))
+        return sub, backlog
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(sub.run_id)
+            if subs is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._subscribers[sub.run_id]
+
+    def subscriber_count(self, run_id: str) -> int:
+        with self._lock:
+            return len(self._subscribers.get(run_id, ()))
+
+
+_BUS = RunEventBus()
+
+
+def get_event_bus() -> RunEventBus:
+    """Return the process-wide run event bus."""
+    return _BUS
+
+
+__all__ = [
+    "RunEventBus",
+    "Subscription",
+    "get_event_bus",
+    "read_events",
+]
@@ -8,13 +8,15 @@ import traceback
 from pathlib import Path
 from typing import Any
 
+from jarvis_core.obs.event_bus import get_event_bus
 from jarvis_core.obs.log_schema import build_log_event
 
 _LOG_LOCK = threading.Lock()
 SYSTEM_LOG_PATH = Path("data/ops/system.log.jsonl")
 
 
-def _run_log_path(run_id: str) -> Path:
+def run_log_path(run_id: str) -> Path:
+    """Return the events.jsonl path for a run."""
     return Path("data/runs") / run_id / "logs" / "events.jsonl"
 
 
@@ -56,7 +58,7 @@ class ObservabilityLogger:
             data=data,
             err=err,
         ).to_dict()
-        _append_jsonl(_run_log_path(self.run_id), [payload])
+        get_event_bus().append(self.run_id, run_log_path(self.run_id), payload)
         _append_jsonl(SYSTEM_LOG_PATH, [payload])
 
     def info(
@@ -113,7 +115,7 @@ def get_logger(run_id: str, job_id: str, component: str, step: str = "") -> Obse
 
 def tail_logs(run_id: str, limit: int = 200) -> list[dict[str, Any]]:
     """Return the last N log entries for a run."""
-    path = _run_log_path(run_id)
+    path = run_log_path(run_id)
     if not path.exists() or limit <= 0:
         return []
     with open(path, encoding="utf-8") as f:
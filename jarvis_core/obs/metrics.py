@@ -76,6 +76,17 @@ def record_step_duration(run_id: str, step: str, duration_ms: float) -> None:
     )
 
 
+def record_stage_cache(run_id: str, step: str, hit: bool) -> None:
+    _append_metric(
+        {
+            "type": "stage_cache",
+            "run_id": run_id,
+            "step": step,
+            "hit": hit,
+        }
+    )
+
+
 def record_progress(run_id: str, step: str, percent: int) -> None:
     _append_metric(
         {
@@ -5,6 +5,14 @@ M4: 運用完備のためのレート制限・リトライ機構
 - 指数バックオフ
 - 最大リトライ回数
 - 全体タイムアウト
+- プロセス間で共有するトークンバケット（SQLite/WAL）
+
+Webアプリ・スケジューラ・harvestワーカーのように複数プロセスが同じAPIを
+叩く場合、``RateLimitConfig.shared_key`` と ``shared_db_path``（または環境変数
+``JARVIS_RATE_LIMIT_DB``）を設定すると、キーごとのトークンバケットが
+SQLiteファイル上で共有され、全プロセス合計のスループットが上限に揃う。
+同じキーを使う呼び出し元は ``pubmed_rate_config()`` のように一つの設定から
+レートを導くこと。バケットのレート・容量はDBの行が正となる。
 """
 
 from __future__ import annotations
@@ -12,7 +20,10 @@ from __future__ import annotations
 import asyncio
 import functools
 import logging
+import os
 import random
+import sqlite3
+import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -22,6 +33,8 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+RATE_LIMIT_DB_ENV = "JARVIS_RATE_LIMIT_DB"
+
 
 @dataclass
 class RateLimitConfig:
@@ -42,6 +55,21 @@ class RateLimitConfig:
     request_timeout_sec: float = 30.0
     total_timeout_sec: float = 300.0
 
+    # プロセス間共有（shared_keyがNoneならプロセス内のみで制限）
+    shared_db_path: str | None = None
+    shared_key: str | None = None
+
+    def effective_rate(self) -> float:
+        """1秒あたりの実効レート（分単位の制限も考慮）."""
+        rate = self.requests_per_second
+        if self.requests_per_minute:
+            rate = min(rate, self.requests_per_minute / 60.0)
+        return rate
+
+    def bucket_capacity(self) -> float:
+        """共有バケットの容量. 1秒あたりの上限を超えるバーストは許さない."""
+        return min(self.burst_limit, max(1.0, self.effective_rate()))
+
 
 @dataclass
 class RateLimitState:
@@ -52,6 +80,13 @@ class RateLimitState:
     failed_requests: int = 0
     retried_requests: int = 0
     last_request_time: float | None = None
+    total_wait_sec: float = 0.0
+    max_wait_sec: float = 0.0
+
+    def add_wait(self, waited: float):
+        """待機時間を記録."""
+        self.total_wait_sec += waited
+        self.max_wait_sec = max(self.max_wait_sec, waited)
 
     def add_request(self):
         """リクエストを記録."""
@@ -71,6 +106,205 @@ class RateLimitState:
         return sum(1 for t in self.request_times if t > cutoff)
 
 
+class SharedTokenBucket:
+    """
+    プロセス間で共有するトークンバケット.
+
+    状態は SQLite（WALモード）の1行に保持し、``BEGIN IMMEDIATE`` で
+    排他的に更新する。取得は「予約」方式：トークンを先に差し引き
+    （負になり得る）、その予約が有効になるまでの秒数を返す。
+    予約はDBのロック取得順に並ぶため、プロセス・スレッド・タスクを
+    またいでFIFOで公平になり、待機中にポーリングもしない。
+    レート・容量は予約のたびにDBの行から読むため、同じキーを開いた
+    全プロセスが最後に登録された値で揃う。
+
+    Args:
+        db_path: 共有するSQLiteファイル
+        key: バケットのキー（例: "pubmed"）
+        rate: 1秒あたりの補充トークン数
+        capacity: バースト上限
+    """
+
+    def __init__(self, db_path: str | os.PathLike, key: str, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.db_path = str(db_path)
+        self.key = key
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            " key TEXT PRIMARY KEY,"
+            " tokens REAL NOT NULL,"
+            " updated REAL NOT NULL,"
+            " rate REAL NOT NULL,"
+            " capacity REAL NOT NULL,"
+            " acquired INTEGER NOT NULL DEFAULT 0,"
+            " rejected INTEGER NOT NULL DEFAULT 0,"
+            " wait_total REAL NOT NULL DEFAULT 0,"
+            " wait_max REAL NOT NULL DEFAULT 0)"
+        )
+        conn.execute(
+            "INSERT INTO buckets (key, tokens, updated, rate, capacity) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT(key) DO UPDATE SET rate = excluded.rate, capacity = excluded.capacity",
+            (self.key, self.capacity, time.time(), self.rate, self.capacity),
+        )
+
+    def reserve(self, tokens: float = 1.0, max_wait: float | None = None) -> float | None:
+        """
+        トークンを予約する.
+
+        Args:
+            tokens: 予約するトークン数
+            max_wait: 許容する最大待機秒数（超えるなら予約しない）
+
+        Returns:
+            予約が有効になるまでの秒数。``max_wait`` を超える場合はNone
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated, rate, capacity FROM buckets WHERE key = ?",
+                (self.key,),
+            ).fetchone()
+            now = time.time()
+            if row:
+                available, updated, rate, capacity = row
+                elapsed = max(0.0, now - updated)
+            else:
+                available, rate, capacity = self.capacity, self.rate, self.capacity
+                elapsed = 0.0
+            available = min(capacity, available + elapsed * rate) - tokens
+            delay = max(0.0, -available / rate)
+            if max_wait is not None and delay > max_wait:
+                conn.execute(
+                    "UPDATE buckets SET rejected = rejected + 1 WHERE key = ?", (self.key,)
+                )
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE buckets SET tokens = ?, updated = ?, acquired = acquired + 1,"
+                " wait_total = wait_total + ?, wait_max = MAX(wait_max, ?) WHERE key = ?",
+                (available, now, delay, delay, self.key),
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return delay
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """使われなかった予約（キャンセル時など）を返却する."""
+        conn = self._connect()
+        conn.execute(
+            "UPDATE buckets SET tokens = MIN(capacity, tokens + ?) WHERE key = ?",
+            (tokens, self.key),
+        )
+
+    def acquire(self, timeout: float | None = None) -> float | None:
+        """
+        トークンを取得するまで待機（同期版）.
+
+        Returns:
+            実際に待った秒数。``timeout`` 内に取得できない場合はNone
+        """
+        delay = self.reserve(max_wait=timeout)
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, timeout: float | None = None) -> float | None:
+        """トークンを取得するまで待機（非同期版）. イベントループはブロックしない."""
+        delay = await asyncio.to_thread(self.reserve, 1.0, timeout)
+        if delay:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.refund()
+                raise
+        return delay
+
+    def stats(self) -> dict[str, Any]:
+        """全プロセス合計の取得数・待機時間."""
+        row = (
+            self._connect()
+            .execute(
+                "SELECT acquired, rejected, wait_total, wait_max, rate, capacity"
+                " FROM buckets WHERE key = ?",
+                (self.key,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            row = (0, 0, 0.0, 0.0, self.rate, self.capacity)
+        acquired, rejected, wait_total, wait_max, rate, capacity = row
+        return {
+            "key": self.key,
+            "rate": rate,
+            "capacity": capacity,
+            "acquired": acquired,
+            "rejected": rejected,
+            "wait_total_sec": wait_total,
+            "wait_max_sec": wait_max,
+            "wait_avg_sec": wait_total / acquired if acquired else 0.0,
+        }
+
+
+_shared_buckets: dict[tuple[str, str], SharedTokenBucket] = {}
+_shared_buckets_lock = threading.Lock()
+
+
+def get_shared_bucket(
+    key: str,
+    rate: float,
+    capacity: float = 1.0,
+    db_path: str | None = None,
+) -> SharedTokenBucket | None:
+    """
+    共有トークンバケットを取得.
+
+    ``db_path`` も環境変数 ``JARVIS_RATE_LIMIT_DB`` も無ければNone
+    （呼び出し側はプロセス内の制限にフォールバックする）。
+    """
+    path = db_path or os.environ.get(RATE_LIMIT_DB_ENV)
+    if not path or rate <= 0:
+        return None
+    with _shared_buckets_lock:
+        bucket = _shared_buckets.get((path, key))
+        if bucket is None or bucket.rate != rate or bucket.capacity != max(1.0, capacity):
+            bucket = SharedTokenBucket(path, key, rate=rate, capacity=capacity)
+            _shared_buckets[(path, key)] = bucket
+    return bucket
+
+
+def shared_bucket_for(config: RateLimitConfig) -> SharedTokenBucket | None:
+    """設定から共有バケットを取得. ``shared_key`` 未設定ならNone."""
+    if not config.shared_key:
+        return None
+    return get_shared_bucket(
+        config.shared_key,
+        rate=config.effective_rate(),
+        capacity=config.bucket_capacity(),
+        db_path=config.shared_db_path,
+    )
+
+
 class RateLimiter:
     """レートリミッター."""
 
@@ -83,6 +317,7 @@ class RateLimiter:
         """
         self.config = config or RateLimitConfig()
         self.state = RateLimitState()
+        self.shared = shared_bucket_for(self.config)
         try:
             asyncio.get_running_loop()
             self._lock = asyncio.Lock()
@@ -110,20 +345,41 @@ class RateLimiter:
 
     def wait_if_needed(self):
         """必要に応じて待機（同期版）."""
-        delay = self._calculate_delay()
-        if delay > 0:
-            logger.debug(f"Rate limiting: waiting {delay:.2f}s")
-            time.sleep(delay)
+        if self.shared is not None:
+            delay = self.shared.acquire() or 0.0
+        else:
+            delay = self._calculate_delay()
+            if delay > 0:
+                logger.debug(f"Rate limiting: waiting {delay:.2f}s")
+                time.sleep(delay)
+        self.state.add_wait(delay)
         self.state.add_request()
 
     async def wait_if_needed_async(self):
         """必要に応じて待機（非同期版）."""
-        delay = self._calculate_delay()
-        if delay > 0:
-            logger.debug(f"Rate limiting: waiting {delay:.2f}s")
-            await asyncio.sleep(delay)
+        if self.shared is not None:
+            delay = await self.shared.acquire_async() or 0.0
+        else:
+            delay = self._calculate_delay()
+            if delay > 0:
+                logger.debug(f"Rate limiting: waiting {delay:.2f}s")
+                await asyncio.sleep(delay)
+        self.state.add_wait(delay)
         self.state.add_request()
 
+    def get_wait_stats(self) -> dict[str, Any]:
+        """待機時間のメトリクス（共有時は全プロセス合計も含む）."""
+        requests = self.state.total_requests
+        stats: dict[str, Any] = {
+            "requests": requests,
+            "wait_total_sec": self.state.total_wait_sec,
+            "wait_max_sec": self.state.max_wait_sec,
+            "wait_avg_sec": self.state.total_wait_sec / requests if requests else 0.0,
+        }
+        if self.shared is not None:
+            stats["shared"] = self.shared.stats()
+        return stats
+
     def get_retry_delay(self, attempt: int) -> float:
         """
         リトライ遅延を計算（指数バックオフ）.
@@ -199,24 +455,32 @@ def with_retry(
 _pubmed_limiter: RateLimiter | None = None
 
 
+def pubmed_rate_config(api_key: str | None = None) -> RateLimitConfig:
+    """
+    PubMed E-utilitiesのレート制限設定.
+
+    共有キー ``"pubmed"`` を使う呼び出し元（``RateLimiter`` と
+    ``PubMedClient``）はすべてこの設定からレートを導く。
+
+    Args:
+        api_key: NCBI APIキー（Noneなら環境変数 ``NCBI_API_KEY``）
+    """
+    # API keyがある場合は10 req/s、ない場合は3 req/s
+    has_api_key = bool(api_key or os.environ.get("NCBI_API_KEY"))
+    return RateLimitConfig(
+        requests_per_second=10.0 if has_api_key else 3.0,
+        max_retries=3,
+        base_delay_sec=1.0,
+        request_timeout_sec=30.0,
+        total_timeout_sec=300.0,
+        shared_key="pubmed",
+    )
+
+
 def get_pubmed_rate_limiter() -> RateLimiter:
     """PubMed用レートリミッターを取得."""
     global _pubmed_limiter
     if _pubmed_limiter is None:
-        import os
-
-        # API keyがある場合は10 req/s、ない場合は3 req/s
-        has_api_key = bool(os.environ.get("NCBI_API_KEY"))
-        rps = 10.0 if has_api_key else 3.0
-
-        _pubmed_limiter = RateLimiter(
-            RateLimitConfig(
-                requests_per_second=rps,
-                max_retries=3,
-                base_delay_sec=1.0,
-                request_timeout_sec=30.0,
-                total_timeout_sec=300.0,
-            )
-        )
+        _pubmed_limiter = RateLimiter(pubmed_rate_config())
 
     return _pubmed_limiter
@@ -77,9 +77,9 @@ def _paper_id(paper: dict) -> str:
 def _embed_texts(texts: list[str], *, seed: int) -> tuple[np.ndarray, str, list[dict]]:
     warnings: list[dict] = []
     try:
-        from sentence_transformers import SentenceTransformer  # type: ignore[import-not-found]
+        from jarvis_core.embeddings.model_registry import load_sentence_transformer
 
-        model = SentenceTransformer("all-MiniLM-L6-v2")
+        model = load_sentence_transformer("all-MiniLM-L6-v2")
         vectors = model.encode(texts, show_progress_bar=False)
         return np.asarray(vectors, dtype=float), "sentence-transformers", warnings
     except Exception as exc:
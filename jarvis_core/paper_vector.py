@@ -27,6 +27,7 @@ from typing import TYPE_CHECKING, Literal
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from .paper_vector_store import PaperVectorStore
     from .reference import Reference
     from .result import EvidenceQAResult
 
@@ -322,6 +323,7 @@ class PaperVector:
 
         # Update index
         _update_index(out_path, self.paper_id, self.source_locator)
+        _write_through_store(out_path, [self])
 
         return str(file_path)
 
@@ -335,6 +337,14 @@ class PaperVector:
 
 def _update_index(out_path: Path, paper_id: str, source_locator: str) -> None:
     """Update the index.json with new paper."""
+    _update_index_many(out_path, [(paper_id, source_locator)])
+
+
+def _update_index_many(out_path: Path, entries: list[tuple[str, str]]) -> None:
+    """Add ``(paper_id, source_locator)`` entries to index.json in one rewrite.
+
+    The file is left untouched when every paper is already indexed.
+    """
     index_path = out_path / "index.json"
 
     if index_path.exists():
@@ -345,18 +355,65 @@ def _update_index(out_path: Path, paper_id: str, source_locator: str) -> None:
 
     # Add if not exists
     existing_ids = {p["paper_id"] for p in index["papers"]}
-    if paper_id not in existing_ids:
+    added = False
+    for paper_id, source_locator in entries:
+        if paper_id in existing_ids:
+            continue
+        existing_ids.add(paper_id)
         index["papers"].append(
             {
                 "paper_id": paper_id,
                 "source_locator": source_locator,
             }
         )
+        added = True
+
+    if not added and index_path.exists():
+        return
 
     with open(index_path, "w", encoding="utf-8") as f:
         json.dump(index, f, indent=2, ensure_ascii=False)
 
 
+def _write_through_store(out_path: Path, vectors: list[PaperVector]) -> None:
+    """Mirror saved vectors into an existing PaperVectorStore.
+
+    ``load_all_vectors`` prefers the store over JSON files, so a store that
+    is not updated would shadow every later save.
+    """
+    from .paper_vector_store import PaperVectorStore
+
+    if vectors and PaperVectorStore.exists(out_path):
+        with PaperVectorStore(out_path) as store:
+            store.add_many(vectors)
+
+
+def save_many(vectors: list[PaperVector], out_dir: str) -> list[str]:
+    """Save several vectors, rewriting index.json once instead of per paper.
+
+    Args:
+        vectors: PaperVectors to save.
+        out_dir: Base directory for paper_vectors.
+
+    Returns:
+        Paths of the saved files.
+    """
+    out_path = Path(out_dir)
+    vectors_dir = out_path / "vectors"
+    vectors_dir.mkdir(parents=True, exist_ok=True)
+
+    paths = []
+    for pv in vectors:
+        file_path = vectors_dir / f"paper_{pv.paper_id}.json"
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(pv.to_dict(), f, indent=2, ensure_ascii=False)
+        paths.append(str(file_path))
+
+    _update_index_many(out_path, [(pv.paper_id, pv.source_locator) for pv in vectors])
+    _write_through_store(out_path, vectors)
+    return paths
+
+
 def generate_paper_id(source_locator: str) -> str:
     """Generate a deterministic paper ID from source locator."""
     h = hashlib.sha256(source_locator.encode("utf-8")).hexdigest()
@@ -498,10 +555,19 @@ def extract_paper_vector_from_result(
 
 
 # ==================== Filter API ====================
+#
+# The filters accept either a list of PaperVectors or a PaperVectorStore; a
+# store answers from its year / concept indexes instead of a linear scan.
+
+
+def _is_store(vectors: object) -> bool:
+    from .paper_vector_store import PaperVectorStore
+
+    return isinstance(vectors, PaperVectorStore)
 
 
 def filter_by_year(
-    vectors: list[PaperVector],
+    vectors: list[PaperVector] | PaperVectorStore,
     min_year: int | None = None,
     max_year: int | None = None,
 ) -> list[PaperVector]:
@@ -515,6 +581,9 @@ def filter_by_year(
     Returns:
         Filtered list.
     """
+    if _is_store(vectors):
+        return vectors.filter_by_year(min_year, max_year)
+
     result = []
     for v in vectors:
         year = v.metadata.year
@@ -529,7 +598,7 @@ def filter_by_year(
 
 
 def filter_by_concept(
-    vectors: list[PaperVector],
+    vectors: list[PaperVector] | PaperVectorStore,
     concept: str,
     min_score: float = 0.1,
 ) -> list[PaperVector]:
@@ -543,6 +612,9 @@ def filter_by_concept(
     Returns:
         Filtered list sorted by concept score.
     """
+    if _is_store(vectors):
+        return vectors.filter_by_concept(concept, min_score)
+
     result = []
     for v in vectors:
         score = v.concept.concepts.get(concept, 0.0)
@@ -555,7 +627,7 @@ def filter_by_concept(
 
 
 def filter_by_year_and_concept(
-    vectors: list[PaperVector],
+    vectors: list[PaperVector] | PaperVectorStore,
     concept: str,
     min_year: int | None = None,
     max_year: int | None = None,
@@ -573,6 +645,9 @@ def filter_by_year_and_concept(
     Returns:
         Filtered and sorted list.
     """
+    if _is_store(vectors):
+        return vectors.filter_by_year_and_concept(concept, min_year, max_year, min_score)
+
     year_filtered = filter_by_year(vectors, min_year, max_year)
     return filter_by_concept(year_filtered, concept, min_score)
 
@@ -580,18 +655,31 @@ def filter_by_year_and_concept(
 def load_all_vectors(vectors_dir: str) -> list[PaperVector]:
     """Load all paper vectors from a directory.
 
+    When the directory holds a PaperVectorStore, papers are read from it and
+    only JSON files for papers missing from the store are parsed.
+
     Args:
         vectors_dir: Base directory containing paper_vectors.
 
     Returns:
         List of all PaperVectors.
     """
+    from .paper_vector_store import PaperVectorStore
+
+    results: list[PaperVector] = []
+    stored: set[str] = set()
+    if PaperVectorStore.exists(vectors_dir):
+        with PaperVectorStore(vectors_dir) as store:
+            results = store.all()
+        stored = {pv.paper_id for pv in results}
+
     vectors_path = Path(vectors_dir) / "vectors"
     if not vectors_path.exists():
-        return []
+        return results
 
-    results = []
     for file_path in vectors_path.glob("paper_*.json"):
+        if file_path.stem[len("paper_") :] in stored:
+            continue
         try:
             pv = PaperVector.load(str(file_path))
             results.append(pv)
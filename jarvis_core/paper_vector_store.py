@@ -0,0 +1,467 @@
+"""Columnar storage for PaperVectors.
+
+``PaperVector.save`` writes one JSON file per paper, and the list-based
+filters in ``paper_vector`` deserialize every paper before scanning it.
+``PaperVectorStore`` keeps the same data in a form that can be queried
+without doing that:
+
+* ``papers.sqlite`` holds one row per paper (payload JSON, year) plus a
+  ``concepts`` table that works as a concept -> paper inverted index.
+  Both are indexed, so year ranges and concept lookups are B-tree scans
+  and only the matching payloads are decoded.
+* ``embeddings.f32`` is a row-major float32 matrix, memory-mapped on read.
+  Row ``i`` belongs to the paper whose ``row`` is ``i``, so similarity
+  search is a single matrix-vector product over the stacked embeddings.
+
+Writes are buffered and committed in batches: ``add()`` only queues a
+paper, and ``flush()`` writes the queue in one transaction and one
+memmap update.  Queries flush first, so readers always see their own
+writes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import numpy as np
+
+from .paper_vector import PaperVector
+
+logger = logging.getLogger(__name__)
+
+DB_NAME = "papers.sqlite"
+MATRIX_NAME = "embeddings.f32"
+DEFAULT_BATCH_SIZE = 256
+
+
+class PaperVectorStore:
+    """SQLite + memmap store for PaperVectors.
+
+    Args:
+        root: Base directory (the same ``out_dir`` used by ``PaperVector.save``).
+        batch_size: Number of queued papers that triggers an automatic flush.
+    """
+
+    def __init__(self, root: str | Path, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, int(batch_size))
+        self.db_path = self.root / DB_NAME
+        self.matrix_path = self.root / MATRIX_NAME
+        self._lock = threading.RLock()
+        self._pending: dict[str, PaperVector] = {}
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+        self._dim: int | None = self._read_dim()
+        self._norms: np.ndarray | None = None
+
+    @classmethod
+    def exists(cls, root: str | Path) -> bool:
+        return (Path(root) / DB_NAME).exists()
+
+    def _init_db(self) -> None:
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS papers ("
+                " row INTEGER PRIMARY KEY,"
+                " paper_id TEXT NOT NULL UNIQUE,"
+                " source_locator TEXT,"
+                " year INTEGER,"
+                " has_embedding INTEGER NOT NULL DEFAULT 0,"
+                " payload TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS concepts ("
+                " concept TEXT NOT NULL,"
+                " row INTEGER NOT NULL,"
+                " score REAL NOT NULL,"
+                " PRIMARY KEY (concept, row))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_papers_year ON papers(year, row)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_concepts_score ON concepts(concept, score DESC)"
+            )
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    def _read_dim(self) -> int | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'dim'").fetchone()
+        return int(row[0]) if row else None
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add(self, vector: PaperVector) -> None:
+        """Queue ``vector`` for writing; an existing ``paper_id`` is replaced."""
+        with self._lock:
+            self._pending[vector.paper_id] = vector
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def add_many(self, vectors: Iterable[PaperVector]) -> int:
+        """Queue several vectors and flush them; returns the number written."""
+        count = 0
+        with self._lock:
+            for vector in vectors:
+                self._pending[vector.paper_id] = vector
+                count += 1
+            self.flush()
+        return count
+
+    def flush(self) -> int:
+        """Write queued vectors in one transaction; returns how many were written."""
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending = list(self._pending.values())
+            self._pending.clear()
+
+            ids = [pv.paper_id for pv in pending]
+            existing = self._rows_for_ids(ids)
+            next_row = self._conn.execute(
+                "SELECT COALESCE(MAX(row) + 1, 0) FROM papers"
+            ).fetchone()[0]
+
+            dim = self._dim
+            paper_rows = []
+            concept_rows = []
+            embeddings: list[tuple[int, np.ndarray]] = []
+            for pv in pending:
+                row = existing.get(pv.paper_id)
+                if row is None:
+                    row = next_row
+                    next_row += 1
+                vector = self._embedding_of(pv)
+                if vector is not None and dim is None:
+                    dim = len(vector)
+                has_embedding = vector is not None and len(vector) == dim
+                if vector is not None and not has_embedding:
+                    logger.warning(
+                        "Skipping embedding of %s: dimension %d != %s",
+                        pv.paper_id,
+                        len(vector),
+                        dim,
+                    )
+                if has_embedding:
+                    embeddings.append((row, vector))
+                elif pv.paper_id in existing and dim is not None:
+                    # Clear the replaced paper's old vector so similar() cannot return it.
+                    embeddings.append((row, np.zeros(dim, dtype=np.float32)))
+                paper_rows.append(
+                    (
+                        row,
+                        pv.paper_id,
+                        pv.source_locator,
+                        pv.metadata.year,
+                        int(has_embedding),
+                        json.dumps(pv.to_dict(), ensure_ascii=False),
+                    )
+                )
+                concept_rows.extend(
+                    (concept, row, float(score)) for concept, score in pv.concept.concepts.items()
+                )
+
+            touched = [(row,) for row, *_ in paper_rows]
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO papers "
+                    "(row, paper_id, source_locator, year, has_embedding, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    paper_rows,
+                )
+                self._conn.executemany("DELETE FROM concepts WHERE row = ?", touched)
+                self._conn.executemany(
+                    "INSERT INTO concepts (concept, row, score) VALUES (?, ?, ?)", concept_rows
+                )
+                if dim is not None and self._dim is None:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('dim', ?)", (str(dim),)
+                    )
+
+            if dim is not None:
+                self._dim = dim
+                self._write_embeddings(next_row, embeddings)
+            return len(pending)
+
+    def _rows_for_ids(self, ids: list[str]) -> dict[str, int]:
+        rows: dict[str, int] = {}
+        # Stay well below SQLite's bound-parameter limit.
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for paper_id, row in self._conn.execute(
+                f"SELECT paper_id, row FROM papers WHERE paper_id IN ({placeholders})", chunk
+            ):
+                rows[paper_id] = row
+        return rows
+
+    @staticmethod
+    def _embedding_of(pv: PaperVector) -> np.ndarray | None:
+        if pv.embedding is None or not pv.embedding.vector:
+            return None
+        return np.asarray(pv.embedding.vector, dtype=np.float32)
+
+    def _write_embeddings(self, n_rows: int, embeddings: list[tuple[int, np.ndarray]]) -> None:
+        assert self._dim is not None
+        row_bytes = self._dim * np.dtype(np.float32).itemsize
+        size = self.matrix_path.stat().st_size if self.matrix_path.exists() else 0
+        if size < n_rows * row_bytes:
+            # Growing the file zero-fills new rows; rows without an embedding stay zero.
+            with open(self.matrix_path, "ab") as f:
+                f.truncate(n_rows * row_bytes)
+        if embeddings:
+            matrix = np.memmap(
+                self.matrix_path, dtype=np.float32, mode="r+", shape=(n_rows, self._dim)
+            )
+            for row, vector in embeddings:
+                matrix[row] = vector
+            matrix.flush()
+            del matrix
+        self._norms = None
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.flush()
+            return self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    def __contains__(self, paper_id: object) -> bool:
+        with self._lock:
+            if paper_id in self._pending:
+                return True
+            row = self._conn.execute(
+                "SELECT 1 FROM papers WHERE paper_id = ?", (paper_id,)
+            ).fetchone()
+            return row is not None
+
+    def paper_ids(self) -> list[str]:
+        with self._lock:
+            self.flush()
+            return [r[0] for r in self._conn.execute("SELECT paper_id FROM papers ORDER BY row")]
+
+    def get(self, paper_id: str) -> PaperVector | None:
+        with self._lock:
+            pending = self._pending.get(paper_id)
+            if pending is not None:
+                return pending
+            row = self._conn.execute(
+                "SELECT payload FROM papers WHERE paper_id = ?", (paper_id,)
+            ).fetchone()
+        return PaperVector.from_dict(json.loads(row[0])) if row else None
+
+    def iter_vectors(self) -> Iterator[PaperVector]:
+        with self._lock:
+            self.flush()
+            payloads = [r[0] for r in self._conn.execute("SELECT payload FROM papers ORDER BY row")]
+        for payload in payloads:
+            yield PaperVector.from_dict(json.loads(payload))
+
+    def all(self) -> list[PaperVector]:
+        return list(self.iter_vectors())
+
+    def _load_rows(self, rows: list[int]) -> list[PaperVector]:
+        """Decode papers for ``rows``, preserving the given order."""
+        payloads: dict[int, str] = {}
+        for start in range(0, len(rows), 500):
+            chunk = rows[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for row, payload in self._conn.execute(
+                f"SELECT row, payload FROM papers WHERE row IN ({placeholders})", chunk
+            ):
+                payloads[row] = payload
+        return [PaperVector.from_dict(json.loads(payloads[r])) for r in rows if r in payloads]
+
+    def _year_rows(self, min_year: int | None, max_year: int | None) -> list[int]:
+        clauses = ["year IS NOT NULL"]
+        params: list[int] = []
+        if min_year is not None:
+            clauses.append("year >= ?")
+            params.append(min_year)
+        if max_year is not None:
+            clauses.append("year <= ?")
+            params.append(max_year)
+        sql = f"SELECT row FROM papers WHERE {' AND '.join(clauses)} ORDER BY year, row"
+        return [r[0] for r in self._conn.execute(sql, params)]
+
+    def _concept_rows(
+        self,
+        concept: str,
+        min_score: float,
+        min_year: int | None = None,
+        max_year: int | None = None,
+    ) -> list[int]:
+        sql = "SELECT c.row FROM concepts c"
+        clauses = ["c.concept = ?", "c.score >= ?"]
+        params: list[object] = [concept, min_score]
+        if min_year is not None or max_year is not None:
+            sql += " JOIN papers p ON p.row = c.row"
+            clauses.append("p.year IS NOT NULL")
+            if min_year is not None:
+                clauses.append("p.year >= ?")
+                params.append(min_year)
+            if max_year is not None:
+                clauses.append("p.year <= ?")
+                params.append(max_year)
+        sql += f" WHERE {' AND '.join(clauses)} ORDER BY c.score DESC, c.row"
+        return [r[0] for r in self._conn.execute(sql, params)]
+
+    def filter_by_year(
+        self, min_year: int | None = None, max_year: int | None = None
+    ) -> list[PaperVector]:
+        """Papers with a known year in ``[min_year, max_year]``, oldest first."""
+        with self._lock:
+            self.flush()
+            return self._load_rows(self._year_rows(min_year, max_year))
+
+    def filter_by_concept(self, concept: str, min_score: float = 0.1) -> list[PaperVector]:
+        """Papers whose ``concept`` score is at least ``min_score``, best first."""
+        with self._lock:
+            self.flush()
+            return self._load_rows(self._concept_rows(concept, min_score))
+
+    def filter_by_year_and_concept(
+        self,
+        concept: str,
+        min_year: int | None = None,
+        max_year: int | None = None,
+        min_score: float = 0.1,
+    ) -> list[PaperVector]:
+        with self._lock:
+            self.flush()
+            rows = self._concept_rows(concept, min_score, min_year, max_year)
+            return self._load_rows(rows)
+
+    # ------------------------------------------------------------------
+    # Similarity
+    # ------------------------------------------------------------------
+
+    def embedding_matrix(self) -> np.ndarray:
+        """Read-only memmap of the stacked embeddings (``rows x dim``)."""
+        with self._lock:
+            self.flush()
+            if self._dim is None or not self.matrix_path.exists():
+                return np.zeros((0, self._dim or 0), dtype=np.float32)
+            n_rows = self.matrix_path.stat().st_size // (self._dim * 4)
+            if n_rows == 0:
+                return np.zeros((0, self._dim), dtype=np.float32)
+            return np.memmap(
+                self.matrix_path, dtype=np.float32, mode="r", shape=(n_rows, self._dim)
+            )
+
+    def _row_norms(self, matrix: np.ndarray) -> np.ndarray:
+        if self._norms is None or len(self._norms) != len(matrix):
+            self._norms = np.linalg.norm(matrix, axis=1)
+        return self._norms
+
+    def similar(
+        self,
+        query: PaperVector | Iterable[float],
+        k: int = 10,
+        min_year: int | None = None,
+        max_year: int | None = None,
+        concept: str | None = None,
+        min_score: float = 0.1,
+    ) -> list[tuple[PaperVector, float]]:
+        """Top-``k`` papers by cosine similarity of their embeddings.
+
+        Args:
+            query: A PaperVector (its embedding is used, and the paper itself
+                is excluded) or a raw embedding.
+            k: Number of results.
+            min_year: Optional lower bound on publication year.
+            max_year: Optional upper bound on publication year.
+            concept: Optional concept the results must carry.
+            min_score: Minimum concept score when ``concept`` is given.
+
+        Returns:
+            ``(paper, similarity)`` pairs, most similar first.
+        """
+        exclude = None
+        if isinstance(query, PaperVector):
+            exclude = query.paper_id
+            q = self._embedding_of(query)
+            if q is None:
+                return []
+        else:
+            q = np.asarray(list(query), dtype=np.float32)
+
+        with self._lock:
+            matrix = self.embedding_matrix()
+            if k <= 0 or len(matrix) == 0 or q.shape != (matrix.shape[1],):
+                return []
+            q_norm = float(np.linalg.norm(q))
+            if q_norm == 0.0:
+                return []
+
+            norms = self._row_norms(matrix)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores = (matrix @ q) / (norms * q_norm)
+            scores[norms == 0] = -np.inf
+
+            if concept is not None:
+                candidates = np.asarray(self._concept_rows(concept, min_score, min_year, max_year))
+            elif min_year is not None or max_year is not None:
+                candidates = np.asarray(self._year_rows(min_year, max_year))
+            else:
+                candidates = None
+            if candidates is not None:
+                mask = np.full(len(scores), -np.inf, dtype=scores.dtype)
+                candidates = candidates[candidates < len(scores)].astype(np.int64)
+                mask[candidates] = scores[candidates]
+                scores = mask
+            if exclude is not None:
+                row = self._conn.execute(
+                    "SELECT row FROM papers WHERE paper_id = ?", (exclude,)
+                ).fetchone()
+                if row is not None and row[0] < len(scores):
+                    scores[row[0]] = -np.inf
+
+            n_valid = int(np.isfinite(scores).sum())
+            k = min(k, n_valid)
+            if k == 0:
+                return []
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.lexsort((top, -scores[top]))]
+            papers = self._load_rows(top.tolist())
+        return [(pv, float(scores[row])) for pv, row in zip(papers, top.tolist())]
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def import_json_dir(self, out_dir: str | Path | None = None) -> int:
+        """Import ``vectors/paper_*.json`` files written by ``PaperVector.save``."""
+        vectors_path = Path(out_dir or self.root) / "vectors"
+        count = 0
+        for file_path in sorted(vectors_path.glob("paper_*.json")):
+            try:
+                self.add(PaperVector.load(str(file_path)))
+                count += 1
+            except Exception as e:
+                logger.debug(f"Failed to import paper vector from {file_path}: {e}")
+        self.flush()
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+    def __enter__(self) -> PaperVectorStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+__all__ = ["PaperVectorStore"]
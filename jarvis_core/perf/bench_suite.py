@@ -0,0 +1,621 @@
+"""Offline benchmark suite for JARVIS hot paths.
+
+Per RP-232, benchmarks must be deterministic and comparable between runs.
+Every case runs on a synthetic corpus generated from a fixed seed at one of
+the ``SCALES`` (1k/10k/100k documents), so the inputs are identical on every
+machine and no network, model download or LLM is involved.
+
+Cases:
+    bm25_index        Build ``search.engine.BM25Index`` in 1k-document batches.
+    bm25_query        Top-10 BM25 queries against a prebuilt index.
+    vector_search     Top-20 dot-product search in ``retrieval.VectorStore``.
+    dedup_exact       Hash dedup with ``index.dedup.DedupFilter``.
+    dedup_near        Shingle near-dedup (quadratic; capped at 250 documents).
+    chunking          ``ingestion.pipeline.TextChunker`` on sectioned full text.
+    evidence_grading  Rule-based ``grade_evidence_batch`` in batches of 100.
+    pipeline_e2e      ``PipelineExecutor`` over registered offline stages.
+    web_search        ``GET /api/search`` through the FastAPI test client.
+
+Each result reports throughput, p50/p95/p99 latency and peak RSS in the
+``SCHEMA_VERSION`` JSON layout.  ``compare_results`` flags cases whose
+throughput dropped, or whose p95 latency grew, by more than a threshold
+relative to a baseline run.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import logging
+import math
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from itertools import accumulate
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = "jarvis-bench/v1"
+SCALES: dict[str, int] = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+DEFAULT_SEED = 42
+DEFAULT_ITERATIONS = 3
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+
+QUERY_COUNT = 200
+WEB_QUERY_COUNT = 50
+BATCH_SIZE = 1_000
+GRADING_BATCH_SIZE = 100
+NEAR_DEDUP_MAX_DOCS = 250
+VECTOR_DIM = 384
+
+PIPELINE_STAGES = [
+    "retrieval.query_expand",
+    "retrieval.query_decompose",
+    "retrieval.search_bm25",
+    "retrieval.dedup",
+    "screening.pico_extract",
+    "screening.study_type_classify",
+    "extraction.claims",
+    "extraction.numeric",
+    "extraction.evidence_link",
+]
+
+_DOMAIN_TERMS = (
+    "tumor cd73 adenosine melanoma immunotherapy pd-1 t-cell macrophage cytokine "
+    "inflammation mortality survival biomarker expression pathway receptor inhibitor "
+    "antibody dose placebo patients cohort mice cell gene protein signaling response "
+    "efficacy safety toxicity metastasis microenvironment hypoxia"
+).split()
+_DESIGNS = [
+    ("randomized controlled trial", "We conducted a double-blind randomized controlled trial"),
+    ("cohort study", "In this prospective cohort study we followed"),
+    ("case-control study", "This case-control study compared"),
+    ("systematic review", "We performed a systematic review and meta-analysis of"),
+    ("case report", "We report a case of"),
+    ("mouse model", "Using a mouse model in vivo we examined"),
+    ("in vitro study", "In vitro experiments with cultured cells examined"),
+]
+_SECTIONS = ("Introduction", "Methods", "Results", "Discussion")
+_SYLLABLES = ["ka", "ro", "mi", "te", "lu", "sa", "no", "vi", "de", "ga", "po", "ri", "zen", "tor"]
+
+
+class SyntheticCorpus:
+    """Deterministic biomedical-like corpus.
+
+    Words follow a Zipf distribution over a fixed vocabulary, each document
+    names one study design, and 4% of documents are exact or near duplicates
+    of an earlier one.  The same ``(n_docs, seed)`` always yields the same
+    documents and queries.
+
+    Args:
+        n_docs: Number of documents.
+        seed: Random seed.
+        title_templates: Optional real titles mixed into the generated ones.
+    """
+
+    def __init__(
+        self,
+        n_docs: int,
+        seed: int = DEFAULT_SEED,
+        title_templates: list[str] | None = None,
+    ):
+        self.n_docs = n_docs
+        self.seed = seed
+        rng = random.Random(seed)
+        self.vocabulary = list(_DOMAIN_TERMS)
+        while len(self.vocabulary) < 5_000:
+            word = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+            self.vocabulary.append(word)
+        self._cum_weights = list(accumulate(1.0 / (rank + 1) for rank in range(5_000)))
+        self.docs: list[dict[str, Any]] = []
+        for i in range(n_docs):
+            self.docs.append(self._make_doc(rng, i, title_templates or []))
+
+    def _words(self, rng: random.Random, count: int) -> str:
+        return " ".join(rng.choices(self.vocabulary, cum_weights=self._cum_weights, k=count))
+
+    def _make_doc(self, rng: random.Random, i: int, templates: list[str]) -> dict[str, Any]:
+        design, opener = _DESIGNS[i % len(_DESIGNS)]
+        if i % 25 == 24 and i >= 7:
+            text = self.docs_text(i - 7)
+        elif i % 25 == 12 and i >= 5:
+            words = self.docs_text(i - 5).split()
+            words[-1] = rng.choice(self.vocabulary)
+            text = " ".join(words)
+        else:
+            text = (
+                f"{opener} {rng.randint(20, 900)} patients. "
+                f"{self._words(rng, rng.randint(40, 80))}. "
+                f"We found that {self._words(rng, 8)} reduced {rng.choice(_DOMAIN_TERMS)} "
+                f"by {rng.randint(5, 60)}% (p=0.0{rng.randint(1, 4)}). "
+                f"{self._words(rng, rng.randint(30, 60))}."
+            )
+        if templates and i % 4 == 0:
+            title = templates[(i // 4) % len(templates)]
+        else:
+            title = f"{design.capitalize()} of {self._words(rng, 3)} in {rng.choice(_DOMAIN_TERMS)}"
+        return {
+            "doc_id": f"doc{i:06d}",
+            "title": title,
+            "abstract": text,
+            "text": text,
+            "study_type": design,
+        }
+
+    def docs_text(self, i: int) -> str:
+        return self.docs[i]["text"]
+
+    def full_text(self, i: int) -> str:
+        """Sectioned full text built from neighbouring documents (not stored)."""
+        parts = []
+        for offset, section in enumerate(_SECTIONS):
+            doc = self.docs[(i + offset) % self.n_docs]
+            parts.append(f"{section}\n\n{doc['text']}\n\n{doc['text']}")
+        return "\n\n".join(parts)
+
+    def queries(self, count: int = QUERY_COUNT) -> list[str]:
+        rng = random.Random(self.seed + 1)
+        return [
+            f"{rng.choice(_DOMAIN_TERMS)} {self._words(rng, rng.randint(1, 3))}"
+            for _ in range(count)
+        ]
+
+    def chunks(self) -> Iterator[dict[str, Any]]:
+        for doc in self.docs:
+            yield {
+                "chunk_id": f"{doc['doc_id']}_abstract",
+                "paper_id": doc["doc_id"],
+                "paper_title": doc["title"],
+                "section": "abstract",
+                "text": doc["text"],
+            }
+
+
+class _Samples:
+    """Per-operation timings collected by a case."""
+
+    def __init__(self) -> None:
+        self.durations: list[float] = []
+        self.items = 0
+        self.extra: dict[str, Any] = {}
+
+    @contextmanager
+    def measure(self, items: int = 1) -> Iterator[None]:
+        start = time.perf_counter()
+        yield
+        self.durations.append(time.perf_counter() - start)
+        self.items += items
+
+
+BenchFn = Callable[[SyntheticCorpus, _Samples, int], None]
+BENCH_CASES: dict[str, BenchFn] = {}
+
+
+def _case(name: str) -> Callable[[BenchFn], BenchFn]:
+    def decorator(fn: BenchFn) -> BenchFn:
+        BENCH_CASES[name] = fn
+        return fn
+
+    return decorator
+
+
+def _batches(items: list[Any], size: int) -> Iterator[list[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+@_case("bm25_index")
+def _bench_bm25_index(corpus: SyntheticCorpus, samples: _Samples, iterations: int) -> None:
+    from jarvis_core.search.engine import BM25Index
+
+    for _ in range(iterations):
+        index = BM25Index()
+        for batch in _batches(corpus.docs, BATCH_SIZE):
+            with samples.measure(len(batch)):
+                index.add_documents(batch)
+        start = time.perf_counter()
+        index.merge_segments()
+        samples.extra["merge_ms"] = (time.perf_counter() - start) * 1000
+
+
+@_case("bm25_query")
+def _bench_bm25_query(corpus: SyntheticCorpus, samples: _Samples, iterations: int) -> None:
+    from jarvis_core.search.engine import BM25Index
+
+    index = BM25Index()
+    index.add_documents(corpus.docs)
+    index.merge_segments()
+    queries = corpus.queries()
+    for _ in range(iterations):
+        for query in queries:
+            with samples.measure():
+                index.search(query, top_k=10)
+
+
+@_case("vector_search")
+def _bench_vector_search(corpus: SyntheticCorpus, samples: _Samples, iterations: int) -> None:
+    import numpy as np
+
+    from jarvis_core.retrieval.vector_store import VectorStore
+
+    rng = np.random.default_rng(corpus.seed)
+    vectors = rng.standard_normal((corpus.n_docs, VECTOR_DIM), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    store = VectorStore(
+        index_path=Path("vectors.npz"),
+        chunk_ids=[doc["doc_id"] for doc in corpus.docs],
+        vectors=vectors,
+        model_name="synthetic",
+    )
+    queries = rng.standard_normal((QUERY_COUNT, VECTOR_DIM), dtype=np.float32)
+    for _ in range(iterations):
+        for query in queries:
+            with samples.measure():
+                store.search(query, top_k=20)
+
+
+@_case("dedup_exact")
+def _bench_dedup_exact(corpus: SyntheticCorpus, samples: _Samples, iterations: int) -> None:
+    from jarvis_core.index.dedup import DedupFilter
+
+    texts = [doc["text"] for doc in corpus.docs]
+    for _ in range(iterations):
+        dedup = DedupFilter()
+        duplicates = 0
+        for batch in _batches(texts, BATCH_SIZE):
+            with samples.measure(len(batch)):
+                duplicates += len(dedup.dedupe(batch).duplicates)
+        samples.extra["duplicates"] = duplicates
+
+
+@_case("dedup_near")
+def _bench_dedup_near(corpus: SyntheticCorpus, samples: _Samples, iterations: int) -> None:
+    from jarvis_core.index.dedup import DedupFilter
+
+    texts = [doc["text"] for doc in corpus.docs[:NEAR_DEDUP_MAX_DOCS]]
+    for _ in range(iterations):
+        with samples.measure(len(texts)):
+            result = DedupFilter(similarity_threshold=0.9).dedupe(texts, check_near=True)
+        samples.extra["duplicates"] = len(result.duplicates)
+    samples.extra["docs_capped_at"] = len(texts)
+
+
+@_case("chunking")
+def _bench_chunking(corpus: SyntheticCorpus, samples: _Samples, iterations: int) -> None:
+    from jarvis_core.ingestion.pipeline import TextChunker
+
+    chunker = TextChunker(chunk_size=1000, overlap=100)
+    for _ in range(iterations):
+        produced = 0
+        for i, doc in enumerate(corpus.docs):
+            text = corpus.full_text(i)
+            with samples.measure():
+                produced += len(chunker.chunk(text, paper_id=doc["doc_id"]))
+        samples.extra["chunks"] = produced
+
+
+@_case("evidence_grading")
+def _bench_evidence_grading(corpus: SyntheticCorpus, samples: _Samples, iterations: int) -> None:
+    from jarvis_core.evidence import grade_evidence_batch
+
+    papers = [{"title": doc["title"], "abstract": doc["abstract"]} for doc in corpus.docs]
+    for _ in range(iterations):
+        for batch in _batches(papers, GRADING_BATCH_SIZE):
+            with samples.measure(len(batch)):
+                grade_evidence_batch(batch, use_llm=False)
+
+
+@_case("pipeline_e2e")
+def _bench_pipeline_e2e(corpus: SyntheticCorpus, samples: _Samples, iterations: int) -> None:
+    import jarvis_core.stages  # noqa: F401  (registers stages)
+    from jarvis_core.contracts.types import Artifacts, Paper, TaskContext
+    from jarvis_core.ops import audit
+    from jarvis_core.pipelines.executor import PipelineConfig, PipelineExecutor
+
+    config = PipelineConfig.from_dict(
+        {
+            "pipeline": "bench_offline",
+            "stages": [{"id": stage} for stage in PIPELINE_STAGES],
+            "policies": {
+                "cache": "none",
+                "provenance_required": False,
+                "refuse_if_no_evidence": False,
+            },
+        }
+    )
+    papers = [
+        Paper(doc_id=doc["doc_id"], title=doc["title"], abstract=doc["abstract"])
+        for doc in corpus.docs
+    ]
+    previous = os.environ.get("USE_MOCK_PUBMED")
+    os.environ["USE_MOCK_PUBMED"] = "1"
+    # Stages log through the global audit logger, whose relative log dir may
+    # have been created under another cwd; use a fresh one in the scratch dir.
+    previous_audit = audit._audit_logger
+    audit._audit_logger = None
+    try:
+        for i in range(iterations):
+            context = TaskContext(goal="CD73 inhibitors in melanoma", domain="oncology")
+            context.run_id = f"bench-{i}"
+            with samples.measure(len(papers)):
+                result = PipelineExecutor(config).run(context, Artifacts(papers=list(papers)))
+            if not result.success:
+                raise RuntimeError(f"pipeline failed: {result.error}")
+            samples.extra["claims"] = result.metrics.claims_total
+    finally:
+        audit._audit_logger = previous_audit
+        if previous is None:
+            os.environ.pop("USE_MOCK_PUBMED", None)
+        else:
+            os.environ["USE_MOCK_PUBMED"] = previous
+
+
+@_case("web_search")
+def _bench_web_search(corpus: SyntheticCorpus, samples: _Samples, iterations: int) -> None:
+    from fastapi.testclient import TestClient
+
+    from jarvis_web.app import app
+
+    chunks_path = Path("data/chunks.jsonl")
+    chunks_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = chunks_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for chunk in corpus.chunks():
+            f.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+    os.replace(tmp_path, chunks_path)  # new inode: the engine reloads
+
+    client = TestClient(app)
+    queries = corpus.queries(WEB_QUERY_COUNT)
+    start = time.perf_counter()
+    client.get("/api/search", params={"q": queries[0], "top_k": 10})
+    samples.extra["cold_load_ms"] = (time.perf_counter() - start) * 1000
+    for _ in range(iterations):
+        for query in queries:
+            with samples.measure():
+                response = client.get("/api/search", params={"q": query, "top_k": 10})
+            if response.status_code != 200:
+                raise RuntimeError(f"/api/search returned {response.status_code}")
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@contextmanager
+def _scratch_dir() -> Iterator[None]:
+    """Run in a temporary cwd so stages and endpoints write nothing into the repo."""
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="jarvis-bench-") as tmp:
+        os.chdir(tmp)
+        try:
+            yield
+        finally:
+            os.chdir(previous)
+
+
+def run_case(
+    case: str,
+    scale: str,
+    n_docs: int,
+    seed: int = DEFAULT_SEED,
+    iterations: int = DEFAULT_ITERATIONS,
+    title_templates: list[str] | None = None,
+    isolated: bool = False,
+) -> dict[str, Any]:
+    """Run one case at one scale and return its result row."""
+    row: dict[str, Any] = {
+        "case": case,
+        "scale": scale,
+        "docs": n_docs,
+        "iterations": iterations,
+        "status": "ok",
+    }
+    samples = _Samples()
+    try:
+        corpus = SyntheticCorpus(n_docs, seed=seed, title_templates=title_templates)
+        gc.collect()
+        with _scratch_dir():
+            BENCH_CASES[case](corpus, samples, iterations)
+    except ImportError as e:
+        row.update(status="skipped", reason=str(e))
+        return row
+    except Exception as e:
+        logger.exception("Benchmark %s@%s failed", case, scale)
+        row.update(status="error", reason=f"{type(e).__name__}: {e}")
+        return row
+
+    ordered = sorted(samples.durations)
+    total = sum(ordered)
+    row.update(
+        ops=len(ordered),
+        items=samples.items,
+        total_sec=round(total, 6),
+        throughput_per_sec=round(samples.items / total, 3) if total > 0 else 0.0,
+        latency_ms={
+            "mean": round(total / len(ordered) * 1000, 4) if ordered else 0.0,
+            "p50": round(_percentile(ordered, 0.50) * 1000, 4),
+            "p95": round(_percentile(ordered, 0.95) * 1000, 4),
+            "p99": round(_percentile(ordered, 0.99) * 1000, 4),
+            "max": round(ordered[-1] * 1000, 4) if ordered else 0.0,
+        },
+        peak_rss_mb=_peak_rss_mb(),
+        rss_isolated=isolated,
+        extra=samples.extra,
+    )
+    return row
+
+
+def _run_isolated(kwargs: dict[str, Any]) -> dict[str, Any]:
+    return run_case(**kwargs, isolated=True)
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> dict[str, Any]:
+    """Compare two suite results.
+
+    A case regresses when its throughput falls, or its p95 latency rises, by
+    more than ``threshold`` (a fraction) relative to the baseline.
+    """
+    base = {
+        (r["case"], r["scale"]): r for r in baseline.get("results", []) if r.get("status") == "ok"
+    }
+    cases = []
+    for row in current.get("results", []):
+        prev = base.get((row["case"], row["scale"]))
+        if row.get("status") != "ok" or prev is None:
+            continue
+        throughput_change = (
+            row["throughput_per_sec"] / prev["throughput_per_sec"] - 1.0
+            if prev["throughput_per_sec"]
+            else 0.0
+        )
+        prev_p95 = prev["latency_ms"]["p95"]
+        p95_change = row["latency_ms"]["p95"] / prev_p95 - 1.0 if prev_p95 else 0.0
+        cases.append(
+            {
+                "case": row["case"],
+                "scale": row["scale"],
+                "throughput_change": round(throughput_change, 4),
+                "p95_change": round(p95_change, 4),
+                "regressed": throughput_change < -threshold or p95_change > threshold,
+            }
+        )
+    return {
+        "threshold": threshold,
+        "baseline_timestamp": baseline.get("timestamp"),
+        "cases": cases,
+        "regressions": [f"{c['case']}@{c['scale']}" for c in cases if c["regressed"]],
+    }
+
+
+def run_suite(
+    scales: list[str] | None = None,
+    cases: list[str] | None = None,
+    seed: int = DEFAULT_SEED,
+    iterations: int = DEFAULT_ITERATIONS,
+    isolate: bool = True,
+    title_templates: list[str] | None = None,
+    baseline: dict[str, Any] | None = None,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    scale_sizes: dict[str, int] | None = None,
+) -> dict[str, Any]:
+    """Run the benchmark suite.
+
+    Args:
+        scales: Scale names from ``scale_sizes`` (default: all of ``SCALES``).
+        cases: Case names from ``BENCH_CASES`` (default: all).
+        seed: Corpus seed.
+        iterations: Passes over each case's workload.
+        isolate: Run each case in a fresh process so ``peak_rss_mb`` is
+            per case rather than cumulative.
+        title_templates: Real titles mixed into the synthetic corpus.
+        baseline: Previous suite result to compare against.
+        threshold: Regression threshold for ``compare_results``.
+        scale_sizes: Override of ``SCALES`` (document count per scale name).
+
+    Returns:
+        Suite result in the ``SCHEMA_VERSION`` layout.
+    """
+    sizes = scale_sizes or SCALES
+    scales = scales or list(sizes)
+    cases = cases or list(BENCH_CASES)
+    unknown = [c for c in cases if c not in BENCH_CASES] + [s for s in scales if s not in sizes]
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases or scales: {unknown}")
+
+    jobs = [
+        {
+            "case": case,
+            "scale": scale,
+            "n_docs": sizes[scale],
+            "seed": seed,
+            "iterations": iterations,
+            "title_templates": title_templates,
+        }
+        for scale in scales
+        for case in cases
+    ]
+    results = []
+    for job in jobs:
+        logger.info("Running benchmark %s@%s", job["case"], job["scale"])
+        if isolate:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                results.append(pool.submit(_run_isolated, job).result())
+        else:
+            results.append(run_case(**job))
+
+    ok = [r for r in results if r["status"] == "ok"]
+    summary: dict[str, Any] = {
+        "schema": SCHEMA_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "environment": _environment(),
+        "config": {
+            "scales": {scale: sizes[scale] for scale in scales},
+            "cases": cases,
+            "seed": seed,
+            "iterations": iterations,
+            "isolated": isolate,
+        },
+        "results": results,
+        # Mean per-operation latency in seconds, kept for older comparison scripts.
+        "overall_avg": (sum(r["latency_ms"]["mean"] for r in ok) / len(ok) / 1000 if ok else 0.0),
+        "comparison": None,
+    }
+    if baseline is not None:
+        summary["comparison"] = compare_results(summary, baseline, threshold)
+    return summary
+
+
+def _environment() -> dict[str, Any]:
+    try:
+        import numpy
+
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy_version,
+    }
+
+
+__all__ = [
+    "BENCH_CASES",
+    "SCALES",
+    "SCHEMA_VERSION",
+    "SyntheticCorpus",
+    "compare_results",
+    "run_case",
+    "run_suite",
+]
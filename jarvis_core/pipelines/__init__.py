@@ -1,5 +1,6 @@
 """JARVIS Pipelines Module"""
 
+from .artifact_cache import StageArtifactCache
 from .executor import (
     DEFAULT_PIPELINE,
     PipelineConfig,
@@ -20,6 +21,7 @@ __all__ = [
     "PipelineConfig",
     "PipelineExecutor",
     "DEFAULT_PIPELINE",
+    "StageArtifactCache",
     "get_pipeline_executor",
     "StageRegistry",
     "StageNotImplementedError",
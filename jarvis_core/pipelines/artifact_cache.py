@@ -0,0 +1,144 @@
+"""
+JARVIS Pipelines - ステージ成果物の内容アドレス型キャッシュ
+
+ステージ名・ハンドラのコード・宣言された入力値からSHA-256キーを計算し、
+ステージの出力を ``<root>/<key[:2]>/<key>.pkl`` に保存する。
+入力が変わらなければ同じキーになるため、再実行時にステージをスキップできる。
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STAGE_CACHE_VERSION = "pipeline_stage_cache_v1"
+DEFAULT_STAGE_CACHE_DIR = Path("data/cache/stages")
+
+
+def _canonical_default(value: Any) -> Any:
+    """JSON化できない値を安定した表現に変換。"""
+    to_dict = getattr(value, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, bytes):
+        return hashlib.sha256(value).hexdigest()
+    return repr(value)
+
+
+def fingerprint_handler(handler: Callable) -> str:
+    """
+    ハンドラのコードのフィンガープリント。
+
+    デコレータを剥がした関数のコードオブジェクトをハッシュするため、
+    ステージ実装を変更するとキャッシュは自動的に無効になる。
+    """
+    func = inspect.unwrap(handler)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return getattr(func, "__qualname__", repr(func))
+    digest = hashlib.sha256()
+    _hash_code(code, digest)
+    return digest.hexdigest()
+
+
+def _hash_code(code: CodeType, digest: Any) -> None:
+    # marshal.dumps()は参照カウント依存で出力が揺れるため、構造的にハッシュする
+    digest.update(code.co_code)
+    digest.update(repr((code.co_names, code.co_varnames)).encode("utf-8"))
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _hash_code(const, digest)
+        else:
+            digest.update(repr(const).encode("utf-8"))
+
+
+def compute_stage_key(stage_name: str, handler: Callable, inputs: dict[str, Any]) -> str:
+    """
+    ステージのキャッシュキーを計算。
+
+    Args:
+        stage_name: ステージ名
+        handler: ステージハンドラ
+        inputs: 宣言された入力キー → 値
+
+    Returns:
+        SHA-256 16進文字列
+    """
+    payload = {
+        "version": STAGE_CACHE_VERSION,
+        "stage": stage_name,
+        "code": fingerprint_handler(handler),
+        "inputs": inputs,
+    }
+    raw = json.dumps(
+        payload,
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=_canonical_default,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class StageArtifactCache:
+    """
+    ステージ出力の内容アドレス型ストア。
+
+    Args:
+        root: 保存先ディレクトリ
+        read_only: Trueなら書き込みを行わない
+    """
+
+    def __init__(self, root: Path | str = DEFAULT_STAGE_CACHE_DIR, read_only: bool = False):
+        self.root = Path(root)
+        self.read_only = read_only
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> Any | None:
+        """キャッシュ済みの値を返す（無ければ、または壊れていればNone）。"""
+        path = self.path_for(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning("Discarding unreadable stage cache entry %s: %s", path, e)
+            return None
+
+    def put(self, key: str, value: Any) -> bool:
+        """値を保存。一時ファイル経由で置き換えるため並行書き込みでも壊れない。"""
+        if self.read_only:
+            return False
+        path = self.path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning("Failed to write stage cache entry %s: %s", path, e)
+            return False
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        return self.path_for(key).exists()
@@ -7,8 +7,10 @@ StageRegistry一本化 - 手動stage_handlers廃止。
 
 from __future__ import annotations
 
+import os
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
@@ -19,9 +21,14 @@ try:
 except ImportError:
     HAS_YAML = False
 
-from jarvis_core.contracts.types import Artifacts, Metrics, ResultBundle, TaskContext
+from jarvis_core.contracts.types import Artifacts, Claim, Metrics, ResultBundle, TaskContext
 from jarvis_core.obs import metrics
 from jarvis_core.obs.logger import get_logger
+from jarvis_core.pipelines.artifact_cache import (
+    DEFAULT_STAGE_CACHE_DIR,
+    StageArtifactCache,
+    compute_stage_key,
+)
 from jarvis_core.pipelines.stage_registry import get_stage_registry
 from jarvis_core.supervisor.lyra import LyraSupervisor, get_lyra
 
@@ -36,6 +43,92 @@ class StageResult:
     outputs: dict[str, Any] = field(default_factory=dict)
     error: str | None = None
     provenance_rate: float = 0.0
+    cached: bool = False
+
+
+@dataclass(frozen=True)
+class StageIO:
+    """ステージが宣言した入出力キー."""
+
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+    cacheable: bool = True
+
+
+_MISSING = object()
+_ARTIFACT_FIELDS = tuple(f.name for f in fields(Artifacts))
+_DISABLED_CACHE_POLICIES = {"none", "off", "disabled", "false"}
+DEFAULT_MAX_PARALLEL_STAGES = 4
+
+
+def _keys_overlap(a: str, b: str) -> bool:
+    """ "metadata" と "metadata.x" のような包含関係も重なりとみなす."""
+    return a == b or a.startswith(b + ".") or b.startswith(a + ".")
+
+
+def _any_overlap(left: tuple[str, ...], right: tuple[str, ...]) -> bool:
+    return any(_keys_overlap(a, b) for a in left for b in right)
+
+
+def _depends_on(later: StageIO, earlier: StageIO) -> bool:
+    """laterがearlierの完了を待つ必要があるか（RAW/WAR/WAW）."""
+    if "claims" in later.inputs:
+        return True
+    if _any_overlap(later.inputs, earlier.outputs):
+        return True
+    if _any_overlap(later.outputs, earlier.inputs):
+        return True
+    later_writes = tuple(k for k in later.outputs if k != "claims")
+    earlier_writes = tuple(k for k in earlier.outputs if k != "claims")
+    return _any_overlap(later_writes, earlier_writes)
+
+
+def _read_key(key: str, context: TaskContext, artifacts: Artifacts) -> Any:
+    """成果物キーの値を取得（存在しなければ_MISSING）."""
+    head, _, rest = key.partition(".")
+    if head == "context":
+        return getattr(context, rest, _MISSING)
+    if head == "env":
+        return os.environ.get(rest, _MISSING)
+    if head not in _ARTIFACT_FIELDS:
+        raise KeyError(f"Unknown artifact key: {key}")
+    value = getattr(artifacts, head)
+    if rest:
+        return value.get(rest, _MISSING) if isinstance(value, dict) else _MISSING
+    return value
+
+
+def _write_key(key: str, artifacts: Artifacts, value: Any) -> None:
+    """成果物キーに値を書き込む（_MISSINGなら削除）."""
+    head, _, rest = key.partition(".")
+    if head not in _ARTIFACT_FIELDS or head == "claims":
+        return
+    if not rest:
+        if value is not _MISSING:
+            setattr(artifacts, head, value)
+        return
+    container = getattr(artifacts, head)
+    if value is _MISSING:
+        container.pop(rest, None)
+    else:
+        container[rest] = value
+
+
+def _is_degraded(io: StageIO, context: TaskContext, artifacts: Artifacts) -> bool:
+    """宣言出力 ``metadata.*_error`` に値があれば劣化結果とみなす（キャッシュしない）."""
+    return any(
+        key.startswith("metadata.")
+        and key.endswith("_error")
+        and _read_key(key, context, artifacts) not in (_MISSING, None, "")
+        for key in io.outputs
+    )
+
+
+def _stage_view(artifacts: Artifacts, claims: list[Claim]) -> Artifacts:
+    """並列実行用のArtifactsビュー（トップレベルのコンテナを浅くコピー）."""
+    view = Artifacts(**{name: getattr(artifacts, name).copy() for name in _ARTIFACT_FIELDS})
+    view.claims = claims
+    return view
 
 
 def _parse_stages(raw_stages: list) -> list[str]:
@@ -115,6 +208,8 @@ class PipelineExecutor:
     - StageRegistryから全ハンドラを取得
     - 手動stage_handlersは廃止
     - YAMLで定義されたステージを順次実行
+    - 入出力を宣言したステージは依存関係のない範囲で並列実行
+    - 宣言済みステージは入力ハッシュで内容アドレス型キャッシュを参照
     - Lyra Supervisorによる監査
     - 根拠付け率の検証
     """
@@ -130,6 +225,40 @@ class PipelineExecutor:
         self.refuse_if_no_evidence = config.policies.get("refuse_if_no_evidence", True)
         self.cache_policy = config.policies.get("cache", "aggressive")
         self.default_timeout = config.policies.get("timeouts", {}).get("stage_default_sec", 120)
+        self.max_parallel_stages = max(
+            1, int(config.policies.get("max_parallel_stages", DEFAULT_MAX_PARALLEL_STAGES))
+        )
+        self.cache = self._build_cache(config.policies)
+
+    def _build_cache(self, policies: dict[str, Any]) -> StageArtifactCache | None:
+        policy = str(self.cache_policy).lower()
+        if self.cache_policy is False or policy in _DISABLED_CACHE_POLICIES:
+            return None
+        root = policies.get("cache_dir") or DEFAULT_STAGE_CACHE_DIR
+        return StageArtifactCache(root, read_only=policy == "read_only")
+
+    def _stage_io(self, stage_name: str) -> StageIO | None:
+        """ステージの入出力宣言を取得（未宣言ならNone＝逐次実行のバリア）."""
+        get_metadata = getattr(self._registry, "get_metadata", None)
+        meta = get_metadata(stage_name) if get_metadata else None
+        if not meta or meta.get("inputs") is None or meta.get("outputs") is None:
+            return None
+        return StageIO(
+            inputs=tuple(meta["inputs"]),
+            outputs=tuple(meta["outputs"]),
+            cacheable=bool(meta.get("cacheable", True)),
+        )
+
+    def _plan_groups(self, stage_names: list[str]) -> list[list[tuple[str, StageIO | None]]]:
+        """連続する宣言済みステージをまとめ、未宣言ステージは単独グループにする."""
+        groups: list[list[tuple[str, StageIO | None]]] = []
+        for name in stage_names:
+            io = self._stage_io(name)
+            if io is not None and groups and groups[-1][-1][1] is not None:
+                groups[-1].append((name, io))
+            else:
+                groups.append([(name, io)])
+        return groups
 
     def run(self, context: TaskContext, artifacts: Artifacts) -> ResultBundle:
         """
@@ -166,18 +295,36 @@ class PipelineExecutor:
         result.add_log(f"Lyra supervision: {lyra_task.task_id}")
 
         # Execute each stage via StageRegistry
-        for stage_name in self.config.stages:
-            stage_result = self._execute_stage(stage_name, context, artifacts, obs_logger)
-            self.results.append(stage_result)
-
-            if not stage_result.success:
-                result.mark_error(f"Stage {stage_name} failed: {stage_result.error}")
-                if self.refuse_if_no_evidence:
-                    break
+        total_stages = len(self.config.stages)
+        index = 0
+        stopped = False
+        for group in self._plan_groups(self.config.stages):
+            if group[0][1] is None:
+                stage_results = [self._execute_stage(group[0][0], context, artifacts, obs_logger)]
             else:
-                # Merge outputs
-                for key, value in stage_result.outputs.items():
-                    result.outputs[key] = value
+                stage_results = self._run_group(group, context, artifacts, obs_logger)
+
+            for stage_result in stage_results:
+                index += 1
+                stage_name = stage_result.stage_name
+                self.results.append(stage_result)
+                obs_logger.progress(
+                    "Pipeline",
+                    int(index * 100 / total_stages),
+                    data={"stage": stage_name, "completed": index, "total": total_stages},
+                )
+
+                if not stage_result.success:
+                    result.mark_error(f"Stage {stage_name} failed: {stage_result.error}")
+                    if self.refuse_if_no_evidence:
+                        stopped = True
+                        break
+                else:
+                    # Merge outputs
+                    for key, value in stage_result.outputs.items():
+                        result.outputs[key] = value
+            if stopped:
+                break
 
         # Calculate metrics
         total_time = (time.time() - start_time) * 1000
@@ -187,6 +334,12 @@ class PipelineExecutor:
             claims_total=len(artifacts.claims),
             claims_with_evidence=sum(1 for c in artifacts.claims if c.has_evidence()),
             papers_processed=len(artifacts.papers),
+            cache_hits=sum(1 for r in self.results if r.cached),
+            cache_misses=sum(
+                1
+                for r in self.results
+                if not r.cached and self.cache is not None and self._is_cacheable(r.stage_name)
+            ),
         )
 
         # Validate provenance if required
@@ -211,6 +364,130 @@ class PipelineExecutor:
 
         return result
 
+    def _is_cacheable(self, stage_name: str) -> bool:
+        io = self._stage_io(stage_name)
+        return io is not None and io.cacheable
+
+    def _run_group(
+        self,
+        group: list[tuple[str, StageIO | None]],
+        context: TaskContext,
+        artifacts: Artifacts,
+        obs_logger: Any | None = None,
+    ) -> list[StageResult]:
+        """
+        入出力を宣言したステージ群をDAGとして実行.
+
+        各ステージはArtifactsのビュー上で動き、完了時に宣言した出力だけが
+        本体へ書き戻される。追加されたclaimsはパイプライン順に連結する。
+        ビューの作成と書き戻しはスケジューラスレッドでのみ行う。
+
+        Returns:
+            実行したステージの結果（パイプライン順）
+        """
+        names = [name for name, _ in group]
+        ios = [io for _, io in group]
+        deps = [{j for j in range(i) if _depends_on(ios[i], ios[j])} for i in range(len(group))]
+
+        results: dict[int, StageResult] = {}
+        new_claims: dict[int, list[Claim]] = {}
+        pending = list(range(len(group)))
+        running: dict[Any, int] = {}
+        failed = False
+
+        workers = min(self.max_parallel_stages, len(group))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stage") as pool:
+            while pending or running:
+                if not failed:
+                    for i in [i for i in pending if deps[i] <= results.keys()]:
+                        pending.remove(i)
+                        claims = list(artifacts.claims)
+                        if "claims" in ios[i].inputs:
+                            for j in range(i):
+                                claims.extend(new_claims.get(j, []))
+                        view = _stage_view(artifacts, claims)
+                        future = pool.submit(
+                            self._execute_declared, names[i], ios[i], context, view, obs_logger
+                        )
+                        running[future] = i
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    stage_result, view, base = future.result()
+                    results[i] = stage_result
+                    if not stage_result.success:
+                        failed = failed or self.refuse_if_no_evidence
+                        continue
+                    for key in ios[i].outputs:
+                        _write_key(key, artifacts, _read_key(key, context, view))
+                    new_claims[i] = view.claims[base:]
+
+        ordered = [results[i] for i in sorted(results)]
+        for i in sorted(new_claims):
+            artifacts.claims.extend(new_claims[i])
+        return ordered
+
+    def _execute_declared(
+        self,
+        stage_name: str,
+        io: StageIO,
+        context: TaskContext,
+        view: Artifacts,
+        obs_logger: Any | None = None,
+    ) -> tuple[StageResult, Artifacts, int]:
+        """宣言済みステージをキャッシュ経由で実行し、(結果, ビュー, 既存claims数)を返す."""
+        base = len(view.claims)
+        key = None
+        if self.cache is not None and io.cacheable:
+            inputs = {k: _read_key(k, context, view) for k in io.inputs}
+            key = compute_stage_key(
+                stage_name,
+                self._registry.get(stage_name),
+                {k: (None if v is _MISSING else v) for k, v in inputs.items()},
+            )
+            start = time.time()
+            entry = self.cache.get(key)
+            metrics.record_stage_cache(context.run_id, stage_name, entry is not None)
+            if entry is not None:
+                for out_key in io.outputs:
+                    _write_key(out_key, view, entry["values"].get(out_key, _MISSING))
+                view.claims.extend(entry["claims"])
+                duration = (time.time() - start) * 1000
+                if obs_logger:
+                    obs_logger.step_end(stage_name, data={"duration_ms": duration, "cached": True})
+                return (
+                    StageResult(
+                        stage_name=stage_name,
+                        success=True,
+                        duration_ms=duration,
+                        outputs=entry["outputs"],
+                        provenance_rate=view.get_provenance_rate(),
+                        cached=True,
+                    ),
+                    view,
+                    base,
+                )
+
+        stage_result = self._execute_stage(stage_name, context, view, obs_logger)
+        # 外部APIの障害などで劣化した結果は保存しない（次回の実行で再試行させる）
+        if key is not None and stage_result.success and not _is_degraded(io, context, view):
+            self.cache.put(
+                key,
+                {
+                    "values": {
+                        k: v
+                        for k in io.outputs
+                        if k != "claims" and (v := _read_key(k, context, view)) is not _MISSING
+                    },
+                    "claims": view.claims[base:],
+                    "outputs": stage_result.outputs,
+                },
+            )
+        return stage_result, view, base
+
     def _execute_stage(
         self,
         stage_name: str,
@@ -271,12 +548,14 @@ class PipelineExecutor:
             "stages_executed": len(self.results),
             "stages_success": sum(1 for r in self.results if r.success),
             "total_duration_ms": sum(r.duration_ms for r in self.results),
+            "cache_hits": sum(1 for r in self.results if r.cached),
             "results": [
                 {
                     "stage": r.stage_name,
                     "success": r.success,
                     "duration_ms": r.duration_ms,
                     "error": r.error,
+                    "cached": r.cached,
                 }
                 for r in self.results
             ],
@@ -38,7 +38,14 @@ class StageRegistry:
         return cls._instance
 
     def register(
-        self, name: str, handler: Callable, description: str = "", requires_provenance: bool = True
+        self,
+        name: str,
+        handler: Callable,
+        description: str = "",
+        requires_provenance: bool = True,
+        inputs: list[str] | None = None,
+        outputs: list[str] | None = None,
+        cacheable: bool = True,
     ) -> None:
         """
         ステージを登録。
@@ -48,6 +55,14 @@ class StageRegistry:
             handler: 実行可能オブジェクト
             description: 説明
             requires_provenance: provenance更新が必須か
+            inputs: 読み込む成果物キー（例: "papers", "metadata.bm25_results",
+                "context.goal", "env.USE_MOCK_PUBMED"）
+            outputs: 書き込む成果物キー（例: "embeddings", "metadata.query_parts"）
+            cacheable: 入力ハッシュによるキャッシュを許可するか
+
+        inputs/outputsを両方宣言したステージは、依存関係のない他ステージと並列実行され、
+        入力が同じならキャッシュから復元される。未宣言のステージは従来どおり逐次実行。
+        既存の値に追記するステージは、そのキーをinputsにも含めること。
         """
         if name in self._handlers:
             raise ValueError(f"Stage '{name}' is already registered")
@@ -56,6 +71,9 @@ class StageRegistry:
         self._metadata[name] = {
             "description": description,
             "requires_provenance": requires_provenance,
+            "inputs": tuple(inputs) if inputs is not None else None,
+            "outputs": tuple(outputs) if outputs is not None else None,
+            "cacheable": cacheable,
         }
 
     def get(self, name: str) -> Callable:
@@ -126,7 +144,14 @@ def get_stage_registry() -> StageRegistry:
     return _registry
 
 
-def register_stage(name: str, description: str = "", requires_provenance: bool = True) -> Callable:
+def register_stage(
+    name: str,
+    description: str = "",
+    requires_provenance: bool = True,
+    inputs: list[str] | None = None,
+    outputs: list[str] | None = None,
+    cacheable: bool = True,
+) -> Callable:
     """
     ステージ登録デコレータ。
 
@@ -139,6 +164,9 @@ def register_stage(name: str, description: str = "", requires_provenance: bool =
         name: ステージ名
         description: 説明
         requires_provenance: provenance更新必須フラグ
+        inputs: 読み込む成果物キー（StageRegistry.register参照）
+        outputs: 書き込む成果物キー
+        cacheable: キャッシュ可否
 
     Returns:
         デコレータ
@@ -149,7 +177,15 @@ def register_stage(name: str, description: str = "", requires_provenance: bool =
         def wrapper(context: TaskContext, artifacts: Artifacts) -> Artifacts:
             return func(context, artifacts)
 
-        _registry.register(name, wrapper, description, requires_provenance)
+        _registry.register(
+            name,
+            wrapper,
+            description,
+            requires_provenance,
+            inputs=inputs,
+            outputs=outputs,
+            cacheable=cacheable,
+        )
         return wrapper
 
     return decorator
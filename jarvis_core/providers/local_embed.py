@@ -84,6 +84,7 @@ class LocalEmbedProvider(EmbedProvider):
             self._model_enum = self._get_model_enum(self._model_name)
 
         self._model = None
+        self._encoder = None
         self._dimension = MODEL_CONFIG.get(self._model_enum, {"dimension": 384})["dimension"]
 
     def _get_model_enum(self, model_name: str) -> EmbeddingModel:
@@ -114,9 +115,10 @@ class LocalEmbedProvider(EmbedProvider):
             return
 
         try:
-            from sentence_transformers import SentenceTransformer
+            from jarvis_core.embeddings.model_registry import get_encode_service
 
-            self._model = SentenceTransformer(self._model_name)
+            self._encoder = get_encode_service(self._model_name)
+            self._model = self._encoder.model
             self._dimension = self._model.get_sentence_embedding_dimension()
             logger.info(
                 f"Local Embed provider initialized: {self._model_name}, " f"dim={self._dimension}"
@@ -144,7 +146,9 @@ class LocalEmbedProvider(EmbedProvider):
         if self._model is None:
             return [0.0] * self._dimension
 
-        embedding = self._model.encode(text, convert_to_numpy=True)
+        # Single texts go through the shared micro-batching service.
+        encoder = self._encoder or self._model
+        embedding = encoder.encode(text)
         return embedding.tolist()
 
     def embed_batch(self, texts: list[str]) -> list[list[float]]:
@@ -10,6 +10,8 @@ import networkx as nx
 from pathlib import Path
 from typing import Optional
 
+from jarvis_core.analysis.graph_analytics import GraphAnalytics
+
 
 def _stringify(val):
     """Convert any value to a GraphML-safe string."""
@@ -25,6 +27,8 @@ class CitationGraph:
 
     def __init__(self):
         self.G = nx.DiGraph()
+        self._analytics: GraphAnalytics | None = None
+        self._analytics_key: tuple | None = None
 
     # ------------------------------------------------------------------
     # Build
@@ -38,6 +42,7 @@ class CitationGraph:
             pid = str(pid)
             if pid in self.G:
                 continue
+            in_sync = self._analytics is not None and self._analytics_key == self._graph_key()
             self.G.add_node(pid, **{
                 "title": _stringify(p.get("title", "")),
                 "year": _stringify(p.get("year", "")),
@@ -46,16 +51,25 @@ class CitationGraph:
                 "score": _stringify(p.get("score", 0)),
                 "evidence_level": _stringify(p.get("evidence_level", "")),
             })
+            if in_sync:
+                self._analytics.add_node(pid)
+                self._analytics_key = self._graph_key()
             added += 1
         return added
 
     def add_citation(self, from_id: str, to_id: str):
         """Add a directed citation edge: from_id cites to_id."""
+        in_sync = self._analytics is not None and self._analytics_key == self._graph_key()
         if from_id not in self.G:
             self.G.add_node(from_id, title=from_id)
         if to_id not in self.G:
             self.G.add_node(to_id, title=to_id)
+        if self.G.has_edge(from_id, to_id):
+            return
         self.G.add_edge(from_id, to_id)
+        if in_sync:
+            self._analytics.add_edge(from_id, to_id)
+            self._analytics_key = self._graph_key()
 
     def add_citations_from_s2(self, papers: list[dict]) -> int:
         """Add citation edges from Semantic Scholar reference data.
@@ -89,6 +103,30 @@ class CitationGraph:
     # Analysis
     # ------------------------------------------------------------------
 
+    def _graph_key(self) -> tuple:
+        return (id(self.G), self.G.number_of_nodes(), self.G.number_of_edges())
+
+    def analytics(self) -> GraphAnalytics:
+        """Return the CSR analytics mirror of ``G``.
+
+        The mirror is kept in sync incrementally by ``add_papers`` and
+        ``add_citation``; direct mutations of ``G`` are detected by node/edge
+        count and trigger a rebuild.
+        """
+        key = self._graph_key()
+        if self._analytics is None or self._analytics_key != key:
+            analytics = GraphAnalytics()
+            for nid in self.G.nodes():
+                analytics.add_node(nid)
+            analytics.add_edges(self.G.edges())
+            self._analytics = analytics
+            self._analytics_key = key
+        return self._analytics
+
+    def pagerank(self) -> dict[str, float]:
+        """PageRank for every node, memoized until the graph changes."""
+        return self.analytics().pagerank_dict()
+
     def stats(self) -> dict:
         """Return basic graph statistics."""
         if len(self.G) == 0:
@@ -121,8 +159,8 @@ class CitationGraph:
         """Find hub papers by PageRank."""
         if len(self.G) == 0:
             return []
-        pr = nx.pagerank(self.G, max_iter=200)
-        ranked = sorted(pr.items(), key=lambda x: x[1], reverse=True)[:top_n]
+        analytics = self.analytics()
+        ranked = analytics.top_k(analytics.pagerank(max_iter=200), top_n)
         return [
             {
                 "id": nid,
@@ -166,9 +204,9 @@ class CitationGraph:
         lines = ["graph LR"]
         # Limit to top nodes by PageRank if too many
         if len(self.G) > max_nodes:
-            pr = nx.pagerank(self.G, max_iter=200)
+            analytics = self.analytics()
             top_nodes = set(
-                n for n, _ in sorted(pr.items(), key=lambda x: x[1], reverse=True)[:max_nodes]
+                n for n, _ in analytics.top_k(analytics.pagerank(max_iter=200), max_nodes)
             )
         else:
             top_nodes = set(self.G.nodes())
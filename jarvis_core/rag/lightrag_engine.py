@@ -1,6 +1,7 @@
 """LightRAG engine for JARVIS Research OS.
 
-LLM backend: Codex CLI -> Copilot CLI -> Gemini API (fallback chain).
+LLM backend: Codex CLI -> Copilot CLI -> Gemini API (hedged provider pool,
+see ``jarvis_core.rag.llm_pool``).
 Embedding: sentence-transformers (local, no API).
 """
 from __future__ import annotations
@@ -8,14 +9,14 @@ from __future__ import annotations
 import asyncio
 import json
 import os
-import subprocess
-import time
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
 from dotenv import load_dotenv
 
+from jarvis_core.rag.llm_pool import AsyncFunctionProvider, CLIProvider, ProviderPool
+
 load_dotenv()
 
 DEFAULT_WORKING_DIR = str(
@@ -33,45 +34,15 @@ PROJECT_DIR = str(
     / "jarvis-ml-pipeline"
 )
 
-_last_llm_call = 0.0
-_LLM_CALL_INTERVAL = 3.0
-
+# Per-provider limits for the hedged fallback chain.  The CLI tools replace
+# the old global 3 s call interval with a 20 requests/minute bucket each.
+CLI_MAX_CONCURRENCY = int(os.getenv("JARVIS_LLM_CLI_CONCURRENCY", "4"))
+GEMINI_MAX_CONCURRENCY = int(os.getenv("JARVIS_LLM_GEMINI_CONCURRENCY", "8"))
+CLI_REQUESTS_PER_MINUTE = 20.0
+GEMINI_REQUESTS_PER_MINUTE = 60.0
+LLM_TIMEOUT = 180.0
 
-def _call_codex(prompt: str, timeout: int = 180) -> Optional[str]:
-    """Call Codex CLI via stdin pipe."""
-    try:
-        result = subprocess.run(
-            ["codex", "exec", "-"],
-            input=prompt,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=PROJECT_DIR,
-        )
-        output = result.stdout.strip()
-        if output and result.returncode == 0:
-            return output
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        pass
-    return None
-
-
-def _call_copilot(prompt: str, timeout: int = 180) -> Optional[str]:
-    """Call Copilot CLI in programmatic mode."""
-    try:
-        result = subprocess.run(
-            ["copilot", "-p", prompt],
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=PROJECT_DIR,
-        )
-        output = result.stdout.strip()
-        if output and result.returncode == 0:
-            return output
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        pass
-    return None
+_provider_pool: Optional[ProviderPool] = None
 
 
 async def _gemini_complete_simple(prompt: str, system_prompt: str = "") -> str:
@@ -101,6 +72,45 @@ async def _gemini_complete_simple(prompt: str, system_prompt: str = "") -> str:
     return ""
 
 
+def build_provider_pool() -> ProviderPool:
+    """Codex CLI -> Copilot CLI -> Gemini API as a hedged provider pool."""
+    return ProviderPool(
+        [
+            CLIProvider(
+                "codex",
+                ["codex", "exec", "-"],
+                stdin=True,
+                cwd=PROJECT_DIR,
+                max_concurrency=CLI_MAX_CONCURRENCY,
+                requests_per_minute=CLI_REQUESTS_PER_MINUTE,
+                timeout=LLM_TIMEOUT,
+            ),
+            CLIProvider(
+                "copilot",
+                ["copilot", "-p", "{prompt}"],
+                cwd=PROJECT_DIR,
+                max_concurrency=CLI_MAX_CONCURRENCY,
+                requests_per_minute=CLI_REQUESTS_PER_MINUTE,
+                timeout=LLM_TIMEOUT,
+            ),
+            AsyncFunctionProvider(
+                "gemini",
+                _gemini_complete_simple,
+                max_concurrency=GEMINI_MAX_CONCURRENCY,
+                requests_per_minute=GEMINI_REQUESTS_PER_MINUTE,
+                timeout=LLM_TIMEOUT,
+            ),
+        ]
+    )
+
+
+def get_provider_pool() -> ProviderPool:
+    global _provider_pool
+    if _provider_pool is None:
+        _provider_pool = build_provider_pool()
+    return _provider_pool
+
+
 async def _llm_complete(
     prompt: str,
     system_prompt: Optional[str] = None,
@@ -108,55 +118,15 @@ async def _llm_complete(
     keyword_extraction: bool = False,
     **kwargs,
 ) -> str:
-    """LLM fallback chain: Codex CLI -> Copilot CLI -> Gemini API."""
-    global _last_llm_call
-
-    now = time.time()
-    elapsed = now - _last_llm_call
-    if elapsed < _LLM_CALL_INTERVAL:
-        await asyncio.sleep(_LLM_CALL_INTERVAL - elapsed)
-    _last_llm_call = time.time()
-
-    full_prompt = prompt
-    if system_prompt:
-        full_prompt = f"{system_prompt}\n\n{prompt}"
-
-    # Try 1: Codex CLI
-    print("  [LLM] Codex...", end="", flush=True)
-    result = await asyncio.get_event_loop().run_in_executor(
-        None, _call_codex, full_prompt
-    )
-    if result:
-        print(" OK")
-        return result
-    print(" skip", end="")
-
-    # Try 2: Copilot CLI
-    print(" -> Copilot...", end="", flush=True)
-    result = await asyncio.get_event_loop().run_in_executor(
-        None, _call_copilot, full_prompt
-    )
-    if result:
-        print(" OK")
-        return result
-    print(" skip", end="")
-
-    # Try 3: Gemini
-    print(" -> Gemini...", end="", flush=True)
-    result = await _gemini_complete_simple(prompt, system_prompt or "")
-    if result:
-        print(" OK")
-        return result
-    print(" FAIL")
-
-    return ""
+    """LLM fallback chain: Codex CLI -> Copilot CLI -> Gemini API (hedged)."""
+    return await get_provider_pool().complete(prompt, system_prompt)
 
 
 async def _local_embed(texts: list[str]) -> np.ndarray:
-    """Local embedding via sentence-transformers."""
-    from sentence_transformers import SentenceTransformer
-    model = SentenceTransformer("all-MiniLM-L6-v2")
-    embeddings = model.encode(texts, show_progress_bar=False)
+    """Local embedding via the shared sentence-transformers encode service."""
+    from jarvis_core.embeddings.model_registry import get_encode_service
+
+    embeddings = await get_encode_service("all-MiniLM-L6-v2").aencode(list(texts))
     if not isinstance(embeddings, np.ndarray):
         embeddings = np.array(embeddings)
     return embeddings
@@ -165,9 +135,10 @@ async def _local_embed(texts: list[str]) -> np.ndarray:
 class JarvisLightRAG:
     """LightRAG wrapper with CLI-based LLM fallback chain."""
 
-    def __init__(self, working_dir: Optional[str] = None):
+    def __init__(self, working_dir: Optional[str] = None, llm_max_async: Optional[int] = None):
         self.working_dir = working_dir or DEFAULT_WORKING_DIR
         Path(self.working_dir).mkdir(parents=True, exist_ok=True)
+        self.llm_max_async = llm_max_async or get_provider_pool().max_concurrency
         self._rag = None
 
     async def _init_rag(self):
@@ -181,7 +152,7 @@ class JarvisLightRAG:
             working_dir=self.working_dir,
             llm_model_func=_llm_complete,
             llm_model_name="codex-copilot-gemini-chain",
-            llm_model_max_async=1,
+            llm_model_max_async=self.llm_max_async,
             embedding_func=EmbeddingFunc(
                 embedding_dim=384,
                 max_token_size=512,
@@ -206,7 +177,8 @@ class JarvisLightRAG:
 
     async def ainsert_papers(self, papers: list[dict]) -> int:
         rag = await self._init_rag()
-        count = 0
+        texts = []
+        titles = []
         for p in papers:
             title = p.get("title", "")
             abstract = p.get("abstract", "")
@@ -221,6 +193,24 @@ class JarvisLightRAG:
                 text += f"DOI: {doi}\n"
             if abstract:
                 text += f"Abstract: {abstract}\n"
+            texts.append(text)
+            titles.append(title)
+        if not texts:
+            return 0
+
+        # One batched insert lets LightRAG run entity extraction for all
+        # papers concurrently (bounded by llm_model_max_async).
+        try:
+            await rag.ainsert(texts)
+            return len(texts)
+        except asyncio.CancelledError:
+            print(f"  [WARN] CancelledError for batch of {len(texts)} papers")
+            return len(texts)
+        except Exception as e:
+            print(f"  [WARN] Batch insert failed ({e}); inserting papers one by one")
+
+        count = 0
+        for title, text in zip(titles, texts):
             try:
                 await rag.ainsert(text)
                 count += 1
@@ -0,0 +1,320 @@
+"""Hedged LLM provider pool.
+
+``ProviderPool.complete`` tries providers in priority order, but it does not
+wait for a slow provider to time out.  If a provider has not answered within
+its hedge delay, the next provider starts in parallel and the first
+non-empty answer wins; the losers are cancelled.  The hedge delay is a
+latency percentile (``hedge_quantile``) of that provider's recent successful
+calls.  A provider that fails is replaced at once by the next one.
+
+Each provider has its own concurrency limit and token-bucket rate limit, so
+many ``complete`` calls can run at once without overloading any backend.
+Providers that fail ``failure_threshold`` times in a row are skipped for
+``cooldown`` seconds.  After that a single probe call decides whether they
+are healthy again.
+
+Providers are CLI executables (``CLIProvider``) or async callables
+(``AsyncFunctionProvider``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from jarvis_core.reliability.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 180.0
+DEFAULT_HEDGE_QUANTILE = 0.9
+DEFAULT_INITIAL_HEDGE_DELAY = 30.0
+DEFAULT_MIN_HEDGE_DELAY = 1.0
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_COOLDOWN = 60.0
+MIN_LATENCY_SAMPLES = 3
+
+
+class ProviderHealth:
+    """Rolling latency window and circuit-breaker state for one provider."""
+
+    def __init__(self, window: int = 50):
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+
+    def record_success(self, latency: float) -> None:
+        self.latencies.append(latency)
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+
+    def record_failure(self, threshold: int, cooldown: float) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= threshold:
+            self.open_until = time.monotonic() + cooldown
+
+    def is_available(self) -> bool:
+        return time.monotonic() >= self.open_until
+
+    def latency_quantile(self, q: float) -> float | None:
+        if len(self.latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "available": self.is_available(),
+            "p50_latency": self.latency_quantile(0.5),
+        }
+
+
+class LLMProvider:
+    """Base class for a pooled LLM backend.
+
+    Args:
+        name: Provider label.
+        max_concurrency: Calls allowed in flight at once.
+        requests_per_minute: Token-bucket rate limit; ``None`` disables it.
+        timeout: Hard per-call timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int = 4,
+        requests_per_minute: float | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.name = name
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.timeout = timeout
+        self.bucket = (
+            TokenBucket(
+                rate=requests_per_minute / 60.0,
+                capacity=max(1, self.max_concurrency),
+            )
+            if requests_per_minute
+            else None
+        )
+
+    async def complete(self, prompt: str, system_prompt: str | None = None) -> str | None:
+        """Return the completion, or ``None``/``""`` on failure."""
+        raise NotImplementedError
+
+
+class CLIProvider(LLMProvider):
+    """Provider backed by a command-line tool.
+
+    ``command`` items may contain ``{prompt}``, which is replaced by the full
+    prompt.  With ``stdin=True`` the prompt is written to standard input
+    instead.  Only a zero exit status with non-empty stdout counts as a
+    success.  The process is killed if the call times out or is cancelled.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        command: Sequence[str],
+        stdin: bool = False,
+        cwd: str | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__(name, **kwargs)
+        self.command = list(command)
+        self.stdin = stdin
+        self.cwd = cwd
+
+    async def complete(self, prompt: str, system_prompt: str | None = None) -> str | None:
+        full_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+        argv = [part.replace("{prompt}", full_prompt) for part in self.command]
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdin=asyncio.subprocess.PIPE if self.stdin else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.cwd,
+            )
+        except (FileNotFoundError, NotADirectoryError, PermissionError, OSError):
+            return None
+        try:
+            stdout, _ = await proc.communicate(full_prompt.encode("utf-8") if self.stdin else None)
+        except BaseException:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+        output = stdout.decode("utf-8", errors="replace").strip()
+        if proc.returncode == 0 and output:
+            return output
+        return None
+
+
+class AsyncFunctionProvider(LLMProvider):
+    """Provider backed by ``async func(prompt, system_prompt) -> str``."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[str, str], Awaitable[str | None]],
+        **kwargs: Any,
+    ):
+        super().__init__(name, **kwargs)
+        self.func = func
+
+    async def complete(self, prompt: str, system_prompt: str | None = None) -> str | None:
+        return await self.func(prompt, system_prompt or "")
+
+
+class ProviderPool:
+    """Priority-ordered, hedged pool of LLM providers.
+
+    Args:
+        providers: Providers in priority order.
+        hedge_quantile: Latency percentile after which the next provider is
+            started alongside a still-running one.
+        initial_hedge_delay: Hedge delay used until a provider has
+            ``MIN_LATENCY_SAMPLES`` successful calls.
+        min_hedge_delay: Lower bound for the hedge delay.
+        failure_threshold: Consecutive failures that take a provider out of
+            rotation.
+        cooldown: Seconds a failing provider is skipped.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[LLMProvider],
+        hedge_quantile: float = DEFAULT_HEDGE_QUANTILE,
+        initial_hedge_delay: float = DEFAULT_INITIAL_HEDGE_DELAY,
+        min_hedge_delay: float = DEFAULT_MIN_HEDGE_DELAY,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ):
+        if not providers:
+            raise ValueError("ProviderPool needs at least one provider")
+        self.providers = list(providers)
+        self.hedge_quantile = hedge_quantile
+        self.initial_hedge_delay = initial_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self._health = {p.name: ProviderHealth() for p in self.providers}
+        # asyncio primitives are bound to the loop that first uses them.
+        self._semaphores: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+    @property
+    def max_concurrency(self) -> int:
+        """Total number of provider calls the pool can have in flight."""
+        return sum(p.max_concurrency for p in self.providers)
+
+    def health(self) -> dict[str, dict[str, Any]]:
+        return {name: state.to_dict() for name, state in self._health.items()}
+
+    def hedge_delay(self, provider: LLMProvider) -> float:
+        observed = self._health[provider.name].latency_quantile(self.hedge_quantile)
+        delay = self.initial_hedge_delay if observed is None else observed
+        return min(max(delay, self.min_hedge_delay), provider.timeout)
+
+    def _ordered(self) -> list[LLMProvider]:
+        healthy = [p for p in self.providers if self._health[p.name].is_available()]
+        # When every provider is failing, probe them all rather than give up.
+        return healthy or list(self.providers)
+
+    def _semaphore(self, provider: LLMProvider) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        entry = self._semaphores.get(provider.name)
+        if entry is None or entry[0] is not loop:
+            entry = (loop, asyncio.Semaphore(provider.max_concurrency))
+            self._semaphores[provider.name] = entry
+        return entry[1]
+
+    async def _rate_limit(self, provider: LLMProvider) -> None:
+        if provider.bucket is None:
+            return
+        while True:
+            result = provider.bucket.try_acquire()
+            if result.allowed:
+                return
+            await asyncio.sleep(result.retry_after or 0.05)
+
+    async def _attempt(
+        self, provider: LLMProvider, prompt: str, system_prompt: str | None
+    ) -> str | None:
+        health = self._health[provider.name]
+        async with self._semaphore(provider):
+            await self._rate_limit(provider)
+            started = time.monotonic()
+            try:
+                result = await asyncio.wait_for(
+                    provider.complete(prompt, system_prompt), provider.timeout
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.debug("LLM provider %s failed: %s", provider.name, exc)
+                result = None
+        if result:
+            health.record_success(time.monotonic() - started)
+            return result
+        health.record_failure(self.failure_threshold, self.cooldown)
+        return None
+
+    async def complete(self, prompt: str, system_prompt: str | None = None) -> str:
+        """Return the first non-empty completion, or ``""`` if all providers fail."""
+        remaining = self._ordered()
+        running: dict[asyncio.Task, LLMProvider] = {}
+        last: LLMProvider | None = None
+
+        def launch() -> None:
+            nonlocal last
+            last = remaining.pop(0)
+            task = asyncio.ensure_future(self._attempt(last, prompt, system_prompt))
+            running[task] = last
+
+        launch()
+        try:
+            while running:
+                timeout = self.hedge_delay(last) if remaining and last is not None else None
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    logger.debug("Hedging %s with %s", last.name, remaining[0].name)
+                    launch()
+                    continue
+                for task in done:
+                    provider = running.pop(task)
+                    result = task.result()
+                    if result:
+                        return result
+                    logger.debug("LLM provider %s returned no result", provider.name)
+                    if remaining:
+                        launch()
+            return ""
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+
+__all__ = [
+    "AsyncFunctionProvider",
+    "CLIProvider",
+    "LLMProvider",
+    "ProviderHealth",
+    "ProviderPool",
+]
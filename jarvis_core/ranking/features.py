@@ -5,16 +5,49 @@ Computes features for Learning to Rank (LTR) models.
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import Dict, Any, List
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Sequence
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+FEATURE_NAMES = [
+    "title_match",
+    "exact_match",
+    "query_len",
+    "doc_len",
+    "bm25_score",
+    "cosine_sim",
+    "has_doi",
+    "year",
+]
+
 
 class RankingFeatures:
     """Feature extractor for query-document pairs."""
 
+    feature_names = FEATURE_NAMES
+
+    def __init__(self, max_cached_texts: int = 65536):
+        self.max_cached_texts = max_cached_texts
+        # Keyed by a digest of the text so cached entries never pin full documents
+        self._token_counts: OrderedDict[bytes, int] = OrderedDict()
+
+    def _token_count(self, text: str) -> int:
+        """Whitespace token count of ``text``, cached per distinct text."""
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        count = self._token_counts.get(key)
+        if count is None:
+            count = len(text.split())
+            self._token_counts[key] = count
+            while len(self._token_counts) > self.max_cached_texts:
+                self._token_counts.popitem(last=False)
+        else:
+            self._token_counts.move_to_end(key)
+        return count
+
     def extract(
         self,
         query: str,
@@ -49,7 +82,53 @@ class RankingFeatures:
 
         return features
 
-    def extract_batch(self, query: str, docs: List[Dict[str, Any]]) -> List[Dict[str, float]]:
+    def extract_matrix(
+        self,
+        query: str,
+        docs: Sequence[Dict[str, Any]],
+        query_vec: Optional[np.ndarray] = None,
+        doc_vecs: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Compute features for all docs as a matrix.
+
+        Columns follow ``FEATURE_NAMES``. Query-derived values are computed
+        once, doc token counts come from a bounded per-text cache, and vector
+        similarity is a single matrix-vector product over ``doc_vecs``.
+        """
+        n = len(docs)
+        X = np.zeros((n, len(FEATURE_NAMES)), dtype=np.float64)
+        if n == 0:
+            return X
+
+        query_lower = query.lower()
+        X[:, 2] = len(query.split())
+
+        cosine = None
+        if query_vec is not None and doc_vecs is not None:
+            cosine = np.asarray(doc_vecs) @ np.asarray(query_vec)
+
+        for i, doc in enumerate(docs):
+            doc_text = doc.get("text", "")
+            X[i, 0] = query_lower in doc.get("title", "").lower()
+            X[i, 1] = query_lower in doc_text.lower()
+            X[i, 3] = self._token_count(doc_text)
+            X[i, 4] = doc.get("bm25_score", 0.0)
+            if cosine is None:
+                X[i, 5] = doc.get("vector_score", 0.0)
+            X[i, 6] = bool(doc.get("doi"))
+            X[i, 7] = float(doc.get("year", 0))
+
+        if cosine is not None:
+            X[:, 5] = cosine
+        return X
+
+    def extract_batch(
+        self,
+        query: str,
+        docs: List[Dict[str, Any]],
+        query_vec: Optional[np.ndarray] = None,
+        doc_vecs: Optional[np.ndarray] = None,
+    ) -> List[Dict[str, float]]:
         """Extract features for a batch of documents."""
-        # Note: In a real implementation, we'd handle vector batching here
-        return [self.extract(query, doc) for doc in docs]
+        X = self.extract_matrix(query, docs, query_vec, doc_vecs)
+        return [dict(zip(FEATURE_NAMES, row)) for row in X.tolist()]
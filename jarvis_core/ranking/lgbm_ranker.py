@@ -13,11 +13,12 @@ import logging
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 try:
     import lightgbm as lgb
-    import numpy as np
 
     HAS_LGBM = True
 except ImportError:
@@ -38,6 +39,37 @@ class LGBMRanker:
             "tme_relevance_score",
         ]
 
+    TIER_MAP = {
+        "rct": 1.0,
+        "clinical_trial": 0.83,
+        "patient": 0.67,
+        "mouse": 0.50,
+        "organoid": 0.33,
+        "cell_line": 0.0,
+        "unknown": 0.0,
+    }
+    EVIDENCE_MAP = {
+        "clinical": 1.0,
+        "imaging": 0.83,
+        "functional": 0.67,
+        "seq_data": 0.50,
+        "flow_cyto": 0.33,
+        "correlation": 0.0,
+        "unknown": 0.0,
+    }
+    CAUSAL_MAP = {"causal": 1.0, "intervention": 0.5, "association": 0.0}
+    REPRO_MAP = {"multi_cohort": 1.0, "replicated": 0.5, "single": 0.0}
+    TME_MAP = {"high": 1.0, "limited": 0.5, "none": 0.0}
+
+    # (rubric key, default value, score map) in feature_names order
+    RUBRIC_COLUMNS = [
+        ("model_tier", "unknown", TIER_MAP),
+        ("evidence_type", "unknown", EVIDENCE_MAP),
+        ("causal_strength", "association", CAUSAL_MAP),
+        ("reproducibility", "single", REPRO_MAP),
+        ("tme_relevance", "none", TME_MAP),
+    ]
+
     def _convert_features(self, rubric_features: dict) -> list[float]:
         """Convert rubric features to numeric scores.
 
@@ -46,36 +78,18 @@ class LGBMRanker:
             mouse: 0.50, organoid: 0.33, cell_line: 0.0
         """
         # Simplified scoring (in production, use rubric weights)
-        tier_map = {
-            "rct": 1.0,
-            "clinical_trial": 0.83,
-            "patient": 0.67,
-            "mouse": 0.50,
-            "organoid": 0.33,
-            "cell_line": 0.0,
-            "unknown": 0.0,
-        }
-        evidence_map = {
-            "clinical": 1.0,
-            "imaging": 0.83,
-            "functional": 0.67,
-            "seq_data": 0.50,
-            "flow_cyto": 0.33,
-            "correlation": 0.0,
-            "unknown": 0.0,
-        }
-        causal_map = {"causal": 1.0, "intervention": 0.5, "association": 0.0}
-        repro_map = {"multi_cohort": 1.0, "replicated": 0.5, "single": 0.0}
-        tme_map = {"high": 1.0, "limited": 0.5, "none": 0.0}
-
         return [
-            tier_map.get(rubric_features.get("model_tier", "unknown"), 0.0),
-            evidence_map.get(rubric_features.get("evidence_type", "unknown"), 0.0),
-            causal_map.get(rubric_features.get("causal_strength", "association"), 0.0),
-            repro_map.get(rubric_features.get("reproducibility", "single"), 0.0),
-            tme_map.get(rubric_features.get("tme_relevance", "none"), 0.0),
+            score_map.get(rubric_features.get(key, default), 0.0)
+            for key, default, score_map in self.RUBRIC_COLUMNS
         ]
 
+    def features_to_matrix(self, features_list: list[dict]) -> np.ndarray:
+        """Convert rubric feature dicts to a feature matrix column by column."""
+        X = np.empty((len(features_list), len(self.RUBRIC_COLUMNS)), dtype=np.float64)
+        for j, (key, default, score_map) in enumerate(self.RUBRIC_COLUMNS):
+            X[:, j] = [score_map.get(f.get(key, default), 0.0) for f in features_list]
+        return X
+
     def train(self, dataset_path: Path, output_path: Path | None = None):
         """Train ranker on golden dataset.
 
@@ -152,11 +166,13 @@ class LGBMRanker:
             "model_saved": str(output_path) if output_path else None,
         }
 
-    def predict(self, features_list: list[dict]) -> list[float]:
+    def predict(self, features_list: list[dict] | np.ndarray) -> list[float]:
         """Predict ranking scores for a list of papers.
 
         Args:
-            features_list: List of rubric feature dicts
+            features_list: List of rubric feature dicts, or a prebuilt
+                rubric matrix from ``features_to_matrix`` (columns in
+                ``feature_names`` order) which is passed through as-is
 
         Returns:
             List of ranking scores (higher = better)
@@ -164,7 +180,10 @@ class LGBMRanker:
         if not self.model:
             raise ValueError("Model not trained. Call train() first.")
 
-        X = np.array([self._convert_features(f) for f in features_list])
+        if isinstance(features_list, np.ndarray):
+            X = features_list
+        else:
+            X = self.features_to_matrix(features_list)
         scores = self.model.predict(X)
         return scores.tolist()
 
@@ -36,14 +36,10 @@ class RankerTrainer:
             clicked_doc = log["clicked_doc"]
             negatives = log["negative_docs"]
 
-            # Positive sample
-            pos_feats = self.feature_extractor.extract(query, clicked_doc)
-            data.append({"label": 1, "features": pos_feats, "qid": log["query_id"]})
-
-            # Negative samples
-            for neg in negatives:
-                neg_feats = self.feature_extractor.extract(query, neg)
-                data.append({"label": 0, "features": neg_feats, "qid": log["query_id"]})
+            # Positive sample first, then negatives, in one batch per query
+            feats = self.feature_extractor.extract_batch(query, [clicked_doc, *negatives])
+            for i, doc_feats in enumerate(feats):
+                data.append({"label": int(i == 0), "features": doc_feats, "qid": log["query_id"]})
 
         self._save_dataset(data)
 
@@ -1,11 +1,42 @@
 """Cross-Encoder Reranker.
 
 Per RP-303, implements two-stage retrieval with cross-encoder reranking.
+
+Scoring is organised for CPU latency budgets:
+
+- pairs are truncated to ``max_length`` tokens and grouped into length
+  buckets, so each ``predict`` batch pads to a similar length and stays under
+  a token budget;
+- scores are cached by (model, query hash, chunk id) in an in-memory LRU,
+  optionally backed by SQLite, so repeated queries skip the model;
+- per-pair latency is measured per model and drives how many candidates
+  ``adaptive_rerank`` sends to the model;
+- with a ``cascade_model_name`` a small model scores every candidate and only
+  the uncertain band around the top-k cutoff is rescored by the large model.
 """
 
 from __future__ import annotations
 
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Prior per-pair latency until a model has been measured.
+DEFAULT_PAIR_LATENCY_MS = 10.0
+# Rough characters per token, used for truncation and bucketing.
+_CHARS_PER_TOKEN = 4
+# Pair overhead: [CLS], [SEP], [SEP].
+_SPECIAL_TOKENS = 3
+_LATENCY_ALPHA = 0.3
+_SQLITE_MAX_VARS = 500
 
 
 @dataclass
@@ -20,6 +51,178 @@ class RerankedResult:
     metadata: dict
 
 
+class ScoreCache:
+    """Cross-encoder score cache keyed by (model, query hash, chunk id).
+
+    An in-memory LRU holds the hot entries.  With ``db_path`` set, scores are
+    also persisted in SQLite; lookups and writes are batched per query so a
+    rerank costs one round trip rather than one per candidate.
+    """
+
+    def __init__(self, max_entries: int = 100_000, db_path: str | Path | None = None):
+        self.max_entries = max_entries
+        self.db_path = Path(db_path) if db_path else None
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[tuple[str, str, str], float] = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        if self.db_path is not None:
+            with self._get_connection() as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS scores (
+                        model TEXT NOT NULL,
+                        query_hash TEXT NOT NULL,
+                        chunk_id TEXT NOT NULL,
+                        score REAL NOT NULL,
+                        created_at REAL NOT NULL,
+                        PRIMARY KEY (model, query_hash, chunk_id)
+                    )
+                    """
+                )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = conn
+        return conn
+
+    @staticmethod
+    def query_hash(query: str) -> str:
+        return hashlib.sha256(query.encode("utf-8")).hexdigest()[:32]
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def get_many(self, model: str, query: str, chunk_ids: list[str]) -> dict[str, float]:
+        """Return cached scores for whichever ``chunk_ids`` are known."""
+        found = self.peek_many(model, query, chunk_ids)
+        hits = sum(1 for c in chunk_ids if c in found)
+        self.hits += hits
+        self.misses += len(chunk_ids) - hits
+        return found
+
+    def peek_many(self, model: str, query: str, chunk_ids: list[str]) -> dict[str, float]:
+        """Like ``get_many`` but without counting hits/misses (for planning)."""
+        qhash = self.query_hash(query)
+        found: dict[str, float] = {}
+        with self._lock:
+            for chunk_id in chunk_ids:
+                key = (model, qhash, chunk_id)
+                score = self._memory.get(key)
+                if score is not None:
+                    self._memory.move_to_end(key)
+                    found[chunk_id] = score
+
+        missing = list(dict.fromkeys(c for c in chunk_ids if c not in found))
+        if missing and self.db_path is not None:
+            conn = self._get_connection()
+            for i in range(0, len(missing), _SQLITE_MAX_VARS):
+                part = missing[i : i + _SQLITE_MAX_VARS]
+                rows = conn.execute(
+                    "SELECT chunk_id, score FROM scores WHERE model = ? AND query_hash = ? "
+                    f"AND chunk_id IN ({','.join('?' * len(part))})",
+                    (model, qhash, *part),
+                ).fetchall()
+                found.update(rows)
+            self._remember(model, qhash, {c: found[c] for c in missing if c in found})
+        return found
+
+    def put_many(self, model: str, query: str, scores: dict[str, float]) -> None:
+        """Store scores for one (model, query)."""
+        if not scores:
+            return
+        qhash = self.query_hash(query)
+        self._remember(model, qhash, scores)
+        if self.db_path is not None:
+            now = time.time()
+            conn = self._get_connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO scores "
+                    "(model, query_hash, chunk_id, score, created_at) VALUES (?, ?, ?, ?, ?)",
+                    [(model, qhash, c, float(s), now) for c, s in scores.items()],
+                )
+
+    def _remember(self, model: str, qhash: str, scores: dict[str, float]) -> None:
+        with self._lock:
+            for chunk_id, score in scores.items():
+                key = (model, qhash, chunk_id)
+                self._memory[key] = float(score)
+                self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached scores (memory and disk)."""
+        with self._lock:
+            self._memory.clear()
+        if self.db_path is not None:
+            conn = self._get_connection()
+            with conn:
+                conn.execute("DELETE FROM scores")
+
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._memory),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "db_path": str(self.db_path) if self.db_path else None,
+        }
+
+    def close(self) -> None:
+        """Close this thread's database connection."""
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+def length_buckets(
+    lengths: list[int], token_budget: int = 8192, max_batch_size: int = 64
+) -> list[list[int]]:
+    """Group pair positions into batches of similar length.
+
+    Positions are sorted by length and packed greedily so that
+    ``batch size * longest pair`` (the padded token count) stays within
+    ``token_budget``.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    longest = 0
+    for i in sorted(range(len(lengths)), key=lengths.__getitem__):
+        grown = max(longest, lengths[i])
+        over_budget = grown * (len(current) + 1) > token_budget
+        if current and (over_budget or len(current) >= max_batch_size):
+            batches.append(current)
+            current, grown = [], lengths[i]
+        current.append(i)
+        longest = grown
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _predict(model: Any, pairs: list[tuple[str, str]]) -> list[float]:
+    try:
+        scores = model.predict(pairs, batch_size=len(pairs), show_progress_bar=False)
+    except TypeError:
+        scores = model.predict(pairs)
+    return [float(s) for s in scores]
+
+
 class CrossEncoderReranker:
     """Cross-encoder reranker for two-stage retrieval.
 
@@ -27,6 +230,22 @@ class CrossEncoderReranker:
     - Takes top-100 from initial retrieval
     - Reranks with cross-encoder
     - Adjusts rerank count based on latency budget
+
+    Args:
+        model_name: Cross-encoder used for the final scores.
+        max_rerank: Maximum candidates scored per query.
+        latency_budget_ms: Budget ``adaptive_rerank`` plans against.
+        max_length: Token limit per (query, text) pair.
+        batch_token_budget: Padded tokens allowed per ``predict`` batch.
+        max_batch_size: Pairs allowed per ``predict`` batch.
+        score_cache: Score cache (default: in-memory LRU).
+        cascade_model_name: Small first-stage model, e.g.
+            ``cross-encoder/ms-marco-TinyBERT-L-2-v2``; enables the cascade.
+        cascade_margin: Combined-score distance from the top-k cutoff within
+            which a first-stage score counts as uncertain.
+        cascade_stage1_share: Fraction of the budget for the first stage.
+        model: Preloaded model exposing ``predict(pairs)``.
+        cascade_model: Preloaded first-stage model.
     """
 
     def __init__(
@@ -34,22 +253,145 @@ class CrossEncoderReranker:
         model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
         max_rerank: int = 100,
         latency_budget_ms: float = 1000.0,
+        max_length: int = 512,
+        batch_token_budget: int = 8192,
+        max_batch_size: int = 64,
+        score_cache: ScoreCache | None = None,
+        cascade_model_name: str | None = None,
+        cascade_margin: float = 2.0,
+        cascade_stage1_share: float = 0.3,
+        model: Any = None,
+        cascade_model: Any = None,
     ):
         self.model_name = model_name
         self.max_rerank = max_rerank
         self.latency_budget_ms = latency_budget_ms
-        self._model = None
-
-    def _load_model(self):
-        """Lazy load the cross-encoder model."""
-        if self._model is None:
+        self.max_length = max_length
+        self.batch_token_budget = batch_token_budget
+        self.max_batch_size = max_batch_size
+        self.score_cache = score_cache if score_cache is not None else ScoreCache()
+        if cascade_model is not None and cascade_model_name is None:
+            cascade_model_name = "cascade"
+        self.cascade_model_name = cascade_model_name
+        self.cascade_margin = cascade_margin
+        self.cascade_stage1_share = cascade_stage1_share
+        self._model = model
+        self._cascade_model = cascade_model
+        self._unavailable: set[str] = set()
+        self._pair_latency_ms: dict[str, float] = {}
+
+    def _load(self, attr: str, name: str | None) -> Any:
+        model = getattr(self, attr)
+        if model is None and name and name not in self._unavailable:
             try:
                 from sentence_transformers import CrossEncoder
 
-                self._model = CrossEncoder(self.model_name)
+                model = CrossEncoder(name, max_length=self.max_length)
+                setattr(self, attr, model)
             except ImportError:
-                self._model = None
-        return self._model
+                logger.debug("sentence_transformers unavailable; %s not loaded", name)
+                self._unavailable.add(name)
+        return model
+
+    def _load_model(self):
+        """Lazy load the cross-encoder model."""
+        return self._load("_model", self.model_name)
+
+    def _load_cascade_model(self):
+        """Lazy load the first-stage cascade model."""
+        return self._load("_cascade_model", self.cascade_model_name)
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _chunk_key(candidate: dict) -> str:
+        chunk_id = candidate.get("chunk_id")
+        if chunk_id is not None:
+            return str(chunk_id)
+        text = str(candidate.get("text", ""))
+        return "text:" + hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+    def pair_latency_ms(self, model_name: str | None = None) -> float:
+        """Observed per-pair latency of a model (prior until measured)."""
+        return self._pair_latency_ms.get(model_name or self.model_name, DEFAULT_PAIR_LATENCY_MS)
+
+    def _observe_latency(self, model_name: str, per_pair_ms: float) -> None:
+        previous = self._pair_latency_ms.get(model_name)
+        if previous is None:
+            self._pair_latency_ms[model_name] = per_pair_ms
+        else:
+            self._pair_latency_ms[model_name] = (
+                _LATENCY_ALPHA * per_pair_ms + (1 - _LATENCY_ALPHA) * previous
+            )
+
+    def _score(
+        self, model: Any, model_name: str, query: str, candidates: list[dict]
+    ) -> list[float]:
+        """Score candidates, reusing cached scores and batching the rest."""
+        ids = [self._chunk_key(c) for c in candidates]
+        scores = self.score_cache.get_many(model_name, query, ids)
+        missing = list(dict.fromkeys(cid for cid in ids if cid not in scores))
+        if missing:
+            first = {}
+            for cid, candidate in zip(ids, candidates):
+                first.setdefault(cid, candidate)
+            max_chars = self.max_length * _CHARS_PER_TOKEN
+            texts = [str(first[cid].get("text", ""))[:max_chars] for cid in missing]
+            query_tokens = _estimate_tokens(query)
+            lengths = [
+                min(self.max_length, query_tokens + _estimate_tokens(t) + _SPECIAL_TOKENS)
+                for t in texts
+            ]
+
+            fresh: dict[str, float] = {}
+            for batch in length_buckets(lengths, self.batch_token_budget, self.max_batch_size):
+                started = time.perf_counter()
+                batch_scores = _predict(model, [(query, texts[j]) for j in batch])
+                elapsed_ms = (time.perf_counter() - started) * 1000.0
+                self._observe_latency(model_name, elapsed_ms / len(batch))
+                for j, score in zip(batch, batch_scores):
+                    fresh[missing[j]] = score
+            self.score_cache.put_many(model_name, query, fresh)
+            scores.update(fresh)
+        return [scores[cid] for cid in ids]
+
+    def _affordable(
+        self, query: str, candidates: list[dict], model_name: str, budget_ms: float
+    ) -> int:
+        """How many leading candidates fit the budget (cache hits are free)."""
+        limit = min(self.max_rerank, len(candidates))
+        ids = [self._chunk_key(c) for c in candidates[:limit]]
+        cached = self.score_cache.peek_many(model_name, query, ids)
+        per_pair = self.pair_latency_ms(model_name)
+        cost = 0.0
+        for n, cid in enumerate(ids):
+            if cid not in cached:
+                cost += per_pair
+                if cost > budget_ms:
+                    return n
+        return limit
+
+    @staticmethod
+    def _results(scored: list[tuple[dict, float, float]], top_k: int) -> list[RerankedResult]:
+        results = []
+        for rank, (candidate, orig_score, rerank_score) in enumerate(scored[:top_k]):
+            results.append(
+                RerankedResult(
+                    chunk_id=candidate.get("chunk_id", str(rank)),
+                    text=candidate.get("text", ""),
+                    original_score=orig_score,
+                    reranked_score=rerank_score,
+                    rank=rank + 1,
+                    metadata=candidate.get("metadata", {}),
+                )
+            )
+        return results
+
+    # ------------------------------------------------------------------
+    # Reranking
+    # ------------------------------------------------------------------
 
     def rerank(
         self,
@@ -77,15 +419,14 @@ class CrossEncoderReranker:
         model = self._load_model()
 
         if model:
-            pairs = [(query, c.get("text", "")) for c in candidates]
-            scores = model.predict(pairs)
+            scores = self._score(model, self.model_name, query, candidates)
         else:
             # Fallback: use original scores
             scores = [c.get("score", 0.0) for c in candidates]
 
         # Combine with original scores
         scored = []
-        for i, (candidate, ce_score) in enumerate(zip(candidates, scores)):
+        for candidate, ce_score in zip(candidates, scores):
             orig_score = candidate.get("score", 0.0)
             # Weighted combination (cross-encoder weighted higher)
             combined = 0.7 * float(ce_score) + 0.3 * orig_score
@@ -94,21 +435,68 @@ class CrossEncoderReranker:
         # Sort by combined score
         scored.sort(key=lambda x: x[2], reverse=True)
 
-        # Build results
-        results = []
-        for rank, (candidate, orig_score, rerank_score) in enumerate(scored[:top_k]):
-            results.append(
-                RerankedResult(
-                    chunk_id=candidate.get("chunk_id", str(rank)),
-                    text=candidate.get("text", ""),
-                    original_score=orig_score,
-                    reranked_score=rerank_score,
-                    rank=rank + 1,
-                    metadata=candidate.get("metadata", {}),
-                )
-            )
+        return self._results(scored, top_k)
 
-        return results
+    def cascade_rerank(
+        self,
+        query: str,
+        candidates: list[dict],
+        top_k: int = 10,
+    ) -> list[RerankedResult]:
+        """Two-model cascade within ``latency_budget_ms``.
+
+        The cascade model scores as many candidates as its share of the budget
+        allows.  Candidates whose combined score lies within ``cascade_margin``
+        of the top-k cutoff form the uncertain band; the closest ones that fit
+        the remaining budget are rescored by the main model and reordered
+        among the positions the band occupied.  Everything else keeps its
+        first-stage position and score.
+
+        Args:
+            query: The search query.
+            candidates: All candidates.
+            top_k: Number of results to return.
+
+        Returns:
+            Reranked results (plain ``rerank`` if either model is unavailable).
+        """
+        if not candidates:
+            return []
+        small = self._load_cascade_model()
+        large = self._load_model()
+        if small is None or large is None:
+            return self.rerank(query, candidates, top_k)
+
+        started = time.perf_counter()
+        stage1_budget = self.latency_budget_ms * self.cascade_stage1_share
+        n1 = self._affordable(query, candidates, self.cascade_model_name, stage1_budget)
+        n1 = max(n1, min(top_k * 2, len(candidates), self.max_rerank))
+        pool = candidates[:n1]
+
+        small_scores = self._score(small, self.cascade_model_name, query, pool)
+        origs = [c.get("score", 0.0) for c in pool]
+        combined = [0.7 * s + 0.3 * o for s, o in zip(small_scores, origs)]
+        order = sorted(range(n1), key=lambda i: combined[i], reverse=True)
+
+        cutoff = combined[order[min(top_k, n1) - 1]]
+        uncertain = sorted(
+            (i for i in order if abs(combined[i] - cutoff) <= self.cascade_margin),
+            key=lambda i: abs(combined[i] - cutoff),
+        )
+        remaining_ms = self.latency_budget_ms - (time.perf_counter() - started) * 1000.0
+        uncertain_pool = [pool[i] for i in uncertain]
+        band = uncertain[: self._affordable(query, uncertain_pool, self.model_name, remaining_ms)]
+
+        if band:
+            large_scores = self._score(large, self.model_name, query, [pool[i] for i in band])
+            for i, score in zip(band, large_scores):
+                combined[i] = 0.7 * score + 0.3 * origs[i]
+            band_set = set(band)
+            slots = [pos for pos, i in enumerate(order) if i in band_set]
+            for pos, i in zip(slots, sorted(band, key=lambda i: combined[i], reverse=True)):
+                order[pos] = i
+
+        return self._results([(pool[i], origs[i], combined[i]) for i in order], top_k)
 
     def estimate_latency(self, num_candidates: int) -> float:
         """Estimate reranking latency in ms.
@@ -117,10 +505,10 @@ class CrossEncoderReranker:
             num_candidates: Number of candidates to rerank.
 
         Returns:
-            Estimated latency in milliseconds.
+            Estimated latency in milliseconds, from the observed per-pair
+            latency (~10ms per candidate until the model has been measured).
         """
-        # Rough estimate: ~10ms per candidate
-        return num_candidates * 10.0
+        return num_candidates * self.pair_latency_ms(self.model_name)
 
     def adaptive_rerank(
         self,
@@ -138,9 +526,11 @@ class CrossEncoderReranker:
         Returns:
             Reranked results within latency budget.
         """
-        # Calculate max candidates within budget
-        max_by_budget = int(self.latency_budget_ms / 10)
-        actual_max = min(max_by_budget, self.max_rerank, len(candidates))
+        if self.cascade_model_name:
+            return self.cascade_rerank(query, candidates, top_k)
+
+        # Calculate max candidates within budget from measured latency
+        actual_max = self._affordable(query, candidates, self.model_name, self.latency_budget_ms)
 
         # Ensure we have enough for top_k
         actual_max = max(actual_max, min(top_k * 2, len(candidates)))
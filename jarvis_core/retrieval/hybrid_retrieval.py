@@ -105,9 +105,9 @@ class DenseRetriever:
             return
 
         try:
-            from sentence_transformers import SentenceTransformer
+            from jarvis_core.embeddings.model_registry import load_sentence_transformer
 
-            self._model = SentenceTransformer(self.model_name)
+            self._model = load_sentence_transformer(self.model_name)
             logger.info(f"Loaded embedding model: {self.model_name}")
         except ImportError:
             logger.warning("sentence-transformers not installed")
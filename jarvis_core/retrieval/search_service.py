@@ -0,0 +1,174 @@
+"""Process-wide hybrid search service with hot index reload.
+
+``HybridSearchEngine`` loads ``chunks.jsonl`` and the vector matrix in its
+constructor, which is far more expensive than a single query.  The
+``SearchService`` keeps one engine per index directory alive for the whole
+process and serves every request from that shared, read-only snapshot.
+
+The indexer writes ``manifest.json`` last on both ``rebuild()`` and
+``update()``, so its ``(mtime_ns, size)`` acts as the index generation.  When
+the generation changes, a background thread loads a fresh engine and swaps
+it in under a lock; requests keep using the previous snapshot until the
+swap, so no query ever blocks on a reload.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from jarvis_core.retrieval.hybrid_search import HybridSearchEngine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_DIR = Path("data/index/v2")
+MANIFEST_NAME = "manifest.json"
+
+Generation = tuple[int, int] | None
+
+
+@dataclass(frozen=True)
+class IndexSnapshot:
+    """An immutable (engine, generation) pair served to requests."""
+
+    engine: HybridSearchEngine
+    generation: Generation
+    loaded_at: float
+
+
+class SearchService:
+    """Shares one ``HybridSearchEngine`` across requests and hot-swaps it.
+
+    Args:
+        index_dir: Directory written by ``RetrievalIndexer``.
+        poll_interval: Minimum seconds between generation checks made from
+            ``snapshot()``.  ``0`` checks on every call.
+        engine_factory: Callable building an engine for ``index_dir``;
+            defaults to ``HybridSearchEngine``.
+    """
+
+    def __init__(
+        self,
+        index_dir: Path | str = DEFAULT_INDEX_DIR,
+        poll_interval: float = 2.0,
+        engine_factory: Callable[[Path], HybridSearchEngine] | None = None,
+    ):
+        self.index_dir = Path(index_dir)
+        self.poll_interval = poll_interval
+        self._factory = engine_factory or HybridSearchEngine
+        self._snapshot: IndexSnapshot | None = None
+        self._lock = threading.Lock()
+        self._reload_thread: threading.Thread | None = None
+        self._last_check = 0.0
+        self.reloads = 0
+
+    def generation(self) -> Generation:
+        """Return the current on-disk generation, or None without a manifest."""
+        try:
+            stat = (self.index_dir / MANIFEST_NAME).stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def snapshot(self) -> IndexSnapshot:
+        """Return the snapshot to serve, scheduling a reload if it is stale.
+
+        The first call loads synchronously; afterwards a stale generation
+        only starts a background reload and the current snapshot is returned.
+        """
+        current = self._snapshot
+        if current is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = self._load()
+                return self._snapshot
+
+        now = time.monotonic()
+        if now - self._last_check >= self.poll_interval:
+            self._last_check = now
+            generation = self.generation()
+            # A missing manifest means a rebuild is in flight (or the index was
+            # removed); keep serving the last good snapshot until it returns.
+            if generation is not None and generation != current.generation:
+                self._schedule_reload()
+        return current
+
+    @property
+    def engine(self) -> HybridSearchEngine:
+        return self.snapshot().engine
+
+    def refresh(self, block: bool = True) -> IndexSnapshot | None:
+        """Force a reload; with ``block=False`` it runs in the background."""
+        if not block:
+            self._schedule_reload()
+            return self._snapshot
+        snapshot = self._load()
+        with self._lock:
+            self._snapshot = snapshot
+        return snapshot
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait for an in-flight background reload to finish."""
+        thread = self._reload_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _load(self) -> IndexSnapshot:
+        generation = self.generation()
+        engine = self._factory(self.index_dir)
+        self.reloads += 1
+        logger.info("Loaded search index %s (%d chunks)", self.index_dir, len(engine.chunk_map))
+        return IndexSnapshot(engine=engine, generation=generation, loaded_at=time.time())
+
+    def _schedule_reload(self) -> None:
+        with self._lock:
+            if self._reload_thread is not None and self._reload_thread.is_alive():
+                return
+            self._reload_thread = threading.Thread(
+                target=self._reload, name="search-index-reload", daemon=True
+            )
+            self._reload_thread.start()
+
+    def _reload(self) -> None:
+        try:
+            snapshot = self._load()
+        except Exception as exc:
+            logger.warning("Search index reload failed for %s: %s", self.index_dir, exc)
+            return
+        with self._lock:
+            self._snapshot = snapshot
+
+
+_SERVICES: dict[Path, SearchService] = {}
+_SERVICES_LOCK = threading.Lock()
+
+
+def get_search_service(index_dir: Path | str = DEFAULT_INDEX_DIR) -> SearchService:
+    """Return the process-wide service for ``index_dir``."""
+    key = Path(index_dir).resolve()
+    service = _SERVICES.get(key)
+    if service is None:
+        with _SERVICES_LOCK:
+            service = _SERVICES.get(key)
+            if service is None:
+                service = SearchService(key)
+                _SERVICES[key] = service
+    return service
+
+
+def reset_search_services() -> None:
+    """Drop all cached services (used by tests and after index deletion)."""
+    with _SERVICES_LOCK:
+        _SERVICES.clear()
+
+
+__all__ = [
+    "IndexSnapshot",
+    "SearchService",
+    "get_search_service",
+    "reset_search_services",
+]
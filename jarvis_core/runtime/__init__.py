@@ -9,7 +9,7 @@ from .circuit_breaker import (
     CircuitBreaker,
     FailureReason,
 )
-from .streaming_bundle import Checkpoint, StreamingBundle
+from .streaming_bundle import BundleReader, Checkpoint, StreamingBundle
 from .task_graph import TaskGraph, TaskNode, TaskState
 
 __all__ = [
@@ -20,6 +20,7 @@ __all__ = [
     "TaskNode",
     "TaskState",
     "StreamingBundle",
+    "BundleReader",
     "Checkpoint",
     "CircuitBreaker",
     "FailureReason",
@@ -6,6 +6,10 @@ Per RP-154, provides checkpoint/resume for long-running tasks.
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+import threading
+import time
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -38,15 +42,206 @@ class Checkpoint:
 
 
 class DurableRunner:
-    """Runner with checkpoint/resume capability."""
+    """Runner with checkpoint/resume capability.
 
-    def __init__(self, run_id: str, checkpoint_dir: str = "data/checkpoints"):
+    State is kept in memory and persisted as a compact snapshot
+    (``<run_id>.checkpoint.json``) plus an append-only write-ahead log
+    (``<run_id>.checkpoint.wal``, one JSON record per line).  Completing an
+    item appends a single small record, so checkpointing every item of a
+    long run costs O(1) I/O per item; ``is_completed`` is a set lookup.
+
+    Each record is flushed to the OS immediately (it survives a process
+    crash); ``fsync`` is batched every ``sync_every`` records or
+    ``sync_interval`` seconds and always done by ``save_checkpoint``.  After
+    ``compact_every`` records the state is written to a new snapshot
+    (atomic replace) and the log is truncated.  Replaying the log is
+    idempotent, so a crash between the snapshot and the truncation is
+    harmless, and a torn final record is discarded.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        checkpoint_dir: str = "data/checkpoints",
+        sync_every: int = 256,
+        sync_interval: float = 1.0,
+        compact_every: int = 10_000,
+    ):
         self.run_id = run_id
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
         self._checkpoint_path = self.checkpoint_dir / f"{run_id}.checkpoint.json"
+        self._wal_path = self.checkpoint_dir / f"{run_id}.checkpoint.wal"
         self._current_stage = CheckpointStage.FETCH
         self._step_id = 0
+        self.sync_every = max(1, sync_every)
+        self.sync_interval = sync_interval
+        self.compact_every = max(1, compact_every)
+
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._has_state = False
+        self._state: dict[str, Any] = {}
+        self._completed: dict[str, None] = {}
+        self._pending: dict[str, None] = {}
+        self._wal = None
+        self._wal_records = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _reset_state(self) -> None:
+        self._has_state = False
+        self._state = {
+            "stage": CheckpointStage.FETCH.value,
+            "step_id": 0,
+            "timestamp": "",
+            "data": {},
+        }
+        self._completed = {}
+        self._pending = {}
+        self._wal_records = 0
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._reset_state()
+        if self._checkpoint_path.exists():
+            with open(self._checkpoint_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            self._state = {
+                "stage": snapshot["stage"],
+                "step_id": snapshot["step_id"],
+                "timestamp": snapshot["timestamp"],
+                "data": snapshot["data"],
+            }
+            self._completed = dict.fromkeys(snapshot.get("completed_items", []))
+            self._pending = dict.fromkeys(snapshot.get("pending_items", []))
+            self._has_state = True
+        if self._wal_path.exists():
+            self._replay_wal()
+        self._loaded = True
+
+    def _replay_wal(self) -> None:
+        valid_bytes = 0
+        with open(self._wal_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # torn final record from a crash
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                self._apply(record)
+                self._wal_records += 1
+                valid_bytes += len(line)
+        if valid_bytes < self._wal_path.stat().st_size:
+            with open(self._wal_path, "r+b") as f:
+                f.truncate(valid_bytes)
+
+    def _apply(self, record: dict[str, Any]) -> None:
+        op = record.get("op")
+        if op == "done":
+            for item in record["items"]:
+                self._completed[item] = None
+                self._pending.pop(item, None)
+        elif op == "pending":
+            for item in record["items"]:
+                if item not in self._completed:
+                    self._pending[item] = None
+        elif op == "checkpoint":
+            self._state = {
+                "stage": record["stage"],
+                "step_id": record["step_id"],
+                "timestamp": record["timestamp"],
+                "data": record["data"],
+            }
+            for item in record.get("undone", []):
+                self._completed.pop(item, None)
+            for item in record.get("done", []):
+                self._completed[item] = None
+            if "pending" in record:
+                # Older logs stored the full pending list
+                self._pending = dict.fromkeys(record["pending"])
+            for item in record.get("pending_removed", []):
+                self._pending.pop(item, None)
+            for item in record.get("pending_added", []):
+                self._pending[item] = None
+        self._has_state = True
+
+    def _append(self, record: dict[str, Any], sync: bool = False) -> None:
+        if self._wal is None:
+            self._wal = open(self._wal_path, "a", encoding="utf-8")
+        self._wal.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._wal.flush()
+        self._wal_records += 1
+        self._unsynced += 1
+        if (
+            sync
+            or self._unsynced >= self.sync_every
+            or time.monotonic() - self._last_sync >= self.sync_interval
+        ):
+            self._sync()
+        if self._wal_records >= self.compact_every:
+            self.compact()
+
+    def _sync(self) -> None:
+        if self._wal is not None and self._unsynced:
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _close_wal(self) -> None:
+        if self._wal is not None:
+            self._sync()
+            self._wal.close()
+            self._wal = None
+
+    def compact(self) -> None:
+        """Fold the write-ahead log into a new snapshot and truncate the log."""
+        with self._lock:
+            self._ensure_loaded()
+            self._close_wal()
+            snapshot = {
+                "run_id": self.run_id,
+                **self._state,
+                "completed_items": list(self._completed),
+                "pending_items": list(self._pending),
+            }
+            fd, tmp = tempfile.mkstemp(dir=self.checkpoint_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self._checkpoint_path)
+            # Replay is idempotent, so a crash before this truncation is safe.
+            with open(self._wal_path, "w", encoding="utf-8"):
+                pass
+            self._wal_records = 0
+
+    def flush(self) -> None:
+        """Force buffered log records to stable storage."""
+        with self._lock:
+            self._sync()
+
+    def close(self) -> None:
+        """Sync and close the log file."""
+        with self._lock:
+            self._close_wal()
+
+    def __enter__(self) -> DurableRunner:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Checkpoint API
+    # ------------------------------------------------------------------
 
     def save_checkpoint(
         self,
@@ -57,6 +252,9 @@ class DurableRunner:
     ) -> None:
         """Save a checkpoint.
 
+        Only the differences to the current completed and pending sets are
+        logged, and the record is fsynced before returning.
+
         Args:
             stage: Current stage.
             data: Data to persist.
@@ -65,55 +263,75 @@ class DurableRunner:
         """
         from datetime import datetime, timezone
 
-        checkpoint = Checkpoint(
-            run_id=self.run_id,
-            stage=stage,
-            step_id=self._step_id,
-            timestamp=datetime.now(timezone.utc).replace(tzinfo=None).isoformat() + "Z",
-            data=data,
-            completed_items=completed or [],
-            pending_items=pending or [],
-        )
-
-        self._current_stage = stage
-        self._step_id += 1
-
-        with open(self._checkpoint_path, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "run_id": checkpoint.run_id,
-                    "stage": checkpoint.stage.value,
-                    "step_id": checkpoint.step_id,
-                    "timestamp": checkpoint.timestamp,
-                    "data": checkpoint.data,
-                    "completed_items": checkpoint.completed_items,
-                    "pending_items": checkpoint.pending_items,
-                },
-                f,
-                indent=2,
-            )
+        with self._lock:
+            self._ensure_loaded()
+            completed_now = dict.fromkeys(completed or [])
+            pending_now = dict.fromkeys(pending or [])
+            record = {
+                "op": "checkpoint",
+                "stage": stage.value,
+                "step_id": self._step_id,
+                "timestamp": datetime.now(timezone.utc).replace(tzinfo=None).isoformat() + "Z",
+                "data": data,
+                "undone": [item for item in self._completed if item not in completed_now],
+                "done": [item for item in completed_now if item not in self._completed],
+                "pending_removed": [item for item in self._pending if item not in pending_now],
+                "pending_added": [item for item in pending_now if item not in self._pending],
+            }
+            self._apply(record)
+            self._completed = completed_now
+            self._pending = pending_now
+            self._current_stage = stage
+            self._step_id += 1
+            self._append(record, sync=True)
+
+    def mark_completed(self, *item_ids: str) -> None:
+        """Record items as done (O(1) per item; fsync is batched)."""
+        with self._lock:
+            self._ensure_loaded()
+            new = [item for item in item_ids if item not in self._completed]
+            if not new:
+                return
+            record = {"op": "done", "items": new}
+            self._apply(record)
+            self._append(record)
+
+    def add_pending(self, item_ids: list[str]) -> None:
+        """Add items to the pending set."""
+        with self._lock:
+            self._ensure_loaded()
+            new = [item for item in item_ids if item not in self._completed]
+            if not new:
+                return
+            record = {"op": "pending", "items": new}
+            self._apply(record)
+            self._append(record)
+
+    def is_completed(self, item_id: str) -> bool:
+        """O(1) check whether an item is already done."""
+        with self._lock:
+            self._ensure_loaded()
+            return item_id in self._completed
 
     def load_checkpoint(self) -> Checkpoint | None:
         """Load existing checkpoint if any."""
-        if not self._checkpoint_path.exists():
-            return None
-
-        with open(self._checkpoint_path, encoding="utf-8") as f:
-            data = json.load(f)
-
-        return Checkpoint(
-            run_id=data["run_id"],
-            stage=CheckpointStage(data["stage"]),
-            step_id=data["step_id"],
-            timestamp=data["timestamp"],
-            data=data["data"],
-            completed_items=data["completed_items"],
-            pending_items=data["pending_items"],
-        )
+        with self._lock:
+            self._ensure_loaded()
+            if not self._has_state:
+                return None
+            return Checkpoint(
+                run_id=self.run_id,
+                stage=CheckpointStage(self._state["stage"]),
+                step_id=self._state["step_id"],
+                timestamp=self._state["timestamp"],
+                data=self._state["data"],
+                completed_items=list(self._completed),
+                pending_items=list(self._pending),
+            )
 
     def can_resume(self) -> bool:
         """Check if this run can be resumed."""
-        return self._checkpoint_path.exists()
+        return self._checkpoint_path.exists() or self._wal_path.exists()
 
     def resume_from(self) -> CheckpointStage | None:
         """Get stage to resume from."""
@@ -124,19 +342,22 @@ class DurableRunner:
 
     def clear_checkpoint(self) -> None:
         """Clear checkpoint after successful completion."""
-        if self._checkpoint_path.exists():
-            self._checkpoint_path.unlink()
+        with self._lock:
+            self._close_wal()
+            for path in (self._checkpoint_path, self._wal_path):
+                if path.exists():
+                    path.unlink()
+            self._reset_state()
+            self._loaded = True
 
     def get_completed_items(self) -> list[str]:
         """Get list of completed item IDs from checkpoint."""
-        checkpoint = self.load_checkpoint()
-        if checkpoint:
-            return checkpoint.completed_items
-        return []
+        with self._lock:
+            self._ensure_loaded()
+            return list(self._completed)
 
     def get_pending_items(self) -> list[str]:
         """Get list of pending item IDs from checkpoint."""
-        checkpoint = self.load_checkpoint()
-        if checkpoint:
-            return checkpoint.pending_items
-        return []
+        with self._lock:
+            self._ensure_loaded()
+            return list(self._pending)
@@ -158,12 +158,9 @@ class GPUAccelerator:
             Embedder instance.
         """
         try:
-            from sentence_transformers import SentenceTransformer
+            from jarvis_core.embeddings.model_registry import load_sentence_transformer
 
-            device = self.get_device()
-            model = SentenceTransformer(model_name, device=device)
-
-            return model
+            return load_sentence_transformer(model_name, device=self.get_device())
         except ImportError:
             return None
 
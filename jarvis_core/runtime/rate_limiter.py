@@ -6,6 +6,10 @@ from jarvis_core.ops.rate_limiter import (
     RateLimitConfig,
     RateLimitState,
     RateLimiter,
+    SharedTokenBucket,
+    get_shared_bucket,
+    pubmed_rate_config,
+    shared_bucket_for,
     with_retry,
 )
 
@@ -26,6 +30,10 @@ __all__ = [
     "RateLimitConfig",
     "RateLimitState",
     "RateLimiter",
+    "SharedTokenBucket",
     "get_rate_limiter",
+    "get_shared_bucket",
+    "pubmed_rate_config",
+    "shared_bucket_for",
     "with_retry",
 ]
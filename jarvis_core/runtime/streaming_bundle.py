@@ -1,17 +1,35 @@
 """Streaming Bundle & Checkpoint.
 
 Per V4.2 Sprint 2, this provides incremental bundle writing and checkpoint/resume.
+
+``finalize()`` streams artifacts into ``bundle.json`` one file at a time, so
+peak memory does not grow with the bundle.  Each artifact is written on its
+own line and its byte range is recorded in ``bundle.index.jsonl``;
+``BundleReader`` uses that index to load single artifacts with one seek
+instead of parsing the whole bundle.  The index header records the bundle
+size, so a reader that catches the two files from different ``finalize()``
+runs ignores the index rather than seeking into the wrong bytes.
 """
 
 from __future__ import annotations
 
 import json
+import logging
+import os
 import shutil
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
+BUNDLE_FILE = "bundle.json"
+BUNDLE_INDEX_FILE = "bundle.index.jsonl"
+BUNDLE_VERSION = "v2"
+_COPY_CHUNK = 1 << 20
+
 
 @dataclass
 class Checkpoint:
@@ -80,9 +98,9 @@ class StreamingBundle:
         path = self.artifacts_dir / f"{artifact_id}.json"
         temp_path = path.with_suffix(".tmp")
 
-        # Write to temp file first
+        # Write to temp file first; compact so finalize can copy it verbatim
         with open(temp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
 
         # Atomic rename
         temp_path.rename(path)
@@ -165,26 +183,60 @@ class StreamingBundle:
     def finalize(self) -> str:
         """Finalize streaming bundle to output directory.
 
+        Artifacts are copied into ``bundle.json`` in chunks, one at a time,
+        and their byte ranges are written to ``bundle.index.jsonl``.  Memory
+        use is independent of the number and size of artifacts.
+
         Returns:
             Path to finalized bundle.
         """
-        # Create final bundle.json
-        artifacts = []
-        for path in self.artifacts_dir.glob("*.json"):
-            with open(path, encoding="utf-8") as f:
-                artifacts.append(json.load(f))
-
-        bundle_data = {
-            "version": "v2",
-            "created_at": datetime.now().isoformat(),
-            "artifacts": artifacts,
-            "evidence_count": len(list(self.evidence_dir.glob("*.txt"))),
+        final_bundle = self.output_dir / BUNDLE_FILE
+        final_index = self.output_dir / BUNDLE_INDEX_FILE
+        temp_bundle = final_bundle.with_suffix(".json.tmp")
+        temp_index = final_index.with_suffix(".jsonl.tmp")
+        temp_entries = self.temp_dir / "index_entries.jsonl"
+        created_at = datetime.now().isoformat()
+        evidence_count = sum(1 for _ in self.evidence_dir.glob("*.txt"))
+        artifact_paths = sorted(self.artifacts_dir.glob("*.json"))
+
+        header = {
+            "version": BUNDLE_VERSION,
+            "created_at": created_at,
+            "evidence_count": evidence_count,
+            "artifact_count": len(artifact_paths),
         }
-
-        # Write final bundle
-        final_bundle = self.output_dir / "bundle.json"
-        with open(final_bundle, "w", encoding="utf-8") as f:
-            json.dump(bundle_data, f, indent=2, ensure_ascii=False)
+        # Artifact IDs go into bundle.json too, so the full-parse fallback keeps them
+        head = json.dumps(
+            {**header, "artifact_ids": [path.stem for path in artifact_paths]},
+            ensure_ascii=False,
+        )
+        with open(temp_bundle, "wb") as out, open(temp_entries, "w", encoding="utf-8") as entries:
+            out.write(head[:-1].encode("utf-8") + b', "artifacts": [\n')
+            for position, path in enumerate(artifact_paths):
+                if position:
+                    out.write(b",\n")
+                offset = out.tell()
+                with open(path, "rb") as src:
+                    shutil.copyfileobj(src, out, _COPY_CHUNK)
+                entry = {"id": path.stem, "offset": offset, "length": out.tell() - offset}
+                entries.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            out.write(b"\n]}\n")
+            out.flush()
+            os.fsync(out.fileno())
+            bundle_size = out.tell()
+
+        # The size is only known now, so the header goes in front of the entries
+        with open(temp_index, "w", encoding="utf-8") as index:
+            index.write(json.dumps({**header, "bundle_size": bundle_size}, ensure_ascii=False))
+            index.write("\n")
+            with open(temp_entries, encoding="utf-8") as entries:
+                shutil.copyfileobj(entries, index, _COPY_CHUNK)
+
+        # The two replaces are not atomic together: between them a reader may
+        # pair the new bundle with the old index.  BundleReader detects that
+        # through ``bundle_size`` and falls back to a full parse.
+        os.replace(temp_bundle, final_bundle)
+        os.replace(temp_index, final_index)
 
         # Copy evidence to final location
         final_evidence = self.output_dir / "evidence"
@@ -209,6 +261,126 @@ class StreamingBundle:
             shutil.rmtree(self.temp_dir)
 
 
+class BundleReader:
+    """Random-access reader for a finalized bundle.
+
+    Only the offset index is held in memory; each artifact is read with a
+    single seek.  Bundles without ``bundle.index.jsonl`` (written before the
+    index existed), or whose size does not match the ``bundle_size`` in the
+    index header, are parsed in full once as a fallback.  The fallback keeps
+    artifact IDs when ``bundle.json`` records them, and uses positions
+    (``"0"``, ``"1"``, ...) for older bundles.
+
+    Args:
+        bundle_dir: Directory containing ``bundle.json``.
+    """
+
+    def __init__(self, bundle_dir: str | Path):
+        self.bundle_dir = Path(bundle_dir)
+        self.bundle_path = self.bundle_dir / BUNDLE_FILE
+        self.index_path = self.bundle_dir / BUNDLE_INDEX_FILE
+        if not self.bundle_path.exists():
+            raise FileNotFoundError(f"No {BUNDLE_FILE} in {self.bundle_dir}")
+
+        self.metadata: dict[str, Any] = {}
+        self._ids: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._ranges: list[tuple[int, int]] = []
+        self._legacy: list[Any] | None = None
+        self._file = None
+
+        if self.index_path.exists():
+            self._load_index()
+            expected = self.metadata.get("bundle_size")
+            actual = self.bundle_path.stat().st_size
+            if expected is not None and expected != actual:
+                logger.warning(
+                    "%s is %d bytes but its index expects %d; ignoring the index",
+                    self.bundle_path,
+                    actual,
+                    expected,
+                )
+                self._ranges = []
+                self._load_legacy()
+        else:
+            self._load_legacy()
+
+    def _load_index(self) -> None:
+        with open(self.index_path, encoding="utf-8") as f:
+            header = f.readline()
+            self.metadata = json.loads(header) if header.strip() else {}
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._positions[entry["id"]] = len(self._ids)
+                self._ids.append(entry["id"])
+                self._ranges.append((entry["offset"], entry["length"]))
+
+    def _load_legacy(self) -> None:
+        logger.info("%s has no index; loading the whole bundle", self.bundle_path)
+        with open(self.bundle_path, encoding="utf-8") as f:
+            data = json.load(f)
+        self._legacy = data.pop("artifacts", [])
+        artifact_ids = data.pop("artifact_ids", None)
+        self.metadata = data
+        if isinstance(artifact_ids, list) and len(artifact_ids) == len(self._legacy):
+            self._ids = [str(artifact_id) for artifact_id in artifact_ids]
+        else:
+            self._ids = [str(i) for i in range(len(self._legacy))]
+        self._positions = {artifact_id: i for i, artifact_id in enumerate(self._ids)}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, artifact_id: object) -> bool:
+        return artifact_id in self._positions
+
+    def ids(self) -> list[str]:
+        """Artifact IDs in bundle order."""
+        return list(self._ids)
+
+    def get(self, key: str | int) -> dict:
+        """Load one artifact by ID or by position.
+
+        Raises:
+            KeyError: Unknown artifact ID.
+            IndexError: Position out of range.
+        """
+        position = key if isinstance(key, int) else self._positions[key]
+        if self._legacy is not None:
+            return self._legacy[position]
+        offset, length = self._ranges[position]
+        if self._file is None:
+            self._file = open(self.bundle_path, "rb")
+        self._file.seek(offset)
+        return json.loads(self._file.read(length).decode("utf-8"))
+
+    def __getitem__(self, key: str | int) -> dict:
+        return self.get(key)
+
+    def __iter__(self) -> Iterator[dict]:
+        """Yield artifacts one at a time in bundle order."""
+        for position in range(len(self._ids)):
+            yield self.get(position)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> BundleReader:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
 def create_streaming_bundle(output_dir: str) -> StreamingBundle:
     """Create a new streaming bundle."""
     return StreamingBundle(output_dir)
+
+
+def open_bundle(bundle_dir: str | Path) -> BundleReader:
+    """Open a finalized bundle for random access."""
+    return BundleReader(bundle_dir)
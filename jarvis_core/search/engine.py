@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 
 @dataclass
 class SearchResult:
@@ -57,84 +59,243 @@ class SearchResults:
         }
 
 
+class _Segment:
+    """不変のポスティングセグメント.
+
+    ``postings`` はトークン -> (doc_ids, tfs) の配列ペア。``doc_ids`` は
+    セグメント構築時に含まれていた文書ID（削除済みはマージ時に除去）。
+    """
+
+    __slots__ = ("postings", "doc_ids")
+
+    def __init__(self, postings: dict[str, tuple[np.ndarray, np.ndarray]], doc_ids: np.ndarray):
+        self.postings = postings
+        self.doc_ids = doc_ids
+
+    @property
+    def num_docs(self) -> int:
+        return len(self.doc_ids)
+
+
 class BM25Index:
-    """BM25インデックス."""
+    """BM25インデックス.
+
+    文書は追加時に一度だけトークン化し、トークンごとのポスティング
+    (doc_id, tf) として保持する。新規文書はメモリ上のバッファに積まれ、
+    ``segment_size`` 件で不変セグメントへフラッシュされる。セグメント数が
+    ``max_segments`` を超えると小さい順に ``merge_factor`` 個をマージし、
+    その際に削除済み文書のポスティングを取り除く。
+
+    検索コストはクエリトークンのポスティング長に比例し、コーパス全体の
+    走査は行わない。削除は墓標方式で、``documents[i]`` は ``None`` になる。
+    削除済み文書の割合が ``compact_ratio`` を超えたセグメントは、マージを
+    待たずにその場で書き直して墓標を取り除く。
+    """
 
-    def __init__(self, k1: float = 1.5, b: float = 0.75):
+    def __init__(
+        self,
+        k1: float = 1.5,
+        b: float = 0.75,
+        segment_size: int = 1024,
+        max_segments: int = 8,
+        merge_factor: int = 4,
+        compact_ratio: float = 0.3,
+    ):
         self.k1 = k1
         self.b = b
-        self.documents: list[dict[str, Any]] = []
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self.merge_factor = max(2, merge_factor)
+        self.compact_ratio = compact_ratio
+        self.documents: list[dict[str, Any] | None] = []
         self.doc_freqs: Counter = Counter()
         self.doc_lengths: list[int] = []
         self.avg_doc_length: float = 0
         self.num_docs: int = 0
+        self.segments: list[_Segment] = []
+        self._buffer: dict[str, tuple[list[int], list[int]]] = {}
+        self._buffer_docs: list[int] = []
+        self._doc_terms: list[tuple[str, ...]] = []
+        self._live: list[bool] = []
+        self._total_length = 0
+        self._arrays: tuple[np.ndarray, np.ndarray] | None = None
 
-    def add_documents(self, documents: list[dict[str, Any]]) -> None:
-        """ドキュメントを追加."""
+    def add_documents(self, documents: list[dict[str, Any]]) -> list[int]:
+        """ドキュメントを追加.
+
+        Returns:
+            追加した文書のID（``documents`` 内の位置）
+        """
+        added: list[int] = []
         for doc in documents:
-            text = doc.get("text", "")
-            tokens = self._tokenize(text)
+            counts = Counter(self._tokenize(doc.get("text", "")))
+            length = sum(counts.values())
+            doc_idx = len(self.documents)
 
             self.documents.append(doc)
-            self.doc_lengths.append(len(tokens))
+            self.doc_lengths.append(length)
+            self._live.append(True)
+            self._doc_terms.append(tuple(counts))
+            self._total_length += length
+            self.num_docs += 1
 
-            # 文書頻度をカウント
-            unique_tokens = set(tokens)
-            for token in unique_tokens:
+            for token, tf in counts.items():
                 self.doc_freqs[token] += 1
+                docs, tfs = self._buffer.setdefault(token, ([], []))
+                docs.append(doc_idx)
+                tfs.append(tf)
+            self._buffer_docs.append(doc_idx)
+            added.append(doc_idx)
 
-        self.num_docs = len(self.documents)
-        self.avg_doc_length = sum(self.doc_lengths) / max(1, self.num_docs)
+            if len(self._buffer_docs) >= self.segment_size:
+                self.flush()
 
-    def search(self, query: str, top_k: int = 10) -> list[tuple]:
-        """検索.
+        self._arrays = None
+        self._update_avg()
+        return added
+
+    def remove_documents(self, doc_indices: list[int]) -> int:
+        """ドキュメントを削除（墓標化）.
 
         Returns:
-            [(doc_index, score), ...]
+            実際に削除した件数
         """
-        query_tokens = self._tokenize(query)
-        scores = []
-
-        for doc_idx, doc in enumerate(self.documents):
-            text = doc.get("text", "")
-            doc_tokens = self._tokenize(text)
-            doc_len = self.doc_lengths[doc_idx]
-
-            score = self._compute_bm25(query_tokens, doc_tokens, doc_len)
-            scores.append((doc_idx, score))
-
-        # スコア順にソート
-        scores.sort(key=lambda x: x[1], reverse=True)
-
-        return scores[:top_k]
-
-    def _compute_bm25(
-        self,
-        query_tokens: list[str],
-        doc_tokens: list[str],
-        doc_len: int,
-    ) -> float:
-        """BM25スコアを計算."""
-        score = 0.0
-        doc_token_counts = Counter(doc_tokens)
-
-        for token in query_tokens:
-            if token not in doc_token_counts:
+        removed = 0
+        for doc_idx in doc_indices:
+            if not 0 <= doc_idx < len(self._live) or not self._live[doc_idx]:
                 continue
+            self._live[doc_idx] = False
+            for token in self._doc_terms[doc_idx]:
+                self.doc_freqs[token] -= 1
+                if self.doc_freqs[token] <= 0:
+                    del self.doc_freqs[token]
+            self._doc_terms[doc_idx] = ()
+            self.documents[doc_idx] = None
+            self._total_length -= self.doc_lengths[doc_idx]
+            self.num_docs -= 1
+            removed += 1
+
+        if removed:
+            self._arrays = None
+            self._update_avg()
+            self._compact_segments()
+        return removed
+
+    def _compact_segments(self) -> None:
+        """墓標の割合が ``compact_ratio`` を超えたセグメントを書き直す."""
+        live = self._live_mask()
+        compacted = False
+        for i, seg in enumerate(self.segments):
+            if not seg.num_docs:
+                continue
+            dead = seg.num_docs - int(np.count_nonzero(live[seg.doc_ids]))
+            if dead and dead / seg.num_docs > self.compact_ratio:
+                self.segments[i] = self._merge([seg])
+                compacted = True
+        if compacted:
+            self.segments = [seg for seg in self.segments if seg.num_docs]
+
+    def flush(self) -> None:
+        """バッファを不変セグメントに変換し、必要ならマージする."""
+        if not self._buffer_docs:
+            return
+        self._arrays = None
+        postings = {
+            token: (np.asarray(docs, dtype=np.int64), np.asarray(tfs, dtype=np.float64))
+            for token, (docs, tfs) in self._buffer.items()
+        }
+        self.segments.append(_Segment(postings, np.asarray(self._buffer_docs, dtype=np.int64)))
+        self._buffer = {}
+        self._buffer_docs = []
+        while len(self.segments) > self.max_segments:
+            self.segments.sort(key=lambda seg: seg.num_docs)
+            merged = self._merge(self.segments[: self.merge_factor])
+            self.segments = [merged] + self.segments[self.merge_factor :]
+
+    def merge_segments(self) -> None:
+        """全セグメント（バッファ含む）を1つにまとめる."""
+        self.flush()
+        if len(self.segments) > 1 or (self.segments and self.segments[0].num_docs != self.num_docs):
+            self.segments = [self._merge(self.segments)]
+
+    def _merge(self, segments: list[_Segment]) -> _Segment:
+        live = self._live_mask()
+        doc_ids = np.concatenate([seg.doc_ids for seg in segments])
+        parts: dict[str, list[tuple[np.ndarray, np.ndarray]]] = {}
+        for seg in segments:
+            for token, pair in seg.postings.items():
+                parts.setdefault(token, []).append(pair)
+
+        postings: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for token, pairs in parts.items():
+            docs = np.concatenate([p[0] for p in pairs])
+            tfs = np.concatenate([p[1] for p in pairs])
+            keep = live[docs]
+            if keep.any():
+                postings[token] = (docs[keep], tfs[keep])
+        return _Segment(postings, doc_ids[live[doc_ids]])
+
+    def _update_avg(self) -> None:
+        self.avg_doc_length = self._total_length / max(1, self.num_docs)
+
+    def _live_mask(self) -> np.ndarray:
+        return self._doc_arrays()[0]
+
+    def _doc_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._arrays is None:
+            self._arrays = (
+                np.asarray(self._live, dtype=bool),
+                np.asarray(self.doc_lengths, dtype=np.float64),
+            )
+        return self._arrays
+
+    def _postings(self, token: str):
+        for seg in self.segments:
+            pair = seg.postings.get(token)
+            if pair is not None:
+                yield pair
+        buffered = self._buffer.get(token)
+        if buffered is not None:
+            yield (
+                np.asarray(buffered[0], dtype=np.int64),
+                np.asarray(buffered[1], dtype=np.float64),
+            )
 
-            tf = doc_token_counts[token]
-            df = self.doc_freqs.get(token, 0)
+    def search(self, query: str, top_k: int = 10) -> list[tuple]:
+        """検索.
 
-            # IDF
+        Returns:
+            [(doc_index, score), ...]（クエリトークンを含む文書のみ）
+        """
+        query_counts = Counter(self._tokenize(query))
+        if not query_counts or self.num_docs == 0 or top_k <= 0:
+            return []
+
+        live, lengths = self._doc_arrays()
+        doc_parts: list[np.ndarray] = []
+        score_parts: list[np.ndarray] = []
+        for token, query_tf in query_counts.items():
+            df = self.doc_freqs.get(token, 0)
+            if df == 0:
+                continue
             idf = math.log((self.num_docs - df + 0.5) / (df + 0.5) + 1)
-
-            # TF正規化
-            norm = self.k1 * (1 - self.b + self.b * doc_len / self.avg_doc_length)
-            tf_normalized = (tf * (self.k1 + 1)) / (tf + norm)
-
-            score += idf * tf_normalized
-
-        return score
+            for docs, tfs in self._postings(token):
+                keep = live[docs]
+                docs, tfs = docs[keep], tfs[keep]
+                norm = self.k1 * (1 - self.b + self.b * lengths[docs] / self.avg_doc_length)
+                doc_parts.append(docs)
+                score_parts.append(query_tf * idf * (tfs * (self.k1 + 1)) / (tfs + norm))
+
+        if not doc_parts:
+            return []
+        doc_ids, inverse = np.unique(np.concatenate(doc_parts), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(score_parts))
+        if top_k < len(scores):
+            candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            candidates = np.arange(len(scores))
+        order = candidates[np.lexsort((doc_ids[candidates], -scores[candidates]))]
+        return [(int(doc_ids[i]), float(scores[i])) for i in order]
 
     def _tokenize(self, text: str) -> list[str]:
         """トークン化."""
@@ -147,29 +308,116 @@ class SearchEngine:
     """検索エンジン.
 
     BM25ベースの検索 + 将来的なベクトル検索拡張。
+    ``add_chunks`` / ``remove_chunks`` で再構築なしに更新でき、``sync`` は
+    chunks.jsonl の追記分だけを取り込む。
     """
 
     def __init__(self):
         self.bm25 = BM25Index()
-        self._chunks: list[dict[str, Any]] = []
+        self._chunk_index: dict[str, int] = {}
         self._loaded = False
+        self._source: tuple[Path, int] | None = None
+        self._offset = 0
+
+    def add_chunks(self, chunks: list[dict[str, Any]]) -> int:
+        """チャンクを追加（同じchunk_idは置き換え）."""
+        chunks = list(chunks)
+        replaced = [
+            self._chunk_index[chunk["chunk_id"]]
+            for chunk in chunks
+            if chunk.get("chunk_id") in self._chunk_index
+        ]
+        if replaced:
+            self.bm25.remove_documents(replaced)
+
+        doc_indices = self.bm25.add_documents(chunks)
+        for chunk, doc_idx in zip(chunks, doc_indices):
+            chunk_id = chunk.get("chunk_id")
+            if chunk_id:
+                self._chunk_index[chunk_id] = doc_idx
+        self._loaded = True
+        return len(doc_indices)
+
+    def remove_chunks(self, chunk_ids: list[str]) -> int:
+        """chunk_idを指定してチャンクを削除."""
+        doc_indices = [
+            self._chunk_index.pop(chunk_id)
+            for chunk_id in chunk_ids
+            if chunk_id in self._chunk_index
+        ]
+        return self.bm25.remove_documents(doc_indices)
 
     def load_chunks(self, filepath: Path) -> int:
-        """chunks.jsonlを読み込み."""
-        self._chunks = []
+        """chunks.jsonlを読み込み（既存のインデックスは破棄）."""
+        self.bm25 = BM25Index(
+            k1=self.bm25.k1,
+            b=self.bm25.b,
+            segment_size=self.bm25.segment_size,
+            max_segments=self.bm25.max_segments,
+            merge_factor=self.bm25.merge_factor,
+            compact_ratio=self.bm25.compact_ratio,
+        )
+        self._chunk_index = {}
+        self._source = None
+        self._offset = 0
 
         if not filepath.exists():
             return 0
 
-        with open(filepath, encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    self._chunks.append(json.loads(line))
-
-        self.bm25.add_documents(self._chunks)
+        inode = filepath.stat().st_ino
+        added = self._read_from(filepath, 0, final_tail=True)
+        self._source = (filepath, inode)
+        self.bm25.merge_segments()
         self._loaded = True
+        return added
+
+    def sync(self, filepath: Path) -> int:
+        """chunks.jsonlの追記分を取り込む.
+
+        ファイルが置き換え・切り詰められた場合は全件を再読み込みする。
+        変更がなければstat 1回で終わる。
+
+        Returns:
+            取り込んだチャンク数
+        """
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return 0
+        if (
+            self._source is None
+            or self._source != (filepath, stat.st_ino)
+            or stat.st_size < self._offset
+        ):
+            return self.load_chunks(filepath)
+        if stat.st_size == self._offset:
+            return 0
+        return self._read_from(filepath, self._offset)
 
-        return len(self._chunks)
+    def _read_from(self, filepath: Path, offset: int, final_tail: bool = False) -> int:
+        """``offset`` 以降の行を取り込む.
+
+        改行で終わらない末尾行は書き込み途中とみなして次回に回す。
+        ``final_tail`` の場合（全件読み込み）は、末尾行が有効なJSONなら取り込む。
+        """
+        chunks: list[dict[str, Any]] = []
+        with open(filepath, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    if final_tail:
+                        try:
+                            chunks.append(json.loads(raw.decode("utf-8")))
+                            offset += len(raw)
+                        except ValueError:
+                            pass
+                    break
+                offset += len(raw)
+                line = raw.decode("utf-8").strip()
+                if line:
+                    chunks.append(json.loads(line))
+        self._offset = offset
+        return self.add_chunks(chunks) if chunks else 0
 
     def search(
         self,
@@ -191,7 +439,7 @@ class SearchEngine:
 
         start = time.time()
 
-        if not self._loaded or not self._chunks:
+        if not self._loaded or self.bm25.num_docs == 0:
             return SearchResults(query=query)
 
         # BM25検索
@@ -204,7 +452,7 @@ class SearchEngine:
             if len(results) >= top_k:
                 break
 
-            chunk = self._chunks[doc_idx]
+            chunk = self.bm25.documents[doc_idx]
 
             # フィルタ適用
             if filters:
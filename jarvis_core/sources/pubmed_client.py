@@ -14,6 +14,8 @@ from typing import Any
 
 import requests  # type: ignore[import-untyped]
 
+from jarvis_core.ops.rate_limiter import pubmed_rate_config, shared_bucket_for
+
 logger = logging.getLogger(__name__)
 
 # NCBI E-utilities base URLs
@@ -64,20 +66,33 @@ class PubMedClient:
         api_key: str | None = None,
         email: str | None = None,
         tool_name: str = "jarvis-research-os",
-        rate_limit: float = 0.34,  # ~3 requests/second
+        rate_limit: float | None = None,
     ):
         self.api_key = api_key
         self.email = email
         self.tool_name = tool_name
+        config = pubmed_rate_config(api_key)
+        # Minimum seconds between requests; 0 disables limiting
+        self._explicit_rate_limit = rate_limit is not None
+        if rate_limit is None:
+            rate_limit = 1.0 / config.effective_rate()
         self.rate_limit = rate_limit
         self._last_request_time = 0.0
+        # Shared across processes when JARVIS_RATE_LIMIT_DB is set; the bucket
+        # rate comes from the same config as get_pubmed_rate_limiter(). An
+        # explicit rate_limit is still applied per client on top of it, so the
+        # stricter of the two wins without changing the shared rate.
+        self._shared_bucket = shared_bucket_for(config) if rate_limit > 0 else None
         self._session = requests.Session()
 
     def _rate_limit_wait(self) -> None:
         """Wait for rate limiting."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
+        if self._shared_bucket is None or self._explicit_rate_limit:
+            elapsed = time.time() - self._last_request_time
+            if elapsed < self.rate_limit:
+                time.sleep(self.rate_limit - elapsed)
+        if self._shared_bucket is not None:
+            self._shared_bucket.acquire()
         self._last_request_time = time.time()
 
     def _build_params(self, **kwargs: str) -> dict[str, str]:
@@ -15,6 +15,8 @@ from typing import Any
 
 import requests  # type: ignore[import-untyped]
 
+from jarvis_core.ops.rate_limiter import get_shared_bucket
+
 logger = logging.getLogger(__name__)
 
 S2_API_BASE = "https://api.semanticscholar.org/graph/v1"
@@ -95,6 +97,10 @@ class SemanticScholarClient:
         self.api_key = api_key
         self.rate_limit = rate_limit
         self._last_request_time = 0.0
+        # Shared across processes when JARVIS_RATE_LIMIT_DB is set
+        self._shared_bucket = (
+            get_shared_bucket("semantic_scholar", rate=1.0 / rate_limit) if rate_limit > 0 else None
+        )
         self._session = requests.Session()
 
         if api_key:
@@ -102,6 +108,9 @@ class SemanticScholarClient:
 
     def _rate_limit_wait(self) -> None:
         """Wait for rate limiting."""
+        if self._shared_bucket is not None:
+            self._shared_bucket.acquire()
+            return
         elapsed = time.time() - self._last_request_time
         if elapsed < self.rate_limit:
             time.sleep(self.rate_limit - elapsed)
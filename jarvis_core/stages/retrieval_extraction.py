@@ -22,7 +22,12 @@ from jarvis_core.pipelines.stage_registry import register_stage
 # ============================================
 
 
-@register_stage("retrieval.query_expand", "MeSH/同義語展開")
+@register_stage(
+    "retrieval.query_expand",
+    "MeSH/同義語展開",
+    inputs=["context.goal"],
+    outputs=["metadata.expanded_queries", "claims"],
+)
 def stage_query_expand(context: TaskContext, artifacts: Artifacts) -> Artifacts:
     """クエリ展開ステージ。"""
     goal = context.goal
@@ -70,7 +75,12 @@ def stage_query_expand(context: TaskContext, artifacts: Artifacts) -> Artifacts:
     return artifacts
 
 
-@register_stage("retrieval.query_decompose", "クエリ分解")
+@register_stage(
+    "retrieval.query_decompose",
+    "クエリ分解",
+    inputs=["context.goal"],
+    outputs=["metadata.query_parts", "claims"],
+)
 def stage_query_decompose(context: TaskContext, artifacts: Artifacts) -> Artifacts:
     """クエリ分解ステージ。"""
     import re
@@ -105,7 +115,19 @@ def stage_query_decompose(context: TaskContext, artifacts: Artifacts) -> Artifac
     return artifacts
 
 
-@register_stage("retrieval.search_bm25", "BM25検索（PubMed API）")
+@register_stage(
+    "retrieval.search_bm25",
+    "BM25検索（PubMed API）",
+    inputs=["context.goal", "env.USE_MOCK_PUBMED", "papers"],
+    outputs=[
+        "papers",
+        "metadata.bm25_results",
+        "metadata.search_source",
+        "metadata.search_query",
+        "metadata.search_error",
+        "claims",
+    ],
+)
 def stage_search_bm25(context: TaskContext, artifacts: Artifacts) -> Artifacts:
     """
     BM25検索ステージ.
@@ -186,7 +208,12 @@ def stage_search_bm25(context: TaskContext, artifacts: Artifacts) -> Artifacts:
     return artifacts
 
 
-@register_stage("retrieval.embed_sectionwise", "セクション別埋め込み")
+@register_stage(
+    "retrieval.embed_sectionwise",
+    "セクション別埋め込み",
+    inputs=["papers", "embeddings"],
+    outputs=["embeddings", "claims"],
+)
 def stage_embed_sectionwise(context: TaskContext, artifacts: Artifacts) -> Artifacts:
     """セクション別埋め込みステージ。"""
     for paper in artifacts.papers:
@@ -218,7 +245,12 @@ def stage_embed_sectionwise(context: TaskContext, artifacts: Artifacts) -> Artif
     return artifacts
 
 
-@register_stage("retrieval.rerank_crossencoder", "CrossEncoderリランク")
+@register_stage(
+    "retrieval.rerank_crossencoder",
+    "CrossEncoderリランク",
+    inputs=["metadata.bm25_results"],
+    outputs=["metadata.reranked_results", "claims"],
+)
 def stage_rerank_crossencoder(context: TaskContext, artifacts: Artifacts) -> Artifacts:
     """CrossEncoderリランクステージ。"""
     results = artifacts.metadata.get("bm25_results", [])
@@ -76,9 +76,9 @@ class CPUEmbedder:
             return
 
         try:
-            from sentence_transformers import SentenceTransformer
+            from jarvis_core.embeddings.model_registry import get_encode_service
 
-            self._model = SentenceTransformer(self.model_name)
+            self._model = get_encode_service(self.model_name)
             self._available = True
         except ImportError:
             self._available = False
@@ -1,11 +1,30 @@
 """MMR - Maximal Marginal Relevance.
 
 Per RP-14, provides diversity-aware reranking.
+
+Selection is incremental: a running array holds each candidate's maximum
+similarity to the items selected so far, and after every pick it is updated
+only against the newly selected item.  Diversifying ``n`` candidates down to
+``k`` therefore costs ``k`` similarity rows (O(k·n)) instead of comparing
+every candidate with every selected item at every step (O(k²·n)).
+
+Similarity backends:
+    - exact Jaccard over token sets (``mmr_rerank``, the default),
+    - MinHash-approximated Jaccard (``mmr_rerank(..., method="minhash")``),
+      one vectorised signature comparison per step,
+    - cosine over dense embeddings (``mmr_rerank_embeddings``), one
+      matrix-vector product per step.
 """
 
 from __future__ import annotations
 
-from typing import List, Tuple
+import zlib
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
 
 
 def jaccard_similarity(tokens1: set, tokens2: set) -> float:
@@ -15,11 +34,90 @@ def jaccard_similarity(tokens1: set, tokens2: set) -> float:
     return len(tokens1 & tokens2) / len(tokens1 | tokens2)
 
 
+def mmr_select(
+    relevance: Sequence[float],
+    similarity_to: Callable[[int], np.ndarray],
+    lambda_param: float = 0.5,
+    top_k: int = 10,
+) -> List[int]:
+    """Core incremental MMR selection.
+
+    Args:
+        relevance: Relevance score per candidate.
+        similarity_to: ``similarity_to(j)`` returns the similarity of every
+            candidate to candidate ``j`` as an array of length ``n``.
+        lambda_param: Balance between relevance (1.0) and diversity (0.0).
+        top_k: Number to select.
+
+    Returns:
+        Selected candidate positions in selection order.
+    """
+    rel = np.asarray(relevance, dtype=np.float64)
+    n = rel.shape[0]
+    if n == 0 or top_k <= 0:
+        return []
+
+    weighted = lambda_param * rel
+    max_sim = np.zeros(n, dtype=np.float64)
+    available = np.ones(n, dtype=bool)
+    selected: List[int] = []
+
+    for _ in range(min(top_k, n)):
+        scores = weighted - (1 - lambda_param) * max_sim
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))  # first maximum, as in a linear scan
+        selected.append(best)
+        available[best] = False
+        if len(selected) < top_k:
+            np.maximum(max_sim, similarity_to(best), out=max_sim)
+
+    return selected
+
+
+class MinHasher:
+    """MinHash signatures for token sets.
+
+    Two sets' Jaccard similarity is estimated by the fraction of equal
+    signature positions; the error shrinks with ``num_perm``.  Token hashes
+    use CRC32, so signatures are stable across processes.
+
+    Args:
+        num_perm: Number of hash permutations (signature length).
+        seed: Seed for the permutation coefficients.
+    """
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        self.num_perm = num_perm
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, tokens: set) -> np.ndarray:
+        """Signature of one token set (all ``_MAX_HASH`` for an empty set)."""
+        if not tokens:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        hashes = np.fromiter(
+            (zlib.crc32(str(t).encode("utf-8")) for t in tokens),
+            dtype=np.uint64,
+            count=len(tokens),
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=0)
+
+    def signatures(self, token_sets: Sequence[set]) -> np.ndarray:
+        """Signature matrix of shape ``(len(token_sets), num_perm)``."""
+        if not token_sets:
+            return np.empty((0, self.num_perm), dtype=np.uint64)
+        return np.vstack([self.signature(tokens) for tokens in token_sets])
+
+
 def mmr_rerank(
     query_tokens: set,
     candidates: List[Tuple[int, float, set]],  # (idx, score, tokens)
     lambda_param: float = 0.5,
     top_k: int = 10,
+    method: str = "exact",
+    num_perm: int = 128,
 ) -> List[Tuple[int, float]]:
     """Rerank candidates using MMR.
 
@@ -28,6 +126,8 @@ def mmr_rerank(
         candidates: List of (idx, score, tokens).
         lambda_param: Balance between relevance (1.0) and diversity (0.0).
         top_k: Number to return.
+        method: ``"exact"`` Jaccard or ``"minhash"`` approximation.
+        num_perm: MinHash signature length (``method="minhash"`` only).
 
     Returns:
         Reranked (idx, score) list.
@@ -35,30 +135,68 @@ def mmr_rerank(
     if not candidates:
         return []
 
-    selected: List[Tuple[int, float, set]] = []
-    remaining = list(candidates)
+    token_sets = [tokens for _, _, tokens in candidates]
+    relevance = [score for _, score, _ in candidates]
+
+    if method == "exact":
 
-    while remaining and len(selected) < top_k:
-        best_idx = -1
-        best_score = float("-inf")
+        def similarity_to(j: int) -> np.ndarray:
+            chosen = token_sets[j]
+            return np.fromiter(
+                (jaccard_similarity(tokens, chosen) for tokens in token_sets),
+                dtype=np.float64,
+                count=len(token_sets),
+            )
 
-        for i, (idx, orig_score, tokens) in enumerate(remaining):
-            # Relevance to query
-            relevance = orig_score
+    elif method == "minhash":
+        signatures = MinHasher(num_perm=num_perm).signatures(token_sets)
+        empty = np.array([not tokens for tokens in token_sets])
 
-            # Diversity from selected
-            if selected:
-                max_sim = max(jaccard_similarity(tokens, s[2]) for s in selected)
-            else:
-                max_sim = 0.0
+        def similarity_to(j: int) -> np.ndarray:
+            if empty[j]:
+                return np.zeros(len(token_sets))
+            sims = (signatures == signatures[j]).mean(axis=1)
+            sims[empty] = 0.0
+            return sims
 
-            mmr_score = lambda_param * relevance - (1 - lambda_param) * max_sim
+    else:
+        raise ValueError(f"Unknown MMR method: {method}")
+
+    order = mmr_select(relevance, similarity_to, lambda_param=lambda_param, top_k=top_k)
+    return [(candidates[i][0], candidates[i][1]) for i in order]
+
+
+def mmr_rerank_embeddings(
+    scores: Sequence[float],
+    embeddings: np.ndarray,
+    lambda_param: float = 0.5,
+    top_k: int = 10,
+    ids: Optional[Sequence[int]] = None,
+) -> List[Tuple[int, float]]:
+    """Rerank dense-embedding candidates using MMR with cosine similarity.
+
+    Args:
+        scores: Relevance score per candidate.
+        embeddings: Candidate vectors, shape ``(n, dim)``.
+        lambda_param: Balance between relevance (1.0) and diversity (0.0).
+        top_k: Number to return.
+        ids: Candidate ids to return (default: row positions).
+
+    Returns:
+        Reranked (id, score) list.
+    """
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.shape[0] == 0:
+        return []
+    if matrix.shape[0] != len(scores):
+        raise ValueError("scores and embeddings must have the same length")
 
-            if mmr_score > best_score:
-                best_score = mmr_score
-                best_idx = i
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    normed = matrix / np.where(norms == 0, 1.0, norms)
 
-        if best_idx >= 0:
-            selected.append(remaining.pop(best_idx))
+    def similarity_to(j: int) -> np.ndarray:
+        return normed @ normed[j]
 
-    return [(idx, score) for idx, score, _ in selected]
+    order = mmr_select(scores, similarity_to, lambda_param=lambda_param, top_k=top_k)
+    id_list = list(ids) if ids is not None else list(range(matrix.shape[0]))
+    return [(id_list[i], float(scores[i])) for i in order]
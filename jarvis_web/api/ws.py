@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from collections.abc import AsyncIterator
 from pathlib import Path
+from typing import Any, Optional
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from jarvis_core.obs.event_bus import get_event_bus
+from jarvis_core.obs.logger import run_log_path
 from jarvis_web.api.orchestrator import _ensure_started
 
+HEARTBEAT_SEC = 15.0
+
 
 router = APIRouter()
 
@@ -68,6 +75,46 @@ def _load_run_status(run_id: str) -> str:
     return "unknown"
 
 
+def _is_terminal(record: dict[str, Any]) -> bool:
+    data = record.get("data", {})
+    return record.get("event") == "step_end" and data.get("step") == "Pipeline"
+
+
+async def iter_run_events(
+    run_id: str,
+    since: Optional[int] = None,
+    follow: bool = True,
+    heartbeat: float = HEARTBEAT_SEC,
+) -> AsyncIterator[Optional[dict[str, Any]]]:
+    """Yield run events from the event bus, replaying from ``since`` first.
+
+    ``None`` is yielded every ``heartbeat`` seconds without events so callers
+    can send keep-alives.  The stream ends after the pipeline's final
+    ``step_end`` event, or after the replay when ``follow`` is false.
+    """
+    subscription, backlog = get_event_bus().subscribe(
+        run_id, source=run_log_path(run_id), since=since, loop=asyncio.get_running_loop()
+    )
+    try:
+        for record in backlog:
+            yield record
+            if _is_terminal(record):
+                return
+        if not follow:
+            return
+        while True:
+            batch = await subscription.aget(timeout=heartbeat)
+            if not batch:
+                yield None
+                continue
+            for record in batch:
+                yield record
+                if _is_terminal(record):
+                    return
+    finally:
+        subscription.close()
+
+
 @router.websocket("/ws/runs/{run_id}")
 async def run_progress(websocket: WebSocket, run_id: str) -> None:
     """WebSocket endpoint for run progress updates."""
@@ -77,6 +124,15 @@ async def run_progress(websocket: WebSocket, run_id: str) -> None:
         {"event": "run_status", "data": {"run_id": run_id, "status": _load_run_status(run_id)}}
     )
 
+    since_param = websocket.query_params.get("since")
+    since = int(since_param) if since_param and since_param.isdigit() else None
+
+    async def forward_events() -> None:
+        async for record in iter_run_events(run_id, since=since):
+            if record is not None:
+                await websocket.send_json({"event": "run_event", "data": record})
+
+    forwarder = asyncio.create_task(forward_events())
     try:
         while True:
             message = await websocket.receive_text()
@@ -84,3 +140,5 @@ async def run_progress(websocket: WebSocket, run_id: str) -> None:
                 await websocket.send_json({"event": "pong", "data": {"run_id": run_id}})
     except WebSocketDisconnect:
         return
+    finally:
+        forwarder.cancel()
@@ -12,18 +12,23 @@ import hashlib
 import json
 import os
 import re
-import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, List, Optional
 
 from jarvis_core.security.fs_safety import resolve_under, safe_extract_zip, sanitize_filename
-from jarvis_core.security.atomic_io import atomic_write_json
 from jarvis_core.redact_logging import setup_logging
+from jarvis_web.run_catalog import RunCatalog
+from jarvis_web.upload_index import UploadTooLarge, get_upload_index, stream_to_tempfile
 
 try:
-    from fastapi import FastAPI, HTTPException, Depends, UploadFile, File
-    from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
+    from fastapi import FastAPI, HTTPException, Depends, Header, Request, UploadFile, File
+    from fastapi.responses import (
+        FileResponse,
+        JSONResponse,
+        RedirectResponse,
+        StreamingResponse,
+    )
     from fastapi.middleware.cors import CORSMiddleware
     from fastapi.staticfiles import StaticFiles
     from pydantic import BaseModel, Field
@@ -63,7 +68,7 @@ if FASTAPI_AVAILABLE:
     from jarvis_web.api.mcp import router as mcp_router
     from jarvis_web.api.inbox import router as inbox_router
     from jarvis_web.api.orchestrator import router as orchestrator_router
-    from jarvis_web.api.ws import router as ws_router
+    from jarvis_web.api.ws import iter_run_events, router as ws_router
     from jarvis_web.routes.research import router as research_router
 
     # from jarvis_web.routes.finance import router as finance_router (Moved to lazy import)
@@ -361,6 +366,23 @@ def _build_run_response(run_dir: Path, include_files: bool) -> dict:
     return response
 
 
+_RUN_CATALOGS: dict[Path, RunCatalog] = {}
+
+
+def get_run_catalog() -> RunCatalog:
+    """Return the run catalog for the current ``RUNS_DIR``."""
+    key = RUNS_DIR.resolve()
+    catalog = _RUN_CATALOGS.get(key)
+    if catalog is None:
+        catalog = RunCatalog(
+            RUNS_DIR.parent / "run_catalog.sqlite",
+            roots=[LEGACY_RUNS_DIR, RUNS_DIR],
+            build_summary=lambda run_dir: _build_run_response(run_dir, include_files=False),
+        )
+        _RUN_CATALOGS[key] = catalog
+    return catalog
+
+
 def load_run_summary(run_dir: Path) -> dict:
     """Load run summary from directory."""
     summary = {
@@ -494,14 +516,35 @@ if FASTAPI_AVAILABLE:
     # === Run Management (AG-05) ===
 
     @app.get("/api/runs")
-    async def list_runs(limit: int = 20, _: bool = Depends(verify_token)):
-        """List runs from logs/runs/ (per BUNDLE_CONTRACT.md)."""
-        run_dirs = _iter_run_dirs()
-        run_dirs.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        runs = [_build_run_response(run_dir, include_files=False) for run_dir in run_dirs[:limit]]
-        return _api_success(
-            {"runs": runs, "total": len(run_dirs)}, legacy={"runs": runs, "total": len(run_dirs)}
-        )
+    async def list_runs(
+        limit: int = 20,
+        offset: int = 0,
+        sort: str = "updated_at",
+        order: str = "desc",
+        status: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        goal: Optional[str] = None,
+        _: bool = Depends(verify_token),
+    ):
+        """List runs from the run catalog (per BUNDLE_CONTRACT.md)."""
+        catalog = get_run_catalog()
+        catalog.maybe_reconcile()
+        try:
+            runs, total = catalog.query(
+                limit=limit,
+                offset=offset,
+                sort=sort,
+                order=order,
+                status=normalize_status(status) if status else None,
+                since=since,
+                until=until,
+                goal=goal,
+            )
+        except ValueError as exc:
+            return _api_error(str(exc), status_code=400)
+        page = {"runs": runs, "total": total, "limit": limit, "offset": offset}
+        return _api_success(page, legacy=page)
 
     @app.get("/api/runs/{run_id}")
     async def get_run(run_id: str, _: bool = Depends(verify_token)):
@@ -549,9 +592,38 @@ if FASTAPI_AVAILABLE:
         )
 
     @app.get("/api/runs/{run_id}/events")
-    async def get_run_events(run_id: str, _: bool = Depends(verify_token)):
-        """Run events are not implemented."""
-        raise HTTPException(status_code=501, detail="Run events not implemented")
+    async def get_run_events(
+        run_id: str,
+        request: Request,
+        since: Optional[int] = None,
+        follow: bool = True,
+        last_event_id: Optional[str] = Header(None),
+        _: bool = Depends(verify_token),
+    ):
+        """Stream run events as Server-Sent Events.
+
+        Events are replayed from ``since`` (or after ``Last-Event-ID``) out of
+        the run's events.jsonl, then pushed live from the event bus.
+        """
+        _resolve_run_dir(run_id)
+        if since is None:
+            since = int(last_event_id) + 1 if last_event_id and last_event_id.isdigit() else 0
+
+        async def event_stream():
+            async for record in iter_run_events(run_id, since=since, follow=follow):
+                if await request.is_disconnected():
+                    break
+                if record is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                data = json.dumps(record["data"], ensure_ascii=False)
+                yield f"id: {record['seq']}\nevent: {record['event']}\ndata: {data}\n\n"
+
+        return StreamingResponse(
+            event_stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
 
     @app.get("/api/qa/report")
     async def qa_report(_: bool = Depends(verify_token)):
@@ -592,6 +664,10 @@ if FASTAPI_AVAILABLE:
                     **request.config,
                 },
             )
+            try:
+                get_run_catalog().upsert(_resolve_run_dir(result.run_id))
+            except Exception:
+                pass  # picked up by the next reconcile
 
             return RunResponse(
                 run_id=result.run_id,
@@ -659,59 +735,49 @@ if FASTAPI_AVAILABLE:
         duplicates = 0
         file_info = []
 
-        # Save and extract ZIP
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
+        # Stream the ZIP to disk, then extract safely
+        try:
+            tmp_path, _, _ = await stream_to_tempfile(
+                file, UPLOADS_DIR, max_size=MAX_UPLOAD_SIZE * MAX_BATCH_FILES
+            )
+        except UploadTooLarge as e:
+            raise HTTPException(status_code=413, detail=str(e))
 
         try:
             # Safe extraction avoiding Zip Slip and DoS
             allowed_ext = {".pdf"}
             extracted_paths = safe_extract_zip(
-                Path(tmp_path),
+                tmp_path,
                 batch_dir,
                 max_files=MAX_BATCH_FILES,
                 max_total_size=MAX_UPLOAD_SIZE * MAX_BATCH_FILES,
                 allowed_ext=allowed_ext,
             )
 
-            # Load existing hashes
-            hash_file = UPLOADS_DIR / "hashes.json"
-            hashes = {}
-            if hash_file.exists():
-                try:
-                    with open(hash_file, "r") as f:
-                        hashes = json.load(f)
-                except Exception:
-                    pass
+            hash_index = get_upload_index(UPLOADS_DIR)
 
             for extracted_path in extracted_paths:
-                # Check for duplicates
+                # Check for duplicates (atomic insert-if-absent)
                 file_hash = get_file_hash(extracted_path)
+                size = extracted_path.stat().st_size
 
-                if file_hash in hashes:
+                if hash_index.claim(file_hash, extracted_path, size) is not None:
                     duplicates += 1
                     extracted_path.unlink()
                 else:
-                    hashes[file_hash] = str(extracted_path)
                     accepted += 1
                     file_info.append(
                         {
                             "name": extracted_path.name,
-                            "size": extracted_path.stat().st_size,
+                            "size": size,
                             "hash": file_hash[:16],
                         }
                     )
-
-            # Save hashes after batch processing
-            if accepted > 0:
-                atomic_write_json(hash_file, hashes)
         except Exception as e:
             # Log error if needed, for now just ensure cleanup
             raise HTTPException(status_code=400, detail=str(e))
         finally:
-            os.unlink(tmp_path)
+            tmp_path.unlink(missing_ok=True)
 
         return UploadResponse(
             batch_id=batch_id,
@@ -747,61 +813,54 @@ async def _handle_upload(files: List[UploadFile], file_type: str) -> UploadRespo
     duplicates = 0
     file_info = []
 
-    # Load existing hashes
-    hash_file = UPLOADS_DIR / "hashes.json"
-    hashes = {}
-    if hash_file.exists():
-        try:
-            with open(hash_file, "r") as f:
-                hashes = json.load(f)
-        except Exception:
-            pass
+    hash_index = get_upload_index(UPLOADS_DIR)
 
     for upload_file in files:
+        tmp_path = None
         try:
-            # Read content
-            content = await upload_file.read()
-
-            # Check size
-            if len(content) > MAX_UPLOAD_SIZE:
+            orig_name = upload_file.filename or f"file_{accepted}.{file_type}"
+            if file_type == "pdf" and not orig_name.lower().endswith(".pdf"):
                 rejected += 1
                 continue
 
-            # Calculate hash
-            file_hash = hashlib.sha256(content).hexdigest()
-
-            # Check duplicate
-            if file_hash in hashes:
-                duplicates += 1
-                continue
-
-            # Save file
-            orig_name = upload_file.filename or f"file_{accepted}.{file_type}"
-            if file_type == "pdf" and not orig_name.lower().endswith(".pdf"):
+            # Stream to a temp file, hashing and enforcing the size cap on the way
+            try:
+                tmp_path, file_hash, size = await stream_to_tempfile(
+                    upload_file, batch_dir, max_size=MAX_UPLOAD_SIZE
+                )
+            except UploadTooLarge:
                 rejected += 1
                 continue
+
             safe_name = sanitize_filename(orig_name)
             filepath = resolve_under(batch_dir, batch_dir / safe_name)
-            with open(filepath, "wb") as f:
-                f.write(content)
 
-            # Update hash registry
-            hashes[file_hash] = str(filepath)
+            # Check duplicate and register atomically
+            if hash_index.claim(file_hash, filepath, size) is not None:
+                duplicates += 1
+                continue
+
+            try:
+                os.replace(tmp_path, filepath)
+            except OSError:
+                hash_index.release(file_hash)
+                raise
+            tmp_path = None
 
             accepted += 1
             file_info.append(
                 {
                     "name": safe_name,
-                    "size": len(content),
+                    "size": size,
                     "hash": file_hash[:16],
                 }
             )
 
         except Exception:
             rejected += 1
-
-    # Save updated hashes
-    atomic_write_json(hash_file, hashes)
+        finally:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
 
     return UploadResponse(
         batch_id=batch_id,
@@ -845,10 +904,8 @@ if FASTAPI_AVAILABLE:
 
             engine = get_search_engine()
 
-            # Load chunks if not loaded
-            chunks_file = Path("data/chunks.jsonl")
-            if chunks_file.exists() and not engine._loaded:
-                engine.load_chunks(chunks_file)
+            # Pick up chunks appended since the last request (cheap when unchanged)
+            engine.sync(Path("data/chunks.jsonl"))
 
             filters = {"paper_id": paper_id} if paper_id else None
             results = engine.search(q, top_k=top_k, filters=filters)
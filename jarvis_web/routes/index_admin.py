@@ -13,6 +13,7 @@ from fastapi import APIRouter, Body, Depends, Header, HTTPException
 from fastapi.responses import JSONResponse
 
 from jarvis_core.retrieval.indexer import RetrievalIndexer
+from jarvis_core.retrieval.search_service import get_search_service
 
 
 router = APIRouter()
@@ -51,6 +52,7 @@ def _rebuild_job() -> None:
     try:
         indexer = RetrievalIndexer()
         indexer.rebuild()
+        get_search_service().refresh(block=False)
         _write_job("completed")
     except Exception as exc:
         _write_job("failed", detail=str(exc))
@@ -82,6 +84,7 @@ async def index_update(
     try:
         indexer = RetrievalIndexer()
         manifest = indexer.update()
+        get_search_service().refresh(block=False)
     except Exception as exc:
         return JSONResponse({"status": "error", "detail": str(exc)}, status_code=200)
     return JSONResponse({"status": "ok", "manifest": manifest.to_dict()}, status_code=200)
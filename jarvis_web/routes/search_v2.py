@@ -8,19 +8,19 @@ from fastapi import APIRouter, Body
 from fastapi.responses import JSONResponse, PlainTextResponse
 
 from jarvis_core.retrieval.export import export_csv, export_json, export_markdown
-from jarvis_core.retrieval.hybrid_search import HybridSearchEngine
+from jarvis_core.retrieval.search_service import get_search_service
 
 
 router = APIRouter()
 
 
 @router.post("/api/search/v2")
-async def search_v2(payload: Dict[str, Any] = Body(...)):
+def search_v2(payload: Dict[str, Any] = Body(...)):
     query = payload.get("query", "")
     mode = payload.get("mode", "hybrid")
     top_k = int(payload.get("top_k", 20))
     filters = payload.get("filters", {}) or {}
-    engine = HybridSearchEngine()
+    engine = get_search_service().engine
     if not engine.chunk_map:
         return JSONResponse(
             {"took_ms": 0, "total_candidates": 0, "results": [], "error": "index_missing"},
@@ -36,13 +36,13 @@ async def search_v2(payload: Dict[str, Any] = Body(...)):
 
 
 @router.post("/api/search/v2/export")
-async def export_search_v2(payload: Dict[str, Any] = Body(...)):
+def export_search_v2(payload: Dict[str, Any] = Body(...)):
     query = payload.get("query", "")
     mode = payload.get("mode", "hybrid")
     top_k = int(payload.get("top_k", 20))
     filters = payload.get("filters", {}) or {}
     export_format = payload.get("format", "json")
-    engine = HybridSearchEngine()
+    engine = get_search_service().engine
     if not engine.chunk_map:
         return JSONResponse(
             {"took_ms": 0, "total_candidates": 0, "results": [], "error": "index_missing"},
@@ -0,0 +1,336 @@
+"""Materialised run catalog backing the ``/api/runs`` listing.
+
+Building a run summary means opening several JSON files per run, which made
+the listing O(number of runs) on every request.  ``RunCatalog`` stores the
+summary of each run in SQLite together with a cheap file-stat signature, so
+the listing is a single indexed query of ``limit`` rows.
+
+The catalog is kept current in three ways:
+
+* ``upsert()`` when the web app finishes a run,
+* ``maybe_reconcile()`` on listing requests, which rescans inline only when a
+  run root directory changed; a scan older than ``max_age`` is refreshed on a
+  background thread so the request is not held up,
+* ``reconcile()`` (``python -m jarvis_web.run_catalog``) to backfill or
+  repair the catalog from the filesystem.
+
+Only runs whose signature changed are re-parsed during a reconcile.  The
+catalog database must live outside the run roots: SQLite touching its own
+files would otherwise bump the root mtime and force a rescan on every request.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+SORT_COLUMNS = {"updated_at", "created_at", "status", "run_id", "goal"}
+SIGNATURE_FILES = ("result.json", "progress.json", "eval_summary.json", "input.json")
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def run_signature(run_dir: Path) -> str:
+    """Cheap change marker: directory mtime plus mtimes of the summary files."""
+    parts = [_mtime_ns(run_dir)] + [_mtime_ns(run_dir / name) for name in SIGNATURE_FILES]
+    return ":".join(str(p) for p in parts)
+
+
+def _read_goal(run_dir: Path) -> str:
+    try:
+        with open(run_dir / "input.json", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return ""
+    if not isinstance(payload, dict):
+        return ""
+    return str(payload.get("goal") or payload.get("query") or "")
+
+
+class RunCatalog:
+    """SQLite catalog of run summaries.
+
+    Args:
+        db_path: Catalog database file.
+        roots: Run root directories in precedence order; a run id found in a
+            later root overrides the same id in an earlier one.
+        build_summary: Callable producing the listing payload for a run
+            directory.  It must include ``status``, ``created_at`` and
+            ``updated_at``.
+        max_age: Seconds after which ``maybe_reconcile`` schedules a
+            background rescan even if no root directory changed.
+
+    Raises:
+        ValueError: If ``db_path`` lies inside one of the run roots.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        roots: Iterable[Path],
+        build_summary: Callable[[Path], dict[str, Any]],
+        max_age: float = 30.0,
+    ):
+        self.db_path = Path(db_path)
+        self.roots = [Path(r) for r in roots]
+        self.build_summary = build_summary
+        self.max_age = max_age
+        for root in self.roots:
+            if self.db_path.resolve().is_relative_to(root.resolve()):
+                raise ValueError(f"Catalog database {self.db_path} must not live inside {root}")
+        self._lock = threading.Lock()
+        self._root_signature: Optional[tuple[int, ...]] = None
+        self._last_reconcile = 0.0
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_id TEXT PRIMARY KEY,
+                    run_dir TEXT NOT NULL,
+                    status TEXT,
+                    goal TEXT,
+                    created_at TEXT,
+                    updated_at TEXT,
+                    signature TEXT,
+                    payload TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_updated ON runs(updated_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_created ON runs(created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status, updated_at)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, run_dir: Path, signature: Optional[str] = None) -> dict[str, Any]:
+        """(Re)build and store the summary for ``run_dir``."""
+        run_dir = Path(run_dir)
+        summary = self.build_summary(run_dir)
+        row = (
+            run_dir.name,
+            str(run_dir),
+            summary.get("status", ""),
+            _read_goal(run_dir),
+            summary.get("created_at", ""),
+            summary.get("updated_at", ""),
+            signature or run_signature(run_dir),
+            json.dumps(summary, ensure_ascii=False, default=str),
+        )
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs "
+                "(run_id, run_dir, status, goal, created_at, updated_at, signature, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return summary
+
+    def remove(self, run_ids: Iterable[str]) -> int:
+        ids = [(run_id,) for run_id in run_ids]
+        if not ids:
+            return 0
+        conn = self._connect()
+        try:
+            conn.executemany("DELETE FROM runs WHERE run_id = ?", ids)
+            conn.commit()
+        finally:
+            conn.close()
+        return len(ids)
+
+    def clear(self) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM runs")
+            conn.commit()
+        finally:
+            conn.close()
+        self._root_signature = None
+
+    # ------------------------------------------------------------------
+    # Reconcile
+    # ------------------------------------------------------------------
+
+    def _scan(self) -> dict[str, Path]:
+        run_dirs: dict[str, Path] = {}
+        for root in self.roots:
+            if not root.exists():
+                continue
+            for run_dir in root.iterdir():
+                if run_dir.is_dir() and not run_dir.name.startswith("."):
+                    run_dirs[run_dir.name] = run_dir
+        return run_dirs
+
+    def _roots_signature(self) -> tuple[int, ...]:
+        return tuple(_mtime_ns(root) for root in self.roots)
+
+    def reconcile(self) -> dict[str, int]:
+        """Sync the catalog with the filesystem, re-parsing only changed runs."""
+        with self._lock:
+            root_signature = self._roots_signature()
+            on_disk = self._scan()
+            conn = self._connect()
+            try:
+                known = {
+                    row[0]: (row[1], row[2])
+                    for row in conn.execute("SELECT run_id, run_dir, signature FROM runs")
+                }
+            finally:
+                conn.close()
+
+            added = updated = 0
+            for run_id, run_dir in on_disk.items():
+                signature = run_signature(run_dir)
+                previous = known.get(run_id)
+                if previous == (str(run_dir), signature):
+                    continue
+                try:
+                    self.upsert(run_dir, signature)
+                except Exception as exc:
+                    logger.warning("Failed to catalog run %s: %s", run_id, exc)
+                    continue
+                if previous is None:
+                    added += 1
+                else:
+                    updated += 1
+
+            removed = self.remove(set(known) - set(on_disk))
+            self._root_signature = root_signature
+            self._last_reconcile = time.monotonic()
+        return {"added": added, "updated": updated, "removed": removed, "total": len(on_disk)}
+
+    def maybe_reconcile(self) -> bool:
+        """Reconcile if a run root changed; refresh a stale scan in the background.
+
+        Returns:
+            True if a reconcile ran inline before returning.
+        """
+        if self._roots_signature() != self._root_signature:
+            self.reconcile()
+            return True
+        if time.monotonic() - self._last_reconcile > self.max_age:
+            self._refresh_in_background()
+        return False
+
+    def _refresh_in_background(self) -> None:
+        thread = self._refresh_thread
+        if thread is not None and thread.is_alive():
+            return
+        thread = threading.Thread(
+            target=self._background_reconcile, name="run-catalog-refresh", daemon=True
+        )
+        self._refresh_thread = thread
+        thread.start()
+
+    def _background_reconcile(self) -> None:
+        try:
+            self.reconcile()
+        except Exception as exc:
+            logger.warning("Background run catalog refresh failed: %s", exc)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        sort: str = "updated_at",
+        order: str = "desc",
+        status: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        goal: Optional[str] = None,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Return one page of run summaries and the total matching count.
+
+        ``since``/``until`` are ISO-8601 bounds on ``created_at``; ``goal`` is
+        a case-insensitive substring match.
+        """
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"Unsupported sort column: {sort}")
+        direction = "ASC" if order.lower() == "asc" else "DESC"
+
+        clauses: list[str] = []
+        params: list[Any] = []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if since:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until:
+            clauses.append("created_at <= ?")
+            params.append(until)
+        if goal:
+            clauses.append("goal LIKE ? ESCAPE '\\'")
+            escaped = goal.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"%{escaped}%")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        conn = self._connect()
+        try:
+            total = conn.execute(f"SELECT COUNT(*) FROM runs {where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT payload FROM runs {where} "
+                f"ORDER BY {sort} {direction}, run_id {direction} LIMIT ? OFFSET ?",
+                [*params, max(0, int(limit)), max(0, int(offset))],
+            ).fetchall()
+        finally:
+            conn.close()
+        return [json.loads(row[0]) for row in rows], total
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI: backfill / repair the run catalog from the filesystem."""
+    import argparse
+
+    from jarvis_web import app as web_app
+
+    parser = argparse.ArgumentParser(description="Reconcile the /api/runs catalog")
+    parser.add_argument("--rebuild", action="store_true", help="Drop and rebuild the catalog")
+    args = parser.parse_args(argv)
+
+    catalog = web_app.get_run_catalog()
+    if args.rebuild:
+        catalog.clear()
+    stats = catalog.reconcile()
+    print(json.dumps(stats))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
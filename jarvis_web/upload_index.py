@@ -0,0 +1,175 @@
+"""Content-hash index and streaming helpers for uploads.
+
+Uploads are deduplicated by SHA-256.  The index lives in a small SQLite
+database (WAL mode) so that registering a hash is a single atomic
+``INSERT OR IGNORE`` instead of rewriting a JSON map for every file.  The
+legacy ``hashes.json`` written by earlier versions is imported once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLarge(Exception):
+    """Raised when a streamed upload exceeds the size cap."""
+
+
+class UploadHashIndex:
+    """SQLite-backed ``sha256 -> stored path`` map with insert-if-absent."""
+
+    def __init__(self, db_path: Path, legacy_json: Optional[Path] = None):
+        self.db_path = Path(db_path)
+        self.legacy_json = legacy_json
+        self._local = threading.local()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self) -> None:
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS upload_hashes ("
+            " sha256 TEXT PRIMARY KEY,"
+            " path TEXT NOT NULL,"
+            " size INTEGER,"
+            " created_at TEXT DEFAULT CURRENT_TIMESTAMP)"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._import_legacy(conn)
+
+    def _import_legacy(self, conn: sqlite3.Connection) -> None:
+        if self.legacy_json is None or not self.legacy_json.exists():
+            return
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone():
+            return
+        try:
+            with open(self.legacy_json, encoding="utf-8") as f:
+                legacy = json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Skipping unreadable legacy hash file %s: %s", self.legacy_json, exc)
+            legacy = {}
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR IGNORE INTO upload_hashes (sha256, path) VALUES (?, ?)",
+                [(str(k), str(v)) for k, v in legacy.items()],
+            )
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('legacy_imported', '1')")
+
+    def claim(self, sha256: str, path: Path | str, size: Optional[int] = None) -> Optional[str]:
+        """Register ``sha256`` for ``path`` unless it is already known.
+
+        Returns:
+            None if this call registered the hash, otherwise the stored path
+            of the existing upload.
+        """
+        conn = self._connect()
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO upload_hashes (sha256, path, size) VALUES (?, ?, ?)",
+            (sha256, str(path), size),
+        )
+        if cursor.rowcount == 1:
+            return None
+        row = conn.execute("SELECT path FROM upload_hashes WHERE sha256 = ?", (sha256,)).fetchone()
+        return row[0] if row else ""
+
+    def release(self, sha256: str) -> None:
+        """Forget a hash (e.g. when storing the claimed file failed)."""
+        self._connect().execute("DELETE FROM upload_hashes WHERE sha256 = ?", (sha256,))
+
+    def get(self, sha256: str) -> Optional[str]:
+        row = (
+            self._connect()
+            .execute("SELECT path FROM upload_hashes WHERE sha256 = ?", (sha256,))
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def __contains__(self, sha256: str) -> bool:
+        return self.get(sha256) is not None
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM upload_hashes").fetchone()[0]
+
+
+_INDEXES: dict[Path, UploadHashIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_upload_index(uploads_dir: Path) -> UploadHashIndex:
+    """Return the shared index for ``uploads_dir`` (``hashes.db`` inside it)."""
+    key = Path(uploads_dir).resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = UploadHashIndex(key / "hashes.db", legacy_json=key / "hashes.json")
+            _INDEXES[key] = index
+    return index
+
+
+async def stream_to_tempfile(
+    upload_file: Any,
+    directory: Path,
+    max_size: int,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Tuple[Path, str, int]:
+    """Stream an ``UploadFile`` into ``directory`` while hashing it.
+
+    The size cap is enforced as bytes arrive, so oversized uploads are
+    rejected without ever being buffered in memory.
+
+    Returns:
+        ``(temp_path, sha256_hex, size)``.
+
+    Raises:
+        UploadTooLarge: If more than ``max_size`` bytes were received.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    sha256 = hashlib.sha256()
+    size = 0
+    fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".upload-", suffix=".part")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = await upload_file.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLarge(f"upload exceeds {max_size} bytes")
+                sha256.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path, sha256.hexdigest(), size
+
+
+__all__ = [
+    "UploadHashIndex",
+    "UploadTooLarge",
+    "get_upload_index",
+    "stream_to_tempfile",
+]
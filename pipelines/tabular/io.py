@@ -1,21 +1,32 @@
 """
 Tabular I/O Module
 
-CSV読み込み、スキーマ検証、列整合チェック
+CSV読み込み、スキーマ検証、列整合チェック、型推論・列指向キャッシュ
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# 型推論のデフォルトチャンク行数
+DEFAULT_CHUNKSIZE = 100_000
+
+# ユニーク率がこれ以下の文字列列は category にする
+CATEGORY_MAX_RATIO = 0.5
+CATEGORY_MAX_UNIQUE = 10_000
+
+CACHE_VERSION = 1
+
 
 @dataclass
 class DataSchema:
@@ -37,10 +48,189 @@ class DataSchema:
         }
 
 
+@dataclass
+class _ColumnStats:
+    """チャンク横断の列統計（型推論用）."""
+
+    kind: str = "empty"  # empty, int, float, bool, object
+    min: float = np.inf
+    max: float = -np.inf
+    has_null: bool = False
+    rows: int = 0
+    uniques: Optional[set] = None
+
+    def update(self, col: pd.Series) -> None:
+        self.rows += len(col)
+        if col.isna().any():
+            self.has_null = True
+        values = col.dropna()
+        if values.empty:
+            return
+
+        if pd.api.types.is_bool_dtype(values):
+            kind = "bool"
+        elif pd.api.types.is_integer_dtype(values):
+            kind = "int"
+        elif pd.api.types.is_float_dtype(values):
+            # 欠損のみで float になった整数列は int 扱い
+            kind = "int" if np.all(np.mod(values.to_numpy(), 1) == 0) else "float"
+        else:
+            kind = "object"
+        self.kind = _merge_kind(self.kind, kind)
+
+        if self.kind in ("int", "float"):
+            self.min = min(self.min, float(values.min()))
+            self.max = max(self.max, float(values.max()))
+        elif self.kind == "object":
+            if self.uniques is None:
+                self.uniques = set()
+            if len(self.uniques) <= CATEGORY_MAX_UNIQUE:
+                self.uniques.update(values.astype(str).unique().tolist())
+
+    def dtype(self) -> str:
+        if self.kind == "float":
+            return "float32"
+        if self.kind == "int":
+            return _int_dtype(self.min, self.max, nullable=self.has_null)
+        if self.kind == "bool":
+            return "boolean" if self.has_null else "bool"
+        if self.kind == "object":
+            n_unique = len(self.uniques or ())
+            if n_unique <= CATEGORY_MAX_UNIQUE and n_unique <= CATEGORY_MAX_RATIO * self.rows:
+                return "category"
+            return "object"
+        return "float32"
+
+
+def _merge_kind(current: str, new: str) -> str:
+    if current in ("empty", new):
+        return new
+    if {current, new} == {"int", "float"}:
+        return "float"
+    return "object"
+
+
+def _int_dtype(lo: float, hi: float, nullable: bool) -> str:
+    for name in ("int8", "int16", "int32"):
+        info = np.iinfo(name)
+        if info.min <= lo and hi <= info.max:
+            return name.capitalize() if nullable else name
+    return "Int64" if nullable else "int64"
+
+
+def infer_dtypes(
+    path: str,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    exclude: Iterable[str] = (),
+) -> Dict[str, str]:
+    """
+    CSVをチャンク単位でストリーミング走査し、縮小型を推論.
+
+    float は float32、整数は値域に応じた最小幅（欠損ありなら nullable Int）、
+    低カーディナリティの文字列は category にする。
+
+    Args:
+        path: CSVパス
+        chunksize: 1チャンクの行数
+        exclude: 推論対象外の列（pandas 既定型のまま読む）
+
+    Returns:
+        列名 → dtype 文字列
+    """
+    excluded = set(exclude)
+    stats: Dict[str, _ColumnStats] = {}
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        for col in chunk.columns:
+            if col in excluded:
+                continue
+            stats.setdefault(col, _ColumnStats()).update(chunk[col])
+    return {col: st.dtype() for col, st in stats.items()}
+
+
+def file_hash(path: str, block_size: int = 1 << 20) -> str:
+    """ファイル内容の SHA-256（ブロック単位で読み込み）."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _cache_formats() -> List[str]:
+    try:
+        import pyarrow  # noqa: F401
+
+        return ["parquet", "pkl"]
+    except ImportError:
+        return ["pkl"]
+
+
+def read_csv_cached(
+    path: str,
+    cache_dir: Optional[str] = None,
+    downcast: bool = True,
+    chunksize: Optional[int] = None,
+    exclude: Iterable[str] = (),
+) -> pd.DataFrame:
+    """
+    CSVを型縮小して読み込み、列指向キャッシュを利用.
+
+    キャッシュはファイル内容のハッシュと読み込み設定をキーに
+    ``cache_dir`` へ Parquet（pyarrow が無ければ pickle）で保存し、
+    同一ファイルの再読込ではCSVパースを省略する。
+
+    Args:
+        path: CSVパス
+        cache_dir: キャッシュディレクトリ（None ならキャッシュしない）
+        downcast: 型推論による縮小を行うか
+        chunksize: 指定時はチャンク単位で読み込み
+        exclude: 型縮小しない列
+
+    Returns:
+        DataFrame
+    """
+    exclude = sorted(set(exclude))
+    cache_path: Optional[Path] = None
+    if cache_dir is not None:
+        key_src = json.dumps(
+            [CACHE_VERSION, file_hash(path), downcast, exclude], ensure_ascii=False
+        )
+        key = hashlib.sha256(key_src.encode("utf-8")).hexdigest()[:24]
+        for fmt in _cache_formats():
+            candidate = Path(cache_dir) / f"{Path(path).stem}_{key}.{fmt}"
+            if candidate.exists():
+                logger.info(f"Loaded cached columns: {candidate}")
+                if fmt == "parquet":
+                    return pd.read_parquet(candidate)
+                return pd.read_pickle(candidate)
+        cache_path = Path(cache_dir) / f"{Path(path).stem}_{key}.{_cache_formats()[0]}"
+
+    dtypes = infer_dtypes(path, chunksize or DEFAULT_CHUNKSIZE, exclude) if downcast else None
+    if chunksize:
+        df = pd.concat(pd.read_csv(path, dtype=dtypes, chunksize=chunksize), ignore_index=True)
+    else:
+        df = pd.read_csv(path, dtype=dtypes)
+
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        if cache_path.suffix == ".parquet":
+            df.to_parquet(tmp_path, index=False)
+        else:
+            df.to_pickle(tmp_path)
+        tmp_path.replace(cache_path)
+        logger.info(f"Cached columns: {cache_path}")
+
+    return df
+
+
 def load_train_test(
     train_path: str,
     test_path: str,
     label_col: str,
+    cache_dir: Optional[str] = None,
+    downcast: bool = True,
+    chunksize: Optional[int] = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series, DataSchema]:
     """
     train/testを読み込み、スキーマ検証.
@@ -49,6 +239,9 @@ def load_train_test(
         train_path: 訓練データパス
         test_path: テストデータパス
         label_col: ラベル列名
+        cache_dir: 列指向キャッシュの保存先（None ならキャッシュしない）
+        downcast: 特徴量列を float32 / category / 縮小整数で読み込むか
+        chunksize: 指定時はチャンク単位で読み込み
 
     Returns:
         (X_train, X_test, y_train, schema)
@@ -56,9 +249,12 @@ def load_train_test(
     Raises:
         ValueError: 列不整合、ラベル欠損等
     """
-    # 読み込み
-    train_df = pd.read_csv(train_path)
-    test_df = pd.read_csv(test_path)
+    # 読み込み（ラベル列は型縮小しない）
+    read_kwargs = dict(
+        cache_dir=cache_dir, downcast=downcast, chunksize=chunksize, exclude=[label_col]
+    )
+    train_df = read_csv_cached(train_path, **read_kwargs)
+    test_df = read_csv_cached(test_path, **read_kwargs)
 
     logger.info(f"Loaded train: {train_df.shape}, test: {test_df.shape}")
 
@@ -107,6 +303,10 @@ def load_train_test(
     # 列順を固定（train基準）
     X_test = X_test[train_cols]
 
+    # train/test で独立に推論した型を揃える
+    if downcast:
+        X_train, X_test = _align_dtypes(X_train, X_test)
+
     # スキーマ生成
     schema = DataSchema(
         train_shape=train_df.shape,
@@ -121,6 +321,36 @@ def load_train_test(
     return X_train, X_test, y_train, schema
 
 
+def _align_dtypes(
+    X_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """train/test の列型が異なる場合に共通型へ揃える."""
+    casts: Dict[str, Any] = {}
+    for col in X_train.columns:
+        a, b = X_train[col].dtype, X_test[col].dtype
+        if a == b:
+            continue
+        if isinstance(a, pd.CategoricalDtype) and isinstance(b, pd.CategoricalDtype):
+            categories = a.categories.union(b.categories)
+            casts[col] = pd.CategoricalDtype(categories)
+        elif pd.api.types.is_numeric_dtype(a) and pd.api.types.is_numeric_dtype(b):
+            nullable = isinstance(a, pd.api.extensions.ExtensionDtype) or isinstance(
+                b, pd.api.extensions.ExtensionDtype
+            )
+            common = np.result_type(getattr(a, "numpy_dtype", a), getattr(b, "numpy_dtype", b))
+            if nullable and np.issubdtype(common, np.integer):
+                casts[col] = pd.api.types.pandas_dtype(common.name.capitalize())
+            else:
+                casts[col] = common
+        else:
+            casts[col] = object
+    if casts:
+        X_train = X_train.astype(casts)
+        X_test = X_test.astype(casts)
+    return X_train, X_test
+
+
 def validate_schema(
     X_train: pd.DataFrame,
     X_test: pd.DataFrame,
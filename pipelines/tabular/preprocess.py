@@ -43,7 +43,7 @@ def fit_transform(
     Returns:
         (変換後データ, scaler)
     """
-    X = X_train.values.astype(np.float32)
+    X = _to_float32(X_train)
 
     if scaler is not None:
         X = scaler.fit_transform(X)
@@ -66,7 +66,7 @@ def transform(
     Returns:
         変換後データ
     """
-    X_arr = X.values.astype(np.float32)
+    X_arr = _to_float32(X)
 
     if scaler is not None:
         X_arr = scaler.transform(X_arr)
@@ -74,6 +74,11 @@ def transform(
     return X_arr
 
 
+def _to_float32(X: pd.DataFrame) -> np.ndarray:
+    """DataFrameをfloat32配列へ（nullable 型の欠損は NaN）."""
+    return X.to_numpy(dtype=np.float32, na_value=np.nan)
+
+
 def save_scaler(scaler: StandardScaler, output_path: str) -> Path:
     """Scalerを保存."""
     path = Path(output_path)
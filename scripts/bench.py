@@ -1,37 +1,44 @@
 """Benchmark Runner.
 
 Per RP-232, runs deterministic benchmarks for performance comparison.
+
+The cases themselves live in ``jarvis_core.perf.bench_suite``: BM25, vector
+search, dedup, chunking, evidence grading, the pipeline executor and the web
+search endpoint, on synthetic corpora of 1k/10k/100k documents.  Results are
+written as ``bench_results.json`` and, given ``--baseline``, compared against a
+previous run.
 """
 
 from __future__ import annotations
 
-import json
-import time
 import argparse
+import json
+import logging
+import sys
 from pathlib import Path
-from typing import Dict, Any
-from datetime import datetime, timezone
-
-
-def run_benchmark(
-    cases_path: str,
-    iterations: int = 3,
-    output_dir: str = "reports/bench/latest",
-) -> Dict[str, Any]:
-    """Run benchmark on cases.
-
-    Args:
-        cases_path: Path to benchmark cases (JSONL).
-        iterations: Number of iterations per case.
-        output_dir: Output directory.
-
-    Returns:
-        Benchmark results.
-    """
-    # Load cases from JSONL or JSON array for compatibility.
+from typing import Any, Dict, List, Optional
+
+# Ensure project root is in sys.path
+root_dir = Path(__file__).resolve().parent.parent
+if str(root_dir) not in sys.path:
+    sys.path.insert(0, str(root_dir))
+
+from jarvis_core.perf.bench_suite import (  # noqa: E402
+    BENCH_CASES,
+    DEFAULT_REGRESSION_THRESHOLD,
+    DEFAULT_SEED,
+    SCALES,
+    run_suite,
+)
+
+
+def load_cases(cases_path: Optional[str]) -> List[Dict[str, Any]]:
+    """Load cases from JSONL or a JSON array (missing file -> no cases)."""
+    if not cases_path:
+        return []
     path = Path(cases_path)
-    cases = []
-    if path.exists():
+    cases: List[Dict[str, Any]] = []
+    if path.is_file():
         raw = path.read_text(encoding="utf-8").strip()
         if raw:
             try:
@@ -44,74 +51,129 @@ def run_benchmark(
                 for line in raw.splitlines():
                     if line.strip():
                         cases.append(json.loads(line))
+    return cases
 
-    results = []
-
-    for case in cases:
-        case_times = []
-
-        for i in range(iterations):
-            start = time.time()
-
-            # Placeholder - would run actual processing
-            time.sleep(0.01)  # Simulate work
-
-            elapsed = time.time() - start
-            case_times.append(elapsed)
-
-        results.append(
-            {
-                "case_id": case.get("id") or case.get("paper_id", "unknown"),
-                "iterations": iterations,
-                "times": case_times,
-                "avg": sum(case_times) / len(case_times),
-                "p50": sorted(case_times)[len(case_times) // 2],
-                "p95": (
-                    sorted(case_times)[int(len(case_times) * 0.95)]
-                    if len(case_times) > 1
-                    else case_times[0]
-                ),
-            }
-        )
 
-    # Aggregate
-    all_avgs = [r["avg"] for r in results]
-    summary = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "cases": len(cases),
-        "iterations": iterations,
-        "overall_avg": sum(all_avgs) / len(all_avgs) if all_avgs else 0,
-        "results": results,
-    }
+def run_benchmark(
+    cases_path: Optional[str] = None,
+    iterations: int = 3,
+    output_dir: str = "reports/bench/latest",
+    scales: Optional[List[str]] = None,
+    only: Optional[List[str]] = None,
+    seed: int = DEFAULT_SEED,
+    baseline_path: Optional[str] = None,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    isolate: bool = True,
+) -> Dict[str, Any]:
+    """Run the benchmark suite.
+
+    Args:
+        cases_path: Optional cases file; its titles are mixed into the
+            synthetic corpus so grading sees realistic study titles.
+        iterations: Passes over each case's workload.
+        output_dir: Output directory, or a ``.json`` file path.
+        scales: Scale names (default: all of ``SCALES``).
+        only: Case names to run (default: all).
+        seed: Corpus seed.
+        baseline_path: Previous ``bench_results.json`` to compare against.
+        threshold: Relative change that counts as a regression.
+        isolate: Run each case in its own process.
+
+    Returns:
+        Benchmark results.
+    """
+    titles = [str(c["title"]) for c in load_cases(cases_path) if c.get("title")]
+    baseline = None
+    if baseline_path and Path(baseline_path).is_file():
+        baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+
+    summary = run_suite(
+        scales=scales,
+        cases=only,
+        seed=seed,
+        iterations=iterations,
+        isolate=isolate,
+        title_templates=titles or None,
+        baseline=baseline,
+        threshold=threshold,
+    )
+    summary["config"]["cases_file"] = cases_path
 
     # Save
     out_path = Path(output_dir)
-    out_path.mkdir(parents=True, exist_ok=True)
+    if out_path.suffix == ".json":
+        out_file = out_path
+    else:
+        out_file = out_path / "bench_results.json"
+    out_file.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(out_path / "bench_results.json", "w", encoding="utf-8") as f:
+    with open(out_file, "w", encoding="utf-8") as f:
         json.dump(summary, f, indent=2)
 
     return summary
 
 
-def main():
+def _csv(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def main() -> int:
     """CLI entry point."""
     parser = argparse.ArgumentParser(description="Run benchmark")
     parser.add_argument(
         "--cases",
         type=str,
-        default="docs/evals/bench_cases.jsonl",
+        default=None,
+        help="Optional cases file (JSON/JSONL) whose titles seed the corpus",
     )
     parser.add_argument("--iterations", type=int, default=3)
     parser.add_argument("--output", type=str, default="reports/bench/latest")
+    parser.add_argument(
+        "--scales", type=_csv, default=list(SCALES), help=f"Comma list of {list(SCALES)}"
+    )
+    parser.add_argument(
+        "--only", type=_csv, default=None, help=f"Comma list of {list(BENCH_CASES)}"
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--baseline", type=str, default=None)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--no-isolate", action="store_true", help="Run all cases in this process")
 
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    result = run_benchmark(
+        args.cases,
+        args.iterations,
+        args.output,
+        scales=args.scales,
+        only=args.only,
+        seed=args.seed,
+        baseline_path=args.baseline,
+        threshold=args.threshold,
+        isolate=not args.no_isolate,
+    )
 
-    result = run_benchmark(args.cases, args.iterations, args.output)
+    print(f"{'case':<18} {'scale':>5} {'items/s':>12} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10}")
+    for row in result["results"]:
+        if row["status"] != "ok":
+            print(f"{row['case']:<18} {row['scale']:>5} {row['status']}: {row.get('reason', '')}")
+            continue
+        latency = row["latency_ms"]
+        print(
+            f"{row['case']:<18} {row['scale']:>5} {row['throughput_per_sec']:>12.1f} "
+            f"{latency['p50']:>10.3f} {latency['p95']:>10.3f} {latency['p99']:>10.3f}"
+        )
 
-    print(f"Benchmark completed: {result['cases']} cases")
-    print(f"Overall avg: {result['overall_avg']:.3f}s")
+    comparison = result.get("comparison")
+    if comparison:
+        regressions = comparison["regressions"]
+        print(f"Regressions vs baseline: {', '.join(regressions) if regressions else 'none'}")
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -4,9 +4,15 @@
 既存テストは変更しない。
 """
 
+import re
+
 import pytest
 
-from jarvis_core.evidence.rule_classifier import RuleBasedClassifier
+from jarvis_core.evidence.rule_classifier import (
+    ClassificationPattern,
+    RuleBasedClassifier,
+    _literal_prefix,
+)
 from jarvis_core.evidence.schema import EvidenceLevel, StudyType
 
 
@@ -90,3 +96,65 @@ class TestEdgeCases:
             abstract="A retrospective cohort of 1,000 participants was analyzed.",
         )
         assert 0.0 <= grade.confidence <= 1.0
+
+
+class TestBatchClassification:
+    PAPERS = [
+        {"title": "A meta-analysis of statin trials", "abstract": "We pooled 25 RCTs."},
+        {"title": "Case report", "abstract": "We describe a rare presentation."},
+        {"title": "Crossover study", "abstract": "Patients were randomly assigned (n = 40)."},
+        {"title": "", "abstract": ""},
+    ]
+
+    def test_trigger_prefilter_matches_per_pattern_search(
+        self, classifier: RuleBasedClassifier
+    ) -> None:
+        text = "systematic review article; cross-over design; follow-up study of matched controls"
+        expected = {
+            ci
+            for ci, config in enumerate(classifier._patterns)
+            if any(p.search(text) for p in config.patterns)
+        }
+        assert classifier._match_configs(text) == expected
+
+    def test_top_level_alternation_has_no_trigger(self) -> None:
+        assert _literal_prefix(r"\bcohort\s+study") == "cohort"
+        assert _literal_prefix(r"\bcase report|\bcase series") == ""
+        assert _literal_prefix(r"\bfollow(-| )up") == "follow"
+        assert _literal_prefix(r"\bsmall\|large") == "small"
+        assert _literal_prefix(r"\btrial[|]x") == "trial"
+
+        custom = RuleBasedClassifier()
+        custom._patterns = [
+            ClassificationPattern(StudyType.CASE_REPORT, [re.compile(r"\bfoo|bar\b")], 0.5)
+        ]
+        custom._matcher = custom._compile_matcher(custom._patterns)
+        assert custom._match_configs("only bar here") == {0}
+
+    def test_case_sensitive_pattern_is_preserved(self, classifier: RuleBasedClassifier) -> None:
+        assert classifier.classify(title="An RCT of drug X").study_type == StudyType.RCT
+        assert classifier.classify(title="rct lowercase").study_type == StudyType.UNKNOWN
+
+    def test_classify_batch_matches_classify(self, classifier: RuleBasedClassifier) -> None:
+        grades = classifier.classify_batch(self.PAPERS)
+        for paper, grade in zip(self.PAPERS, grades):
+            single = classifier.classify(paper["title"], paper["abstract"])
+            assert grade.study_type == single.study_type
+            assert grade.confidence == single.confidence
+
+    def test_classify_batch_parallel(self, classifier: RuleBasedClassifier) -> None:
+        papers = self.PAPERS * 3
+        grades = classifier.classify_batch(papers, jobs=2, chunksize=2)
+        assert [g.study_type for g in grades] == [
+            classifier.classify(p["title"], p["abstract"]).study_type for p in papers
+        ]
+
+    def test_grade_evidence_batch_reuses_classifier(self) -> None:
+        from jarvis_core.evidence.ensemble import _get_classifier, grade_evidence_batch
+        from jarvis_core.evidence.ensemble import EnsembleStrategy
+
+        grades = grade_evidence_batch(self.PAPERS, use_llm=False)
+        assert grades[0].study_type == StudyType.META_ANALYSIS
+        assert grades[-1].level == EvidenceLevel.UNKNOWN
+        strategy = EnsembleStrategy.WEIGHTED_AVERAGE
+        assert _get_classifier(strategy, False) is _get_classifier(strategy, False)
@@ -1,7 +1,7 @@
-from dataclasses import dataclass
+import json
 
+import httpx
 import pytest
-import requests
 
 from async_test_utils import run_async
 from jarvis_core.mcp.chain import ToolChain
@@ -9,22 +9,18 @@ from jarvis_core.mcp.hub import MCPHub
 from jarvis_core.mcp.schema import MCPServer, MCPServerStatus, MCPTool
 
 
-@dataclass
-class _FakeResponse:
-    status_code: int = 200
-    payload: dict | list | None = None
-
-    def raise_for_status(self):
-        if self.status_code >= 400:
-            raise requests.HTTPError(f"Status {self.status_code}")
-
-    def json(self):
-        return self.payload
+def _hub(handler) -> MCPHub:
+    return MCPHub(http_transport=httpx.MockTransport(handler))
 
 
 @pytest.mark.integration
-def test_mcp_server_registration_and_discovery(monkeypatch):
-    hub = MCPHub()
+def test_mcp_server_registration_and_discovery():
+    def fake_request(request):
+        assert request.method == "GET"
+        assert request.url.path.endswith("/tools")
+        return httpx.Response(200, json={"tools": [{"name": "search", "description": "Search"}]})
+
+    hub = _hub(fake_request)
     server = MCPServer(
         name="mock",
         server_url="https://mcp.example",
@@ -34,12 +30,6 @@ def test_mcp_server_registration_and_discovery(monkeypatch):
     )
     hub.register_server(server)
 
-    def fake_request(method, url, headers=None, timeout=None):
-        assert method == "GET"
-        assert url.endswith("/tools")
-        return _FakeResponse(payload={"tools": [{"name": "search", "description": "Search"}]})
-
-    monkeypatch.setattr(requests, "request", fake_request)
     tools = run_async(hub.discover_tools("mock"))
 
     assert tools[0].name == "search"
@@ -47,8 +37,16 @@ def test_mcp_server_registration_and_discovery(monkeypatch):
 
 
 @pytest.mark.integration
-def test_mcp_tool_invoke_and_error(monkeypatch):
-    hub = MCPHub()
+def test_mcp_tool_invoke_and_error():
+    mode = {"fail": False}
+
+    def fake_request(request):
+        if mode["fail"]:
+            raise httpx.ConnectError("boom", request=request)
+        assert request.method == "POST"
+        return httpx.Response(200, json={"items": ["ok"]})
+
+    hub = _hub(fake_request)
     server = MCPServer(
         name="mock",
         server_url="https://mcp.example",
@@ -63,27 +61,19 @@ def test_mcp_tool_invoke_and_error(monkeypatch):
     ]
     hub.register_server(server)
 
-    def fake_success(method, url, headers=None, json=None, timeout=None):
-        assert method == "POST"
-        return _FakeResponse(payload={"items": ["ok"]})
-
-    monkeypatch.setattr(requests, "request", fake_success)
     result = run_async(hub.invoke_tool("search", {"query": "ok"}))
     assert result.success is True
     assert result.data == {"items": ["ok"]}
 
-    def fake_fail(method, url, headers=None, json=None, timeout=None):
-        raise requests.RequestException("boom")
-
-    monkeypatch.setattr(requests, "request", fake_fail)
+    mode["fail"] = True
     result = run_async(hub.invoke_tool("search", {"query": "fail"}))
     assert result.success is False
     assert result.error is not None
 
 
 @pytest.mark.integration
-def test_mcp_rate_limiting(monkeypatch):
-    hub = MCPHub()
+def test_mcp_rate_limiting():
+    hub = _hub(lambda request: httpx.Response(200, json={"items": ["ok"]}))
     server = MCPServer(
         name="rate",
         server_url="https://mcp.example",
@@ -99,10 +89,6 @@ def test_mcp_rate_limiting(monkeypatch):
     ]
     hub.register_server(server)
 
-    def fake_success(method, url, headers=None, json=None, timeout=None):
-        return _FakeResponse(payload={"items": ["ok"]})
-
-    monkeypatch.setattr(requests, "request", fake_success)
     first = run_async(hub.invoke_tool("search", {"query": "one"}))
     second = run_async(hub.invoke_tool("search", {"query": "two"}))
 
@@ -112,8 +98,14 @@ def test_mcp_rate_limiting(monkeypatch):
 
 
 @pytest.mark.integration
-def test_mcp_tool_chain(monkeypatch):
-    hub = MCPHub()
+def test_mcp_tool_chain():
+    def fake_request(request):
+        body = json.loads(request.content)
+        if body.get("tool") == "step_one":
+            return httpx.Response(200, json={"value": 1})
+        return httpx.Response(200, json={"value": body["params"]["value"] + 1})
+
+    hub = _hub(fake_request)
     server = MCPServer(
         name="chain",
         server_url="https://mcp.example",
@@ -131,14 +123,6 @@ def test_mcp_tool_chain(monkeypatch):
     ]
     hub.register_server(server)
 
-    def fake_success(method, url, headers=None, json=None, timeout=None):
-        tool_name = json.get("tool")
-        if tool_name == "step_one":
-            return _FakeResponse(payload={"value": 1})
-        return _FakeResponse(payload={"value": json["params"]["value"] + 1})
-
-    monkeypatch.setattr(requests, "request", fake_success)
-
     chain = ToolChain(hub)
     chain.add_step("step_one", lambda initial, results: {"query": initial["query"]})
     chain.add_step("step_two", lambda _initial, results: {"value": results[-1].data["value"]})
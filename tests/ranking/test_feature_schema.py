@@ -54,3 +54,78 @@ def test_feature_extraction_vector():
     # Same vector -> dot product 1 (if normalized)
     feats2 = extractor.extract(query, doc, query_vec=q_vec, doc_vec=q_vec)
     assert feats2["cosine_sim"] == 1.0
+
+
+def test_extract_matrix_matches_extract():
+    from jarvis_core.ranking.features import FEATURE_NAMES
+
+    extractor = RankingFeatures()
+    query = "Specific Phrase"
+    docs = [
+        {"title": "A specific phrase title", "text": "body content", "year": 2021},
+        {"title": "Other", "text": "a specific phrase in text", "doi": "10.1/x", "bm25_score": 3.5},
+        {"title": "", "text": "", "vector_score": 0.25},
+    ]
+
+    X = extractor.extract_matrix(query, docs)
+    assert X.shape == (3, len(FEATURE_NAMES))
+    for row, doc in zip(X, docs):
+        expected = extractor.extract(query, doc)
+        assert dict(zip(FEATURE_NAMES, row.tolist())) == expected
+
+    assert extractor.extract_batch(query, docs)[1] == extractor.extract(query, docs[1])
+
+
+def test_extract_matrix_vector_similarity_is_batched():
+    import numpy as np
+
+    from jarvis_core.ranking.features import FEATURE_NAMES
+
+    extractor = RankingFeatures()
+    q_vec = np.array([1.0, 0.0])
+    doc_vecs = np.array([[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]])
+    X = extractor.extract_matrix("q", [{}, {}, {}], query_vec=q_vec, doc_vecs=doc_vecs)
+    assert X[:, FEATURE_NAMES.index("cosine_sim")].tolist() == [1.0, 0.0, 0.5]
+    assert extractor.extract_matrix("q", []).shape == (0, 8)
+
+
+def test_extract_matrix_caches_token_counts_by_digest():
+    extractor = RankingFeatures(max_cached_texts=2)
+    docs = [{"text": "alpha beta gamma"}, {"text": "alpha beta gamma"}, {"text": "delta"}]
+
+    X = extractor.extract_matrix("alpha", docs)
+    assert X[:, 3].tolist() == [3.0, 3.0, 1.0]
+    assert len(extractor._token_counts) == 2
+    assert all(isinstance(key, bytes) for key in extractor._token_counts)
+
+    extractor.extract_matrix("alpha", [{"text": "one two"}])
+    assert len(extractor._token_counts) == 2
+
+
+def test_lgbm_ranker_matrix_conversion():
+    from jarvis_core.ranking.lgbm_ranker import LGBMRanker
+
+    ranker = LGBMRanker()
+    rubric = [
+        {"model_tier": "rct", "evidence_type": "imaging", "tme_relevance": "high"},
+        {},
+    ]
+    X = ranker.features_to_matrix(rubric)
+    assert X.tolist() == [ranker._convert_features(f) for f in rubric]
+
+
+def test_lgbm_ranker_matrix_conversion_without_lightgbm():
+    import subprocess
+    import sys
+
+    # A fresh interpreter keeps the LightGBM-less import away from the shared module
+    script = (
+        "import sys\n"
+        "sys.modules['lightgbm'] = None\n"
+        "from jarvis_core.ranking import lgbm_ranker\n"
+        "assert lgbm_ranker.HAS_LGBM is False\n"
+        "X = lgbm_ranker.LGBMRanker().features_to_matrix([{'model_tier': 'mouse'}])\n"
+        "assert X.shape == (1, 5), X.shape\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
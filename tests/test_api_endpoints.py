@@ -92,6 +92,9 @@ class _SearchResult:
 class _FakeSearchEngine:
     _loaded = True
 
+    def sync(self, filepath) -> int:  # noqa: ANN001
+        return 0
+
     def search(self, q: str, top_k: int = 20, filters=None) -> _SearchResult:  # noqa: ANN001
         return _SearchResult()
 
@@ -141,3 +144,58 @@ def test_kpi_endpoint_contract(client: TestClient) -> None:
     _assert_envelope(payload)
     assert "definitions" in payload
     assert "current_values" in payload
+
+
+def test_upload_pdf_deduplicates_and_caps_size(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    files = [
+        ("files", ("a.pdf", b"%PDF-1.4 same", "application/pdf")),
+        ("files", ("b.pdf", b"%PDF-1.4 same", "application/pdf")),
+    ]
+    payload = client.post("/api/upload/pdf", files=files).json()
+    assert payload["accepted"] == 1
+    assert payload["duplicates"] == 1
+
+    monkeypatch.setattr(app_module, "MAX_UPLOAD_SIZE", 8)
+    payload = client.post(
+        "/api/upload/pdf",
+        files=[("files", ("big.pdf", b"%PDF-1.4 too large", "application/pdf"))],
+    ).json()
+    assert payload["rejected"] == 1
+    assert not list(Path("data/uploads").rglob("*.part"))
+
+
+def test_runs_list_paginates_and_filters(client: TestClient) -> None:
+    run_dir = Path("data/runs/run-2")
+    run_dir.mkdir(parents=True)
+    (run_dir / "result.json").write_text(json.dumps({"status": "failed"}), encoding="utf-8")
+
+    payload = client.get("/api/runs", params={"limit": 1, "offset": 0}).json()
+    assert payload["data"]["total"] == 2
+    assert len(payload["data"]["runs"]) == 1
+
+    payload = client.get("/api/runs", params={"status": "failed"}).json()
+    assert [run["run_id"] for run in payload["data"]["runs"]] == ["run-2"]
+
+    response = client.get("/api/runs", params={"sort": "bogus"})
+    assert response.status_code == 400
+
+
+def test_runs_list_does_not_reconcile_twice(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert client.get("/api/runs").status_code == 200
+
+    catalog = app_module.get_run_catalog()
+    reconciles: list[int] = []
+    original = catalog.reconcile
+
+    def counting_reconcile() -> dict:
+        reconciles.append(1)
+        return original()
+
+    monkeypatch.setattr(catalog, "reconcile", counting_reconcile)
+    assert client.get("/api/runs").status_code == 200
+    assert client.get("/api/runs").status_code == 200
+    assert reconciles == []
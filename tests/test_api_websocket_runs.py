@@ -51,3 +51,41 @@ def test_ws_runs_ping_pong_and_disconnect(client: TestClient) -> None:
         pong = websocket.receive_json()
         assert pong["event"] == "pong"
         assert pong["data"]["run_id"] == "run-1"
+
+
+def test_ws_runs_pushes_live_events(client: TestClient) -> None:
+    from jarvis_core.obs.logger import get_logger
+
+    with client.websocket_connect("/ws/runs/run-1") as websocket:
+        websocket.receive_json()
+        websocket.receive_json()
+        # Round-trip a ping so the forwarder is subscribed before publishing.
+        websocket.send_text("ping")
+        assert websocket.receive_json()["event"] == "pong"
+
+        get_logger("run-1", "job", "pipeline").step_start("search")
+        message = websocket.receive_json()
+        assert message["event"] == "run_event"
+        assert message["data"]["event"] == "step_start"
+        assert message["data"]["data"]["step"] == "search"
+
+
+def test_sse_run_events_replay_from_offset(client: TestClient) -> None:
+    from jarvis_core.obs.logger import get_logger
+
+    logger = get_logger("run-1", "job", "pipeline")
+    logger.step_start("search")
+    logger.progress("Pipeline", 50)
+    logger.step_end("Pipeline")
+
+    response = client.get("/api/runs/run-1/events", params={"since": 1})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    blocks = [b for b in response.text.split("\n\n") if b.strip()]
+    assert [b.splitlines()[0] for b in blocks] == ["id: 1", "id: 2"]
+    assert "event: step_end" in blocks[-1]
+
+    response = client.get("/api/runs/run-1/events", headers={"Last-Event-ID": "1"})
+    assert [b.splitlines()[0] for b in response.text.split("\n\n") if b.strip()] == ["id: 2"]
+
+    assert client.get("/api/runs/missing/events").status_code == 404
@@ -0,0 +1,97 @@
+"""Tests for the offline benchmark suite (tiny scales, in-process)."""
+
+from __future__ import annotations
+
+import copy
+import os
+
+import pytest
+
+from jarvis_core.perf.bench_suite import (
+    SCHEMA_VERSION,
+    SyntheticCorpus,
+    compare_results,
+    run_suite,
+)
+
+TINY = {"tiny": 60}
+
+
+def test_corpus_is_deterministic_and_has_duplicates() -> None:
+    first = SyntheticCorpus(100, seed=7)
+    second = SyntheticCorpus(100, seed=7)
+    other = SyntheticCorpus(100, seed=8)
+
+    assert first.docs == second.docs
+    assert first.queries(5) == second.queries(5)
+    assert first.docs != other.docs
+    texts = [doc["text"] for doc in first.docs]
+    assert len(set(texts)) < len(texts)
+    assert first.full_text(3).startswith("Introduction")
+
+
+def test_title_templates_are_mixed_in() -> None:
+    corpus = SyntheticCorpus(8, title_templates=["Phase I trial of immunotherapy"])
+    assert corpus.docs[0]["title"] == "Phase I trial of immunotherapy"
+    assert corpus.docs[1]["title"] != "Phase I trial of immunotherapy"
+
+
+def test_run_suite_schema() -> None:
+    cwd = os.getcwd()
+    result = run_suite(
+        cases=["bm25_index", "bm25_query", "dedup_exact", "chunking", "pipeline_e2e"],
+        iterations=1,
+        isolate=False,
+        scale_sizes=TINY,
+    )
+
+    assert os.getcwd() == cwd
+    assert result["schema"] == SCHEMA_VERSION
+    assert result["config"]["scales"] == TINY
+    assert result["comparison"] is None
+    rows = {row["case"]: row for row in result["results"]}
+    assert set(rows) == {"bm25_index", "bm25_query", "dedup_exact", "chunking", "pipeline_e2e"}
+    for row in rows.values():
+        assert row["status"] == "ok", row
+        assert row["scale"] == "tiny"
+        assert row["throughput_per_sec"] > 0
+        latency = row["latency_ms"]
+        assert latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+    assert rows["bm25_query"]["ops"] == 200
+    assert rows["dedup_exact"]["extra"]["duplicates"] > 0
+    assert rows["pipeline_e2e"]["items"] == TINY["tiny"]
+
+
+def test_unknown_case_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        run_suite(cases=["nope"], isolate=False, scale_sizes=TINY)
+
+
+def test_compare_results_flags_regressions() -> None:
+    baseline = {
+        "timestamp": "t0",
+        "results": [
+            {
+                "case": "bm25_query",
+                "scale": "1k",
+                "status": "ok",
+                "throughput_per_sec": 1000.0,
+                "latency_ms": {"p95": 1.0},
+            },
+            {
+                "case": "chunking",
+                "scale": "1k",
+                "status": "ok",
+                "throughput_per_sec": 1000.0,
+                "latency_ms": {"p95": 1.0},
+            },
+        ],
+    }
+    current = copy.deepcopy(baseline)
+    current["results"][0]["throughput_per_sec"] = 700.0  # 30% slower
+    current["results"][1]["latency_ms"]["p95"] = 1.1  # within threshold
+
+    comparison = compare_results(current, baseline, threshold=0.2)
+    assert comparison["regressions"] == ["bm25_query@1k"]
+    assert comparison["cases"][0]["throughput_change"] == pytest.approx(-0.3)
+    assert comparison["cases"][1]["regressed"] is False
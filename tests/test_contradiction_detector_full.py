@@ -19,3 +19,36 @@ class TestModule:
         from jarvis_core.contradiction import detector
 
         assert detector is not None
+
+
+class TestDetectBatch:
+    def test_blocked_batch_matches_pairwise_scan(self):
+        from jarvis_core.contradiction.detector import ContradictionDetector
+        from jarvis_core.contradiction.schema import Claim
+
+        texts = [
+            "Metformin increase insulin sensitivity in mice",
+            "Metformin decrease insulin sensitivity in mice",
+            "Vitamin D is beneficial for bone density",
+            "Vitamin D is harmful for bone density",
+            "The assay was performed twice",
+            "Metformin activate AMPK signalling in liver",
+            "Metformin suppress AMPK signalling in liver",
+        ]
+        claims = [Claim(claim_id=str(i), text=t, paper_id=f"p{i}") for i, t in enumerate(texts)]
+        d = ContradictionDetector()
+
+        expected = []
+        for i in range(len(claims)):
+            for j in range(i + 1, len(claims)):
+                r = d.detect(claims[i], claims[j])
+                if r.is_contradictory:
+                    expected.append((r.claim_pair.claim_a.claim_id, r.claim_pair.claim_b.claim_id))
+
+        got = [
+            (r.claim_pair.claim_a.claim_id, r.claim_pair.claim_b.claim_id)
+            for r in d.detect_batch(claims)
+        ]
+        assert got == expected
+        assert ("0", "1") in got
+        assert all("4" not in pair for pair in d._candidate_pairs(claims))
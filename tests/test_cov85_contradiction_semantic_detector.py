@@ -119,26 +119,93 @@ def test_detect_returns_none_after_high_similarity_when_no_contradiction() -> No
     assert result.contradiction_type == ContradictionType.NONE
 
 
-def test_detect_batch_collects_only_contradictory_pairs(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_detect_batch_collects_only_contradictory_pairs() -> None:
     detector = SemanticContradictionDetector()
-    claims = [_claim("1", "a"), _claim("2", "b"), _claim("3", "c")]
-
-    def _fake_detect(a: Claim, b: Claim) -> ContradictionResult:
-        ctype = (
-            ContradictionType.DIRECT
-            if {a.claim_id, b.claim_id} == {"1", "2"}
-            else ContradictionType.NONE
-        )
-        return ContradictionResult(
-            claim_pair=ClaimPair(claim_a=a, claim_b=b),
-            contradiction_type=ctype,
-            confidence=0.9,
-        )
+    claims = [
+        _claim("1", "Drug increases survival"),
+        _claim("2", "Drug decreases survival"),
+        _claim("3", "Weather was mild"),
+    ]
+    negated = detector._negate_claim(claims[0].text)
+    detector._embedder = _MapEmbedder(
+        {
+            claims[0].text: [1.0, 0.0],
+            claims[1].text: [1.0, 0.0],
+            claims[2].text: [0.0, 1.0],
+            negated: [1.0, 0.0],
+        }
+    )
 
-    monkeypatch.setattr(detector, "detect", _fake_detect)
     result = detector.detect_batch(claims)
     assert len(result) == 1
     assert {result[0][0].claim_id, result[0][1].claim_id} == {"1", "2"}
+    assert result[0][2].contradiction_type == ContradictionType.DIRECT
+
+
+class _CountingEmbedder(SimpleEmbedder):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def embed(self, text: str) -> np.ndarray:
+        self.calls += 1
+        return super().embed(text)
+
+
+def _batch_claims() -> list[Claim]:
+    texts = [
+        "aspirin increases survival in sepsis patients",
+        "aspirin decreases survival in sepsis patients",
+        "aspirin improves survival in sepsis patients",
+        "statins lower cholesterol in adults",
+        "statins higher cholesterol in adults",
+        "exercise has a positive effect on mood",
+        "exercise has a negative effect on mood",
+        "unrelated claim about river sediment",
+        "aspirin increases survival in sepsis patients",
+    ]
+    return [_claim(str(i), text) for i, text in enumerate(texts)]
+
+
+@pytest.mark.parametrize("use_negation", [True, False])
+def test_detect_batch_matches_pairwise_detect(use_negation: bool) -> None:
+    config = SemanticConfig(similarity_threshold=0.5, use_negation_embedding=use_negation)
+    detector = SemanticContradictionDetector(config=config)
+    detector._embedder = SimpleEmbedder()
+    claims = _batch_claims()
+
+    expected = []
+    for i, a in enumerate(claims):
+        for b in claims[i + 1 :]:
+            r = detector.detect(a, b)
+            if r.is_contradictory:
+                expected.append((a.claim_id, b.claim_id, r.contradiction_type, r.confidence))
+
+    got = [
+        (a.claim_id, b.claim_id, r.contradiction_type, r.confidence)
+        for a, b, r in detector.detect_batch(claims, block_size=4)
+    ]
+    assert len(got) == len(expected) > 0
+    for g, e in zip(got, expected):
+        assert g[:3] == e[:3]
+        assert g[3] == pytest.approx(e[3])
+
+
+def test_detect_batch_embeds_each_text_once_and_top_k() -> None:
+    detector = SemanticContradictionDetector(config=SemanticConfig(similarity_threshold=0.5))
+    embedder = _CountingEmbedder()
+    detector._embedder = embedder
+    claims = _batch_claims()
+
+    everything = detector.detect_batch(claims)
+    # 8 distinct texts plus at most one negation per claim.
+    assert embedder.calls <= 8 + len(claims)
+
+    top = detector.detect_batch(claims, top_k=2)
+    assert len(top) == 2
+    best = sorted((r.confidence for _, _, r in everything), reverse=True)[:2]
+    assert [r.confidence for _, _, r in top] == pytest.approx(best)
+    assert detector.detect_batch(claims[:1]) == []
 
 
 def test_internal_helpers_and_simple_embedder() -> None:
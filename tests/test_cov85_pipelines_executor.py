@@ -29,6 +29,9 @@ class _FakeObsLogger:
     def error(self, message: str, step: str | None = None, exc: Exception | None = None) -> None:
         self.events.append(("error", step, message, type(exc).__name__ if exc else None))
 
+    def progress(self, step: str, percent: int, data=None) -> None:  # noqa: ANN001
+        self.events.append(("progress", step, percent, data))
+
 
 class _FakeRegistry:
     def __init__(self, handlers: dict[str, object]) -> None:
@@ -0,0 +1,133 @@
+"""Tests for batching, caching and cascading in retrieval.cross_encoder."""
+
+from __future__ import annotations
+
+import pytest
+
+from jarvis_core.retrieval.cross_encoder import (
+    CrossEncoderReranker,
+    ScoreCache,
+    length_buckets,
+)
+
+
+class FakeModel:
+    """Scores a pair by how often the query's first word appears in the text."""
+
+    def __init__(self, weight: float = 1.0):
+        self.weight = weight
+        self.batches: list[int] = []
+        self.pairs: list[tuple[str, str]] = []
+
+    def predict(self, pairs, **kwargs):  # noqa: ANN001, ANN003, ANN201
+        self.batches.append(len(pairs))
+        self.pairs.extend(pairs)
+        return [self.weight * text.count(query.split()[0]) for query, text in pairs]
+
+
+def _candidates(n: int) -> list[dict]:
+    return [
+        {"chunk_id": f"c{i}", "text": "cd73 " * (i % 7) + "x" * (i * 13), "score": 0.0}
+        for i in range(n)
+    ]
+
+
+def test_length_buckets_respect_token_budget() -> None:
+    lengths = [10, 500, 20, 480, 15, 30]
+    batches = length_buckets(lengths, token_budget=1000, max_batch_size=3)
+    assert sorted(i for batch in batches for i in batch) == list(range(6))
+    for batch in batches:
+        assert len(batch) <= 3
+        assert max(lengths[i] for i in batch) * len(batch) <= 1000
+    assert batches[0] == [0, 4, 2]  # shortest pairs batched together
+
+
+def test_rerank_caches_repeated_queries_and_truncates() -> None:
+    model = FakeModel()
+    reranker = CrossEncoderReranker(model=model, max_length=16)
+    candidates = _candidates(20)
+
+    first = reranker.rerank("cd73 inhibitors", candidates, top_k=5)
+    assert len(model.pairs) == 20
+    assert all(len(text) <= 16 * 4 for _, text in model.pairs)
+    assert first[0].reranked_score >= first[-1].reranked_score
+
+    second = reranker.rerank("cd73 inhibitors", candidates, top_k=5)
+    assert len(model.pairs) == 20  # served from cache
+    assert [r.chunk_id for r in second] == [r.chunk_id for r in first]
+    assert reranker.score_cache.stats()["hits"] == 20
+
+    reranker.rerank("cd73 other query", candidates[:3], top_k=3)
+    assert len(model.pairs) == 23
+
+
+def test_persistent_cache_survives_new_instances(tmp_path) -> None:
+    db = tmp_path / "scores.db"
+    cache = ScoreCache(db_path=db)
+    cache.put_many("m", "q", {"a": 1.5, "b": -2.0})
+    cache.close()
+
+    reopened = ScoreCache(db_path=db)
+    assert reopened.get_many("m", "q", ["a", "b", "c"]) == {"a": 1.5, "b": -2.0}
+    assert reopened.get_many("other", "q", ["a"]) == {}
+    reopened.clear()
+    assert ScoreCache(db_path=db).get_many("m", "q", ["a"]) == {}
+
+
+def test_lru_eviction() -> None:
+    cache = ScoreCache(max_entries=2)
+    cache.put_many("m", "q", {"a": 1.0, "b": 2.0})
+    cache.get_many("m", "q", ["a"])
+    cache.put_many("m", "q", {"c": 3.0})
+    assert cache.get_many("m", "q", ["a", "b", "c"]) == {"a": 1.0, "c": 3.0}
+
+
+def test_adaptive_rerank_uses_measured_latency() -> None:
+    reranker = CrossEncoderReranker(model=FakeModel(), latency_budget_ms=100.0)
+    assert reranker.estimate_latency(10) == pytest.approx(100.0)
+
+    reranker._observe_latency(reranker.model_name, 2.0)
+    assert reranker.estimate_latency(10) == pytest.approx(20.0)
+    assert reranker._affordable("q", _candidates(80), reranker.model_name, 100.0) == 50
+
+    results = reranker.adaptive_rerank("cd73", _candidates(80), top_k=5)
+    assert len(results) == 5
+    assert reranker.pair_latency_ms() < 2.0  # fake model is far faster than the prior
+
+
+def test_budget_planning_does_not_count_cache_lookups() -> None:
+    reranker = CrossEncoderReranker(model=FakeModel(), latency_budget_ms=10_000.0)
+    candidates = _candidates(10)
+    reranker.rerank("cd73", candidates, top_k=3)
+    assert reranker.score_cache.stats()["misses"] == 10
+
+    reranker.adaptive_rerank("cd73", candidates, top_k=3)
+    stats = reranker.score_cache.stats()
+    assert (stats["hits"], stats["misses"]) == (10, 10)
+    assert reranker.score_cache.peek_many(reranker.model_name, "cd73", ["c0", "zz"]) == {"c0": 0.0}
+    assert reranker.score_cache.stats()["hits"] == 10
+
+
+def test_cascade_rescores_only_uncertain_band() -> None:
+    small, large = FakeModel(), FakeModel(weight=-1.0)
+    reranker = CrossEncoderReranker(
+        model=large, cascade_model=small, cascade_margin=0.5, latency_budget_ms=10_000
+    )
+    candidates = _candidates(30)
+
+    results = reranker.adaptive_rerank("cd73", candidates, top_k=5)
+    assert len(small.pairs) == 30
+    # Stage-1 cutoff is the count-5 tier; only those four candidates are uncertain.
+    assert sorted(text.count("cd73") for _, text in large.pairs) == [5, 5, 5, 5]
+    # Confident count-6 candidates keep their stage-1 order and positions.
+    assert [r.chunk_id for r in results[:4]] == ["c6", "c13", "c20", "c27"]
+    assert results[4].reranked_score == pytest.approx(-3.5)
+
+
+def test_cascade_falls_back_without_models() -> None:
+    reranker = CrossEncoderReranker(model_name="missing/model", cascade_model_name="missing/tiny")
+    reranker._unavailable.update({"missing/model", "missing/tiny"})
+    results = reranker.adaptive_rerank(
+        "q", [{"chunk_id": "a", "text": "t", "score": 0.2}, {"chunk_id": "b", "score": 0.9}]
+    )
+    assert [r.chunk_id for r in results] == ["b", "a"]
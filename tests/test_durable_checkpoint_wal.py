@@ -0,0 +1,147 @@
+"""Tests for the write-ahead checkpoint log of DurableRunner."""
+
+from __future__ import annotations
+
+import json
+import time
+
+from jarvis_core.runtime.durable import CheckpointStage, DurableRunner
+
+
+def test_save_and_load_round_trip(tmp_path) -> None:  # noqa: ANN001
+    runner = DurableRunner("run", checkpoint_dir=str(tmp_path))
+    assert runner.load_checkpoint() is None
+    assert runner.can_resume() is False
+
+    runner.save_checkpoint(CheckpointStage.PARSE, {"k": 1}, completed=["a", "b"], pending=["c"])
+    runner.save_checkpoint(CheckpointStage.INDEX, {"k": 2}, completed=["b", "c"], pending=[])
+    runner.close()
+
+    resumed = DurableRunner("run", checkpoint_dir=str(tmp_path))
+    checkpoint = resumed.load_checkpoint()
+    assert checkpoint is not None
+    assert checkpoint.stage == CheckpointStage.INDEX
+    assert checkpoint.step_id == 1
+    assert checkpoint.data == {"k": 2}
+    assert checkpoint.completed_items == ["b", "c"]
+    assert checkpoint.pending_items == []
+    assert resumed.resume_from() == CheckpointStage.INDEX
+    assert resumed.can_resume() is True
+
+
+def test_checkpoint_logs_only_pending_changes(tmp_path) -> None:  # noqa: ANN001
+    runner = DurableRunner("run", checkpoint_dir=str(tmp_path), compact_every=1_000_000)
+    items = [f"p{i}" for i in range(1000)]
+    runner.save_checkpoint(CheckpointStage.FETCH, {}, completed=[], pending=items)
+    runner.save_checkpoint(CheckpointStage.PARSE, {}, completed=["p0"], pending=items[1:])
+    runner.close()
+
+    records = [
+        json.loads(line)
+        for line in (tmp_path / "run.checkpoint.wal").read_text(encoding="utf-8").splitlines()
+    ]
+    assert records[1]["pending_removed"] == ["p0"]
+    assert records[1]["pending_added"] == []
+    assert "pending" not in records[1]
+
+    resumed = DurableRunner("run", checkpoint_dir=str(tmp_path))
+    assert resumed.get_pending_items() == items[1:]
+    assert resumed.get_completed_items() == ["p0"]
+
+
+def test_legacy_full_pending_record_is_replayed(tmp_path) -> None:  # noqa: ANN001
+    (tmp_path / "run.checkpoint.wal").write_text(
+        '{"op":"pending","items":["a","b"]}\n'
+        '{"op":"checkpoint","stage":"parse","step_id":0,"timestamp":"t","data":{},'
+        '"undone":[],"done":[],"pending":["c"]}\n',
+        encoding="utf-8",
+    )
+    assert DurableRunner("run", checkpoint_dir=str(tmp_path)).get_pending_items() == ["c"]
+
+
+def test_mark_completed_appends_small_records(tmp_path) -> None:  # noqa: ANN001
+    runner = DurableRunner("run", checkpoint_dir=str(tmp_path), compact_every=1_000_000)
+    runner.add_pending([f"item-{i}" for i in range(5)])
+    for i in range(3):
+        runner.mark_completed(f"item-{i}")
+    runner.mark_completed("item-0")  # already done: no new record
+    runner.close()
+
+    lines = (tmp_path / "run.checkpoint.wal").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["op"] for line in lines] == ["pending", "done", "done", "done"]
+
+    resumed = DurableRunner("run", checkpoint_dir=str(tmp_path))
+    assert resumed.is_completed("item-2")
+    assert not resumed.is_completed("item-3")
+    assert resumed.get_completed_items() == ["item-0", "item-1", "item-2"]
+    assert resumed.get_pending_items() == ["item-3", "item-4"]
+
+
+def test_compaction_folds_log_into_snapshot(tmp_path) -> None:  # noqa: ANN001
+    runner = DurableRunner("run", checkpoint_dir=str(tmp_path), compact_every=10)
+    for i in range(25):
+        runner.mark_completed(f"i{i}")
+    runner.close()
+
+    wal_lines = (tmp_path / "run.checkpoint.wal").read_text(encoding="utf-8").splitlines()
+    assert len(wal_lines) == 5
+    snapshot = json.loads((tmp_path / "run.checkpoint.json").read_text(encoding="utf-8"))
+    assert len(snapshot["completed_items"]) == 20
+
+    resumed = DurableRunner("run", checkpoint_dir=str(tmp_path))
+    assert resumed.get_completed_items() == [f"i{i}" for i in range(25)]
+
+
+def test_replay_ignores_torn_record_and_duplicate_replay(tmp_path) -> None:  # noqa: ANN001
+    runner = DurableRunner("run", checkpoint_dir=str(tmp_path), compact_every=1_000_000)
+    runner.mark_completed("a", "b")
+    runner.compact()
+    runner.mark_completed("c")
+    runner.close()
+
+    wal = tmp_path / "run.checkpoint.wal"
+    # Simulate a crash after compaction but before truncation, plus a torn write.
+    wal.write_text(
+        '{"op":"done","items":["a","b"]}\n{"op":"done","items":["c"]}\n{"op":"done","it',
+        encoding="utf-8",
+    )
+    resumed = DurableRunner("run", checkpoint_dir=str(tmp_path))
+    assert resumed.get_completed_items() == ["a", "b", "c"]
+    assert wal.read_text(encoding="utf-8").endswith("\n")
+
+    resumed.mark_completed("d")
+    resumed.close()
+    again = DurableRunner("run", checkpoint_dir=str(tmp_path))
+    assert again.get_completed_items() == ["a", "b", "c", "d"]
+
+
+def test_legacy_snapshot_is_loaded(tmp_path) -> None:  # noqa: ANN001
+    legacy = {
+        "run_id": "old",
+        "stage": "retrieve",
+        "step_id": 4,
+        "timestamp": "2024-01-01T00:00:00Z",
+        "data": {"x": 1},
+        "completed_items": ["p1"],
+        "pending_items": ["p2"],
+    }
+    (tmp_path / "old.checkpoint.json").write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+
+    runner = DurableRunner("old", checkpoint_dir=str(tmp_path))
+    assert runner.resume_from() == CheckpointStage.RETRIEVE
+    assert runner.is_completed("p1")
+    runner.mark_completed("p2")
+    assert runner.get_pending_items() == []
+    runner.clear_checkpoint()
+    assert runner.can_resume() is False
+    assert runner.get_completed_items() == []
+
+
+def test_checkpointing_every_item_is_cheap(tmp_path) -> None:  # noqa: ANN001
+    runner = DurableRunner("big", checkpoint_dir=str(tmp_path))
+    started = time.perf_counter()
+    for i in range(20_000):
+        runner.mark_completed(f"paper-{i}")
+    runner.close()
+    assert time.perf_counter() - started < 10
+    assert DurableRunner("big", checkpoint_dir=str(tmp_path)).is_completed("paper-19999")
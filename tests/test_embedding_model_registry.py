@@ -0,0 +1,176 @@
+"""Tests for the shared embedding model registry and encode service."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from jarvis_core.embeddings.model_registry import EncodeService, ModelRegistry
+
+
+class _FakeModel:
+    """Deterministic model: vector = [len(text), ord(first char)]."""
+
+    def __init__(self, name: str = "fake", **kwargs) -> None:  # noqa: ANN003
+        self.name = name
+        self.kwargs = kwargs
+        self.calls: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def encode(self, texts, **kwargs):  # noqa: ANN001, ANN003, ANN201
+        if kwargs.get("fail"):
+            raise RuntimeError("encode failed")
+        with self._lock:
+            self.calls.append(list(texts))
+        scale = 2.0 if kwargs.get("normalize_embeddings") else 1.0
+        return np.array([[len(t) * scale, ord(t[0]) if t else 0] for t in texts], dtype=float)
+
+
+def test_registry_loads_each_model_once_under_concurrency() -> None:
+    registry = ModelRegistry()
+    loads: list[tuple[str, dict]] = []
+
+    def loader(name: str, **kwargs):  # noqa: ANN003, ANN202
+        time.sleep(0.05)
+        loads.append((name, kwargs))
+        return _FakeModel(name, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        models = list(pool.map(lambda _: registry.get("m", loader=loader), range(8)))
+
+    assert len(loads) == 1
+    assert all(m is models[0] for m in models)
+
+    gpu = registry.get("m", device="cuda", loader=loader)
+    assert gpu is not models[0]
+    assert loads[-1] == ("m", {"device": "cuda"})
+    assert len(registry.loaded()) == 2
+
+
+def test_registry_does_not_cache_failed_loads() -> None:
+    registry = ModelRegistry()
+    attempts = {"n": 0}
+
+    def flaky(name: str, **kwargs):  # noqa: ANN003, ANN202
+        attempts["n"] += 1
+        if attempts["n"] == 1:
+            raise ImportError("sentence-transformers missing")
+        return _FakeModel(name)
+
+    with pytest.raises(ImportError):
+        registry.get("m", loader=flaky)
+    assert registry.get("m", loader=flaky).name == "m"
+    assert attempts["n"] == 2
+
+
+def test_encoder_is_shared_per_model() -> None:
+    registry = ModelRegistry()
+    loader = lambda name, **kw: _FakeModel(name)  # noqa: E731
+    first = registry.get_encoder("m", loader=loader)
+    assert registry.get_encoder("m", loader=loader) is first
+    assert first.model is registry.get("m", loader=loader)
+    registry.clear()
+    assert registry.loaded() == []
+
+
+def test_concurrent_single_calls_are_coalesced() -> None:
+    model = _FakeModel()
+    service = EncodeService(model, max_batch_size=64, max_wait_ms=100)
+    texts = [f"{'x' * i}{chr(97 + i)}" for i in range(16)]
+    barrier = threading.Barrier(len(texts))
+
+    def call(text: str) -> np.ndarray:
+        barrier.wait()
+        return service.encode(text)
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(texts)) as pool:
+            results = list(pool.map(call, texts))
+    finally:
+        service.close()
+
+    for text, vector in zip(texts, results):
+        assert vector.shape == (2,)
+        assert vector.tolist() == [len(text), ord(text[0])]
+    assert service.requests == len(texts)
+    assert len(model.calls) < len(texts)
+
+
+def test_batches_are_deduplicated_and_length_sorted() -> None:
+    model = _FakeModel()
+    service = EncodeService(model, max_batch_size=2, max_wait_ms=0)
+    try:
+        result = service.encode(["ccc", "a", "bb", "a", "dddd"])
+    finally:
+        service.close()
+
+    assert [row[0] for row in result.tolist()] == [3, 1, 2, 1, 4]
+    assert model.calls == [["a", "bb"], ["ccc", "dddd"]]
+
+
+def test_options_split_batches_and_errors_reach_callers() -> None:
+    model = _FakeModel()
+    service = EncodeService(model, max_batch_size=8, max_wait_ms=50)
+    try:
+        plain = service.submit("ab")
+        normalized = service.submit("ab", normalize_embeddings=True)
+        failing = service.submit("ab", fail=True)
+        assert plain.result(timeout=5).tolist() == [2.0, 97.0]
+        assert normalized.result(timeout=5).tolist() == [4.0, 97.0]
+        with pytest.raises(RuntimeError, match="encode failed"):
+            failing.result(timeout=5)
+    finally:
+        service.close()
+
+
+def test_aencode_from_concurrent_tasks() -> None:
+    model = _FakeModel()
+    service = EncodeService(model, max_batch_size=32, max_wait_ms=50)
+
+    async def main() -> list[np.ndarray]:
+        return await asyncio.gather(*(service.aencode([t]) for t in ["a", "bb", "ccc"]))
+
+    try:
+        results = asyncio.run(main())
+    finally:
+        service.close()
+
+    assert [r.shape for r in results] == [(1, 2)] * 3
+    assert [r[0][0] for r in results] == [1, 2, 3]
+    assert len(model.calls) == 1
+
+
+def test_closed_service_rejects_new_requests() -> None:
+    service = EncodeService(_FakeModel(), max_batch_size=4)
+    service.close()
+    with pytest.raises(RuntimeError):
+        service.encode("a")
+
+
+def test_specter2_loads_through_shared_loader(monkeypatch: pytest.MonkeyPatch) -> None:
+    from jarvis_core.embeddings import specter2
+
+    loads: list[tuple[str, dict]] = []
+
+    def fake_loader(name: str, **kwargs):  # noqa: ANN003, ANN202
+        loads.append((name, kwargs))
+        return _FakeModel(name, **kwargs)
+
+    monkeypatch.setitem(
+        sys.modules, "sentence_transformers", types.ModuleType("sentence_transformers")
+    )
+    monkeypatch.setattr(specter2, "load_sentence_transformer", fake_loader)
+
+    model = specter2.SPECTER2Embedding(device="cpu")
+    vector = model.embed_paper("Title", "Abstract")
+    assert loads == [("allenai/specter2", {"device": "cpu"})]
+    assert vector.tolist() == [float(len("Title [SEP] Abstract")), float(ord("T"))]
+    model.embed(["again"])
+    assert len(loads) == 1
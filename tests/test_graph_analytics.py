@@ -0,0 +1,260 @@
+"""Tests for the shared CSR graph analytics module."""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from jarvis_core.analysis.graph_analytics import GraphAnalytics
+from jarvis_core.citation.influence import InfluenceCalculator
+from jarvis_core.citation.stance_classifier import CitationStance
+from jarvis_core.graphrag.engine import (
+    CitationNetworkAnalyzer,
+    GraphEdge,
+    GraphNode,
+    GraphRAGEngine,
+    SemanticClustering,
+)
+
+
+def _edges():
+    return [("p1", "p0"), ("p2", "p0"), ("p3", "p0"), ("p4", "p1"), ("p0", "p4")]
+
+
+class TestGraphAnalytics:
+    def test_pagerank_matches_networkx(self):
+        analytics = GraphAnalytics()
+        analytics.add_node("dangling")
+        analytics.add_edges(_edges())
+
+        G = nx.DiGraph()
+        G.add_node("dangling")
+        G.add_edges_from(_edges())
+        expected = nx.pagerank(G, tol=1.0e-10, max_iter=1000)
+
+        scores = analytics.pagerank_dict(tol=1.0e-10, max_iter=1000)
+        for node, value in expected.items():
+            assert scores[node] == pytest.approx(value, abs=1.0e-6)
+
+    def test_pagerank_restricted_to_induced_subgraph(self):
+        analytics = GraphAnalytics()
+        analytics.add_edges(_edges() + [("p0", "x"), ("x", "p2")])
+        subset = [analytics.index_of(p) for p in ["p0", "p1", "p2", "p3", "p4"]]
+
+        G = nx.DiGraph()
+        G.add_edges_from(_edges())
+        expected = nx.pagerank(G, tol=1.0e-10, max_iter=1000)
+
+        scores = analytics.pagerank(tol=1.0e-10, max_iter=1000, nodes=subset)
+        assert scores[analytics.index_of("x")] == 0.0
+        for node, value in expected.items():
+            assert scores[analytics.index_of(node)] == pytest.approx(value, abs=1.0e-6)
+        assert analytics.pagerank(tol=1.0e-10, max_iter=1000, nodes=subset) is scores
+
+    def test_subset_pagerank_warm_starts_from_previous_subset(self):
+        analytics = GraphAnalytics()
+        analytics.add_edges(_edges())
+        subset = [analytics.index_of(p) for p in ["p0", "p1", "p2", "p3", "p4"]]
+        converged = analytics.pagerank(tol=1.0e-12, max_iter=1000, nodes=subset)
+
+        # Same subgraph, new version: one warm-started step stays converged
+        analytics.add_edge("x", "y")
+        warm = analytics.pagerank(max_iter=1, nodes=subset)
+        np.testing.assert_allclose(warm[subset], converged[subset], atol=1.0e-9)
+
+        cold = GraphAnalytics()
+        cold.add_edges(_edges())
+        one_step = cold.pagerank(max_iter=1, nodes=subset)
+        assert np.abs(one_step[subset] - converged[subset]).sum() > 1.0e-3
+
+    def test_results_memoized_until_version_changes(self):
+        analytics = GraphAnalytics()
+        analytics.add_edges(_edges())
+        first = analytics.pagerank()
+        assert analytics.pagerank() is first
+
+        analytics.add_edge("p5", "p0")
+        second = analytics.pagerank()
+        assert second is not first
+        assert len(second) == 6
+        assert second.sum() == pytest.approx(1.0)
+
+    def test_degrees_and_label_counts(self):
+        analytics = GraphAnalytics()
+        analytics.add_edge("a", "c", label="support")
+        analytics.add_edge("b", "c", label="contrast")
+        analytics.add_edge("c", "d", label="support")
+
+        c = analytics.index_of("c")
+        assert analytics.in_degree()[c] == 2
+        assert analytics.out_degree()[c] == 1
+        assert analytics.label_counts("support").tolist() == [0, 1, 0, 1]
+        assert analytics.label_counts("unknown").tolist() == [0, 0, 0, 0]
+        assert analytics.predecessors("c") == ["a", "b"]
+        assert analytics.successors("c") == ["d"]
+
+    def test_top_k_with_candidates(self):
+        analytics = GraphAnalytics()
+        analytics.add_edges(_edges())
+        scores = analytics.pagerank()
+        top = analytics.top_k(scores, 2)
+        assert top[0][0] == "p0"
+        restricted = analytics.top_k(scores, 1, candidates=[analytics.index_of("p2")])
+        assert restricted[0][0] == "p2"
+
+    def test_empty_graph(self):
+        analytics = GraphAnalytics()
+        assert analytics.pagerank_dict() == {}
+        assert analytics.top_k(analytics.pagerank(), 5) == []
+
+
+class TestGraphAnalyticsIntegration:
+    def test_citation_network_analyzer_ranks_papers(self):
+        engine = GraphRAGEngine()
+        for pid in ["p0", "p1", "p2"]:
+            engine.add_node(GraphNode(pid, "paper", {"title": pid.upper()}))
+        engine.add_node(GraphNode("author_x", "author"))
+        engine.add_edge(GraphEdge("p1", "p0", "cites"))
+        engine.add_edge(GraphEdge("p2", "p0", "cites"))
+        engine.add_edge(GraphEdge("p0", "author_x", "authored_by"))
+
+        analyzer = CitationNetworkAnalyzer(engine)
+        ranks = analyzer.calculate_pagerank()
+        assert set(ranks) == {"p0", "p1", "p2"}
+
+        influential = analyzer.find_influential_papers(top_n=1)
+        assert influential[0]["id"] == "p0"
+        assert influential[0]["title"] == "P0"
+
+    def test_citation_pagerank_ignores_non_paper_nodes(self):
+        def build(with_author: bool) -> CitationNetworkAnalyzer:
+            engine = GraphRAGEngine()
+            for pid in ["p0", "p1", "p2"]:
+                engine.add_node(GraphNode(pid, "paper"))
+            engine.add_edge(GraphEdge("p1", "p0", "cites"))
+            engine.add_edge(GraphEdge("p2", "p0", "cites"))
+            if with_author:
+                engine.add_node(GraphNode("author_x", "author"))
+                engine.add_edge(GraphEdge("p0", "author_x", "authored_by"))
+                engine.add_edge(GraphEdge("author_x", "p1", "wrote"))
+            return CitationNetworkAnalyzer(engine)
+
+        plain = build(False).calculate_pagerank()
+        mixed = build(True).calculate_pagerank()
+        for pid, value in plain.items():
+            assert mixed[pid] == pytest.approx(value)
+        assert sum(mixed.values()) == pytest.approx(1.0)
+
+    def test_influence_batch_from_analytics_graph(self):
+        analytics = GraphAnalytics()
+        analytics.add_edge("a", "target", label=CitationStance.SUPPORT.value)
+        analytics.add_edge("b", "target", label=CitationStance.CONTRAST.value)
+        analytics.add_edge("c", "target", label=CitationStance.MENTION.value)
+
+        calculator = InfluenceCalculator(analytics)
+        score = calculator.calculate("target")
+        assert score.total_citations == 3
+        assert score.support_count == 1
+        assert score.contrast_count == 1
+        assert score.mention_count == 1
+        assert score.influence_score == pytest.approx(1.5)
+
+        missing = calculator.calculate_batch(["nope"])[0]
+        assert missing.total_citations == 0
+
+
+class TestIncidentIndex:
+    def test_incident_with_pending_buffers_and_labels(self):
+        analytics = GraphAnalytics()
+        analytics.add_edge("a", "b", label="cites")
+        analytics.add_edge("a", "c", label="mentions")
+        assert analytics.successors("a") == ["b", "c"]  # builds the index
+
+        analytics.add_edge("a", "d", label="cites")  # lands in the append buffer
+        analytics.add_edge("e", "a", label="cites")
+        eids, nbrs = analytics.incident([analytics.index_of("a")], "out")
+        assert eids.tolist() == [0, 1, 2]
+        assert [analytics.node_ids[i] for i in nbrs] == ["b", "c", "d"]
+        _, cited = analytics.incident([analytics.index_of("a")], "out", labels=["cites"])
+        assert [analytics.node_ids[i] for i in cited] == ["b", "d"]
+        assert analytics.predecessors("a") == ["e"]
+        with pytest.raises(ValueError):
+            analytics.incident([0], "both")
+
+
+class TestGraphRAGEngineIndex:
+    def _random_engine(self, seed=0, n=60, m=400):
+        import random
+
+        rng = random.Random(seed)
+        engine = GraphRAGEngine()
+        for i in range(n):
+            engine.add_node(GraphNode(f"n{i}", "paper"))
+        for _ in range(m):
+            # Interleave queries so the index mixes snapshot and buffered edges.
+            engine.add_edge(
+                GraphEdge(f"n{rng.randrange(n)}", f"n{rng.randrange(n)}", rng.choice("xyz"))
+            )
+            if rng.random() < 0.05:
+                engine.multi_hop_query("n0", hops=1)
+        return engine, rng
+
+    def test_subgraph_and_multi_hop_match_naive_scan(self):
+        engine, rng = self._random_engine()
+        for _ in range(20):
+            ids = [f"n{rng.randrange(60)}" for _ in range(15)] + ["missing"]
+            keep = set(ids)
+            _, edges = engine.get_subgraph(ids)
+            assert edges == [e for e in engine.edges if e.source in keep and e.target in keep]
+            _, typed = engine.get_subgraph(ids, edge_types=["x"])
+            assert typed == [e for e in edges if e.type == "x"]
+
+            start = f"n{rng.randrange(60)}"
+            visited, level = set(), {start}
+            for _ in range(3):
+                level = {t for s in level for t in engine.adjacency.get(s, [])} - visited
+                visited |= level
+            assert {node.id for node in engine.multi_hop_query(start, hops=3)} == visited
+
+        assert engine.multi_hop_query("missing") == []
+        assert engine.get_edges("y") == [e for e in engine.edges if e.type == "y"]
+
+    def test_find_path_respects_max_depth(self):
+        engine = GraphRAGEngine()
+        for pid in "abcd":
+            engine.add_node(GraphNode(pid, "paper"))
+        for s, t in [("a", "b"), ("b", "c"), ("c", "d")]:
+            engine.add_edge(GraphEdge(s, t, "cites"))
+        assert engine.find_path("a", "d") == ["a", "b", "c", "d"]
+        assert engine.find_path("a", "d", max_depth=3) is None
+        assert engine.find_path("d", "a") is None
+
+
+class TestSemanticClusteringMatrix:
+    def test_find_similar_and_clusters(self):
+        clustering = SemanticClustering(dim=3)
+        clustering.add_embedding("a", [1.0, 0.0, 0.0])
+        clustering.add_embedding("b", [0.0, 1.0, 0.0])
+        clustering.add_embedding("a2", [0.9, 0.1, 0.0])
+        clustering.add_embedding("b2", [0.1, 0.9, 0.0])
+        clustering.add_embedding("zero", [0.0, 0.0, 0.0])
+
+        similar = clustering.find_similar("a", top_n=2)
+        assert [pid for pid, _ in similar] == ["a2", "b2"]
+        assert similar[0][1] == pytest.approx(
+            clustering.cosine_similarity([1.0, 0.0, 0.0], [0.9, 0.1, 0.0]), abs=1e-6
+        )
+        clusters = clustering.cluster_papers(n_clusters=2)
+        assert clusters == {0: ["a", "a2", "zero"], 1: ["b", "b2"]}
+        assert clustering.find_similar("missing") == []
+
+        with pytest.raises(ValueError):
+            clustering.add_embedding("bad", [1.0])
+
+    def test_matrix_grows_and_replaces_rows(self):
+        clustering = SemanticClustering()
+        for i in range(40):
+            clustering.add_paper(f"p{i}", f"gene {i} expression tumour")
+        clustering.add_paper("p0", "completely different words")
+        assert clustering.matrix.shape == (40, 64)
+        assert set(clustering.embeddings) == {f"p{i}" for i in range(40)}
+        assert sum(len(v) for v in clustering.cluster_papers(n_clusters=4).values()) == 40
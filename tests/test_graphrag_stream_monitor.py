@@ -0,0 +1,86 @@
+"""Tests for the compiled subscription matcher behind PaperStreamMonitor."""
+
+import random
+
+import pytest
+
+from jarvis_core.graphrag.engine import AhoCorasick, PaperStreamMonitor, SubscriptionIndex
+
+
+def test_aho_corasick_matches_naive_substring_search():
+    rng = random.Random(0)
+    for _ in range(50):
+        patterns = {"".join(rng.choices("abc", k=rng.randint(1, 4))) for _ in range(8)}
+        automaton = AhoCorasick()
+        for pattern in patterns:
+            automaton.add(pattern)
+        text = "".join(rng.choices("abcd", k=rng.randint(0, 40)))
+        assert automaton.search(text) == {p for p in patterns if p in text}
+
+
+def test_aho_corasick_reference_counts():
+    automaton = AhoCorasick()
+    automaton.add("he")
+    automaton.add("he")
+    automaton.add("she")
+    assert automaton.search("ushers") == {"he", "she"}
+    automaton.discard("he")
+    assert automaton.search("ushers") == {"he", "she"}
+    automaton.discard("he")
+    assert "he" not in automaton
+    assert automaton.search("ushers") == {"she"}
+    with pytest.raises(ValueError):
+        automaton.add("")
+
+
+def test_subscription_index_keywords_and_authors():
+    index = SubscriptionIndex()
+    index.add(1, ["CD73", "adenosine"])
+    index.add(2, ["tumor"], authors=["Jane  Doe"])
+    index.add(3, ["nosine"])
+
+    assert index.match("CD73 blockade", "") == {1}
+    assert index.match("Adenosine signalling", "in the tumor") == {1, 2, 3}
+    assert index.match("unrelated", "", authors="John Smith, jane doe") == {2}
+    assert index.match("unrelated", "", authors=["Jane Doe"]) == {2}
+    # Keywords never match across the title/abstract boundary.
+    assert index.match("tu", "mor") == set()
+
+    assert index.remove(1) is True
+    assert index.remove(1) is False
+    assert index.match("CD73 and adenosine", "") == {3}
+
+
+def test_subscription_index_matches_surnames():
+    index = SubscriptionIndex()
+    index.add(1, [], authors=["Smith"])
+    index.add(2, [], authors=["Jane Smith"])
+    assert index.match("", "", authors="John Smith, Jane Doe") == {1}
+    assert index.match("", "", authors=["jane  smith"]) == {1, 2}
+    assert index.match("", "", authors="Smithson Lee") == set()
+
+    monitor = PaperStreamMonitor()
+    fid = monitor.add_filter([], authors=["Smith"])
+    assert monitor.match_filters({"title": "x", "authors": "John Smith, Jane Doe"}) == [fid]
+
+
+def test_monitor_hit_counts_and_filter_removal():
+    monitor = PaperStreamMonitor()
+    cd73 = monitor.add_filter(["CD73"])
+    immuno = monitor.add_filter(["immunotherapy"], authors=["A. Author"])
+    papers = [
+        {"id": "1", "title": "CD73 in immunotherapy", "abstract": ""},
+        {"id": "2", "title": "Other", "abstract": "", "authors": "A. Author, B. Writer"},
+        {"id": "3", "title": "Nothing here", "abstract": None},
+        {"id": "1", "title": "CD73 duplicate", "abstract": ""},
+    ]
+
+    matched = monitor.process_new_papers(papers)
+    assert [p["id"] for p in matched] == ["1", "2"]
+    assert monitor.hit_counts == {cd73: 1, immuno: 2}
+    assert monitor.match_filters(papers[0]) == [cd73, immuno]
+
+    assert monitor.remove_filter(cd73) is True
+    assert [f["id"] for f in monitor.filters] == [immuno]
+    assert monitor.check_match({"title": "CD73 only"}) is False
+    assert monitor.remove_filter(cd73) is False
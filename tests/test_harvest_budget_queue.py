@@ -35,3 +35,73 @@ def test_harvest_budget_exceeded_and_resume(tmp_path: Path):
     assert second["status"] == "success"
     rows = queue.load()
     assert sum(1 for row in rows if row.get("status") == "queued") == 0
+
+
+def _items(n: int, pmc: bool = True) -> list[dict]:
+    return [
+        {"paper_key": f"pmid:{i}", "pmc_id": f"PMC{i}" if pmc else "", "metadata": {"pmid": str(i)}}
+        for i in range(n)
+    ]
+
+
+def test_queue_dedup_and_legacy_import(tmp_path: Path):
+    path = tmp_path / "harvest" / "queue.jsonl"
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        '{"paper_key": "pmid:0", "status": "done", "queued_at": "2024-01-01T00:00:00+00:00"}\n'
+        "not json\n",
+        encoding="utf-8",
+    )
+    queue = HarvestQueue(path)
+    assert queue.load()[0]["status"] == "done"
+
+    assert queue.enqueue_many(_items(3) + _items(2) + [{"title": "no key"}]) == 2
+    assert len(queue) == 3
+    assert queue.counts() == {"done": 1, "queued": 2}
+    # The legacy file is only imported once.
+    assert len(HarvestQueue(path)) == 3
+
+
+def test_queue_lease_ack_retry_and_visibility(tmp_path: Path):
+    queue = HarvestQueue(tmp_path / "queue.jsonl")
+    queue.enqueue_many(_items(3))
+
+    first = queue.lease("w1", limit=2)
+    assert [r["paper_key"] for r in first] == ["pmid:0", "pmid:1"]
+    assert queue.lease("w2", limit=5)[0]["paper_key"] == "pmid:2"
+    assert queue.lease("w2") == []
+
+    assert queue.ack("pmid:0", owner="w2") is False  # not the lease owner
+    assert queue.ack("pmid:0", owner="w1") is True
+    assert queue.retry("pmid:1", reason="boom", owner="w1", max_attempts=2) == "queued"
+    again = queue.lease("w3")
+    assert again[0]["paper_key"] == "pmid:1" and again[0]["attempts"] == 2
+    assert queue.retry("pmid:1", reason="boom", owner="w3", max_attempts=2) == "failed"
+
+    # pmid:2 was leased by w2 which "crashed": it reappears once the lease expires.
+    queue.release("pmid:2", owner="w2")
+    crashed = queue.lease("w4", visibility_timeout=-1)
+    assert crashed[0]["paper_key"] == "pmid:2"
+    assert queue.lease("w5")[0]["paper_key"] == "pmid:2"
+    assert queue.counts() == {"done": 1, "failed": 1, "leased": 1}
+
+
+def test_worker_pool_respects_budget_and_checkpoints(tmp_path: Path):
+    from jarvis_core.harvest.budget import HarvestBudget
+    from jarvis_core.harvest.worker import process_queue
+
+    run_dir = tmp_path / "run"
+    queue = HarvestQueue(run_dir / "harvest" / "queue.jsonl")
+    queue.enqueue_many(_items(20) + [{"paper_key": "pmid:closed", "pmc_id": ""}])
+
+    stats = process_queue(run_dir=run_dir, budget=HarvestBudget(max_items=7), workers=4)
+    assert stats["processed"] == 7
+    assert stats["budget"]["items_done"] == 7
+    assert stats["queue_pending"] == 14
+    assert queue.counts()["done"] == 7
+
+    stats = process_queue(run_dir=run_dir, budget=HarvestBudget(), workers=4)
+    assert stats["processed"] == 13
+    assert stats["skipped"] == 1
+    assert stats["queue_pending"] == 0
+    assert len(list((run_dir / "harvest" / "items").iterdir())) == 20
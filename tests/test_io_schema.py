@@ -106,5 +106,70 @@ class TestValidateSchema:
         assert validate_schema(X_train, X_test, y_train) is True
 
 
+class TestTypedCachedLoad:
+    """型縮小・列指向キャッシュ テスト."""
+
+    def _write(self, tmpdir, n=200):
+        rng = np.random.default_rng(0)
+        train_df = pd.DataFrame(
+            {
+                "f_float": rng.normal(size=n),
+                "f_small_int": rng.integers(0, 100, size=n),
+                "f_null_int": [None if i % 7 == 0 else i for i in range(n)],
+                "f_cat": rng.choice(["a", "b", "c"], size=n),
+                "Class": rng.integers(0, 2, size=n),
+            }
+        )
+        test_df = train_df.drop(columns=["Class"]).iloc[:50]
+        train_path = Path(tmpdir) / "train.csv"
+        test_path = Path(tmpdir) / "test.csv"
+        train_df.to_csv(train_path, index=False)
+        test_df.to_csv(test_path, index=False)
+        return train_path, test_path
+
+    def test_infer_dtypes_streaming(self):
+        from pipelines.tabular.io import infer_dtypes
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            train_path, _ = self._write(tmpdir)
+            dtypes = infer_dtypes(str(train_path), chunksize=32, exclude=["Class"])
+
+        assert dtypes == {
+            "f_float": "float32",
+            "f_small_int": "int8",
+            "f_null_int": "Int16",
+            "f_cat": "category",
+        }
+
+    def test_downcast_and_label_untouched(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            train_path, test_path = self._write(tmpdir)
+            X_train, X_test, y_train, schema = load_train_test(
+                str(train_path), str(test_path), "Class", chunksize=64
+            )
+
+        assert X_train["f_float"].dtype == np.float32
+        assert str(X_train["f_null_int"].dtype) == "Int16"
+        assert list(X_train.dtypes) == list(X_test.dtypes)
+        assert y_train.dtype == np.int64
+        assert schema.dtypes["f_cat"] == "category"
+
+    def test_cache_reused_without_reparsing(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            train_path, test_path = self._write(tmpdir)
+            cache_dir = Path(tmpdir) / "cache"
+            first = load_train_test(str(train_path), str(test_path), "Class", cache_dir=cache_dir)
+            assert len(list(cache_dir.iterdir())) == 2
+
+            def _fail(*args, **kwargs):
+                raise AssertionError("CSV should not be parsed on cache hit")
+
+            monkeypatch.setattr(pd, "read_csv", _fail)
+            second = load_train_test(str(train_path), str(test_path), "Class", cache_dir=cache_dir)
+
+        pd.testing.assert_frame_equal(first[0], second[0])
+        pd.testing.assert_series_equal(first[2], second[2])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,160 @@
+"""Tests for the hedged LLM provider pool (fake provider executables)."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from jarvis_core.rag.llm_pool import AsyncFunctionProvider, CLIProvider, ProviderPool
+
+FAKE_PROVIDER = """
+import sys, time
+sleep, exit_code, reply = float(sys.argv[1]), int(sys.argv[2]), sys.argv[3]
+prompt = sys.argv[4] if len(sys.argv) > 4 else sys.stdin.read()
+time.sleep(sleep)
+if exit_code == 0:
+    print(f"{reply}:{prompt.strip()}")
+sys.exit(exit_code)
+"""
+
+
+@pytest.fixture
+def fake_cli(tmp_path: Path):  # noqa: ANN201
+    script = tmp_path / "fake_llm.py"
+    script.write_text(FAKE_PROVIDER, encoding="utf-8")
+
+    def make(name: str, sleep: float = 0.0, exit_code: int = 0, stdin: bool = False, **kw):  # noqa: ANN003, ANN202
+        command = [sys.executable, str(script), str(sleep), str(exit_code), name]
+        if not stdin:
+            command.append("{prompt}")
+        return CLIProvider(name, command, stdin=stdin, **kw)
+
+    return make
+
+
+def test_cli_provider_prompt_via_argv_and_stdin(fake_cli) -> None:  # noqa: ANN001
+    async def main() -> tuple[str | None, str | None, str | None]:
+        argv = await fake_cli("argv").complete("hello", system_prompt="sys")
+        piped = await fake_cli("piped", stdin=True).complete("hello")
+        missing = await CLIProvider("missing", ["/nonexistent/llm-cli"]).complete("x")
+        return argv, piped, missing
+
+    argv, piped, missing = asyncio.run(main())
+    assert argv == "argv:sys\n\nhello"
+    assert piped == "piped:hello"
+    assert missing is None
+
+
+def test_falls_back_immediately_on_failure(fake_cli) -> None:  # noqa: ANN001
+    pool = ProviderPool(
+        [fake_cli("broken", exit_code=1), fake_cli("backup")],
+        initial_hedge_delay=30.0,
+    )
+    started = time.monotonic()
+    assert asyncio.run(pool.complete("q")) == "backup:q"
+    assert time.monotonic() - started < 10
+    assert pool.health()["broken"]["failures"] == 1
+
+
+def test_hedges_slow_provider_after_delay(fake_cli) -> None:  # noqa: ANN001
+    pool = ProviderPool(
+        [fake_cli("slow", sleep=20.0), fake_cli("fast")],
+        initial_hedge_delay=0.2,
+        min_hedge_delay=0.1,
+    )
+    started = time.monotonic()
+    assert asyncio.run(pool.complete("q")) == "fast:q"
+    # The slow call was cancelled instead of being awaited to completion.
+    assert time.monotonic() - started < 10
+    assert pool.health()["slow"]["failures"] == 0
+
+
+def test_hedge_delay_tracks_latency_percentile() -> None:
+    async def reply(prompt: str, system_prompt: str) -> str:
+        return "ok"
+
+    provider = AsyncFunctionProvider("p", reply, timeout=5.0)
+    pool = ProviderPool([provider], initial_hedge_delay=2.0, min_hedge_delay=0.5)
+    assert pool.hedge_delay(provider) == 2.0
+    for latency in (0.6, 0.7, 0.8, 3.0):
+        pool._health["p"].record_success(latency)
+    assert pool.hedge_delay(provider) == 3.0
+    for latency in (9.0, 9.0, 9.0, 9.0):
+        pool._health["p"].record_success(latency)
+    assert pool.hedge_delay(provider) == 5.0  # clamped to the provider timeout
+
+
+def test_failing_provider_is_skipped_during_cooldown() -> None:
+    calls = {"bad": 0, "good": 0}
+
+    async def bad(prompt: str, system_prompt: str) -> str:
+        calls["bad"] += 1
+        raise RuntimeError("down")
+
+    async def good(prompt: str, system_prompt: str) -> str:
+        calls["good"] += 1
+        return "ok"
+
+    pool = ProviderPool(
+        [AsyncFunctionProvider("bad", bad), AsyncFunctionProvider("good", good)],
+        failure_threshold=2,
+        cooldown=60.0,
+    )
+
+    async def main() -> list[str]:
+        return [await pool.complete("q") for _ in range(5)]
+
+    assert asyncio.run(main()) == ["ok"] * 5
+    assert calls == {"bad": 2, "good": 5}
+    assert pool.health()["bad"]["available"] is False
+
+
+def test_all_failing_returns_empty_string() -> None:
+    async def empty(prompt: str, system_prompt: str) -> str:
+        return ""
+
+    pool = ProviderPool([AsyncFunctionProvider("a", empty), AsyncFunctionProvider("b", empty)])
+    assert asyncio.run(pool.complete("q")) == ""
+
+
+def test_per_provider_concurrency_limit_and_parallel_calls() -> None:
+    state = {"active": 0, "peak": 0}
+
+    async def slow(prompt: str, system_prompt: str) -> str:
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.05)
+        state["active"] -= 1
+        return prompt
+
+    pool = ProviderPool([AsyncFunctionProvider("p", slow, max_concurrency=3)])
+
+    async def main() -> list[str]:
+        return await asyncio.gather(*(pool.complete(str(i)) for i in range(12)))
+
+    started = time.monotonic()
+    assert asyncio.run(main()) == [str(i) for i in range(12)]
+    assert state["peak"] == 3
+    assert time.monotonic() - started < 0.05 * 12
+    assert pool.max_concurrency == 3
+
+
+def test_rate_limit_spaces_out_calls() -> None:
+    async def reply(prompt: str, system_prompt: str) -> str:
+        return prompt
+
+    provider = AsyncFunctionProvider("p", reply, max_concurrency=1, requests_per_minute=600)
+    pool = ProviderPool([provider])
+
+    async def main() -> None:
+        for i in range(3):
+            await pool.complete(str(i))
+
+    started = time.monotonic()
+    asyncio.run(main())
+    # Burst of one, then 10 requests/second.
+    assert time.monotonic() - started >= 0.15
@@ -1,3 +1,7 @@
+import asyncio
+import time
+
+import httpx
 import pytest
 
 from async_test_utils import sync_async_test
@@ -5,51 +9,39 @@ from jarvis_core.mcp.hub import MCPHub
 from jarvis_core.mcp.schema import MCPServer, MCPServerStatus, MCPTool
 
 
-class DummyResponse:
-    def __init__(self, payload: dict, status_code: int = 200):
-        self._payload = payload
-        self.status_code = status_code
-
-    def raise_for_status(self):
-        if self.status_code >= 400:
-            raise RuntimeError("http error")
-
-    def json(self):
-        return self._payload
+def _server(name, **kwargs):
+    return MCPServer(
+        name=name, server_url=f"https://{name}.example/mcp", server_type="http", **kwargs
+    )
 
 
 @sync_async_test
-async def test_discover_and_invoke_tools(monkeypatch):
-    hub = MCPHub()
-    server = MCPServer(
-        name="alpha",
-        server_url="https://example.com/mcp",
-        server_type="http",
-    )
+async def test_discover_and_invoke_tools():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path))
+        if request.url.path.endswith("/tools"):
+            return httpx.Response(
+                200,
+                json={
+                    "tools": [
+                        {
+                            "name": "search",
+                            "description": "Search tool",
+                            "parameters": {"query": "string"},
+                            "required_params": ["query"],
+                            "enabled": True,
+                        }
+                    ]
+                },
+            )
+        return httpx.Response(200, json={"result": "ok"})
+
+    hub = MCPHub(http_transport=httpx.MockTransport(handler))
+    server = _server("alpha")
     hub.register_server(server)
 
-    responses = [
-        DummyResponse(
-            {
-                "tools": [
-                    {
-                        "name": "search",
-                        "description": "Search tool",
-                        "parameters": {"query": "string"},
-                        "required_params": ["query"],
-                        "enabled": True,
-                    }
-                ]
-            }
-        ),
-        DummyResponse({"result": "ok"}),
-    ]
-
-    def fake_request(method, url, headers=None, json=None, timeout=30):
-        return responses.pop(0)
-
-    monkeypatch.setattr("requests.request", fake_request)
-
     tools = await hub.discover_tools("alpha")
     assert tools
     assert tools[0].name == "search"
@@ -58,6 +50,7 @@ async def test_discover_and_invoke_tools(monkeypatch):
     result = await hub.invoke_tool("search", {"query": "cats"})
     assert result.success is True
     assert result.data == {"result": "ok"}
+    assert seen == [("GET", "/mcp/tools"), ("POST", "/mcp/invoke")]
 
     listing = hub.list_all_tools()
     assert listing == [
@@ -69,28 +62,134 @@ async def test_discover_and_invoke_tools(monkeypatch):
             "required_params": ["query"],
         }
     ]
+    await hub.aclose()
 
 
 @sync_async_test
-async def test_rate_limit_exceeded(monkeypatch):
-    hub = MCPHub()
-    server = MCPServer(
-        name="rate",
-        server_url="https://example.com/mcp",
-        server_type="http",
+async def test_rate_limit_exceeded():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"result": "ok"}))
+    hub = MCPHub(http_transport=transport)
+    server = _server(
+        "rate",
         tools=[MCPTool(name="tool", description="", parameters={})],
         requests_per_minute=1,
     )
     hub.register_server(server)
 
-    def fake_request(method, url, headers=None, json=None, timeout=30):
-        return DummyResponse({"result": "ok"})
-
-    monkeypatch.setattr("requests.request", fake_request)
-
     result = await hub.invoke_tool("tool", {})
     assert result.success is True
 
     limited = await hub.invoke_tool("tool", {})
     assert limited.success is False
     assert limited.error == "rate_limit_exceeded"
+    assert server.status == MCPServerStatus.RATE_LIMITED
+    await hub.aclose()
+
+
+@sync_async_test
+async def test_remote_error_sets_server_status():
+    transport = httpx.MockTransport(lambda request: httpx.Response(500, json={}))
+    hub = MCPHub(http_transport=transport)
+    server = _server("broken", tools=[MCPTool(name="tool", description="")])
+    hub.register_server(server)
+
+    result = await hub.invoke_tool("tool", {})
+    assert result.success is False
+    assert result.error
+    assert server.status == MCPServerStatus.ERROR
+    await hub.aclose()
+
+
+@sync_async_test
+async def test_invoke_many_runs_concurrently_in_order():
+    hub = MCPHub()
+
+    async def slow(params):
+        await asyncio.sleep(0.2)
+        return {"n": params["n"]}
+
+    def blocking(params):
+        time.sleep(0.2)
+        return {"n": params["n"]}
+
+    hub.register_local_handler("slow", slow)
+    hub.register_local_handler("blocking", blocking)
+
+    start = time.perf_counter()
+    results = await hub.invoke_many(
+        [("slow", {"n": 1}), ("blocking", {"n": 2}), ("slow", {"n": 3}), ("missing", {})]
+    )
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert [r.data for r in results[:3]] == [{"n": 1}, {"n": 2}, {"n": 3}]
+    assert results[3].error == "tool_not_found"
+
+
+@sync_async_test
+async def test_idempotent_results_are_cached():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.content)
+        return httpx.Response(200, json={"hits": len(calls)})
+
+    hub = MCPHub(http_transport=httpx.MockTransport(handler), cache_ttl=60)
+    hub.register_server(
+        _server(
+            "cache",
+            tools=[
+                MCPTool(name="lookup", description="", idempotent=True),
+                MCPTool(name="write", description=""),
+            ],
+        )
+    )
+
+    first = await hub.invoke_tool("lookup", {"a": 1, "b": 2})
+    second = await hub.invoke_tool("lookup", {"b": 2, "a": 1})
+    assert first.data == second.data == {"hits": 1}
+    assert second.latency_ms == 0.0
+
+    await hub.invoke_tool("write", {"a": 1})
+    await hub.invoke_tool("write", {"a": 1})
+    assert len(calls) == 3
+
+    hub.clear_cache()
+    third = await hub.invoke_tool("lookup", {"a": 1, "b": 2})
+    assert third.data == {"hits": 4}
+    await hub.aclose()
+
+
+@sync_async_test
+async def test_invoke_many_waits_for_tokens_when_allowed():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True}))
+    hub = MCPHub(http_transport=transport)
+    # 120 rpm -> a new token every 0.5 s after the burst of 120.
+    server = _server("burst", tools=[MCPTool(name="t", description="")], requests_per_minute=120)
+    hub.register_server(server)
+    hub._bucket(server)._tokens = 1.0
+
+    results = await hub.invoke_many([("t", {}), ("t", {})], max_wait=2.0)
+    assert all(r.success for r in results)
+
+    hub._bucket(server)._tokens = 0.0
+    limited = await hub.invoke_many([("t", {})])
+    assert limited[0].error == "rate_limit_exceeded"
+    await hub.aclose()
+
+
+def test_invoke_tool_sync_uses_local_handler():
+    hub = MCPHub()
+    hub.register_local_handler("echo", lambda params: params)
+    result = hub.invoke_tool_sync("echo", {"x": 1})
+    assert result.success is True
+    assert result.server_name == "local"
+    assert result.data == {"x": 1}
+
+    def boom(params):
+        raise ValueError("bad")
+
+    hub.register_local_handler("boom", boom)
+    failed = hub.invoke_tool_sync("boom", {})
+    assert failed.success is False
+    assert failed.error == "bad"
@@ -19,9 +19,16 @@ from jarvis_core.ops.metrics import (
 from jarvis_core.ops.rate_limiter import (
     RateLimitConfig,
     RateLimiter,
+    SharedTokenBucket,
+    pubmed_rate_config,
     with_retry,
 )
+from pathlib import Path
 from tempfile import TemporaryDirectory
+import asyncio
+import subprocess
+import sys
+import time
 import pytest
 
 
@@ -53,6 +60,140 @@ class TestRateLimiter:
         assert delay == 10.0
 
 
+class TestSharedTokenBucket:
+    """プロセス間共有トークンバケットのテスト."""
+
+    def test_reservations_queue_in_order(self):
+        """予約は順番に1/rate秒ずつ後ろへずれること."""
+        with TemporaryDirectory() as tmpdir:
+            bucket = SharedTokenBucket(Path(tmpdir) / "rl.db", "k", rate=10.0, capacity=1)
+            delays = [bucket.reserve() for _ in range(4)]
+            assert delays[0] == 0.0
+            for prev, cur in zip(delays, delays[1:]):
+                assert cur == pytest.approx(prev + 0.1, abs=0.02)
+
+    def test_max_wait_rejects_without_consuming(self):
+        """max_waitを超える予約は拒否され、トークンを消費しないこと."""
+        with TemporaryDirectory() as tmpdir:
+            bucket = SharedTokenBucket(Path(tmpdir) / "rl.db", "k", rate=1.0, capacity=1)
+            assert bucket.reserve() == 0.0
+            assert bucket.reserve(max_wait=0.1) is None
+            assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+            stats = bucket.stats()
+            assert stats["acquired"] == 2
+            assert stats["rejected"] == 1
+            assert stats["wait_max_sec"] == pytest.approx(1.0, abs=0.05)
+
+    def test_keys_are_independent(self):
+        """キーごとに別のバケットになること."""
+        with TemporaryDirectory() as tmpdir:
+            db = Path(tmpdir) / "rl.db"
+            a = SharedTokenBucket(db, "pubmed", rate=1.0)
+            b = SharedTokenBucket(db, "s2", rate=1.0)
+            assert a.reserve() == 0.0
+            assert b.reserve() == 0.0
+
+    def test_async_acquire(self):
+        """非同期でも上限レートで取得できること."""
+        with TemporaryDirectory() as tmpdir:
+            bucket = SharedTokenBucket(Path(tmpdir) / "rl.db", "k", rate=20.0, capacity=1)
+
+            async def main():
+                await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+
+            started = time.monotonic()
+            asyncio.run(main())
+            assert time.monotonic() - started >= 0.18
+
+    def test_shared_across_processes(self):
+        """複数プロセスの合計が上限レートに収まること."""
+        with TemporaryDirectory() as tmpdir:
+            db = str(Path(tmpdir) / "rl.db")
+            SharedTokenBucket(db, "k", rate=20.0, capacity=1)
+            code = (
+                "import sys\n"
+                "from jarvis_core.ops.rate_limiter import SharedTokenBucket\n"
+                "b = SharedTokenBucket(sys.argv[1], 'k', rate=20.0, capacity=1)\n"
+                "for _ in range(5):\n"
+                "    b.acquire()\n"
+            )
+            root = Path(__file__).resolve().parents[1]
+            started = time.monotonic()
+            procs = [subprocess.Popen([sys.executable, "-c", code, db], cwd=root) for _ in range(3)]
+            assert all(p.wait(timeout=60) == 0 for p in procs)
+            elapsed = time.monotonic() - started
+            # 15回 / 20 req/s: 最初の1回を除き0.05秒間隔
+            assert elapsed >= 14 / 20.0
+            assert SharedTokenBucket(db, "k", rate=20.0).stats()["acquired"] == 15
+
+    def test_rate_limiter_uses_shared_backend(self):
+        """shared_db_pathを設定するとRateLimiterが共有バケットを使うこと."""
+        with TemporaryDirectory() as tmpdir:
+            config = RateLimitConfig(
+                requests_per_second=20.0,
+                burst_limit=1,
+                shared_db_path=str(Path(tmpdir) / "rl.db"),
+                shared_key="pubmed",
+            )
+            first, second = RateLimiter(config), RateLimiter(config)
+            first.wait_if_needed()
+            second.wait_if_needed()
+            stats = second.get_wait_stats()
+            assert stats["requests"] == 1
+            assert stats["shared"]["acquired"] == 2
+            assert stats["wait_max_sec"] > 0
+
+    def test_reserve_uses_rate_registered_in_db(self):
+        """同じキーを開いた全インスタンスがDBの行のレートに従うこと."""
+        with TemporaryDirectory() as tmpdir:
+            db = Path(tmpdir) / "rl.db"
+            slow = SharedTokenBucket(db, "k", rate=1.0, capacity=1)
+            SharedTokenBucket(db, "k", rate=20.0, capacity=1)
+            assert slow.reserve() == 0.0
+            assert slow.reserve() == pytest.approx(0.05, abs=0.02)
+            assert slow.stats()["rate"] == 20.0
+
+    def test_unkeyed_config_is_not_shared(self):
+        """shared_keyを指定しない設定はバケットを共有しないこと."""
+        with TemporaryDirectory() as tmpdir:
+            config = RateLimitConfig(shared_db_path=str(Path(tmpdir) / "rl.db"))
+            assert RateLimiter(config).shared is None
+
+    def test_pubmed_callers_share_one_rate(self, monkeypatch):
+        """PubMedClientとPubMed用RateLimiterが同じレートを登録すること."""
+        from jarvis_core.sources.pubmed_client import PubMedClient
+
+        with TemporaryDirectory() as tmpdir:
+            monkeypatch.setenv("JARVIS_RATE_LIMIT_DB", str(Path(tmpdir) / "rl.db"))
+            monkeypatch.delenv("NCBI_API_KEY", raising=False)
+            limiter = RateLimiter(pubmed_rate_config())
+            client = PubMedClient()
+            assert client._shared_bucket is limiter.shared
+            assert limiter.shared.stats()["rate"] == 3.0
+
+            keyed = PubMedClient(api_key="key")
+            assert keyed._shared_bucket.stats()["rate"] == 10.0
+
+    def test_pubmed_explicit_rate_limit_applies_in_shared_mode(self, monkeypatch):
+        """共有モードでも明示的なrate_limitがクライアント単位で守られること."""
+        from jarvis_core.sources import pubmed_client
+        from jarvis_core.sources.pubmed_client import PubMedClient
+
+        with TemporaryDirectory() as tmpdir:
+            monkeypatch.setenv("JARVIS_RATE_LIMIT_DB", str(Path(tmpdir) / "rl.db"))
+            monkeypatch.delenv("NCBI_API_KEY", raising=False)
+            sleeps: list[float] = []
+            monkeypatch.setattr(pubmed_client.time, "sleep", sleeps.append)
+
+            client = PubMedClient(rate_limit=5.0)
+            assert client._shared_bucket is not None
+            client._rate_limit_wait()
+            client._rate_limit_wait()
+            assert sleeps and sleeps[-1] == pytest.approx(5.0, abs=0.1)
+            # 共有バケットのレートは変えない
+            assert client._shared_bucket.stats()["rate"] == 3.0
+
+
 class TestWithRetry:
     """リトライデコレータテスト."""
 
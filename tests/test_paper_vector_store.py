@@ -0,0 +1,140 @@
+"""Tests for the columnar PaperVectorStore."""
+
+import json
+
+import numpy as np
+import pytest
+
+from jarvis_core.paper_vector import (
+    ConceptVector,
+    EmbeddingVector,
+    MetadataVector,
+    PaperVector,
+    filter_by_concept,
+    filter_by_year_and_concept,
+    load_all_vectors,
+    save_many,
+)
+from jarvis_core.paper_vector_store import PaperVectorStore
+
+pytestmark = pytest.mark.core
+
+
+def _pv(pid, year=None, concepts=None, vector=None):
+    return PaperVector(
+        paper_id=pid,
+        source_locator=f"pdf:{pid}.pdf",
+        metadata=MetadataVector(year=year),
+        concept=ConceptVector(concepts=concepts or {}),
+        embedding=EmbeddingVector(model="test", vector=vector) if vector else None,
+    )
+
+
+def _papers():
+    return [
+        _pv("p1", 2020, {"CD73": 0.9}, [1.0, 0.0, 0.0]),
+        _pv("p2", 2022, {"PD-1": 0.8, "CD73": 0.3}, [0.9, 0.1, 0.0]),
+        _pv("p3", 2024, {"PD-1": 0.5}, [0.0, 1.0, 0.0]),
+        _pv("p4", None, {"CD73": 0.5}),
+    ]
+
+
+class TestPaperVectorStore:
+    def test_batched_writes_and_lookup(self, tmp_path):
+        store = PaperVectorStore(tmp_path, batch_size=3)
+        for pv in _papers()[:2]:
+            store.add(pv)
+        assert not (tmp_path / "embeddings.f32").exists()
+        assert "p1" in store
+        assert store.get("p2").metadata.year == 2022
+
+        store.add(_papers()[2])  # reaches batch_size -> flush
+        assert (tmp_path / "embeddings.f32").exists()
+        store.add(_papers()[3])
+        assert len(store) == 4
+        assert store.paper_ids() == ["p1", "p2", "p3", "p4"]
+        store.close()
+
+    def test_year_and_concept_indexes(self, tmp_path):
+        with PaperVectorStore(tmp_path) as store:
+            store.add_many(_papers())
+            assert [p.paper_id for p in store.filter_by_year(min_year=2021)] == ["p2", "p3"]
+            assert [p.paper_id for p in store.filter_by_year(max_year=2022)] == ["p1", "p2"]
+            assert [p.paper_id for p in filter_by_concept(store, "CD73")] == ["p1", "p4", "p2"]
+            result = filter_by_year_and_concept(store, "CD73", min_year=2021)
+            assert [p.paper_id for p in result] == ["p2"]
+
+    def test_upsert_replaces_row_and_concepts(self, tmp_path):
+        with PaperVectorStore(tmp_path) as store:
+            store.add_many(_papers())
+            store.add_many([_pv("p1", 2021, {"PD-1": 0.7}, [0.0, 0.0, 1.0])])
+            assert len(store) == 4
+            assert [p.paper_id for p in store.filter_by_concept("CD73")] == ["p4", "p2"]
+            assert store.embedding_matrix()[0].tolist() == [0.0, 0.0, 1.0]
+
+    def test_resave_without_embedding_clears_old_vector(self, tmp_path):
+        with PaperVectorStore(tmp_path) as store:
+            store.add_many(_papers())
+            store.add_many([_pv("p1", 2020), _pv("p2", 2022, vector=[1.0, 0.0])])
+            assert not store.embedding_matrix()[0].any()
+            assert not store.embedding_matrix()[1].any()  # wrong dimension
+            hits = store.similar([1.0, 0.0, 0.0], k=5)
+            assert [p.paper_id for p, _ in hits] == ["p3"]
+
+    def test_similarity_over_matrix(self, tmp_path):
+        with PaperVectorStore(tmp_path) as store:
+            store.add_many(_papers())
+            matrix = store.embedding_matrix()
+            assert matrix.shape == (4, 3)
+            assert not matrix[3].any()  # p4 has no embedding
+
+            hits = store.similar([1.0, 0.0, 0.0], k=5)
+            assert [p.paper_id for p, _ in hits] == ["p1", "p2", "p3"]
+            assert hits[0][1] == pytest.approx(1.0)
+
+            hits = store.similar(store.get("p1"), k=1)
+            assert hits[0][0].paper_id == "p2"
+
+            hits = store.similar([1.0, 0.0, 0.0], k=5, min_year=2023)
+            assert [p.paper_id for p, _ in hits] == ["p3"]
+            assert store.similar([1.0, 0.0], k=3) == []
+
+    def test_reopen_persists(self, tmp_path):
+        with PaperVectorStore(tmp_path) as store:
+            store.add_many(_papers())
+        reopened = PaperVectorStore(tmp_path)
+        np.testing.assert_allclose(reopened.embedding_matrix()[1], [0.9, 0.1, 0.0], rtol=1e-6)
+        assert reopened.similar([0.0, 1.0, 0.0], k=1)[0][0].paper_id == "p3"
+        reopened.close()
+
+
+class TestJsonInterop:
+    def test_save_many_writes_index_once(self, tmp_path):
+        save_many(_papers(), str(tmp_path))
+        index = json.loads((tmp_path / "index.json").read_text())
+        assert [p["paper_id"] for p in index["papers"]] == ["p1", "p2", "p3", "p4"]
+
+    def test_import_and_load_all_vectors_prefers_store(self, tmp_path):
+        save_many(_papers()[:3], str(tmp_path))
+        with PaperVectorStore(tmp_path) as store:
+            assert store.import_json_dir() == 3
+        _papers()[3].save(str(tmp_path))  # saved after the import
+
+        loaded = load_all_vectors(str(tmp_path))
+        assert sorted(p.paper_id for p in loaded) == ["p1", "p2", "p3", "p4"]
+
+    def test_saves_after_import_write_through_to_store(self, tmp_path):
+        save_many(_papers()[:3], str(tmp_path))
+        with PaperVectorStore(tmp_path) as store:
+            store.import_json_dir()
+
+        _pv("p1", 2024, {"CD39": 0.7}).save(str(tmp_path))
+        save_many([_pv("p2", 2025), _pv("p5", 2021)], str(tmp_path))
+
+        loaded = {p.paper_id: p for p in load_all_vectors(str(tmp_path))}
+        assert loaded["p1"].metadata.year == 2024
+        assert loaded["p1"].concept.concepts == {"CD39": 0.7}
+        assert loaded["p2"].metadata.year == 2025
+        assert sorted(loaded) == ["p1", "p2", "p3", "p5"]
+        with PaperVectorStore(tmp_path) as store:
+            assert [p.paper_id for p in store.filter_by_concept("CD39")] == ["p1"]
@@ -0,0 +1,77 @@
+"""Tests for jarvis_tools.papers.mmr."""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from jarvis_tools.papers.mmr import (
+    MinHasher,
+    jaccard_similarity,
+    mmr_rerank,
+    mmr_rerank_embeddings,
+)
+
+
+def _reference_mmr(candidates, lambda_param, top_k):  # noqa: ANN001, ANN202
+    """Straightforward O(k^2 n) MMR used as the oracle."""
+    selected, remaining = [], list(candidates)
+    while remaining and len(selected) < top_k:
+        best_i, best = -1, float("-inf")
+        for i, (_, score, tokens) in enumerate(remaining):
+            max_sim = max((jaccard_similarity(tokens, s[2]) for s in selected), default=0.0)
+            value = lambda_param * score - (1 - lambda_param) * max_sim
+            if value > best:
+                best_i, best = i, value
+        selected.append(remaining.pop(best_i))
+    return [(idx, score) for idx, score, _ in selected]
+
+
+def test_exact_matches_reference() -> None:
+    rng = random.Random(0)
+    vocab = [f"w{i}" for i in range(200)]
+    for _ in range(20):
+        candidates = [
+            (i, round(rng.random(), 2), set(rng.sample(vocab, rng.randint(0, 15))))
+            for i in range(rng.randint(1, 60))
+        ]
+        for lam in (0.0, 0.5, 1.0):
+            k = rng.randint(1, 12)
+            assert mmr_rerank(set(), candidates, lam, k) == _reference_mmr(candidates, lam, k)
+
+
+def test_diversity_skips_near_duplicate() -> None:
+    candidates = [
+        (0, 1.0, {"cd73", "tumor", "adenosine"}),
+        (1, 0.99, {"cd73", "tumor", "adenosine"}),
+        (2, 0.8, {"macrophage", "cytokine"}),
+    ]
+    assert [i for i, _ in mmr_rerank(set(), candidates, 0.5, 2)] == [0, 2]
+    assert [i for i, _ in mmr_rerank(set(), candidates, 0.5, 2, method="minhash")] == [0, 2]
+    assert [i for i, _ in mmr_rerank(set(), candidates, 1.0, 2)] == [0, 1]
+
+
+def test_minhash_estimates_jaccard() -> None:
+    hasher = MinHasher(num_perm=256)
+    a = {f"t{i}" for i in range(100)}
+    b = {f"t{i}" for i in range(50, 150)}
+    estimate = float((hasher.signature(a) == hasher.signature(b)).mean())
+    assert estimate == pytest.approx(jaccard_similarity(a, b), abs=0.08)
+    assert (hasher.signature(a) == MinHasher(num_perm=256).signature(a)).all()
+
+
+def test_minhash_empty_sets_are_not_similar() -> None:
+    candidates = [(0, 1.0, set()), (1, 0.9, set()), (2, 0.1, {"x"})]
+    result = mmr_rerank(set(), candidates, 0.5, 3, method="minhash")
+    assert [i for i, _ in result] == [0, 1, 2]
+    with pytest.raises(ValueError):
+        mmr_rerank(set(), candidates, method="lsh")
+
+
+def test_embeddings_use_cosine_and_ids() -> None:
+    embeddings = np.array([[1.0, 0.0], [2.0, 0.01], [0.0, 1.0]])
+    result = mmr_rerank_embeddings([1.0, 0.95, 0.6], embeddings, 0.5, 2, ids=[10, 11, 12])
+    assert result == [(10, 1.0), (12, 0.6)]
+    assert mmr_rerank_embeddings([], np.empty((0, 2))) == []
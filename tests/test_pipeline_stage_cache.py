@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from jarvis_core.contracts.types import Artifacts, Claim, EvidenceLink, TaskContext
+from jarvis_core.pipelines.artifact_cache import StageArtifactCache, compute_stage_key
+from jarvis_core.pipelines.executor import PipelineConfig, PipelineExecutor
+
+
+class _NullLogger:
+    def step_start(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        pass
+
+    def step_end(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        pass
+
+    def error(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        pass
+
+    def progress(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
+        pass
+
+
+class _DeclaringRegistry:
+    def __init__(self) -> None:
+        self.handlers: dict[str, object] = {}
+        self.metadata: dict[str, dict] = {}
+
+    def add(self, name, handler, inputs=None, outputs=None, cacheable=True) -> None:  # noqa: ANN001
+        self.handlers[name] = handler
+        self.metadata[name] = {
+            "inputs": tuple(inputs) if inputs is not None else None,
+            "outputs": tuple(outputs) if outputs is not None else None,
+            "cacheable": cacheable,
+        }
+
+    def validate_pipeline(self, stages: list[str]) -> None:
+        pass
+
+    def get(self, name: str):
+        return self.handlers[name]
+
+    def get_metadata(self, name: str) -> dict:
+        return self.metadata.get(name, {})
+
+
+def _log_claim(name: str) -> Claim:
+    return Claim(
+        claim_id=f"c-{name}",
+        claim_text=name,
+        evidence=[
+            EvidenceLink(
+                doc_id="internal", section=name, chunk_id="log", start=0, end=1, confidence=1.0
+            )
+        ],
+        claim_type="log",
+    )
+
+
+@pytest.fixture
+def registry(monkeypatch: pytest.MonkeyPatch) -> _DeclaringRegistry:
+    reg = _DeclaringRegistry()
+    cache_events: list[tuple[str, bool]] = []
+    reg.cache_events = cache_events
+    monkeypatch.setattr("jarvis_core.pipelines.executor.get_stage_registry", lambda: reg)
+    monkeypatch.setattr("jarvis_core.pipelines.executor.get_logger", lambda **kw: _NullLogger())
+    monkeypatch.setattr(
+        "jarvis_core.pipelines.executor.metrics.record_run_start", lambda **kw: None
+    )
+    monkeypatch.setattr("jarvis_core.pipelines.executor.metrics.record_run_end", lambda **kw: None)
+    monkeypatch.setattr(
+        "jarvis_core.pipelines.executor.metrics.record_step_duration", lambda *a, **kw: None
+    )
+    monkeypatch.setattr(
+        "jarvis_core.pipelines.executor.metrics.record_stage_cache",
+        lambda run_id, step, hit: cache_events.append((step, hit)),
+    )
+    return reg
+
+
+def _executor(stages: list[str], tmp_path: Path, **policies) -> PipelineExecutor:  # noqa: ANN003
+    cfg = PipelineConfig.from_dict(
+        {
+            "pipeline": "cache-test",
+            "stages": stages,
+            "policies": {"cache_dir": str(tmp_path / "cache"), **policies},
+        }
+    )
+    lyra = SimpleNamespace(supervise=lambda *a, **kw: SimpleNamespace(task_id="lyra"))
+    return PipelineExecutor(config=cfg, lyra=lyra)
+
+
+def _build_search_pipeline(registry: _DeclaringRegistry, calls: dict[str, int]) -> list[str]:
+    def expand(context, artifacts):  # noqa: ANN001
+        calls["expand"] += 1
+        artifacts.metadata["expanded"] = [context.goal, context.goal.upper()]
+        artifacts.add_claim(_log_claim("expand"))
+        return artifacts
+
+    def search(context, artifacts):  # noqa: ANN001
+        calls["search"] += 1
+        artifacts.metadata["hits"] = [f"{context.goal}-1", f"{context.goal}-2"]
+        artifacts.add_claim(_log_claim("search"))
+        return artifacts
+
+    def rank(context, artifacts):  # noqa: ANN001
+        calls["rank"] += 1
+        artifacts.metadata["ranked"] = sorted(artifacts.metadata["hits"], reverse=True)
+        artifacts.add_claim(_log_claim("rank"))
+        return {"top": artifacts.metadata["ranked"][0]}
+
+    registry.add("expand", expand, ["context.goal"], ["metadata.expanded", "claims"])
+    registry.add("search", search, ["context.goal"], ["metadata.hits", "claims"])
+    registry.add("rank", rank, ["metadata.hits"], ["metadata.ranked", "claims"])
+    return ["expand", "search", "rank"]
+
+
+def test_independent_stages_run_concurrently(registry: _DeclaringRegistry, tmp_path: Path) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def make(name: str):  # noqa: ANN202
+        def handler(context, artifacts):  # noqa: ANN001
+            barrier.wait()  # both stages must be in flight at once
+            artifacts.metadata[name] = True
+            artifacts.add_claim(_log_claim(name))
+            return artifacts
+
+        return handler
+
+    registry.add("a", make("a"), ["context.goal"], ["metadata.a", "claims"])
+    registry.add("b", make("b"), ["context.goal"], ["metadata.b", "claims"])
+
+    artifacts = Artifacts()
+    result = _executor(["a", "b"], tmp_path, cache="none").run(
+        TaskContext(goal="g", run_id="r"), artifacts
+    )
+
+    assert result.success is True
+    assert artifacts.metadata == {"a": True, "b": True}
+    assert [c.claim_id for c in artifacts.claims] == ["c-a", "c-b"]
+
+
+def test_dependent_stage_sees_upstream_outputs_and_second_run_hits_cache(
+    registry: _DeclaringRegistry, tmp_path: Path
+) -> None:
+    calls = {"expand": 0, "search": 0, "rank": 0}
+    stages = _build_search_pipeline(registry, calls)
+
+    first = Artifacts()
+    exe = _executor(stages, tmp_path)
+    result = exe.run(TaskContext(goal="q", run_id="r1"), first)
+    assert result.success is True
+    assert result.outputs["top"] == "q-2"
+    assert first.metadata["ranked"] == ["q-2", "q-1"]
+    assert [c.claim_id for c in first.claims] == ["c-expand", "c-search", "c-rank"]
+    assert result.metrics.cache_misses == 3
+    assert result.metrics.cache_hits == 0
+
+    second = Artifacts()
+    exe = _executor(stages, tmp_path)
+    rerun = exe.run(TaskContext(goal="q", run_id="r2"), second)
+    assert calls == {"expand": 1, "search": 1, "rank": 1}
+    assert rerun.outputs["top"] == "q-2"
+    assert second.metadata == first.metadata
+    assert [c.claim_id for c in second.claims] == ["c-expand", "c-search", "c-rank"]
+    assert rerun.metrics.cache_hits == 3
+    assert all(r.cached for r in exe.results)
+    assert exe.get_summary()["cache_hits"] == 3
+    assert sorted(registry.cache_events[-3:]) == [
+        ("expand", True),
+        ("rank", True),
+        ("search", True),
+    ]
+
+    exe = _executor(stages, tmp_path)
+    exe.run(TaskContext(goal="other", run_id="r3"), Artifacts())
+    assert calls == {"expand": 2, "search": 2, "rank": 2}
+
+
+def test_cache_policy_none_disables_cache(registry: _DeclaringRegistry, tmp_path: Path) -> None:
+    calls = {"expand": 0, "search": 0, "rank": 0}
+    stages = _build_search_pipeline(registry, calls)
+    for _ in range(2):
+        exe = _executor(stages, tmp_path, cache="none")
+        assert exe.cache is None
+        exe.run(TaskContext(goal="q", run_id="r"), Artifacts())
+    assert calls == {"expand": 2, "search": 2, "rank": 2}
+    assert registry.cache_events == []
+    assert not (tmp_path / "cache").exists()
+
+
+def test_undeclared_stage_is_a_sequential_barrier(
+    registry: _DeclaringRegistry, tmp_path: Path
+) -> None:
+    order: list[str] = []
+
+    def declared(name: str):  # noqa: ANN202
+        def handler(context, artifacts):  # noqa: ANN001
+            order.append(name)
+            artifacts.metadata[name] = len(artifacts.metadata)
+            artifacts.add_claim(_log_claim(name))
+            return artifacts
+
+        return handler
+
+    def legacy(context, artifacts):  # noqa: ANN001
+        order.append("legacy")
+        artifacts.metadata["legacy_saw"] = sorted(artifacts.metadata)
+        artifacts.add_claim(_log_claim("legacy"))
+        return artifacts
+
+    registry.add("first", declared("first"), ["context.goal"], ["metadata.first"])
+    registry.add("legacy", legacy)
+    registry.add("last", declared("last"), ["context.goal"], ["metadata.last"])
+
+    artifacts = Artifacts()
+    result = _executor(["first", "legacy", "last"], tmp_path).run(
+        TaskContext(goal="g", run_id="r"), artifacts
+    )
+
+    assert result.success is True
+    assert order == ["first", "legacy", "last"]
+    assert artifacts.metadata["legacy_saw"] == ["first"]
+    assert [c.claim_id for c in artifacts.claims] == ["c-first", "c-legacy", "c-last"]
+
+
+def test_failed_declared_stage_stops_dependents(
+    registry: _DeclaringRegistry, tmp_path: Path
+) -> None:
+    calls = {"after": 0}
+
+    def boom(context, artifacts):  # noqa: ANN001
+        artifacts.metadata["partial"] = True
+        raise RuntimeError("boom")
+
+    def after(context, artifacts):  # noqa: ANN001
+        calls["after"] += 1
+        return artifacts
+
+    registry.add("boom", boom, ["context.goal"], ["metadata.partial"])
+    registry.add("after", after, ["metadata.partial"], ["metadata.after"])
+
+    artifacts = Artifacts()
+    result = _executor(["boom", "after"], tmp_path, provenance_required=False).run(
+        TaskContext(goal="g", run_id="r"), artifacts
+    )
+
+    assert result.success is False
+    assert "Stage boom failed" in (result.error or "")
+    assert calls["after"] == 0
+    assert "partial" not in artifacts.metadata
+    assert not any((tmp_path / "cache").rglob("*.pkl"))
+
+
+def test_stage_key_depends_on_inputs_and_code(tmp_path: Path) -> None:
+    def handler_a(context, artifacts):  # noqa: ANN001
+        return 1
+
+    def handler_b(context, artifacts):  # noqa: ANN001
+        return 2
+
+    key = compute_stage_key("s", handler_a, {"context.goal": "q"})
+    assert key == compute_stage_key("s", handler_a, {"context.goal": "q"})
+    assert key != compute_stage_key("s", handler_a, {"context.goal": "other"})
+    assert key != compute_stage_key("s", handler_b, {"context.goal": "q"})
+    assert key != compute_stage_key("t", handler_a, {"context.goal": "q"})
+
+    cache = StageArtifactCache(tmp_path)
+    assert cache.get(key) is None
+    assert cache.put(key, {"value": [1, 2]}) is True
+    assert key in cache
+    assert cache.get(key) == {"value": [1, 2]}
+
+    cache.path_for(key).write_bytes(b"corrupt")
+    assert cache.get(key) is None
+
+    read_only = StageArtifactCache(tmp_path / "ro", read_only=True)
+    assert read_only.put(key, 1) is False
+    assert read_only.get(key) is None
+
+
+def test_degraded_stage_output_is_not_cached(registry: _DeclaringRegistry, tmp_path: Path) -> None:
+    calls = {"search": 0}
+    outage = {"down": True}
+
+    def search(context, artifacts):  # noqa: ANN001
+        calls["search"] += 1
+        if outage["down"]:
+            artifacts.metadata["bm25_results"] = []
+            artifacts.metadata["search_error"] = "pubmed down"
+        else:
+            artifacts.metadata["bm25_results"] = ["pmid:1"]
+        artifacts.add_claim(_log_claim("search"))
+        return artifacts
+
+    registry.add(
+        "search",
+        search,
+        ["context.goal"],
+        ["metadata.bm25_results", "metadata.search_error", "claims"],
+    )
+
+    for run_id in ("r1", "r2"):
+        exe = _executor(["search"], tmp_path)
+        exe.run(TaskContext(goal="q", run_id=run_id), Artifacts())
+        assert not exe.results[0].cached
+    assert calls["search"] == 2
+    assert not any((tmp_path / "cache").rglob("*.pkl"))
+
+    outage["down"] = False
+    healthy = Artifacts()
+    _executor(["search"], tmp_path).run(TaskContext(goal="q", run_id="r3"), healthy)
+    assert "search_error" not in healthy.metadata
+
+    replay = Artifacts()
+    exe = _executor(["search"], tmp_path)
+    exe.run(TaskContext(goal="q", run_id="r4"), replay)
+    assert exe.results[0].cached
+    assert calls["search"] == 3
+    assert replay.metadata["bm25_results"] == ["pmid:1"]
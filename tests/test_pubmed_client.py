@@ -6,6 +6,8 @@ Comprehensive test suite for PubMed client functionality.
 
 from unittest.mock import Mock, patch
 
+import pytest
+
 
 class TestPubMedArticle:
     """Tests for PubMedArticle dataclass."""
@@ -70,7 +72,7 @@ class TestPubMedClient:
 
         assert client.api_key is None
         assert client.tool_name == "jarvis-research-os"
-        assert client.rate_limit == 0.34
+        assert client.rate_limit == pytest.approx(1 / 3)
 
     def test_initialization_with_api_key(self):
         """Test with API key."""
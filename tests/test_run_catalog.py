@@ -0,0 +1,132 @@
+"""Tests for the SQLite run catalog behind /api/runs."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from jarvis_web.run_catalog import RunCatalog
+
+
+def _make_run(root: Path, run_id: str, status: str, goal: str, created_at: str) -> Path:
+    run_dir = root / run_id
+    run_dir.mkdir(parents=True)
+    (run_dir / "result.json").write_text(json.dumps({"status": status}), encoding="utf-8")
+    (run_dir / "input.json").write_text(json.dumps({"goal": goal}), encoding="utf-8")
+    (run_dir / "meta.json").write_text(json.dumps({"created_at": created_at}), encoding="utf-8")
+    return run_dir
+
+
+def _summary(run_dir: Path) -> dict:
+    result = json.loads((run_dir / "result.json").read_text(encoding="utf-8"))
+    meta = json.loads((run_dir / "meta.json").read_text(encoding="utf-8"))
+    return {
+        "run_id": run_dir.name,
+        "status": result["status"],
+        "created_at": meta["created_at"],
+        "updated_at": meta["created_at"],
+    }
+
+
+def _catalog(tmp_path: Path, calls: list[str]) -> RunCatalog:
+    def build(run_dir: Path) -> dict:
+        calls.append(run_dir.name)
+        return _summary(run_dir)
+
+    return RunCatalog(
+        tmp_path / "catalog.sqlite",
+        roots=[tmp_path / "legacy", tmp_path / "runs"],
+        build_summary=build,
+        max_age=3600,
+    )
+
+
+def test_reconcile_only_reparses_changed_runs(tmp_path: Path) -> None:
+    runs = tmp_path / "runs"
+    _make_run(runs, "a", "success", "CD73 survey", "2026-01-01T00:00:00+00:00")
+    run_b = _make_run(runs, "b", "failed", "PD-1 review", "2026-01-02T00:00:00+00:00")
+    calls: list[str] = []
+    catalog = _catalog(tmp_path, calls)
+
+    assert catalog.reconcile() == {"added": 2, "updated": 0, "removed": 0, "total": 2}
+    assert catalog.reconcile()["updated"] == 0
+    assert sorted(calls) == ["a", "b"]
+
+    result = run_b / "result.json"
+    result.write_text(json.dumps({"status": "success"}), encoding="utf-8")
+    stat = result.stat()
+    os.utime(result, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert catalog.reconcile()["updated"] == 1
+    assert calls[-1] == "b"
+
+    (run_b / "result.json").unlink()
+    (run_b / "input.json").unlink()
+    (run_b / "meta.json").unlink()
+    run_b.rmdir()
+    assert catalog.reconcile()["removed"] == 1
+
+
+def test_query_paginates_sorts_and_filters(tmp_path: Path) -> None:
+    runs = tmp_path / "runs"
+    for i in range(5):
+        status = "success" if i % 2 == 0 else "failed"
+        _make_run(runs, f"run-{i}", status, f"goal {i}", f"2026-01-0{i + 1}T00:00:00+00:00")
+    catalog = _catalog(tmp_path, [])
+    catalog.reconcile()
+
+    page, total = catalog.query(limit=2, offset=0, sort="created_at", order="desc")
+    assert total == 5
+    assert [r["run_id"] for r in page] == ["run-4", "run-3"]
+    page, _ = catalog.query(limit=2, offset=2, sort="created_at", order="desc")
+    assert [r["run_id"] for r in page] == ["run-2", "run-1"]
+
+    page, total = catalog.query(status="failed", sort="created_at", order="asc")
+    assert total == 2
+    assert [r["run_id"] for r in page] == ["run-1", "run-3"]
+
+    page, total = catalog.query(since="2026-01-03", until="2026-01-04T23:59:59")
+    assert total == 2
+    page, total = catalog.query(goal="GOAL 4")
+    assert [r["run_id"] for r in page] == ["run-4"]
+
+
+def test_maybe_reconcile_picks_up_new_runs(tmp_path: Path) -> None:
+    runs = tmp_path / "runs"
+    _make_run(runs, "a", "success", "", "2026-01-01T00:00:00+00:00")
+    catalog = _catalog(tmp_path, [])
+    assert catalog.maybe_reconcile() is True
+    assert catalog.maybe_reconcile() is False
+
+    _make_run(runs, "b", "success", "", "2026-01-02T00:00:00+00:00")
+    stat = runs.stat()
+    os.utime(runs, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert catalog.maybe_reconcile() is True
+    assert catalog.query()[1] == 2
+
+
+def test_stale_catalog_refreshes_in_background(tmp_path: Path) -> None:
+    runs = tmp_path / "runs"
+    _make_run(runs, "a", "success", "", "2026-01-01T00:00:00+00:00")
+    calls: list[str] = []
+    catalog = _catalog(tmp_path, calls)
+    assert catalog.maybe_reconcile() is True
+
+    catalog.max_age = 0.0
+    catalog._last_reconcile = 0.0
+    (runs / "a" / "result.json").write_text(json.dumps({"status": "failed"}), encoding="utf-8")
+    stat = (runs / "a" / "result.json").stat()
+    os.utime(runs / "a" / "result.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert catalog.maybe_reconcile() is False
+    assert catalog._refresh_thread is not None
+    catalog._refresh_thread.join(timeout=10)
+    assert calls == ["a", "a"]
+    assert catalog.query(status="failed")[1] == 1
+
+
+def test_catalog_database_inside_root_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        RunCatalog(tmp_path / "runs" / ".catalog.sqlite", [tmp_path / "runs"], _summary)
@@ -0,0 +1,72 @@
+"""Tests for the in-process run event bus."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from jarvis_core.obs.event_bus import RunEventBus, read_events
+
+
+def _event(name: str, step: str = "s", **data) -> dict:
+    return {"event": name, "step": step, "data": data}
+
+
+def test_seq_matches_line_index_and_resume(tmp_path: Path) -> None:
+    source = tmp_path / "events.jsonl"
+    source.write_text(json.dumps(_event("info")) + "\n", encoding="utf-8")
+    bus = RunEventBus()
+
+    assert bus.append("r1", source, _event("step_start")) == 1
+    assert bus.append("r1", source, _event("step_end")) == 2
+
+    sub, backlog = bus.subscribe("r1", source=source, since=1)
+    assert [r["seq"] for r in backlog] == [1, 2]
+    bus.append("r1", source, _event("info"))
+    assert [r["seq"] for r in sub.get(timeout=1)] == [3]
+    assert [r["seq"] for r in read_events(source)] == [0, 1, 2, 3]
+
+    sub.close()
+    assert bus.subscriber_count("r1") == 0
+
+
+def test_progress_ticks_are_coalesced_and_buffer_is_bounded(tmp_path: Path) -> None:
+    source = tmp_path / "events.jsonl"
+    bus = RunEventBus()
+    sub, _ = bus.subscribe("r1", source=source, maxsize=3)
+
+    for percent in range(10):
+        bus.append("r1", source, _event("progress", step="Pipeline", percent=percent))
+    items = sub.drain()
+    assert len(items) == 1
+    assert items[0]["data"]["data"]["percent"] == 9
+
+    bus.append("r1", source, _event("progress", step="a"))
+    bus.append("r1", source, _event("step_start", step="b"))
+    bus.append("r1", source, _event("step_end", step="b"))
+    bus.append("r1", source, _event("step_start", step="c"))
+    items = sub.drain()
+    assert [r["event"] for r in items] == ["step_start", "step_end", "step_start"]
+    assert sub.dropped >= 10
+
+
+def test_concurrent_appends_keep_file_and_seq_consistent(tmp_path: Path) -> None:
+    source = tmp_path / "events.jsonl"
+    bus = RunEventBus()
+    sub, _ = bus.subscribe("r1", source=source, maxsize=10_000)
+
+    def writer(worker: int) -> None:
+        for i in range(50):
+            bus.append("r1", source, _event("info", worker=worker, i=i))
+
+    threads = [threading.Thread(target=writer, args=(w,)) for w in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    received = sub.drain()
+    assert [r["seq"] for r in received] == list(range(200))
+    on_disk = list(read_events(source))
+    assert [r["data"] for r in on_disk] == [r["data"] for r in received]
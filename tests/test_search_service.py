@@ -0,0 +1,102 @@
+"""Tests for the process-wide hybrid search service."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from jarvis_core.retrieval.indexer import RetrievalIndexer
+from jarvis_core.retrieval.search_service import (
+    SearchService,
+    get_search_service,
+    reset_search_services,
+)
+
+FIXTURES = Path("tests/retrieval/fixtures")
+
+
+@pytest.fixture()
+def index_env(tmp_path):
+    kb_dir = tmp_path / "kb"
+    runs_dir = tmp_path / "runs"
+    shutil.copytree(FIXTURES / "kb", kb_dir)
+    shutil.copytree(FIXTURES / "runs", runs_dir)
+    index_dir = tmp_path / "index"
+    indexer = RetrievalIndexer(
+        index_dir=index_dir,
+        kb_dir=kb_dir,
+        runs_dir=runs_dir,
+        legacy_runs_dir=tmp_path / "legacy",
+    )
+    indexer.rebuild()
+    return indexer
+
+
+def _bump_manifest(index_dir: Path) -> None:
+    manifest = index_dir / "manifest.json"
+    stat = manifest.stat()
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_engine_is_shared_between_calls(index_env):
+    service = SearchService(index_env.index_dir, poll_interval=0)
+    first = service.engine
+    assert first.chunk_map
+    assert service.engine is first
+    assert service.reloads == 1
+
+
+def test_generation_change_swaps_snapshot_in_background(index_env):
+    service = SearchService(index_env.index_dir, poll_interval=0)
+    old = service.snapshot()
+    _bump_manifest(index_env.index_dir)
+
+    # The stale snapshot is still served while the reload runs.
+    assert service.snapshot() is old
+    service.wait(timeout=10)
+    new = service.snapshot()
+    assert new is not old
+    assert new.generation == service.generation()
+    assert service.reloads == 2
+
+
+def test_missing_manifest_keeps_last_snapshot(index_env):
+    service = SearchService(index_env.index_dir, poll_interval=0)
+    old = service.snapshot()
+    (index_env.index_dir / "manifest.json").unlink()
+    assert service.snapshot() is old
+    service.wait(timeout=10)
+    assert service.reloads == 1
+
+
+def test_registry_returns_one_service_per_directory(index_env):
+    reset_search_services()
+    try:
+        service = get_search_service(index_env.index_dir)
+        assert get_search_service(str(index_env.index_dir)) is service
+    finally:
+        reset_search_services()
+
+
+def test_search_v2_route_uses_shared_engine(index_env, monkeypatch):
+    try:
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+    except Exception:
+        pytest.skip("FastAPI not available")
+
+    from jarvis_web.routes import search_v2
+
+    service = SearchService(index_env.index_dir, poll_interval=60)
+    monkeypatch.setattr(search_v2, "get_search_service", lambda: service)
+    app = FastAPI()
+    app.include_router(search_v2.router)
+    client = TestClient(app)
+
+    payload = {"query": "CD73 adenosine", "mode": "hybrid", "top_k": 5}
+    for _ in range(3):
+        response = client.post("/api/search/v2", json=payload)
+        assert response.status_code == 200
+        assert "results" in response.json()
+    assert service.reloads == 1
@@ -150,3 +150,62 @@ def test_estimate_recall_and_predictions_paths(monkeypatch: pytest.MonkeyPatch)
     preds = engine.get_predictions()
     assert recall > 0
     assert preds
+
+
+def _separable(n: int = 40) -> tuple[dict[str, list[float]], dict[str, int]]:
+    instances = {f"id{i}": [float(i), float(i % 2)] for i in range(n)}
+    seeds = {"id0": 0, "id1": 0, "id2": 0, f"id{n - 1}": 1, f"id{n - 2}": 1, f"id{n - 3}": 1}
+    return instances, seeds
+
+
+def test_batch_uncertainty_sampling_uses_single_predict_call() -> None:
+    engine = ActiveLearningEngine(ALConfig(initial_samples=2, batch_size=2))
+    instances, seeds = _separable()
+    engine.initialize(instances, seed_labels=seeds)
+    engine._train_model()
+
+    calls: list[int] = []
+    model = engine._model
+    original = model.predict_proba
+
+    def _counting(X: Any) -> Any:
+        calls.append(len(X))
+        return original(X)
+
+    model.predict_proba = _counting
+    picked = engine._uncertainty_sampling(5)
+
+    assert len(calls) == 1
+    assert calls[0] == len(instances) - len(seeds)
+    assert len(picked) == 5
+    assert not set(picked) & set(seeds)
+    # Most uncertain rows sit near the decision boundary in the middle
+    assert all(5 < int(p[2:]) < 35 for p in picked)
+
+
+def test_update_clears_labeled_mask_and_predictions() -> None:
+    engine = ActiveLearningEngine(ALConfig(initial_samples=2, batch_size=1))
+    instances, seeds = _separable(10)
+    engine.initialize(instances, seed_labels=seeds)
+    engine.update("id4", 0)
+
+    preds = engine.get_predictions()
+    assert "id4" not in preds
+    assert len(preds) == 10 - len(seeds) - 1
+    assert engine._labeled_mask.sum() == len(seeds) + 1
+
+
+def test_incremental_training_uses_partial_fit() -> None:
+    engine = ActiveLearningEngine(ALConfig(initial_samples=2, batch_size=1, incremental=True))
+    instances, seeds = _separable()
+    engine.initialize(instances, seed_labels=seeds)
+    engine._train_model()
+
+    from sklearn.linear_model import SGDClassifier
+
+    model = engine._model
+    assert isinstance(model, SGDClassifier)
+    engine.update("id10", 0)
+    assert engine._model is model
+    assert engine._pending_rows == []
+    assert len(engine.get_next_query(3)) == 3
@@ -230,3 +230,114 @@ def test_run_api_and_ui_provider_paths(monkeypatch: pytest.MonkeyPatch, tmp_path
     assert display["run_id"] == "run-1"
     assert display["bundle_complete"] is True
     assert ui.get_run_display("missing")["error"] == "Run not found"
+
+
+def test_bm25_index_incremental_add_remove_and_merge() -> None:
+    bm25 = search_engine_module.BM25Index(segment_size=2, max_segments=2, merge_factor=2)
+    docs = [{"text": f"alpha doc{i}"} for i in range(7)] + [{"text": "beta only"}]
+    bm25.add_documents(docs)
+    assert len(bm25.segments) <= 2
+    assert bm25.num_docs == 8
+    assert {idx for idx, _ in bm25.search("alpha", top_k=10)} == set(range(7))
+    assert bm25.search("missing") == []
+
+    assert bm25.remove_documents([0, 3, 3]) == 2
+    assert bm25.doc_freqs["alpha"] == 5
+    hits = {idx for idx, _ in bm25.search("alpha", top_k=10)}
+    assert hits == {1, 2, 4, 5, 6}
+
+    bm25.merge_segments()
+    assert len(bm25.segments) == 1
+    assert bm25.segments[0].num_docs == 6
+    assert {idx for idx, _ in bm25.search("alpha", top_k=10)} == hits
+
+
+def test_bm25_index_compacts_segment_past_tombstone_ratio() -> None:
+    bm25 = search_engine_module.BM25Index(segment_size=10, max_segments=8, compact_ratio=0.3)
+    bm25.add_documents([{"text": f"alpha doc{i}"} for i in range(20)])
+    first, second = bm25.segments
+
+    bm25.remove_documents([0, 1, 2])
+    assert bm25.segments[0] is first  # 30% dead: not past the threshold
+
+    bm25.remove_documents([3])
+    assert bm25.segments[0] is not first
+    assert bm25.segments[0].num_docs == 6
+    assert len(bm25.segments[0].postings["alpha"][0]) == 6
+    assert bm25.segments[1] is second
+
+    bm25.remove_documents(list(range(4, 10)))
+    assert bm25.segments == [second]
+    assert {idx for idx, _ in bm25.search("alpha", top_k=20)} == set(range(10, 20))
+
+
+def test_bm25_index_scores_match_reference_formula() -> None:
+    import math
+
+    bm25 = search_engine_module.BM25Index(segment_size=1)
+    texts = ["alpha beta beta", "beta gamma", "alpha alpha delta epsilon"]
+    bm25.add_documents([{"text": t} for t in texts])
+    avg = sum(len(t.split()) for t in texts) / 3
+
+    def reference(doc: str) -> float:
+        tokens = doc.split()
+        total = 0.0
+        for token in ["alpha", "beta"]:
+            tf = tokens.count(token)
+            if not tf:
+                continue
+            df = sum(token in t.split() for t in texts)
+            idf = math.log((3 - df + 0.5) / (df + 0.5) + 1)
+            norm = 1.5 * (1 - 0.75 + 0.75 * len(tokens) / avg)
+            total += idf * tf * 2.5 / (tf + norm)
+        return total
+
+    results = dict(bm25.search("alpha beta", top_k=3))
+    for idx, text in enumerate(texts):
+        assert results[idx] == pytest.approx(reference(text))
+
+
+def test_search_engine_live_updates_and_sync(tmp_path: Path) -> None:
+    chunks_path = tmp_path / "chunks.jsonl"
+    chunks_path.write_text(
+        json.dumps({"chunk_id": "c1", "paper_id": "p1", "text": "alpha result"}) + "\n",
+        encoding="utf-8",
+    )
+    engine = search_engine_module.SearchEngine()
+    assert engine.sync(chunks_path) == 1
+    assert engine.sync(chunks_path) == 0
+
+    with open(chunks_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"chunk_id": "c2", "paper_id": "p2", "text": "gamma alpha"}) + "\n")
+        f.write('{"chunk_id": "c3", "text": "partial')
+    assert engine.sync(chunks_path) == 1
+    assert {r.chunk_id for r in engine.search("alpha").results} == {"c1", "c2"}
+
+    engine.add_chunks([{"chunk_id": "c1", "paper_id": "p1", "text": "replaced gamma"}])
+    assert [r.chunk_id for r in engine.search("alpha").results] == ["c2"]
+    assert engine.remove_chunks(["c2", "unknown"]) == 1
+    assert engine.search("alpha").results == []
+
+    chunks_path.write_text(
+        json.dumps({"chunk_id": "n1", "text": "fresh alpha"}) + "\n", encoding="utf-8"
+    )
+    assert engine.sync(chunks_path) == 1
+    assert [r.chunk_id for r in engine.search("alpha").results] == ["n1"]
+
+
+def test_load_chunks_reads_final_line_without_newline(tmp_path: Path) -> None:
+    chunks_path = tmp_path / "chunks.jsonl"
+    lines = [
+        json.dumps({"chunk_id": f"c{i}", "paper_id": "p", "text": f"term{i} text"})
+        for i in range(3)
+    ]
+    chunks_path.write_text("\n".join(lines), encoding="utf-8")
+
+    engine = search_engine_module.SearchEngine()
+    assert engine.load_chunks(chunks_path) == 3
+    assert [r.chunk_id for r in engine.search("term2").results] == ["c2"]
+
+    with open(chunks_path, "a", encoding="utf-8") as f:
+        f.write("\n" + json.dumps({"chunk_id": "c3", "text": "term3"}) + "\n")
+    assert engine.sync(chunks_path) == 1
+    assert len(engine.search("text").results) == 3
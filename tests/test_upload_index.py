@@ -0,0 +1,65 @@
+"""Tests for the streaming upload path and the SQLite upload hash index."""
+
+import asyncio
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+from jarvis_web.upload_index import UploadHashIndex, UploadTooLarge, stream_to_tempfile
+
+
+class _FakeUpload:
+    def __init__(self, data: bytes):
+        self._data = data
+        self._pos = 0
+        self.reads = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        self.reads += 1
+        if size < 0:
+            size = len(self._data) - self._pos
+        chunk = self._data[self._pos : self._pos + size]
+        self._pos += len(chunk)
+        return chunk
+
+
+def test_claim_is_insert_if_absent(tmp_path: Path) -> None:
+    index = UploadHashIndex(tmp_path / "hashes.db")
+    assert index.claim("abc", tmp_path / "a.pdf", 10) is None
+    assert index.claim("abc", tmp_path / "b.pdf", 10) == str(tmp_path / "a.pdf")
+    assert "abc" in index
+    assert len(index) == 1
+
+    index.release("abc")
+    assert "abc" not in index
+
+
+def test_legacy_json_imported_once(tmp_path: Path) -> None:
+    legacy = tmp_path / "hashes.json"
+    legacy.write_text(json.dumps({"h1": "old/one.pdf", "h2": "old/two.pdf"}), encoding="utf-8")
+    index = UploadHashIndex(tmp_path / "hashes.db", legacy_json=legacy)
+    assert len(index) == 2
+    index.release("h1")
+
+    reopened = UploadHashIndex(tmp_path / "hashes.db", legacy_json=legacy)
+    assert "h1" not in reopened
+    assert reopened.get("h2") == "old/two.pdf"
+
+
+def test_stream_to_tempfile_hashes_in_chunks(tmp_path: Path) -> None:
+    data = b"%PDF-1.4 " + b"x" * 5000
+    upload = _FakeUpload(data)
+    path, digest, size = asyncio.run(stream_to_tempfile(upload, tmp_path, 10_000, chunk_size=1024))
+    assert path.read_bytes() == data
+    assert digest == hashlib.sha256(data).hexdigest()
+    assert size == len(data)
+    assert upload.reads > 1
+
+
+def test_stream_to_tempfile_enforces_cap(tmp_path: Path) -> None:
+    upload = _FakeUpload(b"y" * 4096)
+    with pytest.raises(UploadTooLarge):
+        asyncio.run(stream_to_tempfile(upload, tmp_path, 2048, chunk_size=1024))
+    assert list(tmp_path.iterdir()) == []
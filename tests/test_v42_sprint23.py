@@ -1,5 +1,6 @@
 """Tests for V4.2 Sprint 2-3 modules."""
 
+import json
 import tempfile
 from pathlib import Path
 
@@ -74,6 +75,71 @@ class TestStreamingBundle:
             assert bundle.can_resume("abc123")
             assert not bundle.can_resume("different")
 
+    def test_finalize_streams_bundle_with_index(self):
+        from jarvis_core.runtime.streaming_bundle import BundleReader, StreamingBundle
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bundle = StreamingBundle(tmpdir)
+            for i in range(5):
+                bundle.write_artifact(f"a{i}", {"n": i, "text": "日本語" * i})
+            bundle.write_evidence("c1", "chunk")
+            bundle.finalize()
+
+            # bundle.json stays a single valid JSON document
+            with open(Path(tmpdir) / "bundle.json", encoding="utf-8") as f:
+                data = json.load(f)
+            assert data["version"] == "v2"
+            assert data["evidence_count"] == 1
+            assert [a["n"] for a in data["artifacts"]] == list(range(5))
+
+            with BundleReader(tmpdir) as reader:
+                assert len(reader) == 5
+                assert reader.ids() == [f"a{i}" for i in range(5)]
+                assert reader.get("a3") == {"n": 3, "text": "日本語" * 3}
+                assert reader[0]["n"] == 0
+                assert [a["n"] for a in reader] == list(range(5))
+                assert reader.metadata["artifact_count"] == 5
+                assert "missing" not in reader
+
+    def test_reader_ignores_index_from_another_finalize(self):
+        from jarvis_core.runtime.streaming_bundle import BundleReader, StreamingBundle
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            bundle = StreamingBundle(tmpdir)
+            bundle.write_artifact("a0", {"n": 0})
+            bundle.finalize()
+            stale_index = (Path(tmpdir) / "bundle.index.jsonl").read_text(encoding="utf-8")
+
+            bundle = StreamingBundle(tmpdir)
+            bundle.write_artifact("a0", {"n": 10, "text": "longer artifact"})
+            bundle.write_artifact("a1", {"n": 11})
+            bundle.finalize()
+            with BundleReader(tmpdir) as reader:
+                assert (
+                    reader.metadata["bundle_size"] == (Path(tmpdir) / "bundle.json").stat().st_size
+                )
+                assert reader.get("a1") == {"n": 11}
+
+            # New bundle paired with the previous index, as between the two replaces
+            (Path(tmpdir) / "bundle.index.jsonl").write_text(stale_index, encoding="utf-8")
+            with BundleReader(tmpdir) as reader:
+                assert [a["n"] for a in reader] == [10, 11]
+                assert reader.ids() == ["a0", "a1"]
+                assert reader["a1"] == {"n": 11}
+                assert "artifact_ids" not in reader.metadata
+
+    def test_reader_falls_back_without_index(self):
+        from jarvis_core.runtime.streaming_bundle import BundleReader
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            legacy = {"version": "v2", "artifacts": [{"n": 1}, {"n": 2}], "evidence_count": 0}
+            (Path(tmpdir) / "bundle.json").write_text(json.dumps(legacy, indent=2))
+            reader = BundleReader(tmpdir)
+            assert len(reader) == 2
+            assert reader.get(1) == {"n": 2}
+            assert reader.get("0") == {"n": 1}
+            assert reader.metadata["evidence_count"] == 0
+
 
 class TestIncrementalIndex:
     """道E tests."""